@@ -0,0 +1,340 @@
+"""Benchmark suite for the hot paths of mOWL: graph projection, random walks, EL normalization,
+one EL training epoch and ranking evaluation.
+
+Every benchmark runs on the family ontology and on synthetic ontologies of increasing size
+(``synthetic:<number of classes>``, created with ``SyntheticOntologyGenerator``). For every
+benchmark and dataset, the suite records the wall time of each repetition, the peak resident set
+size of the process and the peak and final JVM heap usage, and appends one JSON record per
+measurement to a history file together with the commit it was run on. Two commits of the
+history can be compared offline with ``compare``.
+
+    python suite.py run -ds family -ds synthetic:1000 -ds synthetic:10000
+    python suite.py run -b projection.dl2vec -b walk.deepwalk -ds synthetic:100000 -r 5
+    python suite.py compare --base <commit> --head <commit> --threshold 0.1
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import mowl
+mowl.init_jvm("10g")
+
+from mowl.datasets import Dataset
+from mowl.ontology.synthetic import SyntheticOntologyGenerator
+from mowl.owlapi import OWLAPIAdapter
+from java.util import HashSet
+from java.lang import System
+from java.lang.management import ManagementFactory, MemoryType
+import click as ck
+import datetime
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+
+class BenchmarkDataset(Dataset):
+    """Dataset evaluated on all its classes."""
+
+    @property
+    def evaluation_classes(self):
+        return self.classes, self.classes
+
+
+def load_dataset(name):
+    if name == "family":
+        from mowl.datasets.builtin import FamilyDataset
+        return BenchmarkDataset(FamilyDataset().ontology)
+    if name.startswith("synthetic:"):
+        generator = SyntheticOntologyGenerator(int(name.partition(":")[2]))
+        return BenchmarkDataset(generator.create_ontology())
+    raise ValueError(f"Unknown dataset {name}. Use family or synthetic:<number of classes>.")
+
+
+# Every benchmark prepares its inputs outside the measurement and returns the function that is
+# timed.
+
+def projection(projector_factory):
+    def setup(dataset, tmp_dir):
+        projector = projector_factory()
+        return lambda: projector.project(dataset.ontology)
+    return setup
+
+
+def walk(walker_factory):
+    def setup(dataset, tmp_dir):
+        from mowl.projection import DL2VecProjector
+        edges = DL2VecProjector(True).project(dataset.ontology)
+        walker = walker_factory(os.path.join(tmp_dir, "walks.txt"))
+        return lambda: walker.walk(edges)
+    return setup
+
+
+def normalize(dataset, tmp_dir):
+    from mowl.ontology.normalize import ELNormalizer
+    normalizer = ELNormalizer()
+    return lambda: normalizer.normalize(dataset.ontology)
+
+
+def el_epoch(dataset, tmp_dir):
+    from mowl.models import ELEmbeddings
+    model = ELEmbeddings(dataset, embed_dim=50, epochs=1,
+                         model_filepath=os.path.join(tmp_dir, "model.pt"))
+    # Normalization and tensor creation happen on first access and are not part of the epoch.
+    model.training_datasets
+    return lambda: model.train(epochs=1)
+
+
+def evaluate(dataset, tmp_dir, num_test_axioms=1000):
+    from mowl.evaluation import SubsumptionEvaluator
+    from mowl.models import ELEmbeddings
+    from org.semanticweb.owlapi.model import AxiomType
+
+    adapter = OWLAPIAdapter()
+    testing = adapter.create_ontology("http://mowl/benchmark/testing")
+    axioms = HashSet()
+    for axiom in dataset.ontology.getAxioms(AxiomType.SUBCLASS_OF):
+        if len(axioms) == num_test_axioms:
+            break
+        if not axiom.getSubClass().isAnonymous() and not axiom.getSuperClass().isAnonymous():
+            axioms.add(axiom)
+    adapter.owl_manager.addAxioms(testing, axioms)
+
+    model = ELEmbeddings(dataset, embed_dim=50, model_filepath=os.path.join(tmp_dir, "model.pt"))
+    evaluator = SubsumptionEvaluator(dataset, batch_size=16, closure_cache=False,
+                                     index_cache=False)
+    module = model.module.eval()
+    return lambda: evaluator.evaluate(lambda data: module(data, "gci0"), testing)
+
+
+def _projectors():
+    from mowl.projection import (TaxonomyProjector, DL2VecProjector, OWL2VecStarProjector,
+                                 CategoricalProjector)
+    return {"projection.taxonomy": lambda: TaxonomyProjector(True),
+            "projection.dl2vec": lambda: DL2VecProjector(True),
+            "projection.owl2vec_star": lambda: OWL2VecStarProjector(True),
+            "projection.categorical": lambda: CategoricalProjector("str")}
+
+
+def _walkers():
+    from mowl.walking import DeepWalk, Node2Vec
+    return {"walk.deepwalk": lambda outfile: DeepWalk(10, 20, outfile=outfile, workers=4),
+            "walk.node2vec": lambda outfile: Node2Vec(10, 20, p=1, q=1, outfile=outfile,
+                                                      workers=4)}
+
+
+def benchmarks():
+    registry = {name: projection(factory) for name, factory in _projectors().items()}
+    registry.update({name: walk(factory) for name, factory in _walkers().items()})
+    registry.update({"normalize": normalize, "el_epoch": el_epoch, "evaluate": evaluate})
+    return registry
+
+
+class PeakRSS():
+    """Samples the resident set size of the process in a background thread. On systems without
+    ``/proc``, the peak is the high-water mark reported by ``getrusage``."""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current():
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def jvm_heap_pools():
+    return [pool for pool in ManagementFactory.getMemoryPoolMXBeans()
+            if pool.getType() == MemoryType.HEAP]
+
+
+def measure(run, repeat):
+    """Runs a benchmark ``repeat`` times and returns the wall time of every repetition, the peak
+    RSS and the peak and final JVM heap usage. The JVM peak is the sum of the peaks of the heap
+    memory pools, which are reset after a garbage collection before the first repetition."""
+    System.gc()
+    pools = jvm_heap_pools()
+    for pool in pools:
+        pool.resetPeakUsage()
+
+    times = []
+    with PeakRSS() as rss:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+    heap_peak = sum(pool.getPeakUsage().getUsed() for pool in pools)
+    heap_used = ManagementFactory.getMemoryMXBean().getHeapMemoryUsage().getUsed()
+    return {"seconds": [round(t, 6) for t in times],
+            "seconds_min": round(min(times), 6),
+            "seconds_median": round(statistics.median(times), 6),
+            "peak_rss_mb": round(rss.peak / 2**20, 2),
+            "jvm_heap_peak_mb": round(heap_peak / 2**20, 2),
+            "jvm_heap_used_mb": round(heap_used / 2**20, 2)}
+
+
+def git_revision():
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                cwd=root, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+def read_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@ck.group()
+def main():
+    pass
+
+
+@main.command()
+@ck.option("--benchmark", "-b", multiple=True, help="Benchmarks to run. Defaults to all")
+@ck.option("--dataset_name", "-ds", multiple=True,
+           default=["family", "synthetic:1000", "synthetic:10000"],
+           help="family or synthetic:<number of classes>")
+@ck.option("--repeat", "-r", default=3, help="Repetitions of every benchmark")
+@ck.option("--history", "-o", default=HISTORY_FILE,
+           help="JSON lines file where results are appended")
+@ck.option("--list", "list_benchmarks", is_flag=True, help="List the benchmarks and exit")
+def run(benchmark, dataset_name, repeat, history, list_benchmarks):
+    registry = benchmarks()
+    if list_benchmarks:
+        print("\n".join(registry))
+        return
+
+    unknown = set(benchmark) - set(registry)
+    if unknown:
+        raise ck.BadParameter(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    names = list(benchmark) or list(registry)
+
+    commit, dirty = git_revision()
+    environment = {"commit": commit, "dirty": dirty,
+                   "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                   "host": platform.node(), "machine": platform.machine(),
+                   "python": platform.python_version(),
+                   "jvm_startup_seconds": round(sum(mowl.jvm_startup_times.values()), 4)}
+
+    records = []
+    for name in dataset_name:
+        start = time.perf_counter()
+        dataset = load_dataset(name)
+        load_seconds = time.perf_counter() - start
+        logger.info(f"{name}: {dataset.ontology.getAxiomCount()} axioms, "
+                    f"{len(dataset.classes)} classes, loaded in {load_seconds:.2f}s")
+
+        for benchmark_name in names:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                timed = registry[benchmark_name](dataset, tmp_dir)
+                result = measure(timed, repeat)
+
+            record = dict(environment, benchmark=benchmark_name, dataset=name,
+                          num_axioms=dataset.ontology.getAxiomCount(),
+                          num_classes=len(dataset.classes), repeat=repeat, **result)
+            records.append(record)
+            logger.info(f"{benchmark_name} on {name}: {result['seconds_median']:.3f}s, "
+                        f"RSS {result['peak_rss_mb']:.0f} MB, "
+                        f"JVM heap {result['jvm_heap_peak_mb']:.0f} MB")
+
+    with open(history, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    logger.info(f"Appended {len(records)} results to {history}")
+
+
+@main.command()
+@ck.option("--base", default=None, help="Commit to compare against. Defaults to the second "
+           "most recent commit in the history")
+@ck.option("--head", default=None, help="Commit to compare. Defaults to the most recent commit "
+           "in the history")
+@ck.option("--threshold", "-t", default=0.1, help="Relative slowdown or memory growth reported "
+           "as regression")
+@ck.option("--history", "-o", default=HISTORY_FILE, help="JSON lines file with the results")
+def compare(base, head, threshold, history):
+    records = read_history(history)
+    commits = list(dict.fromkeys(record["commit"] for record in records))
+    if len(commits) < 2 and (base is None or head is None):
+        raise ck.UsageError("The history must contain results of at least two commits.")
+    head = head or commits[-1]
+    base = base or commits[commits.index(head) - 1]
+
+    def latest(commit):
+        # The last measurement of every benchmark and dataset. Abbreviated hashes are accepted.
+        selected = dict()
+        for record in records:
+            if record["commit"] is not None and record["commit"].startswith(commit):
+                selected[(record["benchmark"], record["dataset"])] = record
+        return selected
+
+    base_records, head_records = latest(base), latest(head)
+    metrics = ["seconds_median", "peak_rss_mb", "jvm_heap_peak_mb"]
+    regressions = 0
+
+    print(f"Base {base[:10]}, head {head[:10]}")
+    print("| Benchmark | Dataset | Time (s) | Ratio | Peak RSS (MB) | Ratio | JVM heap (MB) "
+          "| Ratio |")
+    print("|-----------|---------|----------|-------|---------------|-------|---------------"
+          "|-------|")
+    for key in sorted(set(base_records) & set(head_records)):
+        cells = []
+        for metric in metrics:
+            old, new = base_records[key][metric], head_records[key][metric]
+            ratio = new / old if old else float("nan")
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = " !"
+                regressions += 1
+            cells += [f"{old:.3f} -> {new:.3f}", f"{ratio:.2f}{flag}"]
+        print(f"| {key[0]} | {key[1]} | " + " | ".join(cells) + " |")
+
+    if regressions:
+        logger.info(f"{regressions} measurements grew by more than {threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Word2Vec training throughput (words/sec) versus number of workers on random walks over graph
+projections of the PPI-yeast ontology and the Gene Ontology.
+
+Walks are generated once per dataset. For every number of workers, a new Word2Vec model is
+trained on the walks with the Python iterator (``TokenCorpus``) and with gensim's
+``corpus_file`` mode.
+
+    python w2v_throughput.py -ds ppi_yeast -ds go -w 1 -w 2 -w 4 -w 8 -w 16
+"""
+
+import sys
+sys.path.append("../")
+import mowl
+mowl.init_jvm("10g")
+
+from mowl.corpus import TokenCorpus
+from mowl.datasets.builtin import PPIYeastDataset, GOSubsumptionDataset
+from mowl.projection import DL2VecProjector
+from mowl.walking import DeepWalk
+from gensim.models import Word2Vec
+import click as ck
+import csv
+import os
+import tempfile
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+DATASETS = {"ppi_yeast": PPIYeastDataset, "go": GOSubsumptionDataset}
+
+
+def train_throughput(corpus, walks_file, workers, mode, epochs, embed_dim):
+    model = Word2Vec(vector_size=embed_dim, window=5, min_count=1, sg=1, workers=workers)
+    corpus.build_vocab(model)
+
+    start = time.perf_counter()
+    if mode == "corpus_file":
+        model.train(corpus_file=walks_file, total_examples=len(corpus),
+                    total_words=corpus.num_words, epochs=epochs)
+    else:
+        model.train(corpus, total_examples=len(corpus), total_words=corpus.num_words,
+                    epochs=epochs)
+    elapsed = time.perf_counter() - start
+    return corpus.num_words * epochs / elapsed, elapsed
+
+
+@ck.command()
+@ck.option("--dataset_name", "-ds", type=ck.Choice(list(DATASETS)), multiple=True,
+           default=["ppi_yeast", "go"])
+@ck.option("--workers", "-w", type=int, multiple=True, default=[1, 2, 4, 8])
+@ck.option("--num_walks", "-nw", default=10, help="Walks per node")
+@ck.option("--walk_length", "-wl", default=20, help="Length of each walk")
+@ck.option("--epochs", "-e", default=1, help="Word2Vec epochs per measurement")
+@ck.option("--embed_dim", "-dim", default=100, help="Embedding dimension")
+@ck.option("--output", "-o", default=None, help="CSV file where results are appended")
+def main(dataset_name, workers, num_walks, walk_length, epochs, embed_dim, output):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in dataset_name:
+            dataset = DATASETS[name]()
+            walks_file = os.path.join(tmp_dir, f"{name}_walks.txt")
+
+            edges = DL2VecProjector(True).project(dataset.ontology)
+            walker = DeepWalk(num_walks, walk_length, outfile=walks_file, workers=max(workers))
+            walker.walk(edges)
+            corpus = TokenCorpus.from_file(walks_file)
+            logger.info(f"{name}: {len(edges)} edges, {len(corpus)} walks, "
+                        f"{corpus.num_words} words")
+
+            for num_workers in workers:
+                for mode in ["iterable", "corpus_file"]:
+                    words_per_sec, elapsed = train_throughput(corpus, walks_file, num_workers,
+                                                              mode, epochs, embed_dim)
+                    logger.info(f"{name} {mode} workers={num_workers}: "
+                                f"{words_per_sec:,.0f} words/sec ({elapsed:.2f}s)")
+                    rows.append({"dataset": name, "mode": mode, "workers": num_workers,
+                                 "words": corpus.num_words * epochs,
+                                 "seconds": round(elapsed, 4),
+                                 "words_per_sec": round(words_per_sec)})
+
+    print("| Dataset | Mode | Workers | Words/sec |")
+    print("|---------|------|---------|-----------|")
+    for row in rows:
+        print(f"| {row['dataset']} | {row['mode']} | {row['workers']} | "
+              f"{row['words_per_sec']:,} |")
+
+    if output is not None:
+        write_header = not os.path.exists(output)
+        with open(output, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
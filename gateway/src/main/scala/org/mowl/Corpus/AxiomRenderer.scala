@@ -0,0 +1,30 @@
+package org.mowl.Corpus
+
+// OWL API imports
+import org.semanticweb.owlapi.manchestersyntax.renderer.ManchesterOWLSyntaxOWLObjectRendererImpl
+import org.semanticweb.owlapi.model.OWLObject
+
+import org.mowl.MOWLShortFormProvider
+
+object AxiomRenderer {
+
+  // Renderers keep internal state while rendering, so every thread has its own.
+  private val renderers = new ThreadLocal[ManchesterOWLSyntaxOWLObjectRendererImpl] {
+    override def initialValue() = {
+      val renderer = new ManchesterOWLSyntaxOWLObjectRendererImpl()
+      renderer.setShortFormProvider(new MOWLShortFormProvider())
+      renderer
+    }
+  }
+
+  // Characters removed from rendered axioms.
+  private val stripped = "\r\n|()<>".toSet
+
+  /** Renders a block of axioms in Manchester syntax and removes the characters in `stripped`,
+    * returning one sentence per axiom.
+    */
+  def renderBlock(axioms: Array[Object]): Array[String] = {
+    val renderer = renderers.get
+    axioms.map(axiom => renderer.render(axiom.asInstanceOf[OWLObject]).filterNot(stripped))
+  }
+}
@@ -0,0 +1,150 @@
+package org.mowl.Normalization
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.model.parameters.Imports
+
+// jcel imports
+import de.tudresden.inf.lat.jcel.coreontology.axiom.{GCI0Axiom, GCI1Axiom, GCI2Axiom, GCI3Axiom}
+import de.tudresden.inf.lat.jcel.owlapi.translator.TranslationRepository
+
+import collection.JavaConverters._
+import scala.collection.mutable.{ArrayBuffer, HashMap}
+
+/** Normal forms as integer arrays.
+  *
+  * @param arrays flat row-major array of entity indices for every normal form label
+  * @param classes class IRIs; the position of an IRI is its index in `arrays`
+  * @param objectProperties object property IRIs
+  * @param individuals individual IRIs
+  * @param ignored number of normalized axioms that are not GCIs or contain auxiliary entities
+  */
+class NormalForms(
+  val arrays: java.util.Map[String, Array[Long]],
+  val classes: Array[String],
+  val objectProperties: Array[String],
+  val individuals: Array[String],
+  val ignored: Int
+)
+
+/** Assigns consecutive indices to entity names. Entities referenced by jcel integer ids are
+  * translated once per id; ids without an OWL entity get the index -1.
+  */
+class EntityIndex(lookup: Int => Option[String]) {
+  val names = ArrayBuffer[String]()
+  private val indices = HashMap[String, Int]()
+  private val jcelIds = HashMap[Int, Int]()
+
+  def add(name: String): Int = indices.getOrElseUpdate(name, {
+    names += name
+    names.length - 1
+  })
+
+  def fromJcelId(jcelId: Int): Int = jcelIds.getOrElseUpdate(jcelId,
+    lookup(jcelId).map(add).getOrElse(-1))
+}
+
+/** Classifies the axioms produced by the jcel normalization into normal forms. Entity indices
+  * are kept between calls, so that axioms normalized later with the same translator share them.
+  */
+class NormalFormIndexer(repository: TranslationRepository) {
+
+  val classes = new EntityIndex(id => {
+    val owlClass = repository.getOptOWLClass(id)
+    if (owlClass.isPresent) Some(owlClass.get.toStringID) else None
+  })
+  val objectProperties = new EntityIndex(id => {
+    val property = repository.getOptOWLObjectProperty(id)
+    if (property.isPresent) Some(property.get.toStringID) else None
+  })
+  val individuals = new EntityIndex(id => None)
+
+  def indexAxioms(normalizedAxioms: java.util.Collection[_], ontology: OWLOntology): NormalForms = {
+    val rows = HashMap[String, ArrayBuffer[Long]]()
+    for (key <- Seq("gci0", "gci0_bot", "gci1", "gci1_bot", "gci2", "gci3", "gci3_bot",
+      "class_assertion", "object_property_assertion")) {
+      rows(key) = ArrayBuffer[Long]()
+    }
+    var ignored = 0
+
+    for (axiom <- normalizedAxioms.asScala) {
+      val normalForm = axiom match {
+        case a: GCI0Axiom => Some(("gci0", Array(classes.fromJcelId(a.getSubClass),
+          classes.fromJcelId(a.getSuperClass))))
+        case a: GCI1Axiom => Some(("gci1", Array(classes.fromJcelId(a.getLeftSubClass),
+          classes.fromJcelId(a.getRightSubClass), classes.fromJcelId(a.getSuperClass))))
+        case a: GCI2Axiom => Some(("gci2", Array(classes.fromJcelId(a.getSubClass),
+          objectProperties.fromJcelId(a.getPropertyInSuperClass),
+          classes.fromJcelId(a.getClassInSuperClass))))
+        case a: GCI3Axiom => Some(("gci3", Array(objectProperties.fromJcelId(a.getPropertyInSubClass),
+          classes.fromJcelId(a.getClassInSubClass), classes.fromJcelId(a.getSuperClass))))
+        case _ => None
+      }
+
+      normalForm match {
+        case Some((gci, row)) if !row.contains(-1) => {
+          var key = gci
+          if (key == "gci1" && classes.names(row(0)) > classes.names(row(1))) {
+            // Same operand order as the intersections built by the reverse translation.
+            val left = row(0)
+            row(0) = row(1)
+            row(1) = left
+          }
+          if (key != "gci2" && classes.names(row.last).contains("owl#Nothing")) key += "_bot"
+          rows(key) ++= row.map(_.toLong)
+        }
+        case _ => ignored += 1
+      }
+    }
+
+    for (axiom <- ontology.getAxioms(AxiomType.CLASS_ASSERTION, Imports.INCLUDED).asScala) {
+      val classExpression = axiom.getClassExpression
+      if (!classExpression.isAnonymous) {
+        rows("class_assertion") += individuals.add(axiom.getIndividual.toStringID)
+        rows("class_assertion") += classes.add(classExpression.asOWLClass.toStringID)
+      }
+    }
+
+    for (axiom <- ontology.getAxioms(AxiomType.OBJECT_PROPERTY_ASSERTION, Imports.INCLUDED).asScala) {
+      rows("object_property_assertion") += individuals.add(axiom.getSubject.toStringID)
+      rows("object_property_assertion") += objectProperties.add(
+        axiom.getProperty.asOWLObjectProperty.toStringID)
+      rows("object_property_assertion") += individuals.add(axiom.getObject.toStringID)
+    }
+
+    val arrays = new java.util.HashMap[String, Array[Long]]()
+    for ((key, values) <- rows) arrays.put(key, values.toArray)
+    new NormalForms(arrays, classes.names.toArray, objectProperties.names.toArray,
+      individuals.names.toArray, ignored)
+  }
+}
+
+object NormalFormIndexer {
+
+  /** Returns the TBox axioms of an ontology, including its imports, whose type is not in
+    * `unsupportedAxiomTypes` and whose class expressions have a type in `classExpressionTypes`.
+    * Every distinct class expression is checked once.
+    */
+  def supportedTBoxAxioms(
+    ontology: OWLOntology,
+    unsupportedAxiomTypes: java.util.Set[String],
+    classExpressionTypes: java.util.Set[ClassExpressionType]
+  ): java.util.Set[OWLAxiom] = {
+
+    val supported = HashMap[OWLClassExpression, Boolean]()
+    val axioms = new java.util.HashSet[OWLAxiom]()
+
+    for (axiomType <- AxiomType.TBoxAxiomTypes.asScala
+      if !unsupportedAxiomTypes.contains(axiomType.getName)) {
+      val owlAxiomType = axiomType.asInstanceOf[AxiomType[OWLAxiom]]
+      for (axiom <- ontology.getAxioms(owlAxiomType, Imports.INCLUDED).asScala) {
+        val nested = axiom.getNestedClassExpressions.asScala
+        if (nested.forall(expression => supported.getOrElseUpdate(expression,
+          classExpressionTypes.contains(expression.getClassExpressionType)))) {
+          axioms.add(axiom)
+        }
+      }
+    }
+    axioms
+  }
+}
@@ -0,0 +1,42 @@
+package org.mowl.Ontology
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+
+import scala.collection.mutable.HashMap
+
+/** Creates axioms of the form C SubClassOf (R some D) from arrays of IRIs and adds them to an
+  * ontology with one addAxioms call per batch. Classes and object properties are created once per
+  * distinct IRI and existential restrictions once per distinct pair in a batch.
+  */
+class ExistentialAxiomBuilder(val manager: OWLOntologyManager, val ontology: OWLOntology) {
+
+  val factory = manager.getOWLDataFactory
+  private val classes = HashMap[String, OWLClass]()
+  private val objectProperties = HashMap[String, OWLObjectProperty]()
+
+  def owlClass(iri: String): OWLClass =
+    classes.getOrElseUpdate(iri, factory.getOWLClass(IRI.create(iri)))
+
+  def objectProperty(iri: String): OWLObjectProperty =
+    objectProperties.getOrElseUpdate(iri, factory.getOWLObjectProperty(IRI.create(iri)))
+
+  /** Adds the axioms subclasses(i) SubClassOf (relations(i) some fillers(i)).
+    *
+    * @return number of rows in the batch
+    */
+  def add(subclasses: Array[String], relations: Array[String], fillers: Array[String]): Int = {
+    require(subclasses.length == relations.length && relations.length == fillers.length,
+      "subclasses, relations and fillers must have the same length")
+
+    val existentials = HashMap[(String, String), OWLObjectSomeValuesFrom]()
+    val axioms = new java.util.HashSet[OWLAxiom]()
+    for (i <- subclasses.indices) {
+      val existential = existentials.getOrElseUpdate((relations(i), fillers(i)),
+        factory.getOWLObjectSomeValuesFrom(objectProperty(relations(i)), owlClass(fillers(i))))
+      axioms.add(factory.getOWLSubClassOfAxiom(owlClass(subclasses(i)), existential))
+    }
+    manager.addAxioms(ontology, axioms)
+    subclasses.length
+  }
+}
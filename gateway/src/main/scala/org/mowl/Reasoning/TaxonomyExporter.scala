@@ -0,0 +1,96 @@
+package org.mowl.Reasoning
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.model.parameters.Imports
+import org.semanticweb.owlapi.reasoner.{InferenceType, OWLReasoner}
+
+import collection.JavaConverters._
+import scala.collection.mutable.{ArrayBuffer, HashMap, HashSet, Stack}
+
+/** Inferred taxonomy as integer pairs.
+  *
+  * @param classes class IRIs; the position of an IRI is its index in `pairs`
+  * @param pairs flat array (sub_0, super_0, sub_1, super_1, ...) of class indices
+  */
+class SubClassPairs(val classes: Array[String], val pairs: Array[Long])
+
+object TaxonomyExporter {
+
+  /** Exports the inferred taxonomy of the root ontology of a reasoner in a single pass.
+    *
+    * Classes in the signature of the ontology are indexed in IRI order; superclasses outside
+    * the signature (such as owl:Thing) get the following indices. Only the direct
+    * superclasses are queried to the reasoner and the indirect ones are obtained as their
+    * transitive closure.
+    */
+  def subClassPairs(reasoner: OWLReasoner, direct: Boolean): SubClassPairs = {
+    reasoner.precomputeInferences(InferenceType.CLASS_HIERARCHY)
+
+    val ontology = reasoner.getRootOntology
+    val ontClasses = ontology.getClassesInSignature(Imports.EXCLUDED).asScala.toArray
+      .map(c => (c.toStringID, c)).sortBy(_._1)
+
+    val classNames = ArrayBuffer[String]()
+    val classIds = HashMap[String, Int]()
+    for ((name, _) <- ontClasses) {
+      classIds(name) = classNames.length
+      classNames += name
+    }
+
+    val parents = ArrayBuffer.fill(classNames.length)(Array[Int]())
+    for ((name, owlClass) <- ontClasses) {
+      val superNames = reasoner.getSuperClasses(owlClass, true).getFlattened.asScala
+        .map(_.toStringID).toArray.sorted
+      val superIds = superNames.map { superName =>
+        classIds.getOrElseUpdate(superName, {
+          classNames += superName
+          parents += Array[Int]()
+          classNames.length - 1
+        })
+      }
+      parents(classIds(name)) = superIds
+    }
+
+    val ancestors =
+      if (direct) parents.toArray.map(_.distinct.sorted)
+      else transitiveClosure(parents.toArray)
+
+    val pairs = ArrayBuffer[Long]()
+    for (sub <- ancestors.indices; sup <- ancestors(sub)) {
+      pairs += sub
+      pairs += sup
+    }
+
+    new SubClassPairs(classNames.toArray, pairs.toArray)
+  }
+
+  // Iterative post-order traversal to avoid stack overflows on deep hierarchies.
+  def transitiveClosure(parents: Array[Array[Int]]): Array[Array[Int]] = {
+    val ancestors = new Array[Array[Int]](parents.length)
+    val stack = Stack[(Int, Boolean)]()
+
+    for (start <- parents.indices if ancestors(start) == null) {
+      stack.push((start, false))
+      while (stack.nonEmpty) {
+        val (node, expanded) = stack.pop()
+        if (ancestors(node) == null) {
+          if (expanded) {
+            val result = HashSet[Int]()
+            for (parent <- parents(node)) {
+              result += parent
+              if (ancestors(parent) != null) result ++= ancestors(parent)
+            }
+            ancestors(node) = result.toArray.sorted
+          } else {
+            stack.push((node, true))
+            for (parent <- parents(node) if ancestors(parent) == null) {
+              stack.push((parent, false))
+            }
+          }
+        }
+      }
+    }
+    ancestors
+  }
+}
@@ -12,7 +12,9 @@ import scala.concurrent.duration.Duration
 import scala.concurrent.{ Await, Future }
 import scala.concurrent.{ExecutionContext, ExecutionContextExecutorService}
 import scala.util.{Failure, Success, Try}
+import java.util.concurrent.atomic.AtomicLong
 import org.mowl.Edge
+import org.slf4j.LoggerFactory
 
 class DeepWalk (
   var edges: ArrayList[Edge],
@@ -22,9 +24,14 @@ class DeepWalk (
   var workers: Int,
   var outfile: String,
   var nodesOfInterest: ArrayList[String],
-  var seed: Int
+  var seed: Int,
+  var shardFiles: ArrayList[String]
 ) {
 
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, alpha: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], seed: Int) =
+    this(edges, numWalks, walkLength, alpha, workers, outfile, nodesOfInterest, seed,
+      new ArrayList[String]())
 
   val edgesSc = edges.asScala.map(x => (x.src, x.rel, x.dst))
   val entities_ = edgesSc.map(x => List(x._1, x._2, x._3)).flatten.toSet
@@ -43,9 +50,20 @@ class DeepWalk (
   val nodesOfInterestIdx =  HashSet() ++ nodesOfInterest.asScala.map(mapEntsIdx(_)).toSet
 
   private[this] val lock = new Object()
+  private[this] val logger = LoggerFactory.getLogger(classOf[DeepWalk])
 
-  val walksFile = new File(outfile)
-  val bw = new BufferedWriter(new FileWriter(walksFile, true))
+  // Counters of the last call to walk, read from Python.
+  private[this] val walksWritten = new AtomicLong(0)
+  @volatile private[this] var walkingMillis = 0L
+
+  def numWalksWritten: Long = walksWritten.get
+  def walkingTimeMillis: Long = walkingMillis
+
+  // Every worker writes its own shard when shard files are given, so walks are written without
+  // taking the lock.
+  val sharded = shardFiles.size > 0
+  lazy val walksFile = new File(outfile)
+  lazy val bw = new BufferedWriter(new FileWriter(walksFile, true))
 
 
   def processEdges() = {
@@ -71,23 +89,26 @@ class DeepWalk (
       i <- Range(0, newWorkers, 1)
     ) yield (i, pathsPerWorker(i), walkLength, alpha)
 
-    println("Starting pool...")
+    logger.debug(s"Starting pool of $newWorkers threads")
+    walksWritten.set(0)
+    val start = System.nanoTime() / 1000000
     val executor: ExecutorService = Executors.newFixedThreadPool(newWorkers)
     implicit val executionContext: ExecutionContextExecutorService = ExecutionContext.fromExecutorService(executor)
 
     val fut = Future.traverse(argsList)(writeWalksToDisk)
 
     Await.ready(fut, Duration.Inf)
+    walkingMillis = System.nanoTime() / 1000000 - start
 
     fut.onComplete {
       case Success(msg) => {
-        println("* Walking is done, shutting down the executor")
+        logger.info(s"Wrote ${walksWritten.get} walks in $walkingMillis ms")
         executionContext.shutdown()
-        bw.close
+        if (!sharded) bw.close
       }
       case Failure(t) =>
         {
-          println("An error has ocurred in preprocessing generating random walks: " + t.getMessage + " - " + t.printStackTrace)
+          logger.error("An error has ocurred generating random walks", t)
           executionContext.shutdown()
           bw.close
         }
@@ -97,26 +118,30 @@ class DeepWalk (
 
    def writeWalksToDisk(params: (Int, Int, Int, Float))(implicit ec: ExecutionContext): Future[Unit] = Future {
      val (index, numWalks, walkLength, alpha) = params
-     println(s"+ started processing thread $index")
+     logger.debug(s"Started processing thread $index")
      val start = System.nanoTime() / 1000000
-
-     for (i <- 0 until numWalks){
-       val nodesR = rand.shuffle(nodesIdx)
-       for (n <- nodesR){
-         randomWalk(walkLength, alpha, n)
+     val shard = if (sharded) new BufferedWriter(new FileWriter(shardFiles.get(index), true)) else null
+
+     try {
+       for (i <- 0 until numWalks){
+         val nodesR = rand.shuffle(nodesIdx)
+         for (n <- nodesR){
+           randomWalk(walkLength, alpha, n, shard)
+         }
        }
-
+     } finally {
+       if (shard != null) shard.close
      }
      
      val end = System.nanoTime() / 1000000
      val duration = (end - start)
-     println(s"- finished processing thread $index after $duration")
+     logger.debug(s"Finished processing thread $index after $duration ms")
      
   }
 
 
 
-  def randomWalk(walkLength: Int, alpha: Float, start: Int ) ={
+  def randomWalk(walkLength: Int, alpha: Float, start: Int, shard: BufferedWriter) ={
 
     val walk = Array.fill(2*walkLength-1){-1}
     walk(0) = start
@@ -157,18 +182,23 @@ class DeepWalk (
       val intersection = walkSet & nodesOfInterestIdx
 
       if (intersection.size > 0){
-        
-
-        lock.synchronized {
-          bw.write(toWrite)
-        }
+        write(toWrite, shard)
       }
+    }else{
+      write(toWrite, shard)
+    }
+
+  }
+
+  def write(toWrite: String, shard: BufferedWriter) = {
+    walksWritten.incrementAndGet()
+    if (shard != null){
+      shard.write(toWrite)
     }else{
       lock.synchronized {
         bw.write(toWrite)
       }
     }
-
   }
 
 
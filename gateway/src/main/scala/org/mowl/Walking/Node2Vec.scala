@@ -12,7 +12,9 @@ import scala.concurrent.duration.Duration
 import scala.concurrent.{ Await, Future }
 import scala.concurrent.{ExecutionContext, ExecutionContextExecutorService}
 import scala.util.{Failure, Success, Try}
+import java.util.concurrent.atomic.AtomicLong
 import org.mowl.Edge
+import org.slf4j.LoggerFactory
 
 class Node2Vec (
   var edges: ArrayList[Edge],
@@ -22,9 +24,14 @@ class Node2Vec (
   var q: Float,
   var workers: Int,
   var outfile: String,
-  var nodesOfInterest: ArrayList[String]
+  var nodesOfInterest: ArrayList[String],
+  var shardFiles: ArrayList[String]
 ) {
 
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float,
+    workers: Int, outfile: String, nodesOfInterest: ArrayList[String]) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest,
+      new ArrayList[String]())
 
   val edgesSc = edges.asScala.map(x => (x.src, x.rel, x.dst, x.weight))
   val entities = edgesSc.map(x => List(x._1, x._2, x._3)).flatten.toSet
@@ -48,9 +55,22 @@ class Node2Vec (
   val nodesOfInterestIdx =  HashSet() ++ nodesOfInterest.asScala.map(mapEntsIdx(_)).toSet
 
   private[this] val lock = new Object()
+  private[this] val logger = LoggerFactory.getLogger(classOf[Node2Vec])
 
-  val walksFile = new File(outfile)
-  val bw = new BufferedWriter(new FileWriter(walksFile))
+  // Counters of the last call to walk, read from Python.
+  private[this] val walksWritten = new AtomicLong(0)
+  @volatile private[this] var preprocessingMillis = 0L
+  @volatile private[this] var walkingMillis = 0L
+
+  def numWalksWritten: Long = walksWritten.get
+  def preprocessingTimeMillis: Long = preprocessingMillis
+  def walkingTimeMillis: Long = walkingMillis
+
+  // Every worker writes its own shard when shard files are given, so walks are written without
+  // taking the lock.
+  val sharded = shardFiles.size > 0
+  lazy val walksFile = new File(outfile)
+  lazy val bw = new BufferedWriter(new FileWriter(walksFile))
 
 
   def processEdges() = {
@@ -79,12 +99,13 @@ class Node2Vec (
       i <- Range(0, newWorkers, 1)
     ) yield (i, pathsPerWorker(i), walkLength, p, q)
 
-    print("Starting pool...")
+    logger.debug(s"Starting pool of $workers threads")
+    walksWritten.set(0)
 
     val executor: ExecutorService = Executors.newFixedThreadPool(workers)
     implicit val executionContext: ExecutionContextExecutorService = ExecutionContext.fromExecutorService(executor)
 
-    println(s"+ started preprocessing probabilities...")
+    logger.debug("Started preprocessing probabilities")
     val start = System.nanoTime() / 1000000
 
     var listsN: ListBuffer[ListBuffer[Int]] = ListBuffer.fill(newWorkers)(ListBuffer())
@@ -97,8 +118,8 @@ class Node2Vec (
     Await.ready(futNodes, Duration.Inf)
 
     futNodes.onComplete {
-      case Success(msg) => println("* processing probabilities for nodes is over")
-      case Failure(t) => println("An error has ocurred in preprocessing probabilities for nodes: " + t.getMessage + " - " + t.printStackTrace)
+      case Success(msg) => logger.debug("Processing probabilities for nodes is over")
+      case Failure(t) => logger.error("An error has ocurred in preprocessing probabilities for nodes", t)
     }
 
     var listsE: ListBuffer[ListBuffer[(Int, Int)]] = ListBuffer.fill(newWorkers)(ListBuffer())
@@ -112,29 +133,31 @@ class Node2Vec (
     Await.ready(futEdges, Duration.Inf)
 
     futEdges.onComplete {
-      case Success(msg) => println("* processing probabilities for edges is over")
-      case Failure(t) => println("An error has ocurred in preprocessing probabilities for edges: " + t.getMessage + " - " + t.printStackTrace)
+      case Success(msg) => logger.debug("Processing probabilities for edges is over")
+      case Failure(t) => logger.error("An error has ocurred in preprocessing probabilities for edges", t)
     }
 
 
     val end = System.nanoTime() / 1000000
-    val duration = (end - start) / 1000
-    println(s"- finished preprocessing probabilities after $duration seconds")
+    preprocessingMillis = end - start
+    logger.debug(s"Finished preprocessing probabilities after $preprocessingMillis ms")
 
 
     val futWalks = Future.traverse(argsList)(writeWalksToDisk)
 
     Await.ready(futWalks, Duration.Inf)
+    walkingMillis = System.nanoTime() / 1000000 - end
 
     futWalks.onComplete {
       case Success(msg) => {
-        println("* Walking is done, shutting down the executor")
+        logger.info(s"Wrote ${walksWritten.get} walks in $walkingMillis ms after " +
+          s"preprocessing probabilities in $preprocessingMillis ms")
         executionContext.shutdown()
-        bw.close
+        if (!sharded) bw.close
       }
       case Failure(t) =>
         {
-          println("An error has ocurred in preprocessing generating random walks: " + t.getMessage + " - " + t.printStackTrace)
+          logger.error("An error has ocurred generating random walks", t)
           executionContext.shutdown()
           bw.close
         }
@@ -146,22 +169,27 @@ class Node2Vec (
 
     val (index, numWalks, walkLength, p, q) = params
 
-    println(s"+ started processing thread $index")
+    logger.debug(s"Started processing thread $index")
     val start = System.nanoTime() / 1000000
+    val shard = if (sharded) new BufferedWriter(new FileWriter(shardFiles.get(index))) else null
 
-    for (i <- 0 until numWalks){
-      val nodesR = rand.shuffle(nodesIdx)
-      for (n <- nodesR){
-        randomWalk(walkLength, p, q, n)
+    try {
+      for (i <- 0 until numWalks){
+        val nodesR = rand.shuffle(nodesIdx)
+        for (n <- nodesR){
+          randomWalk(walkLength, p, q, n, shard)
+        }
       }
+    } finally {
+      if (shard != null) shard.close
     }
      
     val end = System.nanoTime() / 1000000
     val duration = (end - start)
-    println(s"- finished processing thread $index after $duration")
+    logger.debug(s"Finished processing thread $index after $duration ms")
   }
 
-  def randomWalk(walkLength: Int, p: Float, q: Float, start: Int ) = {
+  def randomWalk(walkLength: Int, p: Float, q: Float, start: Int, shard: BufferedWriter) = {
 
     val walk = Array.fill(2*walkLength-1){-1}
 
@@ -207,17 +235,23 @@ class Node2Vec (
       val intersection = walkSet & nodesOfInterestIdx
 
       if (intersection.size > 0){
-        
-        lock.synchronized {
-          bw.write(toWrite)
-        }
+        write(toWrite, shard)
       }
+    }else{
+      write(toWrite, shard)
+    }
+
+  }
+
+  def write(toWrite: String, shard: BufferedWriter) = {
+    walksWritten.incrementAndGet()
+    if (shard != null){
+      shard.write(toWrite)
     }else{
       lock.synchronized {
         bw.write(toWrite)
       }
     }
-
   }
 
 
@@ -1,10 +1,52 @@
 import jpype
 import jpype.imports
+import hashlib
+import importlib
+import importlib.machinery
+import importlib.util
 import os
 import platform
+import re
+import sys
+import time
+import types
 
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
 
-def init_jvm(memory):
+JAVA_PACKAGES = ("org.semanticweb", "org.mowl", "uk.ac.manchester", "de.tudresden", "java.util",
+                 "java.io", "java.security")
+"""Java packages used by mOWL whose import starts the JVM on demand. Other Java packages, such as \
+the ``org.python.core`` probe of :mod:`copy` or ``java.lang`` in :mod:`platform`, do not start \
+it."""
+
+DEFAULT_JVM_MEMORY = os.environ.get("MOWL_JVM_MEMORY", "10g")
+"""Maximum heap size of a JVM started on demand. It can be set with the ``MOWL_JVM_MEMORY`` \
+environment variable."""
+
+DEFAULT_JVM_OPTIONS = os.environ.get("MOWL_JVM_OPTIONS", "").split()
+"""Extra options of a JVM started on demand, read from the space-separated ``MOWL_JVM_OPTIONS`` \
+environment variable."""
+
+DEFAULT_CLASS_DATA_SHARING = os.environ.get("MOWL_JVM_CDS", "0").lower() in ("1", "true", "yes")
+"""Whether a JVM started on demand uses a class-data-sharing archive. It can be enabled with \
+``MOWL_JVM_CDS=1``."""
+
+CDS_DIR = os.path.join(os.environ.get("MOWL_CACHE_DIR",
+                                      os.path.join(os.path.expanduser("~"), ".cache", "mowl")),
+                       "cds")
+
+jvm_startup_times = dict()
+"""Seconds spent in each step of the last JVM startup: ``classpath``, ``start_jvm`` and \
+``load_owlapi``."""
+
+_jvm_memory = None
+
+
+def _classpath():
     dirname = os.path.dirname(__file__)
 
     jars_dir = os.path.join(dirname, "lib/")
@@ -12,15 +54,183 @@ def init_jvm(memory):
         raise FileNotFoundError(f"JAR files not found. Make sure that the lib directory exists \
 and contains the JAR dependencies.")
 
+    jars = [jars_dir + name for name in sorted(os.listdir(jars_dir))]
     if (platform.system() == 'Windows'):
-        jars = f'{str.join(";", [jars_dir + name for name in os.listdir(jars_dir)])}'
+        return jars, f'{str.join(";", jars)}'
     else:
-        jars = f'{str.join(":", [jars_dir + name for name in os.listdir(jars_dir)])}'
+        return jars, f'{str.join(":", jars)}'
+
+
+def _java_major_version(jvm_path):
+    """Reads the Java version from the ``release`` file of the Java installation that contains \
+``jvm_path``. Returns ``None`` if it cannot be found."""
+    directory = os.path.dirname(jvm_path)
+    for _ in range(4):
+        release = os.path.join(directory, "release")
+        if os.path.exists(release):
+            with open(release) as f:
+                match = re.search(r'JAVA_VERSION="(\d+)(?:\.(\d+))?', f.read())
+            if match is None:
+                return None
+            major = int(match.group(1))
+            return int(match.group(2)) if major == 1 else major
+        directory = os.path.dirname(directory)
+    return None
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _cds_options(jvm_path, jars, cds_archive):
+    """Returns the JVM options to use or create an AppCDS archive of the mOWL classpath.
+
+    If the archive exists, it is mapped at startup. Otherwise, the first process that claims \
+the archive lock dumps the classes it loaded into the archive when the JVM exits (dynamic \
+archiving, Java 13 or newer). Other processes started meanwhile run without archive.
+    """
+    version = _java_major_version(jvm_path)
+    if version is not None and version < 13:
+        logger.warning(f"Class-data-sharing archives require Java 13 or newer, found Java \
+{version}. Starting the JVM without archive.")
+        return []
+
+    if cds_archive is None:
+        digest = hashlib.sha256(jvm_path.encode("utf-8"))
+        for jar in jars:
+            stat = os.stat(jar)
+            digest.update(f"{jar}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        cds_archive = os.path.join(CDS_DIR, f"mowl-{digest.hexdigest()[:16]}.jsa")
+
+    if os.path.exists(cds_archive):
+        logger.debug(f"Using class-data-sharing archive {cds_archive}")
+        return [f"-XX:SharedArchiveFile={cds_archive}", "-Xshare:auto"]
+
+    os.makedirs(os.path.dirname(os.path.abspath(cds_archive)), exist_ok=True)
+    lock = f"{cds_archive}.lock"
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        with open(lock) as f:
+            owner = f.read().strip()
+        if owner.isdigit() and _process_alive(int(owner)):
+            return []
+        os.remove(lock)
+        return _cds_options(jvm_path, jars, cds_archive)
+
+    with os.fdopen(fd, "w") as f:
+        f.write(str(os.getpid()))
+    logger.info(f"Class-data-sharing archive will be created at {cds_archive} when the JVM exits")
+    return [f"-XX:ArchiveClassesAtExit={cds_archive}"]
+
+
+def init_jvm(memory, jvm_options=None, class_data_sharing=False, cds_archive=None):
+    """Starts the JVM with the mOWL JAR files in the classpath. The JVM can only be started \
+once per process; later calls have no effect.
+
+    :param memory: Maximum heap size, passed to the JVM as ``-Xmx``. For example, ``"10g"``.
+    :type memory: str
+    :param jvm_options: Extra JVM options, for example ``["-Xms2g", "-XX:+UseParallelGC", \
+"-XX:ParallelGCThreads=4"]``. Defaults to ``None``.
+    :type jvm_options: list of str, optional
+    :param class_data_sharing: If ``True``, the JVM uses an AppCDS archive of the classes \
+loaded by mOWL, which cuts the time spent loading and verifying OWLAPI, ELK and jcel classes \
+in every new process. The archive is created when the first JVM using this option exits. \
+Requires Java 13 or newer. Defaults to ``False``.
+    :type class_data_sharing: bool, optional
+    :param cds_archive: Path of the archive. Defaults to a file in ``$MOWL_CACHE_DIR/cds`` (or \
+``~/.cache/mowl/cds``) named after the Java installation and the JAR files.
+    :type cds_archive: str, optional
+    """
+    global _jvm_memory
+
+    if jvm_options is None:
+        jvm_options = []
+    if not isinstance(jvm_options, (list, tuple)):
+        raise TypeError("Optional parameter jvm_options must be of type list.")
+    if cds_archive is not None and not isinstance(cds_archive, str):
+        raise TypeError("Optional parameter cds_archive must be of type str.")
+
+    start = time.perf_counter()
+    jars, classpath = _classpath()
 
     if not jpype.isJVMStarted():
+        jvm_path = jpype.getDefaultJVMPath()
+        options = ["-ea", f"-Xmx{memory}", "-Djava.class.path=" + classpath]
+        if class_data_sharing:
+            options += _cds_options(jvm_path, jars, cds_archive)
+        options += list(jvm_options)
+        jvm_startup_times["classpath"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        jpype.startJVM(jvm_path, *options, convertStrings=False)
+        jvm_startup_times["start_jvm"] = time.perf_counter() - start
+        _jvm_memory = memory
+
+        start = time.perf_counter()
+        jpype.JClass("org.semanticweb.owlapi.apibinding.OWLManager").createOWLOntologyManager()
+        jvm_startup_times["load_owlapi"] = time.perf_counter() - start
+
+        breakdown = ", ".join(f"{step} {seconds:.2f}s" for step, seconds
+                              in jvm_startup_times.items())
+        logger.info(f"JVM started in {sum(jvm_startup_times.values()):.2f}s ({breakdown})")
+    elif _jvm_memory is not None and memory != _jvm_memory:
+        logger.warning(f"The JVM is already running with -Xmx{_jvm_memory}. Call \
+mowl.init_jvm before importing JVM-dependent modules to use -Xmx{memory}.")
+
+
+def _in_packages(name, packages):
+    return any(name == package or name.startswith(package + ".") for package in packages)
+
+
+class _JavaPackagePlaceholder(types.ModuleType):
+    """Parent of a package in :data:`JAVA_PACKAGES`, such as ``org``, imported before the JVM is \
+started. It is replaced by the JPype package once the JVM is running."""
+
+
+class _JVMOnDemandFinder():
+    """Import hook that starts the JVM with :data:`DEFAULT_JVM_MEMORY`, \
+:data:`DEFAULT_JVM_OPTIONS` and :data:`DEFAULT_CLASS_DATA_SHARING` the first time a package in \
+:data:`JAVA_PACKAGES` is imported, so that modules using OWLAPI can be imported without calling \
+:func:`init_jvm` first. The import itself is left to JPype."""
+
+    def find_spec(self, name, path, target=None):
+        if name.partition(".")[0] not in {package.partition(".")[0] for package in JAVA_PACKAGES}:
+            return None
+
+        if not jpype.isJVMStarted():
+            if _in_packages(name, JAVA_PACKAGES):
+                logger.debug(f"Starting the JVM on demand to import {name}")
+                init_jvm(DEFAULT_JVM_MEMORY, jvm_options=DEFAULT_JVM_OPTIONS,
+                         class_data_sharing=DEFAULT_CLASS_DATA_SHARING)
+            elif any(package.startswith(name + ".") for package in JAVA_PACKAGES):
+                # Parent packages are imported first, so "org" is looked up before "org.mowl".
+                if "." not in name and importlib.machinery.PathFinder.find_spec(name) is not None:
+                    return None
+                return importlib.util.spec_from_loader(name, self, is_package=True)
+            else:
+                return None
+
+        parent = name.rpartition(".")[0]
+        if isinstance(sys.modules.get(parent), _JavaPackagePlaceholder):
+            for placeholder in [module_name for module_name, module in list(sys.modules.items())
+                                if isinstance(module, _JavaPackagePlaceholder)]:
+                del sys.modules[placeholder]
+            importlib.import_module(parent)
+        return None
+
+    def create_module(self, spec):
+        return _JavaPackagePlaceholder(spec.name)
+
+    def exec_module(self, module):
+        pass
+
 
-        jpype.startJVM(
-            jpype.getDefaultJVMPath(), "-ea",
-            f"-Xmx{memory}",
-            "-Djava.class.path=" + jars,
-            convertStrings=False)
+if not any(isinstance(finder, _JVMOnDemandFinder) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _JVMOnDemandFinder())
@@ -1,4 +1,13 @@
-from .model import Model
-from .elmodel import EmbeddingELModel
-from .graph_model import GraphModel, RandomWalkModel, KGEModel
-from .syntactic_model import SyntacticModel
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "Model": ".model",
+    "EmbeddingELModel": ".elmodel",
+    "GraphModel": ".graph_model",
+    "RandomWalkModel": ".graph_model",
+    "KGEModel": ".graph_model",
+    "SyntacticModel": ".syntactic_model",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,18 +1,27 @@
-from mowl.ontology.normalize import ELNormalizer
+from mowl.ontology.normalize import ELNormalizer, NORMAL_FORM_COLUMNS
+from mowl.owlapi import OWLAPIAdapter
+from mowl.inference.el import GCI0Score, GCI1Score, GCI2Score, GCI3Score
 from mowl.base_models.model import Model
 from mowl.datasets.el import ELDataset
 from mowl.projection import projector_factory
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.utils.instrumentation import timed
 import torch as th
 from torch.utils.data import DataLoader, default_collate
 
 from deprecated.sphinx import versionadded, versionchanged
 
 from org.semanticweb.owlapi.model import OWLClassExpression, OWLClass, OWLObjectSomeValuesFrom, OWLObjectIntersectionOf
+from java.util import HashSet
 
-import copy
 import numpy as np
 import mowl.error.messages as msg
 import os
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
 
 @versionchanged(version="1.0.0", reason="Added the 'load_normalized' parameter.")
 class EmbeddingELModel(Model):
@@ -61,11 +70,15 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         self.device = device
         self.load_normalized = load_normalized
         
+        self._training_el_dataset = None
+        self._validation_el_dataset = None
+        self._testing_el_dataset = None
         self._training_datasets = None
         self._validation_datasets = None
         self._testing_datasets = None
 
         self._loaded_eval = False
+        self._validation_candidates = None
 
     def init_module(self):
         raise NotImplementedError
@@ -77,30 +90,33 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         if self._datasets_loaded:
             return
 
-        training_el_dataset = ELDataset(self.dataset.ontology,
+        self._training_el_dataset = ELDataset(self.dataset.ontology,
                                         self.class_index_dict,
                                         self.object_property_index_dict,
                                         extended=self._extended,
                                         load_normalized = self.load_normalized,
                                         device=self.device)
 
-        self._training_datasets = training_el_dataset.get_gci_datasets()
+        self._training_datasets = self._training_el_dataset.get_gci_datasets()
 
+        self._validation_el_dataset = None
         self._validation_datasets = None
         if self.dataset.validation:
-            validation_el_dataset = ELDataset(self.dataset.validation, self.class_index_dict,
-                                              self.object_property_index_dict,
-                                              extended=self._extended, device=self.device)
+            self._validation_el_dataset = ELDataset(self.dataset.validation,
+                                                    self.class_index_dict,
+                                                    self.object_property_index_dict,
+                                                    extended=self._extended, device=self.device)
 
-            self._validation_datasets = validation_el_dataset.get_gci_datasets()
+            self._validation_datasets = self._validation_el_dataset.get_gci_datasets()
 
+        self._testing_el_dataset = None
         self._testing_datasets = None
         if self.dataset.testing:
-            testing_el_dataset = ELDataset(self.dataset.testing, self.class_index_dict,
-                                           self.object_property_index_dict,
-                                           extended=self._extended, device=self.device)
+            self._testing_el_dataset = ELDataset(self.dataset.testing, self.class_index_dict,
+                                                 self.object_property_index_dict,
+                                                 extended=self._extended, device=self.device)
 
-            self._testing_datasets = testing_el_dataset.get_gci_datasets()
+            self._testing_datasets = self._testing_el_dataset.get_gci_datasets()
 
         self._datasets_loaded = True
 
@@ -198,6 +214,93 @@ of :class:`torch.utils.data.DataLoader`
         self._load_dataloaders()
         return self._testing_dataloaders
 
+    def sampled_ranking_metric(self, data, metric="mrr", gci_name="gci2", num_candidates=100,
+                               seed=42):
+        """Computes a ranking metric of the given axioms against a fixed random subset of \
+candidate classes. Each axiom is corrupted by replacing its last element (the superclass or \
+filler) with every candidate and the rank of the true axiom among the corrupted ones is \
+recorded. The candidate subset is sampled once and reused across calls, so values are \
+comparable across epochs.
+
+        :param data: Tensor of GCIs to rank, as returned by the :class:`ELDataset \
+<mowl.datasets.el.ELDataset>` datasets.
+        :type data: :class:`torch.Tensor`
+        :param metric: Either ``"mrr"`` or ``"hits@k"`` for some integer ``k``. Defaults to \
+``"mrr"``.
+        :type metric: str, optional
+        :param gci_name: Name of the GCI type of ``data``. Defaults to ``"gci2"``.
+        :type gci_name: str, optional
+        :param num_candidates: Number of candidate classes to rank against. Defaults to 100.
+        :type num_candidates: int, optional
+        :param seed: Seed used to sample the candidate subset. Defaults to 42.
+        :type seed: int, optional
+        :rtype: float
+        """
+
+        if metric == "mrr":
+            k = None
+        elif metric.startswith("hits@") and metric[5:].isdigit():
+            k = int(metric[5:])
+        else:
+            raise ValueError("Parameter metric must be 'mrr' or 'hits@k'.")
+
+        num_classes = len(self.class_index_dict)
+        candidates = self._validation_candidates
+        if candidates is None or len(candidates) != min(num_candidates, num_classes):
+            generator = th.Generator().manual_seed(seed)
+            candidates = th.randperm(num_classes, generator=generator)[:num_candidates]
+            self._validation_candidates = candidates
+
+        candidates = candidates.to(self.device)
+        num_cands = len(candidates)
+        if len(data) == 0:
+            return 0.0
+
+        chunk_size = max(1, self.batch_size // (num_cands + 1))
+        all_ranks = []
+        with th.no_grad():
+            for start in range(0, len(data), chunk_size):
+                batch = data[start:start + chunk_size].to(self.device)
+                true_scores = self.module(batch, gci_name).reshape(-1, 1)
+
+                corrupted = batch.repeat_interleave(num_cands, dim=0)
+                corrupted[:, -1] = candidates.repeat(len(batch))
+                cand_scores = self.module(corrupted, gci_name).reshape(len(batch), num_cands)
+
+                better = (cand_scores < true_scores).sum(dim=1).float()
+                ties = (cand_scores == true_scores).sum(dim=1).float()
+                ranks = 1 + better + ties / 2
+                all_ranks.append(ranks)
+
+        ranks = th.cat(all_ranks)
+        if k is None:
+            return (1 / ranks).mean().item()
+        return (ranks <= k).float().mean().item()
+
+    @timed("validate")
+    def validate(self, metric="loss", gci_name="gci2", num_candidates=100):
+        """Computes a validation value on the validation set.
+
+        :param metric: ``"loss"`` returns the mean loss of the validation GCIs (lower is \
+better). ``"mrr"`` or ``"hits@k"`` return the corresponding \
+:meth:`sampled_ranking_metric` (higher is better). Defaults to ``"loss"``.
+        :type metric: str, optional
+        :param gci_name: GCI type used for validation. Defaults to ``"gci2"``.
+        :type gci_name: str, optional
+        :param num_candidates: Number of candidates for ranking metrics. Defaults to 100.
+        :type num_candidates: int, optional
+        :rtype: float
+        """
+        self.module.eval()
+        data = self.validation_datasets[gci_name][:]
+
+        if metric == "loss":
+            with th.no_grad():
+                return th.mean(self.module(data, gci_name)).detach().item()
+
+        return self.sampled_ranking_metric(data, metric=metric, gci_name=gci_name,
+                                           num_candidates=num_candidates)
+
     @versionadded(version="0.2.0")
     def score(self, axiom):
         """
@@ -297,90 +400,266 @@ of :class:`torch.utils.data.DataLoader`
         score = self.module(gci_data, gci_name)
         return score
 
+    def score_axioms(self, axioms, batch_size=None):
+        """
+        Returns the scores of a collection of axioms in :math:`\mathcal{EL}` normal form. The \
+axioms are classified in bulk by :meth:`mowl.ontology.normalize.ELNormalizer.normalize_as_arrays` \
+and every normal form is scored with batched forward passes, which is much faster than calling \
+:meth:`score` once per axiom.
+
+        :param axioms: The axioms to score.
+        :type axioms: list of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :param batch_size: Number of axioms per forward pass. If ``None``, the batch size of \
+the model is used. Defaults to ``None``.
+        :type batch_size: int, optional
+        :return: Scores aligned with the input axioms.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        if batch_size is None:
+            batch_size = self.batch_size
+        if not isinstance(batch_size, int):
+            raise TypeError("Optional parameter batch_size must be of type int.")
+
+        axioms = [axiom.getAxiomWithoutAnnotations() for axiom in axioms]
+        axiom_set = HashSet()
+        for axiom in axioms:
+            axiom_set.add(axiom)
+
+        adapter = OWLAPIAdapter()
+        ontology = adapter.owl_manager.createOntology(axiom_set)
+        try:
+            arrays, entities = ELNormalizer().normalize_as_arrays(ontology)
+        finally:
+            adapter.owl_manager.removeOntology(ontology)
+
+        indices = {"classes": self.class_index_dict,
+                   "object_properties": self.object_property_index_dict}
+        owl_entities = {"classes": [adapter.create_class(name) for name in entities["classes"]],
+                        "object_properties": [adapter.create_object_property(name) for name
+                                              in entities["object_properties"]]}
+
+        # Normalized axioms are matched to the input axioms by rebuilding them from their rows.
+        def rebuild(gci_name, row):
+            if gci_name.startswith("gci0"):
+                sub, super_ = row
+            elif gci_name.startswith("gci1"):
+                sub = adapter.create_object_intersection_of(row[0], row[1])
+                super_ = row[2]
+            elif gci_name == "gci2":
+                sub = row[0]
+                super_ = adapter.create_object_some_values_from(row[1], row[2])
+            else:
+                sub = adapter.create_object_some_values_from(row[0], row[1])
+                super_ = row[2]
+            return adapter.create_subclass_of(sub, super_)
+
+        scores_by_axiom = dict()
+        training = self.module.training
+        self.module.eval()
+        try:
+            with th.no_grad():
+                for gci_name, rows in arrays.items():
+                    if len(rows) == 0 or not gci_name.startswith("gci"):
+                        continue
+                    kinds = NORMAL_FORM_COLUMNS[gci_name]
+                    gci_data = th.tensor(np.stack(
+                        [np.array([indices[kind][name] for name in entities[kind]],
+                                  dtype=np.int64)[rows[:, column]]
+                         for column, kind in enumerate(kinds)], axis=1))
+
+                    module_gci_name = gci_name if self.extended else gci_name.replace("_bot", "")
+                    gci_scores = []
+                    for start in range(0, len(gci_data), batch_size):
+                        batch = gci_data[start:start + batch_size].to(self.device)
+                        gci_scores.append(self.module(batch, module_gci_name).reshape(-1).cpu())
+
+                    for row, score in zip(rows.tolist(), th.cat(gci_scores).tolist()):
+                        owl_row = [owl_entities[kind][i] for kind, i in zip(kinds, row)]
+                        scores_by_axiom[rebuild(gci_name, owl_row)] = score
+        finally:
+            self.module.train(training)
+
+        try:
+            return np.array([scores_by_axiom[axiom] for axiom in axioms], dtype=np.float32)
+        except KeyError as e:
+            raise TypeError(f"Axiom {e} is not in EL normal form.") from None
+
+    _gci_scoring_slots = {"gci0": ("classes", "classes"),
+                          "gci1": ("classes", "classes", "classes"),
+                          "gci2": ("classes", "object_properties", "classes"),
+                          "gci3": ("object_properties", "classes", "classes")}
+
+    @versionadded(version="1.0.2")
+    def get_axiom_scoring(self, gci_name):
+        """Returns an :class:`AxiomScoring <mowl.inference.axiom_scoring.AxiomScoring>` object \
+that scores the axioms of a normal form with the module of the model. The loss function of the \
+module for the normal form is passed as ``batch_method``, so the candidate axioms of a pattern \
+are scored in batches of index tensors.
+
+        :param gci_name: Name of the normal form. Choices are ``gci0``, ``gci1``, ``gci2`` and \
+``gci3``.
+        :type gci_name: str
+        :rtype: :class:`mowl.inference.el.GCI0Score`, :class:`mowl.inference.el.GCI1Score`, \
+:class:`mowl.inference.el.GCI2Score` or :class:`mowl.inference.el.GCI3Score`
+        """
+
+        if gci_name not in self._gci_scoring_slots:
+            raise ValueError(f"Parameter gci_name must be one of the following: "
+                             f"{', '.join(self._gci_scoring_slots)}.")
+
+        indices = {"classes": self.class_index_dict,
+                   "object_properties": self.object_property_index_dict}
+        class_list = list(indices["classes"])
+        property_list = list(indices["object_properties"])
+
+        # Positions in class_list and property_list are the ids of the module.
+        def batch_method(data):
+            return self.module(data.to(self.device), gci_name)
+
+        def method(point):
+            ids = [indices[kind][name] for kind, name
+                   in zip(self._gci_scoring_slots[gci_name], point)]
+            return batch_method(th.tensor([ids], dtype=th.long))
+
+        if gci_name == "gci0":
+            return GCI0Score(method, class_list, batch_method=batch_method)
+        if gci_name == "gci1":
+            return GCI1Score(method, class_list, batch_method=batch_method)
+        if gci_name == "gci2":
+            return GCI2Score(method, class_list, property_list, batch_method=batch_method)
+        return GCI3Score(method, class_list, property_list, batch_method=batch_method)
 
     @property
     def class_embeddings(self):
-        class_embeds = {
-            k: v for k, v in zip(self.class_index_dict.keys(),
-                                 self.module.class_embed.weight.cpu().detach().numpy())}
-        return class_embeds
+        """Class embeddings as an :class:`EmbeddingStore \
+<mowl.utils.embedding_store.EmbeddingStore>` backed by the class embedding matrix of the module.
+
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
+        """
+        return EmbeddingStore(self.class_index_dict,
+                              self.module.class_embed.weight.detach().cpu().numpy())
 
     @property
     def object_property_embeddings(self):
-        rel_embeds = {
-            k: v for k, v in zip(self.object_property_index_dict.keys(),
-                                 self.module.rel_embed.weight.cpu().detach().numpy())}
-        
-        return rel_embeds
-        
-    
+        """Object property embeddings as an :class:`EmbeddingStore \
+<mowl.utils.embedding_store.EmbeddingStore>`.
+
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
+        """
+        return EmbeddingStore(self.object_property_index_dict,
+                              self.module.rel_embed.weight.detach().cpu().numpy())
+
     @property
     def individual_embeddings(self):
+        """Individual embeddings as an :class:`EmbeddingStore \
+<mowl.utils.embedding_store.EmbeddingStore>`. The store is empty if the module does not \
+embed individuals.
+
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
+        """
         if self.module.ind_embed is None:
-            return dict()
-        
-        ind_embeds = {
-            k: v for k, v in zip(self.individual_index_dict.keys(),
-                                 self.module.ind_embed.weight.cpu().detach().numpy())}
-        
-        return ind_embeds
-        
+            return EmbeddingStore.from_dict(dict(), embedding_dim=self.embed_dim)
 
+        return EmbeddingStore(self.individual_index_dict,
+                              self.module.ind_embed.weight.detach().cpu().numpy())
 
-    def add_axioms(self, *axioms):
-        prev_class_embeds = None
-        prev_object_property_embeds = None
-        prev_individual_embeds = None
-        
-        if len(self.class_embeddings) > 0:
-            prev_class_embeds = copy.deepcopy(self.class_embeddings)
+    _class_tables = ("class_embed", "class_rad", "class_offset", "class_center", "bump_classes")
+    _object_property_tables = ("rel_embed", "head_center", "head_offset", "tail_center",
+                               "tail_offset")
+    _individual_tables = ("ind_embed", "ind_rad", "ind_offset", "ind_center", "bump_individuals")
 
-        if len(self.object_property_embeddings) > 0:
-            prev_object_property_embeds = copy.deepcopy(self.object_property_embeddings)
+    def _grow_embeddings(self, tables, prev_index, names):
+        """Resizes the embedding tables of the module to the entities in ``names``. Rows of \
+entities in ``prev_index`` are copied in a single indexing operation; rows of new entities are \
+initialized the same way the modules initialize them.
 
-        if len(self.individual_embeddings) > 0:
-            prev_individual_embeds = copy.deepcopy(self.individual_embeddings)
+        :return: Number of entities that were not present in ``prev_index``.
+        :rtype: int
+        """
+        old_rows = np.fromiter((prev_index.get(name, -1) for name in names), dtype=np.int64,
+                               count=len(names))
+        kept = old_rows >= 0
+        new_rows = th.from_numpy(np.nonzero(kept)[0])
+        old_rows = th.from_numpy(old_rows[kept])
+
+        for name in tables:
+            embedding = getattr(self.module, name, None)
+            if not isinstance(embedding, th.nn.Embedding):
+                continue
+
+            weight = embedding.weight
+            new_weight = th.empty((len(names), weight.shape[1]), dtype=weight.dtype,
+                                  device=weight.device)
+            th.nn.init.uniform_(new_weight, a=-1, b=1)
+            new_weight /= th.linalg.norm(new_weight, axis=1).reshape(-1, 1)
+            new_weight[new_rows.to(weight.device)] = weight.data[old_rows.to(weight.device)]
+
+            embedding.weight = th.nn.Parameter(new_weight, requires_grad=weight.requires_grad)
+            embedding.num_embeddings = len(names)
+
+        return len(names) - int(kept.sum())
+
+    @versionchanged(version="1.0.2", reason="Embedding tables are resized in place and all \
+the tables of the module (centers, offsets, radii) are updated. Loaded GCI datasets are \
+extended incrementally.")
+    def add_axioms(self, *axioms):
+        """Adds axioms to the training ontology and resizes the embedding tables of the module \
+to the new signature. Embeddings of existing entities are preserved and embeddings of new \
+entities are randomly initialized. If the GCI datasets are loaded, only the new axioms are \
+normalized and appended to them (see :meth:`mowl.datasets.el.ELDataset.add_axioms`).
+
+        .. note::
+            Entity indices follow the sorted order of the dataset, so the index of an existing \
+entity can change when new entities are added. Indices must be obtained again from \
+:attr:`class_index_dict` and related properties after calling this method.
+
+        :param axioms: Axioms to add.
+        :type axioms: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        """
+        prev_class_index = self.class_index_dict
+        prev_object_property_index = self.object_property_index_dict
+        prev_individual_index = self.individual_index_dict
 
         self.dataset.add_axioms(*axioms)
 
-        if prev_class_embeds is not None:
-            new_class_embeds = []
-            for cls in self.dataset.classes:
-                cls = str(cls.toStringID())
-                if cls in prev_class_embeds:
-                    new_class_embeds.append(prev_class_embeds[cls])
-                else:
-                    new_class_embeds.append(np.random.normal(size=self.embed_dim))
-            
+        classes = self.dataset.classes.as_str
+        object_properties = self.dataset.object_properties.as_str
+        individuals = self.dataset.individuals.as_str
 
-            new_class_embeds = np.asarray(new_class_embeds)
-            self.module.class_embed.weight.data = th.from_numpy(new_class_embeds).float()
+        new_classes = self._grow_embeddings(self._class_tables, prev_class_index, classes)
+        new_object_properties = self._grow_embeddings(self._object_property_tables,
+                                                      prev_object_property_index,
+                                                      object_properties)
+        new_individuals = 0
+        if len(prev_individual_index) > 0:
+            new_individuals = self._grow_embeddings(self._individual_tables,
+                                                    prev_individual_index, individuals)
 
-        if prev_object_property_embeds is not None:
-            new_object_property_embeds = []
-            for rel in self.dataset.object_properties:
-                rel = str(rel.toStringID())
-                if rel in prev_object_property_embeds:
-                    new_object_property_embeds.append(prev_object_property_embeds[rel])
-                else:
-                    new_object_property_embeds.append(np.random.normal(size=self.embed_dim))
-            
-            new_object_property_embeds = np.asarray(new_object_property_embeds)
-            self.module.rel_embed.weight.data = th.from_numpy(new_object_property_embeds).float()
-
-        if prev_individual_embeds is not None:
-            new_individual_embeds = []
-            for ind in self.dataset.individuals:
-                ind = str(ind.toStringID())
-                if ind in prev_individual_embeds:
-                    new_individual_embeds.append(prev_individual_embeds[ind])
-                else:
-                    new_individual_embeds.append(np.random.normal(size=self.embed_dim))
-            
-            new_individual_embeds = np.asarray(new_individual_embeds)
-            self.module.ind_embed.weight.data = th.from_numpy(new_individual_embeds).float()
+        self.module.nb_ont_classes = len(classes)
+        self.module.nb_rels = len(object_properties)
+        if len(prev_individual_index) > 0:
+            self.module.nb_inds = len(individuals)
 
-            
+        logger.info(f"Added {new_classes} classes, {new_object_properties} object properties "
+                    f"and {new_individuals} individuals to the embedding tables.")
+
+        if self._datasets_loaded:
+            class_index_dict = self.class_index_dict
+            object_property_index_dict = self.object_property_index_dict
+            self._training_el_dataset.add_axioms(
+                *axioms, class_index_dict=class_index_dict,
+                object_property_index_dict=object_property_index_dict)
+            self._training_datasets = self._training_el_dataset.get_gci_datasets()
+
+            if self._validation_el_dataset is not None:
+                self._validation_el_dataset.reindex(class_index_dict, object_property_index_dict)
+            if self._testing_el_dataset is not None:
+                self._testing_el_dataset.reindex(class_index_dict, object_property_index_dict)
+
+        self._dataloaders_loaded = False
+        self._loaded_eval = False
+        self._validation_candidates = None
 
     def from_pretrained(self, model):
         if not isinstance(model, str):
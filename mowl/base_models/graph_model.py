@@ -2,7 +2,10 @@ from mowl.base_models.model import Model
 from mowl.projection.base import ProjectionModel
 from mowl.projection import Edge
 from mowl.walking import WalkingModel
+from mowl.owlapi import OWLAPIAdapter
 import mowl.error.messages as msg
+from java.util import HashSet
+import uuid
 import logging
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler()
@@ -46,6 +49,60 @@ class GraphModel(Model):
         self._graph_node_to_id = {node: i for i, node in enumerate(nodes)}
         self._graph_relation_to_id = {relation: i for i, relation in enumerate(relations)}
         
+    def _project_axioms(self, axioms):
+        """Projects a collection of axioms that is not part of any dataset ontology.
+
+        :param axioms: Axioms to project.
+        :type axioms: list of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :rtype: list of :class:`mowl.projection.edge.Edge`
+        """
+        adapter = OWLAPIAdapter()
+        ontology = adapter.create_ontology(f"http://mowl.borg/projection/{uuid.uuid4()}")
+        adapter.owl_manager.addAxioms(ontology, HashSet(list(axioms)))
+        try:
+            return self.projector.project(ontology)
+        finally:
+            adapter.owl_manager.removeOntology(ontology)
+
+    def _extend_graph(self, axioms):
+        """Projects only ``axioms`` and appends the resulting edges to the graph. Nodes and \
+relations that are not in the graph yet get ids after the existing ones, so previously \
+assigned ids do not change. The axioms are expected to be already in the dataset.
+
+        :param axioms: Newly added axioms.
+        :type axioms: list of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :return: The edges generated from ``axioms``.
+        :rtype: list of :class:`mowl.projection.edge.Edge`
+        """
+        if self.projector is None:
+            raise ValueError(msg.GRAPH_MODEL_PROJECTOR_NOT_SET)
+
+        if self._edges is None:
+            self._load_edges()
+            return self._edges
+
+        new_edges = self._project_axioms(axioms)
+        self._edges.extend(new_edges)
+
+        nodes, relations = Edge.get_entities_and_relations(new_edges)
+        nodes = set(nodes)
+        for axiom in axioms:
+            nodes |= {str(cls.toStringID()) for cls in axiom.getClassesInSignature()}
+
+        node_to_id = dict(self._graph_node_to_id)
+        for node in sorted(nodes):
+            if node not in node_to_id:
+                node_to_id[node] = len(node_to_id)
+
+        relation_to_id = dict(self._graph_relation_to_id)
+        for relation in relations:
+            if relation not in relation_to_id:
+                relation_to_id[relation] = len(relation_to_id)
+
+        self._graph_node_to_id = node_to_id
+        self._graph_relation_to_id = relation_to_id
+        return new_edges
+
     @property
     def edges(self):
         """
@@ -105,9 +105,9 @@ class Model():
     @property
     def class_embeddings(self):
         """
-        Returns a dictionary with class names as keys and class embeddings as values.
+        Returns a mapping with class names as keys and class embeddings as values.
         
-        :rtype: dict
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
         """
         raise NotImplementedError()
 
@@ -115,9 +115,9 @@ class Model():
     @property
     def object_property_embeddings(self):
         """
-        Returns a dictionary with object property names as keys and object property embeddings as values.
+        Returns a mapping with object property names as keys and object property embeddings as values.
 
-        :rtype: dict
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
         """
         raise NotImplementedError()
 
@@ -125,9 +125,9 @@ class Model():
     @property
     def individual_embeddings(self):
         """
-        Returns a dictionary with individual names as keys and individual embeddings as values.
+        Returns a mapping with individual names as keys and individual embeddings as values.
 
-        :rtype: dict
+        :rtype: :class:`mowl.utils.embedding_store.EmbeddingStore`
         """
         raise NotImplementedError()
 
@@ -1,9 +1,11 @@
 from mowl.base_models.model import Model
 import mowl.error.messages as msg
-from mowl.corpus import extract_annotation_corpus, extract_and_save_annotation_corpus, extract_axiom_corpus, extract_and_save_axiom_corpus
+from mowl.corpus import extract_annotation_corpus, extract_and_save_annotation_corpus, extract_axiom_corpus, extract_and_save_axiom_corpus, \
+    iter_axiom_corpus, iter_annotation_corpus, CorpusStream
+from itertools import chain
 import tempfile
 
-from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionadded, versionchanged
 
 
 import logging
@@ -29,6 +31,8 @@ class SyntacticModel(Model):
         self._corpus = None
         self._save_corpus = True
         self._with_annotations = False
+        self._stream_corpus = False
+        self._corpus_workers = 1
 
     @property
     def corpus_filepath(self):
@@ -54,24 +58,39 @@ class SyntacticModel(Model):
     
         return self._corpus
 
-    def generate_corpus(self, save = True, with_annotations=False):
+    @versionchanged(version="1.0.2", reason="Added the ``stream`` and ``workers`` parameters.")
+    def generate_corpus(self, save = True, with_annotations=False, stream=False, workers=1):
         """Generates the corpus of the training ontology. It uses the Manchester OWL Syntax.
         
         :param save: if True, the corpus is saved into the model filepath, otherwise, the corpus is returned as a list of sentences. Default is True.
         :type save: bool, optional
         :param with_annotations: if True, the corpus is generated with the annotations, otherwise, the corpus is generated only with the axioms. Default is False.
         :type with_annotations: bool, optional
+        :param stream: if True, no corpus is extracted now. Instead, the corpus is rendered from the ontology every time :attr:`corpus_stream` is iterated, so it is never materialized in memory or on disk. Default is False.
+        :type stream: bool, optional
+        :param workers: number of threads rendering axioms. Default is 1.
+        :type workers: int, optional
         """
+        if not isinstance(workers, int):
+            raise TypeError("Optional parameter 'workers' must be of type int.")
+
+        self._stream_corpus = stream
+        self._corpus_workers = workers
+        if stream:
+            self._save_corpus = save
+            self._with_annotations = with_annotations
+            return self.corpus_stream
+
         if save:
             extract_and_save_axiom_corpus(self.dataset.ontology,
                                                self.corpus_filepath,
-                                               mode="w")
+                                               mode="w", workers=workers)
             if with_annotations:
                 extract_and_save_annotation_corpus(self.dataset.ontology,
                                                    self.corpus_filepath,
                                                    mode="a")
         else:
-            corpus = extract_axiom_corpus(self.dataset.ontology)
+            corpus = extract_axiom_corpus(self.dataset.ontology, workers=workers)
             if with_annotations:
                 corpus += extract_annotation_corpus(self.dataset.ontology)
 
@@ -83,6 +102,25 @@ class SyntacticModel(Model):
         self._save_corpus = save
         self._with_annotations = with_annotations
 
+    @property
+    @versionadded(version="1.0.2")
+    def corpus_stream(self):
+        """Restartable iterable over the tokenized sentences of the corpus. Sentences are \
+rendered from the current training ontology on every iteration.
+
+        :rtype: :class:`mowl.corpus.CorpusStream`
+        """
+        ontology = self.dataset.ontology
+        workers = self._corpus_workers
+        with_annotations = self._with_annotations
+
+        def corpus_fn():
+            sentences = iter_axiom_corpus(ontology, workers=workers)
+            if with_annotations:
+                sentences = chain(sentences, iter_annotation_corpus(ontology))
+            return sentences
+
+        return CorpusStream(corpus_fn)
 
     @versionadded(version="0.4.0")
     def load_corpus(self):
@@ -1,2 +1,18 @@
-from .base import extract_and_save_annotation_corpus, extract_and_save_axiom_corpus, \
-    extract_annotation_corpus, extract_axiom_corpus
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "extract_and_save_annotation_corpus": ".base",
+    "extract_and_save_axiom_corpus": ".base",
+    "extract_annotation_corpus": ".base",
+    "extract_axiom_corpus": ".base",
+    "iter_axiom_blocks": ".base",
+    "iter_axiom_corpus": ".base",
+    "iter_annotation_corpus": ".base",
+    "save_corpus": ".base",
+    "merge_corpus_files": ".base",
+    "CorpusStream": ".base",
+    "TokenCorpus": ".tokens",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
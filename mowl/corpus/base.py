@@ -3,23 +3,285 @@ from org.semanticweb.owlapi.manchestersyntax.renderer import \
     ManchesterOWLSyntaxOWLObjectRendererImpl
 from org.semanticweb.owlapi.model import OWLLiteral, OWLOntology
 from org.semanticweb.owlapi.search import EntitySearcher
-from deprecated.sphinx import deprecated
-
-from jpype.types import JString
+from deprecated.sphinx import deprecated, versionadded, versionchanged
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+import gzip
+import os
+import shutil
+import threading
 
 from org.mowl import MOWLShortFormProvider
+from java.util import Arrays
+try:
+    from org.mowl.Corpus import AxiomRenderer
+except ImportError:
+    # gateway.jar built before the renderer was added; axioms are rendered one by one.
+    AxiomRenderer = None
 import logging
 
+# Characters removed from rendered axioms. Equivalent to the Java regular expression
+# "[\\r\\n|\\r|\\n()|<|>]" used before, applied in Python to a whole block at once.
+_RENDER_STRIP = str.maketrans("", "", "\r\n|()<>")
+
+_thread_state = threading.local()
+
+
+def _get_renderer():
+    """Returns the Manchester syntax renderer of the current thread. Renderers keep internal \
+state while rendering, so they cannot be shared between threads."""
+    renderer = getattr(_thread_state, "renderer", None)
+    if renderer is None:
+        renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
+        renderer.setShortFormProvider(MOWLShortFormProvider())
+        _thread_state.renderer = renderer
+    return renderer
+
+
+def _render_block(axioms):
+    if AxiomRenderer is not None:
+        return [str(sentence) for sentence in AxiomRenderer.renderBlock(axioms)]
+
+    renderer = _get_renderer()
+    return [str(renderer.render(axiom)).translate(_RENDER_STRIP) for axiom in axioms]
+
+
+def _check_block_params(block_size, workers):
+    if not isinstance(block_size, int):
+        raise TypeError("Optional parameter block_size must be of type int.")
+    if not isinstance(workers, int):
+        raise TypeError("Optional parameter workers must be of type int.")
+    if block_size < 1:
+        raise ValueError("Optional parameter block_size must be positive.")
+    if workers < 1:
+        raise ValueError("Optional parameter workers must be positive.")
+
+
+def _open_corpus_file(out_file, mode):
+    """Opens a corpus file for writing. Files ending in ``.gz`` are gzip-compressed."""
+    if out_file.endswith(".gz"):
+        return gzip.open(out_file, f"{mode}t", encoding="utf-8")
+    return open(out_file, mode, encoding="utf-8")
+
+
+@versionadded(version="1.0.2")
+def iter_axiom_blocks(ontology, block_size=10000, workers=1):
+    """Renders the axioms of an ontology in Manchester syntax and yields them in blocks. \
+Blocks are rendered concurrently by ``workers`` threads, each with its own renderer. Every \
+block is rendered with a single call to ``org.mowl.Corpus.AxiomRenderer``, during which JPype \
+releases the GIL, so threads render in parallel. Blocks are yielded in the \
+order of the axioms of the ontology and at most ``2 * workers`` blocks are kept in memory.
+
+    :param ontology: Input ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :param block_size: Number of axioms rendered per block. Defaults to ``10000``.
+    :type block_size: int, optional
+    :param workers: Number of rendering threads. Defaults to ``1``.
+    :type workers: int, optional
+    :rtype: generator of list[str]
+    """
+
+    if not isinstance(ontology, OWLOntology):
+        raise TypeError(
+            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+    _check_block_params(block_size, workers)
+
+    axioms = ontology.getAxioms().toArray()
+    num_axioms = len(axioms)
+    # Slices of Java arrays are views that JPype passes to Java as the whole array, so blocks
+    # are copied.
+    blocks = (Arrays.copyOfRange(axioms, start, min(start + block_size, num_axioms))
+              for start in range(0, num_axioms, block_size))
+
+    if workers == 1:
+        for block in blocks:
+            yield _render_block(block)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(_render_block, block)
+                        for block in islice(blocks, 2 * workers))
+        while pending:
+            rendered = pending.popleft().result()
+            for block in islice(blocks, 1):
+                pending.append(executor.submit(_render_block, block))
+            yield rendered
+
+
+@versionadded(version="1.0.2")
+def iter_axiom_corpus(ontology, block_size=10000, workers=1):
+    """Generator version of :func:`extract_axiom_corpus`. Axioms are rendered in blocks by \
+:func:`iter_axiom_blocks` and yielded one sentence at a time, so the corpus is never fully \
+materialized.
+
+    :param ontology: Input ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :param block_size: Number of axioms rendered per block. Defaults to ``10000``.
+    :type block_size: int, optional
+    :param workers: Number of rendering threads. Defaults to ``1``.
+    :type workers: int, optional
+    :rtype: generator of str
+    """
+    for block in iter_axiom_blocks(ontology, block_size=block_size, workers=workers):
+        yield from block
+
+
+@versionadded(version="1.0.2")
+def iter_annotation_corpus(ontology):
+    """Generator version of :func:`extract_and_save_annotation_corpus`. Yields one sentence per \
+literal annotation of the classes and individuals of the ontology.
+
+    :param ontology: Input ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :rtype: generator of str
+    """
+
+    if not isinstance(ontology, OWLOntology):
+        raise TypeError(
+            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+
+    for owl_class in ontology.getClassesInSignature():
+        cls = str(owl_class)
+        yield from _annotation_sentences(cls, owl_class, ontology)
+
+    for owl_individual in ontology.getIndividualsInSignature():
+        ind = str(owl_individual.toStringID())
+        yield from _annotation_sentences(ind, owl_individual, ontology)
+
+
+def _annotation_sentences(name, entity, ontology):
+    annotations = EntitySearcher.getAnnotations(entity, ontology)
+    for annotation in annotations:
+        if isinstance(annotation.getValue(), OWLLiteral):
+            obj_property = str(annotation.getProperty()).replace("\n", " ")
+            # could filter on property
+            value = str(annotation.getValue().getLiteral()).replace("\n", " ")
+            yield f'{name} {obj_property} {value}'
+
+
+@versionadded(version="1.0.2")
+def save_corpus(sentences, out_file, mode="w", shard_size=None):
+    """Writes a stream of sentences to a corpus file, one sentence per line. Files ending in \
+``.gz`` are gzip-compressed. If ``shard_size`` is given, the corpus is split into files of at \
+most ``shard_size`` sentences named by inserting the shard number before the extension of \
+``out_file``, i.e., ``corpus.txt.gz`` becomes ``corpus-00000.txt.gz``, ``corpus-00001.txt.gz``, \
+etc.
+
+    :param sentences: Sentences to write.
+    :type sentences: iterable of str
+    :param out_file: File path to save the corpus.
+    :type out_file: str
+    :param mode: mode for opening the `out_file`, defaults to `"w"`. Sharded corpora are always \
+written from scratch.
+    :type mode: str, optional
+    :param shard_size: Maximum number of sentences per file. Defaults to ``None`` (one file).
+    :type shard_size: int, optional
+    :return: Paths of the written files.
+    :rtype: list[str]
+    """
+
+    if not isinstance(out_file, str):
+        raise TypeError("Parameter out_file must be of type str")
+    if not isinstance(mode, str):
+        raise TypeError("Optional parameter mode must be of type str")
+    if shard_size is not None and not isinstance(shard_size, int):
+        raise TypeError("Optional parameter shard_size must be of type int.")
+
+    if mode not in ["w", "a"]:
+        raise ValueError("Parameter mode must be a file reading mode. Options are 'a' or 'w'")
+
+    if shard_size is None:
+        with _open_corpus_file(out_file, mode) as f:
+            for sentence in sentences:
+                f.write(f'{sentence}\n')
+        return [out_file]
+
+    if shard_size < 1:
+        raise ValueError("Optional parameter shard_size must be positive.")
+
+    root, ext = os.path.splitext(out_file[:-3] if out_file.endswith(".gz") else out_file)
+    ext += ".gz" if out_file.endswith(".gz") else ""
+
+    sentences = iter(sentences)
+    paths = []
+    while True:
+        shard = list(islice(sentences, shard_size))
+        if not shard and paths:
+            break
+        path = f"{root}-{len(paths):05d}{ext}"
+        with _open_corpus_file(path, "w") as f:
+            f.write("".join(f'{sentence}\n' for sentence in shard))
+        paths.append(path)
+        if len(shard) < shard_size:
+            break
+    return paths
+
+
+@versionadded(version="1.0.2")
+def merge_corpus_files(paths, out_file):
+    """Concatenates corpus files, for example the shards written by :func:`save_corpus`, into \
+a single uncompressed file. Compressed inputs (``.gz``) are decompressed. The output can be \
+passed as ``corpus_file`` to :class:`gensim.models.word2vec.Word2Vec`, which requires an \
+uncompressed file to split it by byte offsets among its workers.
+
+    :param paths: Paths of the corpus files.
+    :type paths: list of str
+    :param out_file: Path of the merged file.
+    :type out_file: str
+    :rtype: str
+    """
+
+    if not isinstance(paths, (list, tuple)):
+        raise TypeError("Parameter paths must be of type list.")
+    if not isinstance(out_file, str):
+        raise TypeError("Parameter out_file must be of type str")
+
+    with open(out_file, "wb") as out:
+        for path in paths:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rb") as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+    return out_file
+
+
+@versionadded(version="1.0.2")
+class CorpusStream():
+    """Restartable iterable over a corpus generated on demand. Every iteration calls \
+``corpus_fn`` again and yields the sentences split into tokens. This is the format expected by \
+:class:`gensim.models.word2vec.Word2Vec`, which iterates the corpus once to build the vocabulary \
+and once per training epoch.
+
+    :param corpus_fn: Function without arguments that returns an iterable of sentences.
+    :type corpus_fn: callable
+    """
 
-def extract_and_save_axiom_corpus(ontology, out_file, mode="w"):
+    def __init__(self, corpus_fn):
+        if not callable(corpus_fn):
+            raise TypeError("Parameter corpus_fn must be callable.")
+        self.corpus_fn = corpus_fn
+
+    def __iter__(self):
+        for sentence in self.corpus_fn():
+            yield sentence.split()
+
+
+@versionchanged(version="1.0.2", reason="Axioms are rendered in blocks, optionally by \
+several threads, and files ending in ``.gz`` are gzip-compressed.")
+def extract_and_save_axiom_corpus(ontology, out_file, mode="w", block_size=10000, workers=1):
     """Method to extract axioms of a particular ontology and save it into a file.
 
     :param ontology: Input ontology.
     :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
-    :param out_file: File path to save the extracted axioms.
+    :param out_file: File path to save the extracted axioms. If it ends in ``.gz``, the file is \
+gzip-compressed.
     :type out_file: str
     :param mode: mode for opening the `out_file`, defaults to `"w"`
     :type mode: str, optional
+    :param block_size: Number of axioms rendered and written at once. Defaults to ``10000``.
+    :type block_size: int, optional
+    :param workers: Number of rendering threads. Defaults to ``1``.
+    :type workers: int, optional
     """
 
     if not isinstance(ontology, OWLOntology):
@@ -34,23 +296,25 @@ def extract_and_save_axiom_corpus(ontology, out_file, mode="w"):
         raise ValueError("Parameter mode must be a file reading mode. Options are 'a' or 'w'")
 
     logging.info("Generating axioms corpus")
-    renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
-    shortFormProvider = MOWLShortFormProvider()
-    renderer.setShortFormProvider(shortFormProvider)
-    with open(out_file, mode) as f:
-        axioms = ontology.getAxioms()
-        for axiom in axioms:
-            rax = renderer.render(axiom)
-            rax = rax.replaceAll(JString("[\\r\\n|\\r|\\n()|<|>]"), JString(""))
-            f.write(f'{rax}\n')
-
-
-def extract_axiom_corpus(ontology):
+    with _open_corpus_file(out_file, mode) as f:
+        for block in iter_axiom_blocks(ontology, block_size=block_size, workers=workers):
+            if block:
+                f.write("\n".join(block) + "\n")
+
+
+@versionchanged(version="1.0.2", reason="Axioms are rendered in blocks, optionally by \
+several threads. Sentences are returned as Python strings.")
+def extract_axiom_corpus(ontology, block_size=10000, workers=1):
     """Method to extract axioms of a particular ontology. Similar to \
-:func:`extract_and_save_axiom_corpus` but this method returns a list instead saving into a file.
+:func:`extract_and_save_axiom_corpus` but this method returns a list instead saving into a file. \
+Use :func:`iter_axiom_corpus` to avoid holding the whole corpus in memory.
 
     :param ontology: Input ontology.
     :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :param block_size: Number of axioms rendered at once. Defaults to ``10000``.
+    :type block_size: int, optional
+    :param workers: Number of rendering threads. Defaults to ``1``.
+    :type workers: int, optional
     :rtype: list[str]
     """
 
@@ -59,27 +323,18 @@ def extract_axiom_corpus(ontology):
             "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
 
     logging.info("Generating axioms corpus")
-    renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
-    shortFormProvider = MOWLShortFormProvider()
-    renderer.setShortFormProvider(shortFormProvider)
-
-    corpus = []
-
-    axioms = ontology.getAxioms()
-    for axiom in axioms:
-        rax = renderer.render(axiom)
-        rax = rax.replaceAll(JString("[\\r\\n|\\r|\\n()|<|>]"), JString(""))
-        corpus.append(rax)
-    return corpus
+    return list(iter_axiom_corpus(ontology, block_size=block_size, workers=workers))
 
 
+@versionchanged(version="1.0.2", reason="Files ending in ``.gz`` are gzip-compressed.")
 def extract_and_save_annotation_corpus(ontology, out_file, mode="w"):
     """This method generates a textual representation of the annotation axioms in an ontology \
 following the Manchester Syntax.
 
     :param ontology: OWL ontology from which the annotations will be extracted.
     :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
-    :param out_file: File path to save the extracted annotations.
+    :param out_file: File path to save the extracted annotations. If it ends in ``.gz``, the \
+file is gzip-compressed.
     :type out_file: str
     :param mode: mode for opening the `out_file`, defaults to `"w"`
     :type mode: str ,optional
@@ -97,28 +352,9 @@ following the Manchester Syntax.
         raise ValueError("Parameter mode must be a file reading mode. Options are 'a' or 'w'")
 
     logging.info("Generating annotation corpus")
-    with open(out_file, mode) as f:
-        for owl_class in ontology.getClassesInSignature():
-            cls = str(owl_class)
-
-            annotations = EntitySearcher.getAnnotations(owl_class, ontology)
-            for annotation in annotations:
-                if isinstance(annotation.getValue(), OWLLiteral):
-                    obj_property = str(annotation.getProperty()).replace("\n", " ")
-                    # could filter on property
-                    value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                    f.write(f'{cls} {obj_property} {value}\n')
-
-        for owl_individual in ontology.getIndividualsInSignature():
-            ind = str(owl_individual.toStringID())
-
-            annotations = EntitySearcher.getAnnotations(owl_individual, ontology)
-            for annotation in annotations:
-                if isinstance(annotation.getValue(), OWLLiteral):
-                    obj_property = str(annotation.getProperty()).replace("\n", " ")
-                    # could filter on property
-                    value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                    f.write(f'{ind} {obj_property} {value}\n')
+    with _open_corpus_file(out_file, mode) as f:
+        for sentence in iter_annotation_corpus(ontology):
+            f.write(f'{sentence}\n')
 
 
 def extract_annotation_corpus(ontology):
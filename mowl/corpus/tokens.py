@@ -0,0 +1,210 @@
+from array import array
+import gzip
+import os
+
+import numpy as np
+from deprecated.sphinx import versionadded
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+# Same limit as :class:`gensim.models.word2vec.LineSentence`: longer sentences are split.
+MAX_SENTENCE_LENGTH = 10000
+
+
+@versionadded(version="1.0.2")
+class TokenCorpus():
+    """Tokenized corpus stored as a flat array of ``int32`` token ids and an array of sentence \
+offsets. The corpus is parsed once; afterwards it can be iterated any number of times without \
+parsing text again, which is what :class:`gensim.models.word2vec.Word2Vec` does once to build \
+the vocabulary and once per epoch. Token counts are available without iterating the corpus, so \
+the Word2Vec vocabulary can be built from them directly (see :meth:`build_vocab`).
+
+    :param tokens: Token ids of all the sentences, one after another.
+    :type tokens: :class:`numpy.ndarray`
+    :param offsets: Array of length ``len(self) + 1`` with the position in ``tokens`` where each \
+sentence starts. The last element is ``len(tokens)``.
+    :type offsets: :class:`numpy.ndarray`
+    :param words: Word of every token id.
+    :type words: list of str
+    :param block_size: Number of sentences decoded at once while iterating. Defaults to ``4096``.
+    :type block_size: int, optional
+    """
+
+    def __init__(self, tokens, offsets, words, block_size=4096):
+        if not isinstance(words, list):
+            raise TypeError("Parameter words must be of type list.")
+        if not isinstance(block_size, int):
+            raise TypeError("Optional parameter block_size must be of type int.")
+
+        self.tokens = tokens
+        self.offsets = offsets
+        self.words = words
+        self.block_size = block_size
+        self._word_array = np.array(words, dtype=object)
+        self._counts = None
+
+    @classmethod
+    def from_sentences(cls, sentences, **kwargs):
+        """Builds a corpus from sentences.
+
+        :param sentences: Sentences either as strings, which are split on whitespace, or as \
+lists of words.
+        :type sentences: iterable of str or iterable of list of str
+        :rtype: :class:`TokenCorpus`
+        """
+        index = dict()
+        tokens = array("i")
+        offsets = array("q", [0])
+
+        for sentence in sentences:
+            if isinstance(sentence, str):
+                sentence = sentence.split()
+            # Empty sentences are kept so that sentences keep their positions.
+            for start in range(0, max(len(sentence), 1), MAX_SENTENCE_LENGTH):
+                chunk = sentence[start:start + MAX_SENTENCE_LENGTH]
+                tokens.extend([index.setdefault(word, len(index)) for word in chunk])
+                offsets.append(len(tokens))
+
+        tokens = np.frombuffer(tokens, dtype=np.int32) if len(tokens) else np.zeros(0, np.int32)
+        offsets = np.frombuffer(offsets, dtype=np.int64)
+        return cls(tokens, offsets, list(index), **kwargs)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Parses a text corpus with one sentence per line, such as the walks written by \
+:class:`mowl.walking.WalkingModel` or the corpus of :class:`mowl.base_models.SyntacticModel`. \
+Files ending in ``.gz`` are read as gzip-compressed.
+
+        :param path: Path of the corpus file.
+        :type path: str
+        :rtype: :class:`TokenCorpus`
+        """
+        if not isinstance(path, str):
+            raise TypeError("Parameter path must be of type str.")
+
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            corpus = cls.from_sentences(f, **kwargs)
+        logger.debug(f"Parsed {len(corpus)} sentences and {corpus.num_words} words from {path}")
+        return corpus
+
+    @classmethod
+    def from_files(cls, paths, **kwargs):
+        """Parses several text corpus files, such as the shards written by \
+:func:`mowl.corpus.save_corpus` or by a sharded :class:`mowl.walking.WalkingModel`, into a \
+single corpus. Sentences keep the order of ``paths``.
+
+        :param paths: Paths of the corpus files.
+        :type paths: list of str
+        :rtype: :class:`TokenCorpus`
+        """
+        if not isinstance(paths, (list, tuple)):
+            raise TypeError("Parameter paths must be of type list.")
+
+        def sentences():
+            for path in paths:
+                opener = gzip.open if path.endswith(".gz") else open
+                with opener(path, "rt", encoding="utf-8") as f:
+                    yield from f
+
+        corpus = cls.from_sentences(sentences(), **kwargs)
+        logger.debug(f"Parsed {len(corpus)} sentences and {corpus.num_words} words from "
+                     f"{len(paths)} files")
+        return corpus
+
+    def save(self, prefix):
+        """Saves the corpus as ``{prefix}.tokens.npy``, ``{prefix}.offsets.npy`` and \
+``{prefix}.vocab.txt``.
+
+        :param prefix: Path prefix of the files.
+        :type prefix: str
+        """
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.save(f"{prefix}.tokens.npy", self.tokens)
+        np.save(f"{prefix}.offsets.npy", self.offsets)
+        with open(f"{prefix}.vocab.txt", "w", encoding="utf-8") as f:
+            f.write("".join(f"{word}\n" for word in self.words))
+
+    @classmethod
+    def load(cls, prefix, mmap=True, **kwargs):
+        """Loads a corpus saved with :meth:`save`.
+
+        :param prefix: Path prefix of the files.
+        :type prefix: str
+        :param mmap: If ``True``, the token and offset arrays are memory-mapped instead of read \
+into memory. Defaults to ``True``.
+        :type mmap: bool, optional
+        :rtype: :class:`TokenCorpus`
+        """
+        mmap_mode = "r" if mmap else None
+        tokens = np.load(f"{prefix}.tokens.npy", mmap_mode=mmap_mode)
+        offsets = np.load(f"{prefix}.offsets.npy", mmap_mode=mmap_mode)
+        with open(f"{prefix}.vocab.txt", "r", encoding="utf-8") as f:
+            words = f.read().splitlines()
+        return cls(tokens, offsets, words, **kwargs)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_words(self):
+        """Total number of tokens in the corpus.
+
+        :rtype: int
+        """
+        return int(self.offsets[-1])
+
+    @property
+    def counts(self):
+        """Number of occurrences of every word, computed once with :func:`numpy.bincount` \
+over the token array.
+
+        :rtype: dict of str to int
+        """
+        if self._counts is None:
+            counts = np.bincount(self.tokens, minlength=len(self.words))
+            self._counts = dict(zip(self.words, counts.tolist()))
+        return self._counts
+
+    def __iter__(self):
+        num_sentences = len(self)
+        for block_start in range(0, num_sentences, self.block_size):
+            block_end = min(block_start + self.block_size, num_sentences)
+            offsets = self.offsets[block_start:block_end + 1]
+            first = int(offsets[0])
+            words = self._word_array[self.tokens[first:int(offsets[-1])]].tolist()
+            bounds = (offsets - first).tolist()
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                yield words[start:end]
+
+    def build_vocab(self, w2v_model, update=False):
+        """Builds the vocabulary of a Word2Vec model from the token counts of the corpus, \
+without iterating over the sentences.
+
+        :param w2v_model: Word2Vec model.
+        :type w2v_model: :class:`gensim.models.word2vec.Word2Vec`
+        :param update: If ``True``, new words are added to an existing vocabulary. Defaults to \
+``False``.
+        :type update: bool, optional
+        """
+        w2v_model.build_vocab_from_freq(self.counts, corpus_count=len(self), update=update)
+        w2v_model.corpus_total_words = self.num_words
+
+    def to_corpus_file(self, path):
+        """Writes the corpus as text with one sentence per line and words separated by a \
+space, the format expected by the ``corpus_file`` argument of \
+:class:`gensim.models.word2vec.Word2Vec`.
+
+        :param path: Path of the output file.
+        :type path: str
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for sentence in self:
+                f.write(" ".join(sentence))
+                f.write("\n")
@@ -1,7 +1,16 @@
-import mowl
-import jpype
+from mowl.utils.lazy import lazy_exports
 
-from mowl.datasets.base import Dataset, PathDataset, RemoteDataset, TarFileDataset, OWLClasses, \
-    OWLIndividuals, OWLObjectProperties
-from mowl.datasets.el import ELDataset
-from mowl.datasets.alc import ALCDataset
+_EXPORTS = {
+    "Dataset": "mowl.datasets.base",
+    "PathDataset": "mowl.datasets.base",
+    "RemoteDataset": "mowl.datasets.base",
+    "TarFileDataset": "mowl.datasets.base",
+    "OWLClasses": "mowl.datasets.base",
+    "OWLIndividuals": "mowl.datasets.base",
+    "OWLObjectProperties": "mowl.datasets.base",
+    "ELDataset": "mowl.datasets.el",
+    "ALCDataset": "mowl.datasets.alc",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,3 +1,8 @@
-from .alc_dataset import ALCDataset
+from mowl.utils.lazy import lazy_exports
 
-__all__ = ["ALCDataset", ]
+_EXPORTS = {
+    "ALCDataset": ".alc_dataset",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -6,21 +6,24 @@ import tarfile
 import pathlib
 import os
 
-from jpype import java
 import requests
 
 # OWLAPI imports
 from org.semanticweb.owlapi.model import OWLOntology, OWLClass, OWLObjectProperty, OWLIndividual
-from org.semanticweb.owlapi.apibinding import OWLManager
 
 from mowl.projection import TaxonomyWithRelationsProjector
 from mowl.owlapi.adapter import OWLAPIAdapter
 from mowl.owlapi.defaults import TOP, BOT
+from mowl.ontology.snapshot import load_ontologies
+from mowl.utils.instrumentation import timer
 from deprecated.sphinx import versionadded, versionchanged
 
 
 from java.util import HashSet
 
+DEFAULT_SNAPSHOT = os.environ.get("MOWL_ONTOLOGY_SNAPSHOTS", "1").lower() in ("1", "true", "yes")
+"""Whether :class:`PathDataset` loads ontologies from snapshots by default."""
+
 
 class Dataset():
     """This class represents an mOWL dataset.
@@ -206,8 +209,11 @@ validation and testing ontologies using the OWLAPI method ``ontology.getIndividu
         
 
     
+@versionchanged(version="1.0.2", reason="Added the ``snapshot`` parameter. The ontology \
+documents are parsed in parallel threads.")
 class PathDataset(Dataset):
-    """Loads the dataset from ontology documents.
+    """Loads the dataset from ontology documents. Training, validation and testing documents \
+are parsed concurrently, each with its own ontology manager.
 
     :param ontology_path: Training dataset
     :type ontology_path: str
@@ -215,6 +221,11 @@ class PathDataset(Dataset):
     :type validation_path: str, optional
     :param testing_path: Testing dataset. Defaults to ``None``.
     :type testing_path: str, optional
+    :param snapshot: Whether to load the documents from snapshots in OWL functional syntax \
+stored next to them (see :func:`mowl.ontology.snapshot.load_ontology`). Defaults to \
+:data:`DEFAULT_SNAPSHOT`, which can be set with the ``MOWL_ONTOLOGY_SNAPSHOTS`` environment \
+variable.
+    :type snapshot: bool, optional
     """
 
     ontology_path: str
@@ -227,7 +238,8 @@ class PathDataset(Dataset):
     def __init__(self,
                  ontology_path: str,
                  validation_path: str = None,
-                 testing_path: str = None):
+                 testing_path: str = None,
+                 snapshot: bool = None):
 
         # Checks on training file path
         if not isinstance(ontology_path, str):
@@ -252,9 +264,15 @@ class PathDataset(Dataset):
             if not os.path.exists(testing_path):
                 raise FileNotFoundError(f"Testing ontology file not found {testing_path}")
 
+        if snapshot is None:
+            snapshot = DEFAULT_SNAPSHOT
+        if not isinstance(snapshot, bool):
+            raise TypeError("Optional parameter snapshot must be of type bool.")
+
         self.ontology_path = ontology_path
         self.validation_path = validation_path
         self.testing_path = testing_path
+        self.snapshot = snapshot
 
         ontology, validation, testing = self._load()
         super().__init__(ontology, validation=validation, testing=testing)
@@ -265,21 +283,10 @@ class PathDataset(Dataset):
         self._evaluation_classes = None
 
     def _load(self):
-
-        ont_manager = OWLManager.createOWLOntologyManager()
-        ontology = ont_manager.loadOntologyFromOntologyDocument(
-            java.io.File(self.ontology_path))
-
-        validation = None
-        if self.validation_path is not None:
-            validation = ont_manager.loadOntologyFromOntologyDocument(
-                java.io.File(self.validation_path))
-
-        testing = None
-        if self.testing_path is not None:
-            testing = ont_manager.loadOntologyFromOntologyDocument(
-                java.io.File(self.testing_path))
-
+        paths = [self.ontology_path, self.validation_path, self.testing_path]
+        with timer("load", dataset=type(self).__name__) as load_timer:
+            ontology, validation, testing = load_ontologies(paths, snapshot=self.snapshot)
+            load_timer.set(items=ontology.getAxiomCount())
         return ontology, validation, testing
 
 
@@ -293,6 +300,8 @@ class TarFileDataset(PathDataset):
         See below
     :Keyword Arguments:
         * **dataset_name** (str): Name of the dataset
+        * **snapshot** (bool): Whether to load the ontologies from snapshots. See \
+:class:`PathDataset`.
     """
     tarfile_path: str
     dataset_name: str
@@ -301,6 +310,7 @@ class TarFileDataset(PathDataset):
     def __init__(self, tarfile_path: str, *args, **kwargs):
         self.tarfile_path = tarfile_path
         self.dataset_name = kwargs.pop('dataset_name', None)
+        snapshot = kwargs.pop('snapshot', None)
         if self.dataset_name is None:
             basename = os.path.basename(self.tarfile_path)
             self.dataset_name = basename.split(os.extsep, 1)[0]
@@ -330,7 +340,8 @@ class TarFileDataset(PathDataset):
         super().__init__(
             ontology_path,
             validation_path,
-            testing_path)
+            testing_path,
+            snapshot=snapshot)
 
     def _extract(self):
         with tarfile.open(self.tarfile_path) as tarf:
@@ -359,16 +370,18 @@ class RemoteDataset(TarFileDataset):
     :type url: str
     :param data_root: Root directory
     :type data_root: str
+    :param snapshot: Whether to load the ontologies from snapshots. See :class:`PathDataset`.
+    :type snapshot: bool, optional
     """
 
     url: str
     data_root: str
 
-    def __init__(self, url: str, data_root='./'):
+    def __init__(self, url: str, data_root='./', snapshot=None):
         self.url = url
         self.data_root = data_root
         tarfile_path = self._download()
-        super().__init__(tarfile_path)
+        super().__init__(tarfile_path, snapshot=snapshot)
 
     def _download(self):
         filename = self.url.split('/')[-1]
@@ -1,20 +1,19 @@
-from mowl.datasets.builtin.ppi_yeast import PPIYeastDataset, PPIYeastSlimDataset
-from mowl.datasets.builtin.gda import GDADataset, GDAHumanDataset, GDAMouseDataset, \
-    GDAMouseELDataset, GDAHumanELDataset
-from mowl.datasets.builtin.gda2 import GDADatasetV2, GDADatasetV2EL
-from mowl.datasets.builtin.family import FamilyDataset
-from mowl.datasets.builtin.subsumption import GOSubsumptionDataset, FoodOnSubsumptionDataset
-__all__ = [
-    "GOSubsumptionDataset",
-    "FoodOnSubsumptionDataset",
-    "PPIYeastDataset",
-    "PPIYeastSlimDataset",
-    "GDADataset",
-    "GDAHumanDataset",
-    "GDAHumanELDataset",
-    "GDAMouseDataset",
-    "GDAMouseELDataset",
-    "GDADatasetV2",
-    "GDADatasetV2EL",
-    "FamilyDataset"
-]
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "PPIYeastDataset": "mowl.datasets.builtin.ppi_yeast",
+    "PPIYeastSlimDataset": "mowl.datasets.builtin.ppi_yeast",
+    "GDADataset": "mowl.datasets.builtin.gda",
+    "GDAHumanDataset": "mowl.datasets.builtin.gda",
+    "GDAMouseDataset": "mowl.datasets.builtin.gda",
+    "GDAMouseELDataset": "mowl.datasets.builtin.gda",
+    "GDAHumanELDataset": "mowl.datasets.builtin.gda",
+    "GDADatasetV2": "mowl.datasets.builtin.gda2",
+    "GDADatasetV2EL": "mowl.datasets.builtin.gda2",
+    "FamilyDataset": "mowl.datasets.builtin.family",
+    "GOSubsumptionDataset": "mowl.datasets.builtin.subsumption",
+    "FoodOnSubsumptionDataset": "mowl.datasets.builtin.subsumption",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
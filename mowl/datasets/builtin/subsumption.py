@@ -2,8 +2,7 @@ from ..base import RemoteDataset, OWLClasses
 from deprecated.sphinx import versionadded
 import os
 
-import java
-from org.semanticweb.owlapi.apibinding import OWLManager
+from mowl.ontology.snapshot import load_ontology
 
 
 
@@ -27,9 +26,8 @@ class SubsumptionDataset(RemoteDataset):
     @property
     def deductive_closure_ontology(self):
         if self._deductive_closure_ontology is None:
-            ont_manager = OWLManager.createOWLOntologyManager()
-            ontology = ont_manager.loadOntologyFromOntologyDocument(
-                java.io.File(self.deductive_closure_ontology_path))
+            ontology = load_ontology(self.deductive_closure_ontology_path,
+                                     snapshot=self.snapshot)
             self._deductive_closure_ontology = ontology
 
         return self._deductive_closure_ontology
@@ -1,3 +1,12 @@
-from .el_dataset import ELDataset, GCI0Dataset, GCI1Dataset, GCI2Dataset, GCI3Dataset
+from mowl.utils.lazy import lazy_exports
 
-__all__ = ["ELDataset", "GCI0Dataset", "GCI1Dataset", "GCI2Dataset", "GCI3Dataset"]
+_EXPORTS = {
+    "ELDataset": ".el_dataset",
+    "GCI0Dataset": ".el_dataset",
+    "GCI1Dataset": ".el_dataset",
+    "GCI2Dataset": ".el_dataset",
+    "GCI3Dataset": ".el_dataset",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,9 +1,13 @@
+import numpy as np
 import torch as th
 from torch.utils.data import DataLoader
-from mowl.ontology.normalize import ELNormalizer, GCI
+from mowl.ontology.normalize import ELNormalizer, NORMAL_FORM_COLUMNS
 from mowl.datasets.gci import GCIDataset, ClassAssertionDataset, ObjectPropertyAssertionDataset
+from mowl.owlapi import OWLAPIAdapter
 import random
+from deprecated.sphinx import versionadded
 from org.semanticweb.owlapi.model import OWLOntology
+from java.util import HashSet
 
 
 class ELDataset():
@@ -69,7 +73,9 @@ org.semanticweb.owlapi.model.OWLOntology.")
         self._individual_index_dict = individual_index_dict
         self.device = device
         self.load_normalized = load_normalized
-        
+        self._normalizer = None
+        self._own_index_dicts = set()
+
         self._gci0_dataset = None
         self._gci1_dataset = None
         self._gci2_dataset = None
@@ -84,101 +90,192 @@ org.semanticweb.owlapi.model.OWLOntology.")
         if self._loaded:
             return
 
-        normalizer = ELNormalizer()
-
-        gcis = normalizer.normalize(self._ontology, load=self.load_normalized)
-
-        classes = set()
-        relations = set()
-        individuals = set()
-        for k, v in gcis.items():
-            new_classes, new_relations, new_individuals = GCI.get_entities(v)
-            classes |= set(new_classes)
-            relations |= set(new_relations)
-            individuals |= set(new_individuals)
+        self._normalizer = ELNormalizer()
 
-        classes = sorted(list(classes))
-        relations = sorted(list(relations))
-        individuals = sorted(list(individuals))
+        arrays, entities = self._normalizer.normalize_as_arrays(self._ontology,
+                                                                load=self.load_normalized)
 
-        
         if self._class_index_dict is None:
-            self._class_index_dict = {v: k for k, v in enumerate(classes)}
+            self._own_index_dicts.add("classes")
+            self._class_index_dict = {v: k for k, v in enumerate(sorted(entities["classes"]))}
         if self._object_property_index_dict is None:
+            self._own_index_dicts.add("object_properties")
+            relations = sorted(entities["object_properties"])
             self._object_property_index_dict = {v: k for k, v in enumerate(relations)}
         if self._individual_index_dict is None:
+            self._own_index_dicts.add("individuals")
+            individuals = sorted(entities["individuals"])
             self._individual_index_dict = {v: k for k, v in enumerate(individuals)}
-        if not self._extended:
-            gci0 = gcis["gci0"] + gcis["gci0_bot"]
-            gci1 = gcis["gci1"] + gcis["gci1_bot"]
-            gci2 = gcis["gci2"]
-            gci3 = gcis["gci3"] + gcis["gci3_bot"]
-
-            random.shuffle(gci0)
-            random.shuffle(gci1)
-            random.shuffle(gci2)
-            random.shuffle(gci3)
-
-            self._gci0_dataset = GCI0Dataset(gci0, self._class_index_dict, device=self.device)
-            self._gci1_dataset = GCI1Dataset(gci1, self._class_index_dict, device=self.device)
-            self._gci2_dataset = GCI2Dataset(
-                gci2, self._class_index_dict,
-                object_property_index_dict=self._object_property_index_dict, device=self.device)
-            self._gci3_dataset = GCI3Dataset(
-                gci3, self._class_index_dict,
-                object_property_index_dict=self._object_property_index_dict, device=self.device)
-        else:
-            gci0 = gcis["gci0"]
-            gci0_bot = gcis["gci0_bot"]
-            gci1 = gcis["gci1"]
-            gci1_bot = gcis["gci1_bot"]
-            gci2 = gcis["gci2"]
-            gci3 = gcis["gci3"]
-            gci3_bot = gcis["gci3_bot"]
-
-            random.shuffle(gci0)
-            random.shuffle(gci0_bot)
-            random.shuffle(gci1)
-            random.shuffle(gci1_bot)
-            random.shuffle(gci2)
-            random.shuffle(gci3)
-            random.shuffle(gci3_bot)
-
-            self._gci0_dataset = GCI0Dataset(gci0, self._class_index_dict, device=self.device)
-            self._gci0_bot_dataset = GCI0Dataset(
-                gci0_bot, self._class_index_dict,
-                device=self.device)
-            self._gci1_dataset = GCI1Dataset(gci1, self._class_index_dict, device=self.device)
-            self._gci1_bot_dataset = GCI1Dataset(
-                gci1_bot, self._class_index_dict,
-                device=self.device)
-            self._gci2_dataset = GCI2Dataset(
-                gci2, self._class_index_dict,
-                object_property_index_dict=self._object_property_index_dict,
-                device=self.device)
-            self._gci3_dataset = GCI3Dataset(
-                gci3, self._class_index_dict,
-                object_property_index_dict=self._object_property_index_dict,
-                device=self.device)
-            self._gci3_bot_dataset = GCI3Dataset(
-                gci3_bot, self._class_index_dict,
-                object_property_index_dict=self._object_property_index_dict,
-                device=self.device)
-
-        if len(gcis["class_assertion"]) > 0:
-            gci_class_assertion = gcis["class_assertion"]
-            random.shuffle(gci_class_assertion)
-            self._class_assertion_dataset = ClassAssertionDataset(
-                gci_class_assertion, self._class_index_dict, self._individual_index_dict, device=self.device)
-
-        if len(gcis["object_property_assertion"]) > 0:
-            gci_object_property_assertion = gcis["object_property_assertion"]
-            random.shuffle(gci_object_property_assertion)
-            self._object_property_assertion_dataset = ObjectPropertyAssertionDataset(
-                gci_object_property_assertion, self._object_property_index_dict, self._individual_index_dict, device=self.device)
-            
+
+        for key, tensor in self._to_tensors(arrays, entities).items():
+            if key in ("class_assertion", "object_property_assertion") and len(tensor) == 0:
+                continue
+            setattr(self, f"_{key}_dataset", self._create_dataset(key, tensor))
+
         self._loaded = True
 
+    @versionadded(version="1.0.2")
+    def add_axioms(self, *axioms, class_index_dict=None, object_property_index_dict=None,
+                   individual_index_dict=None):
+        """Adds axioms to the ontology and appends their normal forms to the datasets. Only the \
+new axioms are normalized; the translator and the normalized axioms of the previous \
+normalization are reused.
+
+        Index dictionaries passed as parameters replace the current ones and existing rows are \
+reindexed accordingly (see :meth:`reindex`). Dictionaries created by the dataset are extended \
+with the new entities, keeping them sorted as in :meth:`load`.
+
+        :param axioms: Axioms to add.
+        :type axioms: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :param class_index_dict: New class index dictionary. Defaults to ``None``.
+        :type class_index_dict: dict, optional
+        :param object_property_index_dict: New object property index dictionary. Defaults to \
+``None``.
+        :type object_property_index_dict: dict, optional
+        :param individual_index_dict: New individual index dictionary. Defaults to ``None``.
+        :type individual_index_dict: dict, optional
+        """
+        manager = OWLAPIAdapter().owl_manager
+        manager.addAxioms(self._ontology, HashSet(axioms))
+
+        if not self._loaded:
+            if class_index_dict is not None:
+                self._class_index_dict = class_index_dict
+            if object_property_index_dict is not None:
+                self._object_property_index_dict = object_property_index_dict
+            if individual_index_dict is not None:
+                self._individual_index_dict = individual_index_dict
+            return
+
+        arrays, entities = self._normalizer.normalize_new_axioms(axioms)
+
+        new_dicts = {"classes": class_index_dict,
+                     "object_properties": object_property_index_dict,
+                     "individuals": individual_index_dict}
+        current_dicts = self._index_dicts()
+        for kind in self._own_index_dicts:
+            if new_dicts[kind] is None and not set(entities[kind]) <= current_dicts[kind].keys():
+                names = sorted(set(current_dicts[kind]) | set(entities[kind]))
+                new_dicts[kind] = {v: k for k, v in enumerate(names)}
+        self.reindex(new_dicts["classes"], new_dicts["object_properties"],
+                     new_dicts["individuals"])
+
+        for key, tensor in self._to_tensors(arrays, entities).items():
+            if len(tensor) == 0:
+                continue
+            dataset = getattr(self, f"_{key}_dataset")
+            if dataset is None:
+                setattr(self, f"_{key}_dataset", self._create_dataset(key, tensor))
+            else:
+                dataset._data = th.cat([dataset.data, tensor.to(dataset.device)], dim=0)
+
+    @versionadded(version="1.0.2")
+    def reindex(self, class_index_dict=None, object_property_index_dict=None,
+                individual_index_dict=None):
+        """Replaces the index dictionaries and maps the rows of every dataset to the new \
+indices. The new dictionaries must contain all the entities of the current ones.
+
+        :param class_index_dict: New class index dictionary. Defaults to ``None``.
+        :type class_index_dict: dict, optional
+        :param object_property_index_dict: New object property index dictionary. Defaults to \
+``None``.
+        :type object_property_index_dict: dict, optional
+        :param individual_index_dict: New individual index dictionary. Defaults to ``None``.
+        :type individual_index_dict: dict, optional
+        """
+        self.load()
+
+        new_dicts = {"classes": class_index_dict,
+                     "object_properties": object_property_index_dict,
+                     "individuals": individual_index_dict}
+        remaps = dict()
+        for kind, old_dict in self._index_dicts().items():
+            new_dict = new_dicts[kind]
+            if new_dict is None or new_dict is old_dict:
+                continue
+            old_indices = np.fromiter(old_dict.values(), dtype=np.int64, count=len(old_dict))
+            remap = np.full(old_indices.max(initial=-1) + 1, -1, dtype=np.int64)
+            remap[old_indices] = [new_dict[name] for name in old_dict]
+            remaps[kind] = th.from_numpy(remap)
+
+        if class_index_dict is not None:
+            self._class_index_dict = class_index_dict
+        if object_property_index_dict is not None:
+            self._object_property_index_dict = object_property_index_dict
+        if individual_index_dict is not None:
+            self._individual_index_dict = individual_index_dict
+
+        for key, source_keys in self._dataset_keys().items():
+            dataset = getattr(self, f"_{key}_dataset")
+            if dataset is None:
+                continue
+            data = dataset.data.clone()
+            for column, kind in enumerate(NORMAL_FORM_COLUMNS[source_keys[0]]):
+                if kind in remaps:
+                    remap = remaps[kind].to(data.device)
+                    data[:, column] = remap[data[:, column]]
+            dataset._data = data
+
+            if hasattr(dataset, "class_index_dict"):
+                dataset.class_index_dict = self._class_index_dict
+            if hasattr(dataset, "object_property_index_dict") and \
+               dataset.object_property_index_dict is not None:
+                dataset.object_property_index_dict = self._object_property_index_dict
+            if hasattr(dataset, "individual_index_dict"):
+                dataset.individual_index_dict = self._individual_index_dict
+
+    def _index_dicts(self):
+        return {"classes": self._class_index_dict,
+                "object_properties": self._object_property_index_dict,
+                "individuals": self._individual_index_dict}
+
+    def _dataset_keys(self):
+        """Returns the normal forms merged into each dataset."""
+        if self._extended:
+            keys = {key: [key] for key in ("gci0", "gci0_bot", "gci1", "gci1_bot", "gci2",
+                                           "gci3", "gci3_bot")}
+        else:
+            keys = {"gci0": ["gci0", "gci0_bot"], "gci1": ["gci1", "gci1_bot"],
+                    "gci2": ["gci2"], "gci3": ["gci3", "gci3_bot"]}
+        keys["class_assertion"] = ["class_assertion"]
+        keys["object_property_assertion"] = ["object_property_assertion"]
+        return keys
+
+    def _to_tensors(self, arrays, entities):
+        """Maps the arrays of :meth:`mowl.ontology.normalize.ELNormalizer.normalize_as_arrays` \
+to the index dictionaries of the dataset and returns one shuffled tensor per dataset."""
+        index_dicts = self._index_dicts()
+        lookups = {kind: np.array([index_dicts[kind][name] for name in names], dtype=np.int64)
+                   for kind, names in entities.items()}
+
+        tensors = dict()
+        for key, source_keys in self._dataset_keys().items():
+            columns = NORMAL_FORM_COLUMNS[source_keys[0]]
+            data = np.concatenate([arrays[source_key] for source_key in source_keys])
+            order = list(range(len(data)))
+            random.shuffle(order)
+            data = data[order]
+            indexed = [lookups[kind][data[:, i]] for i, kind in enumerate(columns)]
+            tensors[key] = th.from_numpy(np.stack(indexed, axis=1)).to(self.device)
+        return tensors
+
+    def _create_dataset(self, key, tensor):
+        if key == "class_assertion":
+            return ClassAssertionDataset(tensor, self._class_index_dict,
+                                         self._individual_index_dict, device=self.device)
+        if key == "object_property_assertion":
+            return ObjectPropertyAssertionDataset(tensor, self._object_property_index_dict,
+                                                  self._individual_index_dict,
+                                                  device=self.device)
+
+        dataset_class = {"gci0": GCI0Dataset, "gci1": GCI1Dataset, "gci2": GCI2Dataset,
+                         "gci3": GCI3Dataset}[key[:4]]
+        if key in ("gci0", "gci0_bot", "gci1", "gci1_bot"):
+            return dataset_class(tensor, self._class_index_dict, device=self.device)
+        return dataset_class(tensor, self._class_index_dict,
+                             object_property_index_dict=self._object_property_index_dict,
+                             device=self.device)
+
     def get_gci_datasets(self):
         """Returns a dictionary containing the name of the normal forms as keys and the \
         corresponding datasets as values. This method will return 7 datasets if the class \
@@ -8,7 +8,10 @@ class GCIDataset(Dataset):
         self.class_index_dict = class_index_dict
         self.object_property_index_dict = object_property_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
@@ -53,7 +56,10 @@ class ClassAssertionDataset(Dataset):
         self.class_index_dict = class_index_dict
         self.individual_index_dict = individual_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
@@ -85,7 +91,10 @@ class ObjectPropertyAssertionDataset(Dataset):
         self.object_property_index_dict = object_property_index_dict
         self.individual_index_dict = individual_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
@@ -1,5 +1,14 @@
-from mowl.evaluation.base import BaseRankingEvaluator, RankingEvaluator, Evaluator
-from mowl.evaluation.subsumption import SubsumptionEvaluator
-from mowl.evaluation.ppi import PPIEvaluator
-from mowl.evaluation.gda import GDAEvaluator
+from mowl.utils.lazy import lazy_exports
 
+_EXPORTS = {
+    "BaseRankingEvaluator": "mowl.evaluation.base",
+    "RankingEvaluator": "mowl.evaluation.base",
+    "Evaluator": "mowl.evaluation.base",
+    "SubsumptionEvaluator": "mowl.evaluation.subsumption",
+    "PPIEvaluator": "mowl.evaluation.ppi",
+    "GDAEvaluator": "mowl.evaluation.gda",
+    "EvaluationIndexCache": "mowl.evaluation.index",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
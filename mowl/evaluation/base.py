@@ -2,7 +2,10 @@ import numpy as np
 import torch as th
 
 from mowl.utils.data import FastTensorDataLoader
+from mowl.reasoning.closure import ClosureCache
+from mowl.evaluation.index import EvaluationIndexCache
 from mowl.error import messages as msg
+from mowl.utils.instrumentation import timed
 
 import logging
 from deprecated.sphinx import versionchanged
@@ -314,7 +317,8 @@ class RankingEvaluator(BaseRankingEvaluator):
     Ranking evaluation class for ontology embedding methods. It encapsulates :class:`BaseRankingEvaluator` to support mOWL datasets
     """
 
-    def __init__(self, dataset, batch_size=16, device="cpu"):
+    @versionchanged(version="1.0.2", reason="Added the ``index_cache`` parameter.")
+    def __init__(self, dataset, batch_size=16, device="cpu", index_cache=True):
         """
         :param dataset: The mOWL dataset object.
         :type dataset: :class:`mowl.datasets.base.Dataset`
@@ -322,9 +326,14 @@ class RankingEvaluator(BaseRankingEvaluator):
         :type batch_size: int
         :param device: The device to use for evaluation.
         :type device: str
+        :param index_cache: Whether to store and reuse the evaluation heads and tails and the \
+tuples of the evaluated ontologies on disk. If a string is given, it is used as the cache \
+directory. Defaults to True.
+        :type index_cache: bool or str, optional
         """
 
         self.dataset = dataset
+        self.index_cache = get_index_cache(index_cache)
         
         self.class_to_id = {c: i for i, c in enumerate(self.dataset.classes.as_str)}
         self.id_to_class = {i: c for c, i in self.class_to_id.items()}
@@ -332,14 +341,12 @@ class RankingEvaluator(BaseRankingEvaluator):
         self.relation_to_id = {r: i for i, r in enumerate(self.dataset.object_properties.as_str)}
         self.id_to_relation = {i: r for r, i in self.relation_to_id.items()}
 
-        eval_heads, eval_tails = self.dataset.evaluation_classes
-        self.class_id_to_head_id = {self.class_to_id[c]: i for i, c in enumerate(eval_heads.as_str)}
-        self.class_id_to_tail_id = {self.class_to_id[c]: i for i, c in enumerate(eval_tails.as_str)}
+        eval_heads, eval_tails = evaluation_entity_ids(self)
+        self.class_id_to_head_id = {c: i for i, c in enumerate(eval_heads.tolist())}
+        self.class_id_to_tail_id = {c: i for i, c in enumerate(eval_tails.tolist())}
          
-        eval_heads, eval_tails = self.dataset.evaluation_classes
-        
-        evaluation_heads_tensor = th.tensor([self.class_to_id[c] for c in eval_heads.as_str], dtype=th.long).to(device)
-        evaluation_tails_tensor = th.tensor([self.class_to_id[c] for c in eval_tails.as_str], dtype=th.long).to(device)
+        evaluation_heads_tensor = th.from_numpy(eval_heads).long().to(device)
+        evaluation_tails_tensor = th.from_numpy(eval_tails).long().to(device)
 
         super().__init__(evaluation_heads_tensor, evaluation_tails_tensor, batch_size, device)
 
@@ -353,6 +360,7 @@ class RankingEvaluator(BaseRankingEvaluator):
         """
         raise NotImplementedError
 
+    @timed("evaluate")
     def evaluate(self, evaluation_model, testing_ontology, filter_ontologies = None, mode="head_centric"):
         """
         Evaluate the model on the testing ontology.
@@ -365,13 +373,13 @@ class RankingEvaluator(BaseRankingEvaluator):
         :return: The computed ranking metrics.
         :rtype: dict
         """
-        testing_data = self.create_tuples(testing_ontology)
+        testing_data = cached_tuples(self, testing_ontology)
 
         filter_data = None
         if filter_ontologies is not None:
             filter_data = []
             for ontology in filter_ontologies:
-                filter_data.append(self.create_tuples(ontology))
+                filter_data.append(cached_tuples(self, ontology))
             filter_data = th.cat(filter_data, dim=0)
             
         return self.compute_ranking_metrics(evaluation_model, testing_data, filter_data=filter_data, mode=mode)
@@ -387,18 +395,24 @@ class Evaluator:
     :type device: str, optional
     :param batch_size: Batch size for evaluation. Defaults to 16.
     :type batch_size: int, optional
+    :param closure_cache: Whether to store and reuse the deductive closure tuples on disk. \
+If a string is given, it is used as the cache directory. Defaults to True.
+    :type closure_cache: bool or str, optional
+    :param index_cache: Whether to store and reuse the training, validation and testing tuples \
+and the evaluation heads and tails on disk. If a string is given, it is used as the cache \
+directory. Defaults to True.
+    :type index_cache: bool or str, optional
     """
     
-    def __init__(self, dataset, device="cpu", batch_size=16):
+    def __init__(self, dataset, device="cpu", batch_size=16, closure_cache=True,
+                 index_cache=True):
 
 
         self.dataset = dataset
         self.device = device
         self.batch_size = batch_size
-        self.train_tuples = self.create_tuples(dataset.ontology)
-        self.valid_tuples = self.create_tuples(dataset.validation)
-        self.test_tuples = self.create_tuples(dataset.testing)
-        self._deductive_closure_tuples = None
+        self.closure_cache = get_closure_cache(closure_cache)
+        self.index_cache = get_index_cache(index_cache)
 
         self.class_to_id = {c: i for i, c in enumerate(self.dataset.classes.as_str)}
         self.id_to_class = {i: c for c, i in self.class_to_id.items()}
@@ -406,21 +420,26 @@ class Evaluator:
         self.relation_to_id = {r: i for i, r in enumerate(self.dataset.object_properties.as_str)}
         self.id_to_relation = {i: r for r, i in self.relation_to_id.items()}
 
-        eval_heads, eval_tails = self.dataset.evaluation_classes
-        self.class_id_to_head_id = {self.class_to_id[c]: i for i, c in enumerate(eval_heads.as_str)}
-        self.class_id_to_tail_id = {self.class_to_id[c]: i for i, c in enumerate(eval_tails.as_str)}
+        self.train_tuples = cached_tuples(self, dataset.ontology)
+        self.valid_tuples = cached_tuples(self, dataset.validation)
+        self.test_tuples = cached_tuples(self, dataset.testing)
+        self._deductive_closure_tuples = None
+
+        eval_heads, eval_tails = evaluation_entity_ids(self)
+        self.class_id_to_head_id = {c: i for i, c in enumerate(eval_heads.tolist())}
+        self.class_id_to_tail_id = {c: i for i, c in enumerate(eval_tails.tolist())}
          
-        eval_heads, eval_tails = self.dataset.evaluation_classes
-        
         print(f"Number of evaluation classes: {len(eval_heads)}")
-        self.evaluation_heads = th.tensor([self.class_to_id[c] for c in eval_heads.as_str], dtype=th.long).to(self.device)
-        self.evaluation_tails = th.tensor([self.class_to_id[c] for c in eval_tails.as_str], dtype=th.long).to(self.device)
+        self.evaluation_heads = th.from_numpy(eval_heads).long().to(self.device)
+        self.evaluation_tails = th.from_numpy(eval_tails).long().to(self.device)
 
 
     @property
     def deductive_closure_tuples(self):
         if self._deductive_closure_tuples is None:
-            self._deductive_closure_tuples = self.create_tuples(self.dataset.deductive_closure_ontology)
+            self._deductive_closure_tuples = cached_closure_tuples(
+                self, self.dataset.deductive_closure_ontology, "precomputed",
+                lambda: self.create_tuples(self.dataset.deductive_closure_ontology))
         return self._deductive_closure_tuples
         
     def create_tuples(self, ontology):
@@ -629,6 +648,7 @@ class Evaluator:
             return metrics
 
         
+    @timed("evaluate")
     def evaluate(self, *args,
                  include_deductive_closure=False,
                  exclude_testing_set=False,
@@ -677,7 +697,99 @@ class Evaluator:
                                   exclude_testing_set=exclude_testing_set,
                                   filter_deductive_closure=filter_deductive_closure,
                                   **kwargs)
-    
+
+
+def get_closure_cache(closure_cache):
+    """Creates the :class:`mowl.reasoning.ClosureCache` selected by the ``closure_cache`` \
+parameter of the evaluators.
+
+    :rtype: :class:`mowl.reasoning.ClosureCache` or ``None``
+    """
+    if isinstance(closure_cache, bool):
+        return ClosureCache() if closure_cache else None
+    if isinstance(closure_cache, str):
+        return ClosureCache(closure_cache)
+    raise TypeError("Optional parameter closure_cache must be of type bool or str.")
+
+
+def get_index_cache(index_cache):
+    """Creates the :class:`mowl.evaluation.index.EvaluationIndexCache` selected by the \
+``index_cache`` parameter of the evaluators.
+
+    :rtype: :class:`mowl.evaluation.index.EvaluationIndexCache` or ``None``
+    """
+    if isinstance(index_cache, bool):
+        return EvaluationIndexCache() if index_cache else None
+    if isinstance(index_cache, str):
+        return EvaluationIndexCache(index_cache)
+    raise TypeError("Optional parameter index_cache must be of type bool or str.")
+
+
+def _index_dataset_key(evaluator):
+    key = getattr(evaluator, "_index_dataset_key", None)
+    if key is None:
+        key = evaluator.index_cache.dataset_key(evaluator, evaluator.dataset)
+        evaluator._index_dataset_key = key
+    return key
+
+
+def evaluation_entity_ids(evaluator):
+    """Returns the class indices of the evaluation heads and tails of the dataset of an \
+evaluator, loading them from its index cache when available. The keys include the names of the \
+evaluation classes.
+
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+    evaluation_names = [entities.as_str for entities in evaluator.dataset.evaluation_classes]
+
+    def compute_fn(position):
+        def compute():
+            return [evaluator.class_to_id[c] for c in evaluation_names[position]]
+        return compute
+
+    if evaluator.index_cache is None:
+        return tuple(np.array(compute_fn(position)(), dtype=np.int64) for position in (0, 1))
+
+    cache = evaluator.index_cache
+    dataset_key = _index_dataset_key(evaluator)
+    return tuple(cache.get(cache.key(dataset_key, name, names=evaluation_names[position]),
+                           compute_fn(position))
+                 for position, name in enumerate(("heads", "tails")))
+
+
+def cached_tuples(evaluator, ontology):
+    """Returns the tuples that ``evaluator.create_tuples`` extracts from an ontology, loading \
+them from the index cache of the evaluator when available. The key includes the evaluator \
+type, the dataset vocabulary and the content of the ontology.
+
+    :rtype: :class:`torch.Tensor`
+    """
+    if evaluator.index_cache is None or ontology is None:
+        return evaluator.create_tuples(ontology)
+
+    cache = evaluator.index_cache
+    key = cache.key(_index_dataset_key(evaluator), "tuples", ontology)
+    tuples = cache.get(key, lambda: evaluator.create_tuples(ontology).cpu().numpy())
+    return th.from_numpy(tuples).long()
+
+
+def cached_closure_tuples(evaluator, ontology, reasoner, compute_fn):
+    """Returns the deductive closure tuples of an evaluator, loading them from its closure cache \
+when available. The cache key includes the evaluator class, so evaluators that index axioms \
+differently do not share entries.
+
+    :rtype: :class:`torch.Tensor`
+    """
+    if evaluator.closure_cache is None:
+        return compute_fn()
+
+    vocabulary = evaluator.dataset.classes.as_str + evaluator.dataset.object_properties.as_str
+    key = evaluator.closure_cache.key(ontology, reasoner, vocabulary,
+                                      namespace=type(evaluator).__name__)
+    tuples = evaluator.closure_cache.get(key, lambda: compute_fn().cpu().numpy())
+    return th.from_numpy(tuples).long()
+
+
 def compute_rank_roc(ranks, num_entities, method="riemann"):
     if method == "riemann":
         fn = riemann_sum
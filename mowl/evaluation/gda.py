@@ -1,5 +1,5 @@
 from mowl.evaluation import Evaluator, RankingEvaluator
-from mowl.projection import TaxonomyWithRelationsProjector, Edge
+from mowl.projection import TaxonomyWithRelationsProjector
 import torch as th
 import logging
 logger = logging.getLogger(__name__)
@@ -16,21 +16,8 @@ class GDAEvaluatorOld(Evaluator):
         projector = TaxonomyWithRelationsProjector(relations=[self.dataset.evaluation_object_property])
         edges = projector.project(ontology)
 
-        classes, relations = Edge.get_entities_and_relations(edges)
-
-        class_str2owl = self.dataset.classes.to_dict()
-        class_owl2idx = self.dataset.classes.to_index_dict()
-        relation_str2owl = self.dataset.object_properties.to_dict()
-        relation_owl2idx = self.dataset.object_properties.to_index_dict()
-        
-        edges_indexed = []
-
-        for e in edges:
-            head = class_owl2idx[class_str2owl[e.src]]
-            relation = relation_owl2idx[relation_str2owl[e.rel]]
-            tail = class_owl2idx[class_str2owl[e.dst]]
-            edges_indexed.append((head, relation, tail))
-        
+        edges_indexed = [(self.class_to_id[e.src], self.relation_to_id[e.rel],
+                          self.class_to_id[e.dst]) for e in edges]
         return th.tensor(edges_indexed, dtype=th.long)
 
     def get_logits(self, model, batch):
@@ -68,21 +55,8 @@ class GDAEvaluator(RankingEvaluator):
         projector = TaxonomyWithRelationsProjector(relations=[self.dataset.evaluation_object_property])
         edges = projector.project(ontology)
 
-        classes, relations = Edge.get_entities_and_relations(edges)
-
-        class_str2owl = self.dataset.classes.to_dict()
-        class_owl2idx = self.dataset.classes.to_index_dict()
-        relation_str2owl = self.dataset.object_properties.to_dict()
-        relation_owl2idx = self.dataset.object_properties.to_index_dict()
-        
-        edges_indexed = []
-
-        for e in edges:
-            head = class_owl2idx[class_str2owl[e.src]]
-            relation = relation_owl2idx[relation_str2owl[e.rel]]
-            tail = class_owl2idx[class_str2owl[e.dst]]
-            edges_indexed.append((head, relation, tail))
-        
+        edges_indexed = [(self.class_to_id[e.src], self.relation_to_id[e.rel],
+                          self.class_to_id[e.dst]) for e in edges]
         return th.tensor(edges_indexed, dtype=th.long)
 
     def get_scores(self, model, batch):
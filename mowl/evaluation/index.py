@@ -0,0 +1,131 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from mowl.reasoning.closure import DEFAULT_CACHE_DIR, ontology_content_hash
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+INDEX_FORMAT_VERSION = 1
+"""Version of the layout of the cached arrays. It is part of every key, so changing it \
+invalidates the arrays cached by previous versions."""
+
+
+class EvaluationIndexCache():
+    """On-disk cache of the integer arrays built when an evaluator is set up: the tuples \
+extracted from the training, validation and testing ontologies and the indices of the \
+evaluation heads and tails. Arrays are stored as ``.npy`` files whose names are derived from \
+the evaluator type, the dataset and the content of the ontology, so that evaluators created \
+again for the same dataset (for example, once per checkpoint) load them instead of projecting \
+the ontologies.
+
+    :param cache_dir: Directory where the arrays are stored. Defaults to ``evaluation`` inside \
+``$MOWL_CACHE_DIR`` or ``~/.cache/mowl``.
+    :type cache_dir: str, optional
+    """
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, "evaluation")
+        if not isinstance(cache_dir, str):
+            raise TypeError("Optional parameter cache_dir must be of type str.")
+
+        self.cache_dir = cache_dir
+
+    def dataset_key(self, evaluator, dataset):
+        """Computes the part of the keys shared by all the arrays of an evaluator: the \
+format version, the evaluator and dataset types and the class and object property vocabulary, \
+which determines the indices stored in the arrays.
+
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        for part in (str(INDEX_FORMAT_VERSION), type(evaluator).__name__,
+                     type(dataset).__name__):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for names in (dataset.classes.as_str, dataset.object_properties.as_str):
+            for name in names:
+                digest.update(name.encode("utf-8"))
+                digest.update(b"\n")
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def key(self, dataset_key, name, ontology=None, names=None):
+        """Computes the key of an array.
+
+        :param dataset_key: Key obtained with :meth:`dataset_key`.
+        :type dataset_key: str
+        :param name: Name of the array, for example ``"tuples"`` or ``"heads"``.
+        :type name: str
+        :param ontology: Ontology the array is extracted from, if any. Its content hash is part \
+of the key. Defaults to ``None``.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`, optional
+        :param names: Entity names the array is computed from, if any, such as the evaluation \
+classes of the dataset. Defaults to ``None``.
+        :type names: list of str, optional
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        for part in (dataset_key, name):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        if ontology is not None:
+            digest.update(ontology_content_hash(ontology).encode("utf-8"))
+        if names is not None:
+            for entity_name in names:
+                digest.update(entity_name.encode("utf-8"))
+                digest.update(b"\n")
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"index_{key}.npy")
+
+    def load(self, key):
+        """Loads an array.
+
+        :rtype: :class:`numpy.ndarray` or ``None`` if the array is not cached.
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        return np.load(path, allow_pickle=False)
+
+    def save(self, key, array):
+        """Stores an array. The file is written under a temporary name and renamed, so \
+concurrent readers never see partial files.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get(self, key, compute_fn):
+        """Returns the cached array or computes and stores it.
+
+        :param key: Key obtained with :meth:`key`.
+        :type key: str
+        :param compute_fn: Function returning the array.
+        :type compute_fn: callable
+        :rtype: :class:`numpy.ndarray`
+        """
+        array = self.load(key)
+        if array is not None:
+            logger.debug(f"Loaded evaluation index from {self.path(key)}")
+            return array
+
+        array = np.asarray(compute_fn(), dtype=np.int64)
+        self.save(key, array)
+        return array
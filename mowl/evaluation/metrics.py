@@ -1,27 +1,88 @@
 from sklearn.utils import column_or_1d
 from sklearn.utils.multiclass import type_of_target
 from sklearn import metrics as skm
+from deprecated.sphinx import versionadded
 import numpy as np
 
 
-def precision_and_recall_at_k(y_true, y_score, k, nb_positives, pos_label=1):
+def _binary_labels(y_true, pos_label):
+    y_true_arr = column_or_1d(y_true)
+    if y_true_arr.dtype != bool:
+        y_true_type = type_of_target(y_true_arr)
+        if not (y_true_type == "binary"):
+            raise ValueError("y_true must be a binary column.")
+    return y_true_arr == pos_label
 
-    y_true_type = type_of_target(y_true)
-    if not (y_true_type == "binary"):
-        raise ValueError("y_true must be a binary column.")
 
-    # Makes this compatible with various array types
-    y_true_arr = column_or_1d(y_true)
+def _ranking(y_true, y_score, pos_label):
+    """Sorts the scores in descending order once. Ties keep the reversed input order, as in \
+:func:`precision_and_recall_at_k`.
+
+    :rtype: tuple of the sorted scores and the cumulative number of positives at each rank.
+    """
+    y_true_arr = _binary_labels(y_true, pos_label)
     y_score_arr = column_or_1d(y_score)
+    desc_sort_order = np.argsort(y_score_arr, kind="stable")[::-1]
+    return y_score_arr[desc_sort_order], np.cumsum(y_true_arr[desc_sort_order])
+
+
+def _precision_and_recall_at_ks(hits, ks, nb_positives):
+    results = dict()
+    for k in ks:
+        predicted_true_positives = hits[min(k, len(hits)) - 1] if k > 0 and len(hits) else 0
+        precision = predicted_true_positives / k if k > 0 else float("nan")
+        recall = predicted_true_positives / nb_positives if nb_positives > 0 else float("nan")
+        results[k] = precision, recall
+    return results
+
+
+def _roc_curve(sorted_scores, hits):
+    """Computes the ROC curve as :func:`sklearn.metrics.roc_curve` with \
+``drop_intermediate=True``, from scores sorted in descending order.
+    """
+    distinct_value_indices = np.where(np.diff(sorted_scores))[0]
+    threshold_idxs = np.r_[distinct_value_indices, len(sorted_scores) - 1]
+    tps = hits[threshold_idxs]
+    fps = 1 + threshold_idxs - tps
+    thresholds = sorted_scores[threshold_idxs]
+
+    if len(fps) > 2:
+        optimal_idxs = np.where(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)),
+                                      True])[0]
+        fps, tps, thresholds = fps[optimal_idxs], tps[optimal_idxs], thresholds[optimal_idxs]
+
+    tps = np.r_[0, tps]
+    fps = np.r_[0, fps]
+    thresholds = np.r_[np.inf, thresholds]
+
+    fpr = fps / fps[-1] if fps[-1] > 0 else np.full(fps.shape, np.nan)
+    tpr = tps / tps[-1] if tps[-1] > 0 else np.full(tps.shape, np.nan)
+    return fpr, tpr, thresholds
 
-    y_true_arr = y_true_arr == pos_label
 
-    desc_sort_order = np.argsort(y_score_arr)[::-1]
-    y_true_sorted = y_true_arr[desc_sort_order]
+def precision_and_recall_at_k(y_true, y_score, k, nb_positives, pos_label=1):
+    return precision_and_recall_at_ks(y_true, y_score, [k], nb_positives,
+                                      pos_label=pos_label)[k]
+
 
-    predicted_true_positives = y_true_sorted[:k].sum()
+@versionadded(version="1.0.2")
+def precision_and_recall_at_ks(y_true, y_score, ks, nb_positives, pos_label=1):
+    """Computes precision and recall at several cut-offs from a single sort of the scores.
 
-    return predicted_true_positives / k, predicted_true_positives / nb_positives
+    :param y_true: Binary labels.
+    :type y_true: array-like
+    :param y_score: Scores, higher is more likely to be positive.
+    :type y_score: array-like
+    :param ks: Cut-offs.
+    :type ks: list of int
+    :param nb_positives: Number of positives used to compute the recall.
+    :type nb_positives: int
+    :param pos_label: Label of the positive class. Defaults to ``1``.
+    :rtype: dict of {int: (float, float)} mapping each cut-off to its precision and recall. \
+Precision at ``k=0`` and recall with no positives are ``nan``.
+    """
+    _, hits = _ranking(y_true, y_score, pos_label)
+    return _precision_and_recall_at_ks(hits, ks, nb_positives)
 
 
 def auc(y_true, y_score, pos_label=1):
@@ -38,3 +99,48 @@ def precision(y_true, y_score, pos_label=1):
 
 def recall(y_true, y_score, pos_label=1):
     return skm.recall_score(y_true, y_score, pos_label=pos_label)
+
+
+@versionadded(version="1.0.2")
+def binary_metrics(y_true, y_score, ks, nb_positives=None, pos_label=1):
+    """Computes the AUC, the precision and recall at the threshold maximizing the geometric \
+mean of the true and false positive rates (as :func:`auc`) and the precision and recall at \
+every cut-off in ``ks``. The scores are sorted once and every metric is obtained from the \
+cumulative number of positives along the ranking.
+
+    :param y_true: Binary labels.
+    :type y_true: array-like
+    :param y_score: Scores, higher is more likely to be positive.
+    :type y_score: array-like
+    :param ks: Cut-offs for precision and recall.
+    :type ks: list of int
+    :param nb_positives: Number of positives used to compute the recall at the cut-offs. \
+Defaults to the number of positives in ``y_true``.
+    :type nb_positives: int, optional
+    :param pos_label: Label of the positive class. Defaults to ``1``.
+    :rtype: dict with the keys ``auc``, ``precision``, ``recall``, ``prec@k`` and ``rec@k``.
+    """
+    sorted_scores, hits = _ranking(y_true, y_score, pos_label)
+    if nb_positives is None:
+        nb_positives = int(hits[-1]) if len(hits) else 0
+
+    metrics = dict()
+
+    fpr, tpr, thresholds = _roc_curve(sorted_scores, hits)
+    gmeans = np.sqrt(tpr * (1 - fpr))
+    threshold = thresholds[np.argmax(gmeans)]
+    metrics["auc"] = skm.auc(fpr, tpr)
+
+    # Number of scores strictly greater than the threshold, i.e., predicted positives.
+    predicted = len(sorted_scores) - np.searchsorted(sorted_scores[::-1], threshold,
+                                                     side="right")
+    true_positives = int(hits[predicted - 1]) if predicted > 0 else 0
+    positives = int(hits[-1]) if len(hits) else 0
+    metrics["precision"] = true_positives / predicted if predicted > 0 else 0.
+    metrics["recall"] = true_positives / positives if positives > 0 else 0.
+
+    for k, (prec, rec) in _precision_and_recall_at_ks(hits, ks, nb_positives).items():
+        metrics[f"prec@{k}"] = prec
+        metrics[f"rec@{k}"] = rec
+
+    return metrics
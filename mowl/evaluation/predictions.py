@@ -1,59 +1,57 @@
 import numpy as np
-from mowl.evaluation.metrics import auc, precision_and_recall_at_k, precision, recall
+from deprecated.sphinx import versionchanged
+from mowl.evaluation.metrics import binary_metrics
 
 
+@versionchanged(version="1.0.2", reason="Predictions can be given as NumPy arrays. All the \
+metrics are computed from a single sort of the scores.")
 def evaluate_predictions(true_axioms, predictions, ks, pos_label=1):
     """Method that evaluates precision, recall and AUC for predictions of axioms.
 
+    Predictions can be given in three forms:
+
+    * A dictionary of the form prediction -> score. ``true_axioms`` is the set of true \
+      positives.
+    * A tuple ``(ids, scores)`` of aligned arrays, where ``ids`` identify the predicted axioms \
+      (for example, integer indices). ``true_axioms`` is an array with the ids of the true \
+      positives.
+    * An array of scores. ``true_axioms`` is an array of the same length with binary labels.
+
+    In the first two forms, recall is computed with respect to all the true positives, \
+    including those not predicted.
+
     :param true_axioms: Axioms in the true positives set
-    :type true_axioms: set
+    :type true_axioms: set, :class:`numpy.ndarray`
     :param predictions: Dictionary of predictions of the form prediction -> score
-    :type: dict
+    :type: dict, tuple of :class:`numpy.ndarray` or :class:`numpy.ndarray`
     """
 
-    y_scores = []
-    y_true = []
-    true_axioms = set(true_axioms)
-
     if pos_label != 1 and pos_label != 0:
         raise ValueError("Pos label must be either 0 or 1")
 
-    invert = False
-    if pos_label == 0:
-        invert = True
-
-    for name, k in predictions.items():
-        if name in true_axioms:
-            y_true.append(1)
-        else:
-            y_true.append(0)
-
-        if invert:
-            k = 1 - k
-        y_scores.append(k)
+    if isinstance(predictions, dict):
+        true_axioms = set(true_axioms)
+        y_true = np.fromiter((name in true_axioms for name in predictions), dtype=bool,
+                             count=len(predictions))
+        y_scores = np.fromiter(predictions.values(), dtype=np.float64, count=len(predictions))
+        nb_positives = len(true_axioms)
+    elif isinstance(predictions, tuple):
+        ids, y_scores = predictions
+        true_axioms = np.unique(np.asarray(true_axioms))
+        y_true = np.isin(np.asarray(ids), true_axioms)
+        y_scores = np.asarray(y_scores)
+        nb_positives = len(true_axioms)
+    else:
+        y_scores = np.asarray(predictions)
+        y_true = np.asarray(true_axioms).astype(bool)
+        if y_true.shape != y_scores.shape:
+            raise ValueError("Parameters true_axioms and predictions must have the same shape.")
+        nb_positives = int(y_true.sum())
 
-    pos_label = 1
-
-    y_scores = np.array(y_scores)
-    y_true = np.array(y_true)
-
-    metrics = dict()
-
-    auc_value, threshold = auc(y_true, y_scores, pos_label=pos_label)
-    metrics["auc"] = auc_value
-
-    y_scores = [1 if x > threshold else 0 for x in y_scores]
-
-    prec = precision(y_true, y_scores, pos_label=pos_label)
-    rec = recall(y_true, y_scores, pos_label=pos_label)
-    metrics["precision"] = prec
-    metrics["recall"] = rec
+    if pos_label == 0:
+        y_scores = 1 - y_scores
 
-    for k in ks:
-        prec, rec = precision_and_recall_at_k(y_true, y_scores, k, len(true_axioms),
-                                              pos_label=pos_label)
-        metrics[f"prec@{k}"] = prec
-        metrics[f"rec@{k}"] = rec
+    metrics = binary_metrics(y_true, y_scores, ks, nb_positives=nb_positives)
 
     new_metrics = {}
     for k, v in sorted(metrics.items()):
@@ -1,5 +1,11 @@
 from mowl.evaluation import Evaluator, RankingEvaluator
-from mowl.projection import TaxonomyProjector, Edge
+from mowl.evaluation.base import get_closure_cache, cached_closure_tuples, cached_tuples
+from mowl.projection import TaxonomyProjector
+from mowl.reasoning import MOWLReasoner
+from mowl.owlapi.defaults import TOP
+from mowl.utils.instrumentation import timed
+from org.semanticweb.elk.owlapi import ElkReasonerFactory
+import numpy as np
 import torch as th
 
 
@@ -11,18 +17,7 @@ class SubsumptionEvaluatorOld(Evaluator):
         projector = TaxonomyProjector()
         edges = projector.project(ontology)
 
-        classes, relations = Edge.get_entities_and_relations(edges)
-
-        class_str2owl = self.dataset.classes.to_dict()
-        class_owl2idx = self.dataset.classes.to_index_dict()
-
-        edges_indexed = []
-        
-        for e in edges:
-            head = class_owl2idx[class_str2owl[e.src]]
-            tail = class_owl2idx[class_str2owl[e.dst]]
-            edges_indexed.append((head, tail))
-        
+        edges_indexed = [(self.class_to_id[e.src], self.class_to_id[e.dst]) for e in edges]
         return th.tensor(edges_indexed, dtype=th.long)
 
     def get_logits(self, model, batch):
@@ -78,25 +73,86 @@ class SubsumptionEvaluatorOld(Evaluator):
 
 
 class SubsumptionEvaluator(RankingEvaluator):
-    def __init__(self, *args, **kwargs):
+    """
+    Ranking evaluator for subsumption axioms :math:`C \sqsubseteq D`.
+
+    :param closure_cache: Whether to store and reuse the deductive closure tuples on disk. \
+If a string is given, it is used as the cache directory. Defaults to True.
+    :type closure_cache: bool or str, optional
+    """
+    
+    def __init__(self, *args, closure_cache=True, **kwargs):
         super().__init__(*args, **kwargs)
+        self.closure_cache = get_closure_cache(closure_cache)
+        self._deductive_closure_tuples = None
+
+    @property
+    def deductive_closure_tuples(self):
+        """Subsumption tuples of the deductive closure of the training ontology. If the dataset \
+provides a ``deductive_closure_ontology``, it is used; otherwise the closure is inferred with \
+the ELK reasoner. In both cases the tuples are stored in the closure cache.
+
+        :rtype: :class:`torch.Tensor`
+        """
+        if self._deductive_closure_tuples is None:
+            if hasattr(self.dataset, "deductive_closure_ontology"):
+                ontology = self.dataset.deductive_closure_ontology
+                tuples = cached_closure_tuples(self, ontology, "precomputed",
+                                               lambda: self.create_tuples(ontology))
+            else:
+                tuples = cached_closure_tuples(self, self.dataset.ontology, "elk",
+                                               self._infer_closure_tuples)
+            self._deductive_closure_tuples = tuples
+        return self._deductive_closure_tuples
+
+    def _infer_closure_tuples(self):
+        reasoner = ElkReasonerFactory().createReasoner(self.dataset.ontology)
+        names, pairs = MOWLReasoner(reasoner).infer_subclass_pairs()
+        reasoner.dispose()
+
+        ids = np.array([self.class_to_id.get(name, -1) for name in names], dtype=np.int64)
+        is_top = np.array([name == TOP for name in names], dtype=bool)
+        tuples = ids[pairs]
+        keep = (tuples >= 0).all(axis=1) & (tuples[:, 0] != tuples[:, 1]) & ~is_top[pairs[:, 1]]
+        return th.from_numpy(tuples[keep])
+
+    @timed("evaluate")
+    def evaluate(self, evaluation_model, testing_ontology, filter_ontologies=None,
+                 mode="head_centric", filter_deductive_closure=False):
+        """
+        Evaluate the model on the testing ontology.
+
+        :param filter_deductive_closure: Whether to filter the deductive closure of the \
+training ontology (except the testing axioms) from the rankings. Defaults to False.
+        :type filter_deductive_closure: bool, optional
+
+        See :meth:`mowl.evaluation.RankingEvaluator.evaluate` for the other parameters.
+        """
+        if not filter_deductive_closure:
+            return super().evaluate(evaluation_model, testing_ontology,
+                                    filter_ontologies=filter_ontologies, mode=mode)
+
+        testing_data = cached_tuples(self, testing_ontology)
+        closure = self.deductive_closure_tuples
+        # Pairs are encoded as single integers, so membership is tested without comparing
+        # every closure pair with every testing pair.
+        num_classes = len(self.class_to_id)
+        closure_codes = closure[:, 0] * num_classes + closure[:, 1]
+        testing_codes = testing_data[:, 0] * num_classes + testing_data[:, 1]
+        in_test = th.isin(closure_codes, testing_codes)
+        filter_data = [closure[~in_test]]
+        if filter_ontologies is not None:
+            filter_data += [cached_tuples(self, ontology) for ontology in filter_ontologies]
+        filter_data = th.cat(filter_data, dim=0)
+
+        return self.compute_ranking_metrics(evaluation_model, testing_data,
+                                            filter_data=filter_data, mode=mode)
 
     def create_tuples(self, ontology):
         projector = TaxonomyProjector()
         edges = projector.project(ontology)
 
-        classes, relations = Edge.get_entities_and_relations(edges)
-
-        class_str2owl = self.dataset.classes.to_dict()
-        class_owl2idx = self.dataset.classes.to_index_dict()
-
-        edges_indexed = []
-        
-        for e in edges:
-            head = class_owl2idx[class_str2owl[e.src]]
-            tail = class_owl2idx[class_str2owl[e.dst]]
-            edges_indexed.append((head, tail))
-        
+        edges_indexed = [(self.class_to_id[e.src], self.class_to_id[e.dst]) for e in edges]
         return th.tensor(edges_indexed, dtype=th.long)
 
     def get_scores(self, model, batch):
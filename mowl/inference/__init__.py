@@ -1 +1,8 @@
-from .base import Inferrer
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "Inferrer": ".base",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
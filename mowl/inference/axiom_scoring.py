@@ -2,6 +2,7 @@ from tqdm import tqdm
 import re
 import itertools as it
 import numpy as np
+import torch as th
 
 
 class AxiomScoring():
@@ -13,14 +14,25 @@ class AxiomScoring():
 
     :param patterns: Collection of patterns accepted by the scoring method
     :type patterns: list
+    :param batch_method: Batched version of ``method``. It receives a tensor of shape \
+    ``(N, number of slots)`` with the positions of the entities in ``class_list`` or \
+    ``property_list`` (one column per pattern slot, in pattern order) and returns ``N`` scores. \
+    If ``None``, ``method`` is called once per axiom. Defaults to ``None``.
+    :type batch_method: callable, optional
     """
 
-    def __init__(self, patterns, method, class_list, property_list=None, canonical_pattern=0):
+    _slot_regex = re.compile("[cp]\\?.*?\\?")
+
+    def __init__(self, patterns, method, class_list, property_list=None, canonical_pattern=0,
+                 batch_method=None):
         self.patterns = set(patterns)
         self.canonical_pattern = patterns[canonical_pattern]
         self.method = method
+        self.batch_method = batch_method
         self.class_list = class_list
         self.property_list = [] if property_list is None else property_list
+        self._positions = dict()
+        self._slot_cache = dict()
 
     def is_pattern_correct(self, pattern):
         pattern = self.canonical_expression(pattern)
@@ -47,42 +59,89 @@ class AxiomScoring():
         pattern_decomp = re.split("\s+", pattern)
         return pattern_decomp
 
+    def _entity_list(self, obj):
+        return self.class_list if obj.startswith("c") else self.property_list
+
+    def _resolve_slots(self, pattern):
+        """Resolves every slot of a pattern to the positions of the matching entities. \
+Regular expressions are compiled once per slot and the result is cached; slots that are a \
+literal entity name are resolved with a dictionary lookup.
+
+        :return: List of ``(entity list, positions)`` pairs, one per slot.
+        :rtype: list
+        """
+        slots = []
+        for pat in self.standardize_pattern(pattern):
+            if not self._slot_regex.fullmatch(pat):
+                continue
+            obj = pat[:-1]
+            names = self._entity_list(obj)
+
+            if obj not in self._slot_cache:
+                regex = obj[2:]
+                if re.escape(regex) == regex:
+                    kind = obj[0]
+                    if kind not in self._positions:
+                        self._positions[kind] = {name: i for i, name in enumerate(names)}
+                    positions = [self._positions[kind][regex]] \
+                        if regex in self._positions[kind] else []
+                else:
+                    compiled = re.compile(regex)
+                    positions = [i for i, name in enumerate(names) if compiled.fullmatch(name)]
+                self._slot_cache[obj] = th.tensor(positions, dtype=th.long)
+
+            slots.append((names, self._slot_cache[obj]))
+        return slots
+
     def pattern_to_data_points(self, pattern):
         """This method will receive any accepted pattern and transform it into data points to be \
             accepted by the method.
         """
-        pattern_decomp = self.standardize_pattern(pattern)
-
-        objects = []
-        regex = re.compile("[cp]\?.*?\?")
-        for pat in pattern_decomp:
-            match = regex.fullmatch(pat)
-            if match:
-                objects.append(match.group(0))
-
-        # objects =re.findall("[cr]\?.*?\?", pattern)
-        objects = [x[:-1] for x in objects]
-
-        objects_sub_lists = []
-
-        for obj in objects:
-            regex = obj[2:]
-            print(f"regex {regex}")
-            regex = re.compile(regex)
+        slots = self._resolve_slots(pattern)
+        objects_sub_lists = [[names[i] for i in positions.tolist()] for names, positions in slots]
+        return it.product(*objects_sub_lists)
 
-            if obj.startswith("c"):
-                iter_list = self.class_list
-            elif obj.startswith("p"):
-                iter_list = self.property_list
+    def _unravel(self, flat, slots):
+        """Maps flat positions in the Cartesian product of the slots to entity positions.
 
-            curr_list = []
-            for name in iter_list:
+        :rtype: :class:`torch.Tensor` of shape ``(len(flat), len(slots))``
+        """
+        columns = []
+        remainder = flat
+        for _, positions in reversed(slots):
+            columns.append(positions[remainder % len(positions)])
+            remainder = remainder // len(positions)
+        return th.stack(columns[::-1], dim=1)
+
+    def _score_data(self, data, slots):
+        if self.batch_method is not None:
+            return self.batch_method(data).reshape(-1).detach().cpu()
+
+        scores = []
+        for row in data.tolist():
+            point = tuple(names[i] for (names, _), i in zip(slots, row))
+            scores.append(self.method(point).cpu().detach().item())
+        return th.tensor(scores)
+
+    def iter_scores(self, pattern, batch_size=65536):
+        """Scores every axiom matching the pattern in chunks of the Cartesian product of the \
+pattern slots.
+
+        :param pattern: The pattern to score.
+        :type pattern: str
+        :param batch_size: Number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :return: Generator of ``(positions, scores)`` pairs, where ``positions`` has one row \
+per axiom with the positions of its entities in ``class_list`` or ``property_list``.
+        """
+        slots = self._resolve_slots(pattern)
+        total = int(np.prod([len(positions) for _, positions in slots]))
 
-                match = regex.fullmatch(name)
-                if match:
-                    curr_list.append(match.group(0))
-            objects_sub_lists.append(curr_list)
-        return it.product(*objects_sub_lists)
+        with th.no_grad():
+            for start in range(0, total, batch_size):
+                flat = th.arange(start, min(start + batch_size, total))
+                data = self._unravel(flat, slots)
+                yield data, self._score_data(data, slots)
 
     def inverse(self, point, pattern):
         output = []
@@ -97,14 +156,45 @@ class AxiomScoring():
         assert len(point) == 0
         return " ".join(output)
 
-    def score(self, pattern):
+    def _render(self, row, slots, pattern):
+        point = tuple(names[i] for (names, _), i in zip(slots, row))
+        return self.inverse(point[:pattern.count("??")], pattern)
+
+    def score(self, pattern, top_k=None, batch_size=65536):
+        """Scores the axioms matching a pattern. Lower scores are better.
+
+        :param pattern: The pattern to score.
+        :type pattern: str
+        :param top_k: If given, only the ``top_k`` best axioms are kept and rendered as \
+strings. Defaults to ``None``, which returns every axiom.
+        :type top_k: int, optional
+        :param batch_size: Number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :return: Dictionary mapping axioms to scores. With ``top_k``, axioms are ordered from \
+best to worst.
+        :rtype: dict
+        """
         can_pattern = self.canonical_expression(pattern)
         self.is_pattern_correct(can_pattern)
-        data_points = self.pattern_to_data_points(pattern)
-
-        preds = dict()
-        for point in tqdm(data_points):
-
-            preds[self.inverse(point, can_pattern)] = self.method(point).cpu().detach().item()
-
-        return preds
+        slots = self._resolve_slots(pattern)
+
+        if top_k is None:
+            preds = dict()
+            for data, scores in tqdm(self.iter_scores(pattern, batch_size=batch_size)):
+                for row, score in zip(data.tolist(), scores.tolist()):
+                    preds[self._render(row, slots, can_pattern)] = score
+            return preds
+
+        if not isinstance(top_k, int):
+            raise TypeError("Optional parameter top_k must be of type int.")
+
+        best_scores = th.empty(0)
+        best_data = th.empty((0, len(slots)), dtype=th.long)
+        for data, scores in tqdm(self.iter_scores(pattern, batch_size=batch_size)):
+            scores = th.cat([best_scores, scores.float()])
+            data = th.cat([best_data, data])
+            best_scores, idxs = th.topk(scores, min(top_k, len(scores)), largest=False)
+            best_data = data[idxs]
+
+        return {self._render(row, slots, can_pattern): score for row, score in
+                zip(best_data.tolist(), best_scores.tolist())}
@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 from mowl.inference.axiom_scoring import AxiomScoring
+from mowl.utils.embedding_store import EmbeddingStore
 import torch as th
 import torch.nn as nn
 from gensim.models.keyedvectors import KeyedVectors
@@ -11,18 +13,19 @@ class CosineSimilarityInfer(AxiomScoring):
         method = CosineSimilarity(embeddings)
         class_list = list(embeddings.keys())
         patterns = [f"c?? SubClassOf {relation} some c??"]
-        super().__init__(patterns, method, class_list)
+        # Positions in class_list are the embedding indices of the method.
+        super().__init__(patterns, method, class_list, batch_method=method)
 
     def embeddings_to_dict(self, embeddings):
         embeddings_dict = dict()
         if isinstance(embeddings, KeyedVectors):
             for idx, word in enumerate(embeddings.index_to_key):
                 embeddings_dict[word] = embeddings[word]
-        elif isinstance(embeddings, dict):
+        elif isinstance(embeddings, Mapping):
             embeddings_dict = embeddings
         else:
-            raise TypeError("Embeddings type {type(embeddings)} not recognized. Expected types \
-                are dict or gensim.models.keyedvectors.KeyedVectors")
+            raise TypeError(f"Embeddings type {type(embeddings)} not recognized. Expected types \
+                are dict, EmbeddingStore or gensim.models.keyedvectors.KeyedVectors")
 
         return embeddings_dict
 
@@ -33,22 +36,33 @@ class CosineSimilarity(nn.Module):
         super().__init__()
 
         self.class_index_dict = {v: k for k, v in enumerate(class_embeddings.keys())}
-        self.class_vectors = list(class_embeddings.values())
+        if isinstance(class_embeddings, EmbeddingStore):
+            self.class_vectors = th.tensor(class_embeddings.matrix)
+        else:
+            self.class_vectors = list(class_embeddings.values())
         self.device = device
         num_classes = len(self.class_vectors)
         embedding_size = len(self.class_vectors[0])
 
         if isinstance(self.class_vectors, list):
-            self.class_vectors = th.tensor(self.class_vectors).to(device)
+            self.class_vectors = th.tensor(self.class_vectors)
+        self.class_vectors = self.class_vectors.to(device)
 
         self.class_embedding_layer = nn.Embedding(num_classes, embedding_size)
         self.class_embedding_layer.weight = nn.parameter.Parameter(self.class_vectors)
 
     def forward(self, data):
-        x, y = data
-        x, y = self.class_index_dict[x], self.class_index_dict[y]
-        x = th.tensor([x]).to(self.device)
-        y = th.tensor([y]).to(self.device)
+        """Scores pairs of classes. ``data`` is either a pair of class names or a tensor of \
+shape ``(N, 2)`` with class indices.
+        """
+        if isinstance(data, th.Tensor):
+            data = data.to(self.device)
+            x, y = data[:, 0], data[:, 1]
+        else:
+            x, y = data
+            x, y = self.class_index_dict[x], self.class_index_dict[y]
+            x = th.tensor([x]).to(self.device)
+            y = th.tensor([y]).to(self.device)
         # implement code that checks dimensionality
 
         srcs = self.class_embedding_layer(x)
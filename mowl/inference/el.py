@@ -3,11 +3,11 @@ import re
 
 
 class GCI0Score(AxiomScoring):
-    def __init__(self, gci0_method, class_list):
+    def __init__(self, gci0_method, class_list, batch_method=None):
         patterns = ["c?? SubClassOf c??",
                     "not c?? or c?? SubClassOf owl:Nothing",
                     "not c??"]
-        super().__init__(patterns, gci0_method, class_list)
+        super().__init__(patterns, gci0_method, class_list, batch_method=batch_method)
 
     def standardize_pattern(self, pattern):
         if "SubClassOf" in pattern:
@@ -21,9 +21,9 @@ class GCI0Score(AxiomScoring):
 
 
 class GCI1Score(AxiomScoring):
-    def __init__(self, gci0_method, class_list):
+    def __init__(self, gci0_method, class_list, batch_method=None):
         patterns = ["c?? and c?? SubClassOf c??", "c?? DisjointWith c??"]
-        super().__init__(patterns, gci0_method, class_list)
+        super().__init__(patterns, gci0_method, class_list, batch_method=batch_method)
 
         def standardize_pattern(self, pattern):
             if "DisjointWith" in pattern:
@@ -37,12 +37,14 @@ class GCI1Score(AxiomScoring):
 
 
 class GCI2Score(AxiomScoring):
-    def __init__(self, gci0_method, class_list, property_list):
+    def __init__(self, gci0_method, class_list, property_list, batch_method=None):
         patterns = ["c?? SubClassOf p?? some c??"]
-        super().__init__(patterns, gci0_method, class_list, property_list)
+        super().__init__(patterns, gci0_method, class_list, property_list,
+                         batch_method=batch_method)
 
 
 class GCI3Score(AxiomScoring):
-    def __init__(self, gci0_method, class_list, property_list):
+    def __init__(self, gci0_method, class_list, property_list, batch_method=None):
         patterns = ["p?? some c?? SubClassOf c??"]
-        super().__init__(patterns, gci0_method, class_list, property_list)
+        super().__init__(patterns, gci0_method, class_list, property_list,
+                         batch_method=batch_method)
@@ -2,7 +2,10 @@ import numpy as np
 from torch.utils.data import IterableDataset, DataLoader
 from tqdm import tqdm
 from scipy.stats import rankdata
+import torch as th
 import torch.nn as nn
+from mowl.inference.elinfer.topk import stream_topk, pair_filter
+from mowl.projection.factory import projector_factory
 
 
 class GCI0Inference():
@@ -60,6 +63,60 @@ class GCI0Inference():
             sub, sup = self.index_class_dict[sub], self.index_class_dict[sup]
             print(sub, sup, score)
 
+    def infer_topk(self, class_index_dict, top_k=10, mode="superclass", batch_size=65536,
+                   axioms_to_filter=None):
+        """Streams the ``top_k`` best predicted axioms :math:`C \sqsubseteq D` per class \
+without building the dense prediction matrix.
+
+        :param class_index_dict: Dictionary mapping class names to embedding indices.
+        :type class_index_dict: dict
+        :param top_k: Number of predictions per class. Defaults to ``10``.
+        :type top_k: int, optional
+        :param mode: If ``"superclass"``, superclasses are predicted for every class; if \
+``"subclass"``, subclasses are predicted for every class. Defaults to ``"superclass"``.
+        :type mode: str, optional
+        :param batch_size: Maximum number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :param axioms_to_filter: Ontology whose subclass axioms are excluded from the \
+predictions. Defaults to ``None``.
+        :type axioms_to_filter: :class:`org.semanticweb.owlapi.model.OWLOntology`, optional
+        :return: Generator of ``(subclass, superclass, score)`` tuples.
+        """
+        if mode not in ["superclass", "subclass"]:
+            raise ValueError("Optional parameter mode must be either 'superclass' or 'subclass'.")
+
+        classes = list(class_index_dict.keys())
+        class_position = {c: i for i, c in enumerate(classes)}
+        emb_idxs = th.tensor(list(class_index_dict.values()), dtype=th.long, device=self.device)
+        num_classes = len(classes)
+
+        def score_fn(queries, candidates):
+            q = emb_idxs[queries].unsqueeze(1).expand(-1, len(candidates))
+            c = emb_idxs[candidates].unsqueeze(0).expand(len(queries), -1)
+            pair = (q, c) if mode == "superclass" else (c, q)
+            return self.method(th.stack(pair, dim=-1).reshape(-1, 2))
+
+        excluded = []
+        if axioms_to_filter is not None:
+            edges = projector_factory("taxonomy").project(axioms_to_filter)
+            for edge in edges:
+                if edge.src in class_position and edge.dst in class_position:
+                    sub, sup = class_position[edge.src], class_position[edge.dst]
+                    excluded.append((sub, sup) if mode == "superclass" else (sup, sub))
+        filtered = pair_filter(excluded, num_classes, device=self.device)
+
+        def mask_fn(queries, candidates):
+            diagonal = queries.unsqueeze(1) == candidates.unsqueeze(0)
+            return diagonal | filtered(queries, candidates)
+
+        records = stream_topk(score_fn, num_classes, num_classes, top_k, batch_size=batch_size,
+                              mask_fn=mask_fn, device=self.device)
+        for query, candidate, score in records:
+            if mode == "superclass":
+                yield classes[query], classes[candidate], score
+            else:
+                yield classes[candidate], classes[query], score
+
 
 class InferGCI0Module(nn.Module):
     def __init__(self, method):
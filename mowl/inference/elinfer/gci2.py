@@ -2,9 +2,11 @@ import numpy as np
 from torch.utils.data import IterableDataset, DataLoader
 from tqdm import tqdm
 from scipy.stats import rankdata
+import torch as th
 import torch.nn as nn
 import itertools
 from mowl.projection.factory import projector_factory
+from mowl.inference.elinfer.topk import stream_topk, pair_filter
 
 
 class GCI2Inference():
@@ -298,6 +300,94 @@ class GCI2Inference():
         axioms = dict(sorted(axioms.items(), key=lambda x: x[1]))
         return axioms
 
+    def infer_topk(
+            self, top_k=10, infer_mode="filler", subclass_condition=None,
+            property_condition=None, filler_condition=None, axioms_to_filter=None,
+            batch_size=65536):
+        """Streams the ``top_k`` best predicted axioms :math:`C \sqsubseteq \exists R.D` per \
+query without building dense prediction or filtering matrices. Queries are enumerated \
+arithmetically, so the full product of the two fixed entity sets is never stored.
+
+        :param top_k: Number of predictions per query. Defaults to ``10``.
+        :type top_k: int, optional
+        :param infer_mode: Entity to predict: ``"subclass"`` (:math:`C`), ``"property"`` \
+(:math:`R`) or ``"filler"`` (:math:`D`). Defaults to ``"filler"``.
+        :type infer_mode: str, optional
+        :param subclass_condition: Predicate selecting the subclasses. Defaults to ``None``.
+        :type subclass_condition: callable, optional
+        :param property_condition: Predicate selecting the properties. Defaults to ``None``.
+        :type property_condition: callable, optional
+        :param filler_condition: Predicate selecting the fillers. Defaults to ``None``.
+        :type filler_condition: callable, optional
+        :param axioms_to_filter: Ontology whose axioms are excluded from the predictions. \
+Defaults to ``None``.
+        :type axioms_to_filter: :class:`org.semanticweb.owlapi.model.OWLOntology`, optional
+        :param batch_size: Maximum number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :return: Generator of ``(subclass, property, filler, score)`` tuples.
+        """
+        if infer_mode not in ["subclass", "property", "filler"]:
+            raise ValueError("Optional parameter infer_mode must be one of 'subclass', "
+                             "'property' or 'filler'.")
+
+        subclasses = sorted(x for x in self.class_index_dict
+                            if subclass_condition is None or subclass_condition(x))
+        properties = sorted(x for x in self.property_index_dict
+                            if property_condition is None or property_condition(x))
+        fillers = sorted(x for x in self.class_index_dict
+                         if filler_condition is None or filler_condition(x))
+
+        def to_tensor(names, index_dict):
+            return th.tensor([index_dict[n] for n in names], dtype=th.long, device=self.device)
+
+        entities = {"subclass": subclasses, "property": properties, "filler": fillers}
+        embs = {"subclass": to_tensor(subclasses, self.class_index_dict),
+                "property": to_tensor(properties, self.property_index_dict),
+                "filler": to_tensor(fillers, self.class_index_dict)}
+        positions = {k: {n: i for i, n in enumerate(v)} for k, v in entities.items()}
+
+        # The two entities that are fixed in each query, in axiom order.
+        first, second = [k for k in ["subclass", "property", "filler"] if k != infer_mode]
+        num_second = len(entities[second])
+        num_queries = len(entities[first]) * num_second
+        num_candidates = len(entities[infer_mode])
+
+        def axiom_embs(queries, candidates):
+            shape = (len(queries), len(candidates))
+            parts = {first: embs[first][queries // num_second].unsqueeze(1).expand(shape),
+                     second: embs[second][queries % num_second].unsqueeze(1).expand(shape),
+                     infer_mode: embs[infer_mode][candidates].unsqueeze(0).expand(shape)}
+            return parts
+
+        def score_fn(queries, candidates):
+            parts = axiom_embs(queries, candidates)
+            x = th.stack([parts["subclass"], parts["property"], parts["filler"]], dim=-1)
+            return self.method(x.reshape(-1, 3))
+
+        excluded = []
+        if axioms_to_filter is not None:
+            triples = process_axioms(
+                axioms_to_filter, "taxonomy_rels", taxonomy=False, properties=properties)
+            for c, p, d in triples:
+                axiom = {"subclass": c, "property": p, "filler": d}
+                if all(axiom[k] in positions[k] for k in axiom):
+                    query = positions[first][axiom[first]] * num_second + \
+                        positions[second][axiom[second]]
+                    excluded.append((query, positions[infer_mode][axiom[infer_mode]]))
+        filtered = pair_filter(excluded, num_candidates, device=self.device)
+
+        def mask_fn(queries, candidates):
+            parts = axiom_embs(queries, candidates)
+            return (parts["subclass"] == parts["filler"]) | filtered(queries, candidates)
+
+        records = stream_topk(score_fn, num_queries, num_candidates, top_k,
+                              batch_size=batch_size, mask_fn=mask_fn, device=self.device)
+        for query, candidate, score in records:
+            axiom = {first: entities[first][query // num_second],
+                     second: entities[second][query % num_second],
+                     infer_mode: entities[infer_mode][candidate]}
+            yield axiom["subclass"], axiom["property"], axiom["filler"], score
+
 
 class InferGCI2Module(nn.Module):
     def __init__(self, method):
@@ -0,0 +1,91 @@
+import torch as th
+
+
+def stream_topk(score_fn, num_queries, num_candidates, top_k, batch_size=65536, mask_fn=None,
+                device="cpu"):
+    """Streams the ``top_k`` best candidates of every query without materializing the full \
+score matrix. Lower scores are better.
+
+    Queries and candidates are referred to by their position in ``range(num_queries)`` and \
+``range(num_candidates)``. At most ``batch_size`` pairs are scored at once; the running top-k of \
+each query is merged with every new chunk of candidates using :func:`torch.topk`, so memory is \
+bounded by ``batch_size`` and the number of queries in a chunk times ``top_k``.
+
+    :param score_fn: Function taking a tensor of query positions of shape ``(Q,)`` and a tensor \
+of candidate positions of shape ``(C,)`` and returning scores of shape ``(Q, C)``.
+    :type score_fn: callable
+    :param num_queries: Number of queries.
+    :type num_queries: int
+    :param num_candidates: Number of candidates.
+    :type num_candidates: int
+    :param top_k: Number of candidates kept per query.
+    :type top_k: int
+    :param batch_size: Maximum number of pairs scored at once. Defaults to ``65536``.
+    :type batch_size: int, optional
+    :param mask_fn: Function with the same inputs as ``score_fn`` returning a boolean tensor of \
+shape ``(Q, C)`` that is ``True`` for pairs that must be filtered out. Defaults to ``None``.
+    :type mask_fn: callable, optional
+    :param device: Device where query and candidate positions are created.
+    :type device: str, optional
+    :return: Generator of ``(query, candidate, score)`` tuples. For every query the candidates \
+are yielded from best to worst.
+    """
+    if not isinstance(top_k, int):
+        raise TypeError("Parameter top_k must be of type int.")
+    if not isinstance(batch_size, int):
+        raise TypeError("Optional parameter batch_size must be of type int.")
+
+    top_k = min(top_k, num_candidates)
+    if top_k <= 0 or num_queries == 0:
+        return
+
+    candidate_chunk = min(num_candidates, batch_size)
+    query_chunk = max(1, batch_size // candidate_chunk)
+    all_candidates = th.arange(num_candidates, device=device)
+
+    with th.no_grad():
+        for query_start in range(0, num_queries, query_chunk):
+            queries = th.arange(query_start, min(query_start + query_chunk, num_queries),
+                                device=device)
+            best_scores = th.empty((len(queries), 0), device=device)
+            best_candidates = th.empty((len(queries), 0), dtype=th.long, device=device)
+
+            for candidate_start in range(0, num_candidates, candidate_chunk):
+                candidates = all_candidates[candidate_start:candidate_start + candidate_chunk]
+                scores = score_fn(queries, candidates).reshape(len(queries), len(candidates))
+                scores = scores.float().to(device)
+                if mask_fn is not None:
+                    scores = scores.masked_fill(mask_fn(queries, candidates), float("inf"))
+
+                scores = th.cat([best_scores, scores], dim=1)
+                candidates = th.cat([best_candidates,
+                                     candidates.expand(len(queries), -1)], dim=1)
+                best_scores, positions = th.topk(scores, min(top_k, scores.shape[1]), dim=1,
+                                                 largest=False, sorted=True)
+                best_candidates = th.gather(candidates, 1, positions)
+
+            rows = zip(queries.tolist(), best_candidates.tolist(), best_scores.tolist())
+            for query, candidate_row, score_row in rows:
+                for candidate, score in zip(candidate_row, score_row):
+                    if score == float("inf"):
+                        break
+                    yield query, candidate, score
+
+
+def pair_filter(excluded_pairs, num_candidates, device="cpu"):
+    """Creates a ``mask_fn`` for :func:`stream_topk` from a sparse collection of pairs.
+
+    :param excluded_pairs: Pairs of ``(query, candidate)`` positions to filter out.
+    :type excluded_pairs: iterable of tuple
+    :param num_candidates: Number of candidates.
+    :type num_candidates: int
+    :rtype: callable
+    """
+    codes = [query * num_candidates + candidate for query, candidate in excluded_pairs]
+    codes = th.tensor(sorted(set(codes)), dtype=th.long, device=device)
+
+    def mask_fn(queries, candidates):
+        pair_codes = queries.unsqueeze(1) * num_candidates + candidates.unsqueeze(0)
+        return th.isin(pair_codes, codes)
+
+    return mask_fn
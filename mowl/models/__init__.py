@@ -1,13 +1,18 @@
-from mowl.models.elembeddings.model import ELEmbeddings
-from mowl.models.elembeddings.examples.model_ppi import ELEmPPI
-from mowl.models.elembeddings.examples.model_gda import ELEmGDA
+from mowl.utils.lazy import lazy_exports
 
-from mowl.models.elbe.model import ELBoxEmbeddings, ELBE
-from mowl.models.elbe.examples.model_ppi import ELBEPPI
-from mowl.models.elbe.examples.model_gda import ELBEGDA
+_EXPORTS = {
+    "ELEmbeddings": "mowl.models.elembeddings.model",
+    "ELEmPPI": "mowl.models.elembeddings.examples.model_ppi",
+    "ELEmGDA": "mowl.models.elembeddings.examples.model_gda",
+    "ELBoxEmbeddings": "mowl.models.elbe.model",
+    "ELBE": "mowl.models.elbe.model",
+    "ELBEPPI": "mowl.models.elbe.examples.model_ppi",
+    "ELBEGDA": "mowl.models.elbe.examples.model_gda",
+    "BoxSquaredEL": "mowl.models.boxsquaredel.model",
+    "RandomWalkPlusW2VModel": "mowl.models.graph_random_walk.random_walk_w2v_model",
+    "GraphPlusPyKEENModel": "mowl.models.graph_kge.graph_pykeen_model",
+    "SyntacticPlusW2VModel": "mowl.models.syntactic.w2v_model",
+}
 
-from mowl.models.boxsquaredel.model import BoxSquaredEL
-
-from mowl.models.graph_random_walk.random_walk_w2v_model import RandomWalkPlusW2VModel
-from mowl.models.graph_kge.graph_pykeen_model import GraphPlusPyKEENModel
-from mowl.models.syntactic.w2v_model import SyntacticPlusW2VModel
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
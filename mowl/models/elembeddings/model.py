@@ -3,6 +3,8 @@ from mowl.nn import ELEmModule
 from tqdm import trange, tqdm
 import torch as th
 import numpy as np
+from mowl.utils.training import AsyncCheckpointer, EarlyStopping
+from mowl.utils.instrumentation import timed, timer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,7 +55,24 @@ class ELEmbeddings(EmbeddingELModel):
             margin=self.margin
         ).to(self.device)
 
-    def train(self, epochs=None, validate_every=1):
+    @timed("train")
+    def train(self, epochs=None, validate_every=1, validation_metric="loss", patience=None):
+        """Trains the model.
+
+        :param epochs: Number of epochs. If ``None``, the value passed to the constructor is \
+used. Defaults to ``None``.
+        :type epochs: int, optional
+        :param validate_every: Number of epochs between validation steps. Defaults to 1.
+        :type validate_every: int, optional
+        :param validation_metric: Metric used for model selection. ``"loss"`` uses the mean \
+loss of the validation GCI2 axioms. ``"mrr"`` and ``"hits@k"`` use a ranking metric over a \
+fixed random subset of candidate classes (see :meth:`sampled_ranking_metric`). Defaults to \
+``"loss"``.
+        :type validation_metric: str, optional
+        :param patience: Number of validation steps without improvement before training stops. \
+If ``None``, training runs for all the epochs. Defaults to ``None``.
+        :type patience: int, optional
+        """
         logger.warning('You are using the default training method. If you want to use a cutomized training method (e.g., different negative sampling, etc.), please reimplement the train method in a subclass.')
 
         points_per_dataset = {k: len(v) for k, v in self.training_datasets.items()}
@@ -64,7 +83,9 @@ class ELEmbeddings(EmbeddingELModel):
         logger.info(string)
             
         optimizer = th.optim.Adam(self.module.parameters(), lr=self.learning_rate)
-        best_loss = float('inf')
+        mode = "min" if validation_metric == "loss" else "max"
+        early_stopping = EarlyStopping(patience=patience, mode=mode)
+        checkpointer = AsyncCheckpointer(self.model_filepath)
 
         all_classes_ids = list(self.class_index_dict.values())
         all_inds_ids = list(self.individual_index_dict.values())
@@ -72,56 +93,57 @@ class ELEmbeddings(EmbeddingELModel):
         if epochs is None:
             epochs = self.epochs
         
-        for epoch in trange(epochs):
-            self.module.train()
-
-            train_loss = 0
-            loss = 0
-
-            for gci_name, gci_dataset in self.training_datasets.items():
-                if len(gci_dataset) == 0:
-                    continue
-
-                loss += th.mean(self.module(gci_dataset[:], gci_name))
-                if gci_name == "gci2":
-                    idxs_for_negs = np.random.choice(all_classes_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
-                    loss += th.mean(self.module(neg_data, gci_name, neg=True))
-
-                if gci_name == "object_property_assertion":
-                    idxs_for_negs = np.random.choice(all_inds_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
-                    loss += th.mean(self.module(neg_data, gci_name, neg=True))
+        try:
+            for epoch in trange(epochs):
+                with timer("epoch", model=type(self).__name__, epoch=epoch + 1) as epoch_timer:
+                    self.module.train()
+
+                    train_loss = 0
+                    loss = 0
+
+                    for gci_name, gci_dataset in self.training_datasets.items():
+                        if len(gci_dataset) == 0:
+                            continue
+
+                        loss += th.mean(self.module(gci_dataset[:], gci_name))
+                        if gci_name == "gci2":
+                            idxs_for_negs = np.random.choice(all_classes_ids, size=len(gci_dataset), replace=True)
+                            rand_index = th.tensor(idxs_for_negs).to(self.device)
+                            data = gci_dataset[:]
+                            neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                            loss += th.mean(self.module(neg_data, gci_name, neg=True))
+
+                        if gci_name == "object_property_assertion":
+                            idxs_for_negs = np.random.choice(all_inds_ids, size=len(gci_dataset), replace=True)
+                            rand_index = th.tensor(idxs_for_negs).to(self.device)
+                            data = gci_dataset[:]
+                            neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                            loss += th.mean(self.module(neg_data, gci_name, neg=True))
                     
-            loss += self.module.regularization_loss()
+                    loss += self.module.regularization_loss()
                     
-            optimizer.zero_grad()
-            loss.backward()
-            optimizer.step()
-            train_loss += loss.detach().item()
-
-            loss = 0
-
-            if (epoch + 1) % validate_every == 0:
-                if self.dataset.validation is not None:
-                    with th.no_grad():
-                        self.module.eval()
-                        valid_loss = 0
-                        gci2_data = self.validation_datasets["gci2"][:]
-                        loss = th.mean(self.module(gci2_data, "gci2"))
-                        valid_loss += loss.detach().item()
-
-
-                        if valid_loss < best_loss:
-                            best_loss = valid_loss
-                            th.save(self.module.state_dict(), self.model_filepath)
-                    print(f'Epoch {epoch+1}: Train loss: {train_loss} Valid loss: {valid_loss}')
-                else:
-                    print(f'Epoch {epoch+1}: Train loss: {train_loss}')
+                    optimizer.zero_grad()
+                    loss.backward()
+                    optimizer.step()
+                    train_loss += loss.detach().item()
+                    epoch_timer.set(loss=train_loss)
+
+                loss = 0
+
+                if (epoch + 1) % validate_every == 0:
+                    if self.dataset.validation is not None:
+                        valid_value = self.validate(metric=validation_metric)
+                        if early_stopping.step(valid_value):
+                            checkpointer.save(self.module)
+                        print(f'Epoch {epoch+1}: Train loss: {train_loss} Valid {validation_metric}: {valid_value}')
+
+                        if early_stopping.should_stop:
+                            logger.info(f"Early stopping at epoch {epoch+1}. Best valid {validation_metric}: {early_stopping.best}")
+                            break
+                    else:
+                        print(f'Epoch {epoch+1}: Train loss: {train_loss}')
+        finally:
+            checkpointer.close()
  
     def eval_method(self, data):
         return self.module.gci2_loss(data)
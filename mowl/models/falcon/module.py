@@ -4,6 +4,12 @@ from mowl.owlapi import OWLAPIAdapter, ClassExpressionType, OWLSubClassOfAxiom,
     OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, OWLClassAssertionAxiom, \
     OWLObjectPropertyAssertionAxiom
 
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
 
 class FALCONModule(th.nn.Module):
     """Based on the original implementation at \
@@ -38,6 +44,33 @@ https://github.com/bio-ontology-research-group/FALCON
         self.residuum = residuum
         self.device = device
         self.adapter = OWLAPIAdapter()
+        self.nrelations = nrelations
+        self.embed_dim = embed_dim
+        self._heads_csr = self._build_csr(heads_dict)
+        self._tails_csr = self._build_csr(tails_dict)
+
+    def _build_csr(self, used_dict):
+        """Encodes a dictionary ``{(entity, relation): [used entities]}`` as two sorted arrays of \
+codes. ``keys`` holds one code per ``(entity, relation)`` pair and ``used`` holds one code per \
+``(pair position, used entity)``, so membership tests become binary searches.
+        """
+        pairs = sorted(used_dict.keys())
+        keys = th.tensor([e * self.nrelations + r for e, r in pairs], dtype=th.int64)
+        used = [row * self.nentities + ent for row, pair in enumerate(pairs)
+                for ent in sorted(set(used_dict[pair]))]
+        used = th.tensor(used, dtype=th.int64)
+        return keys, used
+
+    @staticmethod
+    def _isin_sorted(values, sorted_codes):
+        if len(sorted_codes) == 0:
+            return th.zeros_like(values, dtype=th.bool)
+        pos = th.searchsorted(sorted_codes, values).clamp(max=len(sorted_codes) - 1)
+        return sorted_codes[pos] == values
+
+    def _split_fc_0(self):
+        weight = self.fc_0.weight[0]
+        return weight[:self.embed_dim], weight[self.embed_dim:], self.fc_0.bias[0]
 
     def _mem(self, c_emb, e_emb):
         emb = th.cat([c_emb, e_emb], dim=-1)
@@ -91,26 +124,53 @@ https://github.com/bio-ontology-research-group/FALCON
         return ret.expand_as(r_fs)
     
     def _get_c_fs_batch(self, c_emb, e_emb):
-        e_emb = e_emb.unsqueeze(
-            dim=0).repeat(c_emb.size()[0], 1, 1)
-        c_emb = c_emb.unsqueeze(dim=1).expand_as(e_emb)
-        return self._mem(c_emb, e_emb).squeeze(dim=-1)
+        # fc_0 is linear, so the membership of every entity in every class splits into a class
+        # term and an entity term that are computed once and broadcast.
+        w_c, w_e, bias = self._split_fc_0()
+        return th.sigmoid((c_emb @ w_c).unsqueeze(dim=1) + (e_emb @ w_e).unsqueeze(dim=0) + bias)
 
     def _get_r_fs_batch(self, r_emb, e_emb):
-        e_emb = e_emb.unsqueeze(
-            dim=0).repeat(r_emb.size()[0], 1, 1)
-        r_emb = r_emb.unsqueeze(dim=1).expand_as(e_emb)
-        return self._mem(e_emb + r_emb, e_emb).squeeze(dim=-1)
-
-    def sample_negatives(self, e, r, used_dict):
-        ret = th.zeros((e.shape[0], self.num_negs), dtype=th.int64)
-        for i in range(e.shape[0]):
-            used = th.tensor(used_dict[(e[i].item(), r[i].item())])
-            neg_pool = th.ones(self.nentities)
-            neg_pool[used] = 0
-            neg_pool = neg_pool.nonzero()
-            neg = neg_pool[th.randint(len(neg_pool), (self.num_negs,))]
-            ret[i, :] = neg.flatten()
+        # Same as _mem(e_emb + r_emb, e_emb) for every pair of relation and entity.
+        w_c, w_e, bias = self._split_fc_0()
+        return th.sigmoid((r_emb @ w_c).unsqueeze(dim=1) +
+                          (e_emb @ (w_c + w_e)).unsqueeze(dim=0) + bias)
+
+    def sample_negatives(self, e, r, used_dict, max_rounds=100):
+        """Samples ``num_negs`` entities per example uniformly among the entities that are not \
+in ``used_dict[(e, r)]``. Rejected samples are redrawn for at most ``max_rounds`` rounds; \
+samples still rejected after that are kept and a warning is logged. Pairs ``(e, r)`` missing \
+from ``used_dict`` have no known entities, so any entity can be sampled for them.
+        """
+        if used_dict is self.heads_dict:
+            keys, used = self._heads_csr
+        elif used_dict is self.tails_dict:
+            keys, used = self._tails_csr
+        else:
+            keys, used = self._build_csr(used_dict)
+
+        e = e.reshape(-1).cpu()
+        r = r.reshape(-1).cpu()
+        pair_codes = e * self.nrelations + r
+        rows = th.searchsorted(keys, pair_codes)
+        found = self._isin_sorted(pair_codes, keys)
+        rows = th.where(found, rows, th.full_like(rows, -1)).unsqueeze(dim=1)
+
+        def known(samples):
+            return self._isin_sorted(rows * self.nentities + samples, used) & (rows >= 0)
+
+        ret = th.randint(self.nentities, (e.shape[0], self.num_negs), dtype=th.int64)
+        rejected = known(ret)
+        for _ in range(max_rounds):
+            num_rejected = int(rejected.sum())
+            if num_rejected == 0:
+                break
+            ret[rejected] = th.randint(self.nentities, (num_rejected,), dtype=th.int64)
+            rejected = known(ret)
+
+        num_rejected = int(rejected.sum())
+        if num_rejected > 0:
+            logger.warning(f"{num_rejected} negative samples are known entities after "
+                           f"{max_rounds} rounds of rejection sampling.")
         return ret
 
     def forward_fs(self, cexpr, x, e_emb, cur_index=0):
@@ -2,14 +2,15 @@ from pykeen.models import ERModel
 
 from mowl.base_models import KGEModel
 from mowl.projection import Edge
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.utils.instrumentation import timed
 import torch as th
-import copy
-import numpy as np
 from pykeen.nn.init import PretrainedInitializer
 import os
 import mowl.error.messages as msg
 from pykeen.training import SLCWATrainingLoop
-from deprecated.sphinx import versionadded
+from pykeen.triples import TriplesFactory
+from deprecated.sphinx import versionadded, versionchanged
 import logging
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler()
@@ -52,60 +53,43 @@ class GraphPlusPyKEENModel(KGEModel):
         return self._triples_factory
 
 
+    def _entity_store(self, name_to_id, representations):
+        if len(name_to_id) == 0:
+            return EmbeddingStore.from_dict(dict())
+
+        idxs = th.tensor(list(name_to_id.values()))
+        matrix = representations(indices=idxs).cpu().detach().numpy()
+        return EmbeddingStore(list(name_to_id.keys()), matrix)
+
     @property
     def class_embeddings(self):
         if self._kge_method is None:
             raise AttributeError(msg.MODEL_NOT_TRAINED_OR_LOADED)
-        
-        classes = self.dataset.classes.as_str
-        if len(classes) == 0:
-            return dict()
-
-        
-        cls_graph_id = {cls: self.triples_factory.entity_to_id[cls] for cls in classes if cls in self.triples_factory.entity_to_id}
 
-        def get_embedding(idxs):
-            return self._kge_method.entity_representations[0](indices=idxs).cpu().detach().numpy()
-
-        idxs = th.tensor(list(cls_graph_id.values()))
-        cls_embeddings = dict(zip(cls_graph_id.keys(), get_embedding(idxs)))
-        return cls_embeddings
+        entity_to_id = self.triples_factory.entity_to_id
+        classes = {cls: entity_to_id[cls] for cls in self.dataset.classes.as_str
+                   if cls in entity_to_id}
+        return self._entity_store(classes, self._kge_method.entity_representations[0])
 
     @property
     def object_property_embeddings(self):
         if self._kge_method is None:
             raise AttributeError(msg.MODEL_NOT_TRAINED_OR_LOADED)
 
-        object_properties = self.graph_relation_to_id.keys()
-        if len(object_properties) == 0:
-            return dict()
-
-        op_graph_id = {op: self.triples_factory.relation_to_id[op] for op in object_properties if op in self.triples_factory.relation_to_id}
-
-        def get_embedding(idxs):
-            return self._kge_method.relation_representations[0](indices=idxs).cpu().detach().numpy()
+        relation_to_id = self.triples_factory.relation_to_id
+        object_properties = {op: relation_to_id[op] for op in self.graph_relation_to_id.keys()
+                             if op in relation_to_id}
+        return self._entity_store(object_properties, self._kge_method.relation_representations[0])
 
-        idxs = th.tensor(list(op_graph_id.values()))
-        op_embeddings = dict(zip(op_graph_id.keys(), get_embedding(idxs)))
-        return op_embeddings
-    
     @property
     def individual_embeddings(self):
         if self._kge_method is None:
             raise AttributeError(msg.MODEL_NOT_TRAINED_OR_LOADED)
-        
-        individuals = self.dataset.individuals.as_str
-        if len(individuals) == 0:
-            return dict()
 
-        ind_graph_id = {ind: self.triples_factory.entity_to_id[ind] for ind in individuals if ind in self.triples_factory.entity_to_id}
-
-        def get_embedding(idxs):
-            return self._kge_method.entity_representations[0](indices=idxs).cpu().detach().numpy()
-
-        idxs = th.tensor(list(ind_graph_id.values()))
-        ind_embeddings = dict(zip(ind_graph_id.keys(), get_embedding(idxs)))
-        return ind_embeddings
+        entity_to_id = self.triples_factory.entity_to_id
+        individuals = {ind: entity_to_id[ind] for ind in self.dataset.individuals.as_str
+                       if ind in entity_to_id}
+        return self._entity_store(individuals, self._kge_method.entity_representations[0])
 
     @property
     def evaluation_model(self):
@@ -138,6 +122,7 @@ class GraphPlusPyKEENModel(KGEModel):
 
 
 
+    @timed("train")
     def train(self, epochs=0):
         """
         Triggers the PyKEEN training process.
@@ -167,53 +152,57 @@ class GraphPlusPyKEENModel(KGEModel):
         th.save(self._kge_method, self.model_filepath)
 
         
+    @versionchanged(version="1.0.2", reason="Only the new axioms are projected and the \
+embedding tables are extended without changing the ids of existing entities.")
     def add_axioms(self, *axioms):
-        prev_class_embeds = copy.deepcopy(self.class_embeddings)
-        prev_object_property_embeds = copy.deepcopy(self.object_property_embeddings)
-        prev_individual_embeds = copy.deepcopy(self.individual_embeddings)
-        prev_relation_to_id = self.triples_factory.relation_to_id
-        print(f"Number of classes before adding axioms: {len(prev_class_embeds)}")
-        print(f"Number of object properties before adding axioms: {len(prev_object_property_embeds)}")
-        print(f"Number of individuals before adding axioms: {len(prev_individual_embeds)}")
-        
-        self.dataset.add_axioms(*axioms)
-        self._load_edges()
-        self._triples_factory = Edge.as_pykeen(self.edges, entity_to_id = self.graph_node_to_id,
-                                               relation_to_id = self.graph_relation_to_id, create_inverse_triples=False)
-
-
-        new_class_embeds = []
-        for new_node, new_id in self.graph_node_to_id.items():
-            if new_node in prev_class_embeds:
-                new_class_embeds.append(prev_class_embeds[new_node])
-            elif new_node in prev_individual_embeds:
-                new_class_embeds.append(prev_individual_embeds[new_node])
-            else:
-                class_size = self._kge_method.entity_representations[0](indices=None).shape[1]
-                new_class_embeds.append(np.random.normal(size=class_size))
-                
-        new_class_embeds = np.asarray(new_class_embeds)
-
-        new_object_property_embeds = []
-        for new_relation, new_id in self.graph_relation_to_id.items():
-            if new_relation in prev_object_property_embeds:
-                new_object_property_embeds.append(prev_object_property_embeds[new_relation])
-            else:
-                op_size = self._kge_method.relation_representations[0](indices=None).shape[1]
-                new_object_property_embeds.append(np.random.normal(size=op_size))
-
-        new_object_property_embeds = np.asarray(new_object_property_embeds)
-
-        pretrained_cls_embeddings = th.tensor(new_class_embeds)
-        pretrained_op_embeddings = th.tensor(new_object_property_embeds)
-        
-        new_kge_method = self._kge_method_uninitialized(triples_factory=self.triples_factory,
-                                                        entity_initializer=PretrainedInitializer(tensor=pretrained_cls_embeddings),
-                                                        relation_initializer=PretrainedInitializer(tensor=pretrained_op_embeddings),
-                                                        *self._kge_method_args, **self._kge_method_kwargs)
-        self._kge_method = new_kge_method
+        """Adds axioms to the training ontology. Only the new axioms are projected; their edges \
+are appended to the graph and to the triples factory. New entities and relations get ids after \
+the existing ones and are randomly initialized, while existing embeddings keep their values \
+and ids.
 
+        :param axioms: Axioms to add.
+        :type axioms: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        """
+        if self._kge_method is None:
+            raise AttributeError(msg.MODEL_NOT_TRAINED_OR_LOADED)
 
+        prev_triples_factory = self.triples_factory
+        prev_entity_embeds = self._kge_method.entity_representations[0](indices=None).detach()
+        prev_relation_embeds = self._kge_method.relation_representations[0](indices=None).detach()
+
+        self.dataset.add_axioms(*axioms)
+        new_edges = self._extend_graph(axioms)
+
+        entity_to_id = self.graph_node_to_id
+        relation_to_id = self.graph_relation_to_id
+        new_triples = th.tensor([[entity_to_id[edge.src], relation_to_id[edge.rel],
+                                  entity_to_id[edge.dst]] for edge in new_edges],
+                                dtype=prev_triples_factory.mapped_triples.dtype).reshape(-1, 3)
+        mapped_triples = th.cat([prev_triples_factory.mapped_triples, new_triples])
+        self._triples_factory = TriplesFactory(mapped_triples, entity_to_id=entity_to_id,
+                                               relation_to_id=relation_to_id,
+                                               create_inverse_triples=False)
+
+        num_new_entities = len(entity_to_id) - prev_entity_embeds.shape[0]
+        num_new_relations = len(relation_to_id) - prev_relation_embeds.shape[0]
+        logger.info(f"Added {len(new_edges)} edges, {num_new_entities} entities and "
+                    f"{num_new_relations} relations to the graph.")
+
+        def extend(embeds, num_new):
+            new_embeds = th.randn(num_new, *embeds.shape[1:], dtype=embeds.dtype,
+                                  device=embeds.device)
+            return th.cat([embeds, new_embeds]).cpu()
+
+        entity_embeds = extend(prev_entity_embeds, num_new_entities)
+        relation_embeds = extend(prev_relation_embeds, num_new_relations)
+
+        new_kge_method = self._kge_method_uninitialized(
+            *self._kge_method_args, triples_factory=self.triples_factory,
+            entity_initializer=PretrainedInitializer(tensor=entity_embeds),
+            relation_initializer=PretrainedInitializer(tensor=relation_embeds),
+            **self._kge_method_kwargs)
+        self._kge_method = new_kge_method.to(self.device)
+        self._evaluation_model = None
 
     def from_pretrained(self, model):
         #self._model_filepath = model
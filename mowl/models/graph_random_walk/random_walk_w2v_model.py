@@ -1,8 +1,11 @@
 from mowl.base_models.graph_model import RandomWalkModel
 from gensim.models import Word2Vec
-from gensim.models.word2vec import LineSentence
 import mowl.error.messages as msg
+from mowl.corpus import TokenCorpus, merge_corpus_files
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.utils.instrumentation import timed
 import os
+import tempfile
 import time
 import numpy as np
 import torch as th
@@ -19,15 +22,30 @@ logger.setLevel(logging.INFO)
 class RandomWalkPlusW2VModel(RandomWalkModel):
     """
     Embedding model that combines graph projections + random walks.
+
+    Walks are parsed once into a :class:`mowl.corpus.TokenCorpus` that is used to build the \
+Word2Vec vocabulary and for every training epoch. The walkers write the walks as text, and the \
+token counts of the vocabulary are computed from the token array built while parsing them.
+
+    :param corpus_dir: Directory where the tokenized walks are stored and memory-mapped from. If \
+``None``, the tokenized walks are kept in memory. Defaults to ``None``.
+    :type corpus_dir: str, optional
     """
     
-    def __init__(self, *args, **kwargs):
+    @versionchanged(version="1.0.2", reason="Added the ``corpus_dir`` parameter.")
+    def __init__(self, *args, corpus_dir=None, **kwargs):
         super(RandomWalkPlusW2VModel, self).__init__(*args, **kwargs)
 
+        if corpus_dir is not None and not isinstance(corpus_dir, str):
+            raise TypeError("Optional parameter corpus_dir must be of type str.")
+
+        self.corpus_dir = corpus_dir
+        self._walk_corpus = None
         self._edges = None
+        self._edges_by_node = None
         self.w2v_model = None
         self.update_w2v_model = False
-        self.axioms_added = False
+        self._graph_walked = False
 
         self.device = th.device("cuda" if th.cuda.is_available() else "cpu")
         
@@ -38,11 +56,7 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
         
-        cls_embeds = {}
-        for cls in self.dataset.classes.as_str:
-            if cls in self.w2v_model.wv:
-                cls_embeds[cls] = self.w2v_model.wv[cls]
-        return cls_embeds
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv, self.dataset.classes.as_str)
 
     @property
     def object_property_embeddings(self):
@@ -51,11 +65,8 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
 
-        obj_prop_embeds = {}
-        for obj_prop in self.dataset.object_properties.as_str:
-            if obj_prop in self.w2v_model.wv:
-                obj_prop_embeds[obj_prop] = self.w2v_model.wv[obj_prop]
-        return obj_prop_embeds
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv,
+                                                 self.dataset.object_properties.as_str)
 
     @property
     def individual_embeddings(self):
@@ -63,13 +74,8 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
             raise AttributeError(msg.W2V_MODEL_NOT_SET)
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
-        
-        
-        ind_embeds = {}
-        for ind in self.dataset.individuals.as_str:
-            if ind in self.w2v_model.wv:
-                ind_embeds[ind] = self.w2v_model.wv[ind]
-        return ind_embeds
+
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv, self.dataset.individuals.as_str)
 
 
     @property
@@ -90,12 +96,43 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         self.w2v_model = Word2Vec(*args, **kwargs)
         self.embed_dim = self.w2v_model.vector_size
 
-    def train(self, epochs=None):
+    @property
+    @versionadded(version="1.0.2")
+    def walk_corpus(self):
+        """Tokenized random walks used to train the Word2Vec model.
+
+        :rtype: :class:`mowl.corpus.TokenCorpus`
+        """
+        if self._walk_corpus is None:
+            raise AttributeError(msg.CORPUS_NOT_GENERATED)
+        return self._walk_corpus
+
+    def _load_walks(self):
+        """Parses the walks written by the walker, which are split in several files if the \
+walker is sharded. If :attr:`corpus_dir` is set, the tokenized walks are saved there and \
+memory-mapped."""
+        corpus = TokenCorpus.from_files(self.walker.walk_files)
+        if self.corpus_dir is None:
+            return corpus
+
+        prefix = os.path.join(self.corpus_dir, "walks")
+        corpus.save(prefix)
+        return TokenCorpus.load(prefix, mmap=True)
+
+    @versionchanged(version="1.0.2", reason="Walks are parsed once into a token corpus and \
+the vocabulary is built from its token counts. Added the ``use_corpus_file`` and ``workers`` \
+parameters.")
+    @timed("train")
+    def train(self, epochs=None, use_corpus_file=False, workers=None):
         """
         Triggers the Word2Vec training process.
 
         :param epochs: Number of epochs to train the model. If None, the value of the epochs parameter passed to the constructor will be used.
         :type epochs: int
+        :param use_corpus_file: If True, Word2Vec reads the walk file itself through its ``corpus_file`` mode, in which each worker trains on its own byte range of the file without going through the Python iterator. This scales to more workers than the default mode. Walks of a sharded walker are merged into a temporary file first. Default is False.
+        :type use_corpus_file: bool, optional
+        :param workers: Number of Word2Vec worker threads. If None, the value set in :meth:`set_w2v_model` is used.
+        :type workers: int, optional
         """
         if self.projector is None:
             raise AttributeError(msg.GRAPH_MODEL_PROJECTOR_NOT_SET)
@@ -103,40 +140,125 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
             raise AttributeError(msg.RANDOM_WALK_MODEL_WALKER_NOT_SET)
         if self.w2v_model is None:
             raise AttributeError(msg.W2V_MODEL_NOT_SET)
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise TypeError("Optional parameter workers must be of type int.")
+            self.w2v_model.workers = workers
         if epochs is None:
             epochs = self.w2v_model.epochs
 
-        if self._edges is None or self.axioms_added:
-            self.axioms_added = False
+        if self._edges is None:
             self._edges = self.projector.project(self.dataset.ontology)
-            
+            self._edges_by_node = None
+
+        if not self._graph_walked:
             self.walker.walk(self._edges)
-            
-        sentences = LineSentence(self.walker.outfile)
-        self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
-        if epochs > 0:
-            self.w2v_model.train(sentences, total_examples=self.w2v_model.corpus_count, epochs=epochs)
-        
+            self._graph_walked = True
+            self._walk_corpus = None
+
+        if self._walk_corpus is None:
+            self._walk_corpus = self._load_walks()
+
+        sentences = self._walk_corpus
+        sentences.build_vocab(self.w2v_model, update=self.update_w2v_model)
+        if epochs <= 0:
+            return
+
+        if use_corpus_file:
+            walk_files = self.walker.walk_files
+            if len(walk_files) == 1:
+                self.w2v_model.train(corpus_file=walk_files[0], total_examples=len(sentences),
+                                     total_words=sentences.num_words, epochs=epochs)
+                return
+
+            # Word2Vec reads a single file, so the shards are merged into a temporary one.
+            fd, corpus_file = tempfile.mkstemp(suffix=".txt",
+                                               dir=os.path.dirname(os.path.abspath(walk_files[0])))
+            os.close(fd)
+            try:
+                merge_corpus_files(walk_files, corpus_file)
+                self.w2v_model.train(corpus_file=corpus_file, total_examples=len(sentences),
+                                     total_words=sentences.num_words, epochs=epochs)
+            finally:
+                os.remove(corpus_file)
+        else:
+            self.w2v_model.train(sentences, total_examples=len(sentences),
+                                 total_words=sentences.num_words, epochs=epochs)
+
+    def _index_edges(self, edges):
+        """Adds edges to the index of the edges incident to every node of the graph."""
+        for edge in edges:
+            self._edges_by_node.setdefault(edge.src, []).append(edge)
+            if edge.dst != edge.src:
+                self._edges_by_node.setdefault(edge.dst, []).append(edge)
+
+    def _neighbourhood_edges(self, seeds, hops):
+        """Returns the edges of the graph within ``hops`` undirected steps of ``seeds``. The \
+index of the edges incident to every node is built on the first call and then kept up to date \
+by :meth:`add_axioms`.
+
+        :param seeds: Names of the nodes where the neighbourhood starts.
+        :type seeds: set of str
+        :param hops: Radius of the neighbourhood.
+        :type hops: int
+        :rtype: list of :class:`mowl.projection.edge.Edge`
+        """
+        if self._edges_by_node is None:
+            self._edges_by_node = dict()
+            self._index_edges(self._edges)
+
+        visited = set(seeds)
+        frontier = set(seeds)
+        for _ in range(hops):
+            frontier = {neighbour for node in frontier
+                        for edge in self._edges_by_node.get(node, [])
+                        for neighbour in (edge.src, edge.dst)}
+            frontier -= visited
+            if not frontier:
+                break
+            visited |= frontier
+
+        # Every edge is indexed under its source, so it is collected once.
+        return [edge for node in sorted(visited) for edge in self._edges_by_node.get(node, [])
+                if edge.src == node and edge.dst in visited]
+
+    @versionchanged(version="1.0.2", reason="Only the new axioms are projected and only the \
+neighbourhood of the new edges is walked.")
     def add_axioms(self, *axioms):
-        classes = set()
-        object_properties = set()
-        individuals = set()
+        """Adds axioms to the training ontology. Only the new axioms are projected and random \
+walks are generated only on the part of the graph within ``walk_length`` steps of the new \
+edges, keeping the walks that contain new entities. The Word2Vec vocabulary is updated with \
+these walks, which are also the corpus used by the next call to :meth:`train`. If the model \
+has not been trained yet, the axioms are only added to the training ontology and the next call \
+to :meth:`train` walks the whole graph.
 
+        :param axioms: Axioms to add.
+        :type axioms: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        """
+        new_entities = set()
         for axiom in axioms:
-            classes |= set(axiom.getClassesInSignature())
-            object_properties |= set(axiom.getObjectPropertiesInSignature())
-            individuals |= set(axiom.getIndividualsInSignature())
+            for entity in axiom.getSignature():
+                new_entities.add(str(entity.toStringID()))
 
-        new_entities = list(classes.union(object_properties).union(individuals))
-            
         self.dataset.add_axioms(*axioms)
-        self._edges = self.projector.project(self.dataset.ontology)
-        self.walker.walk(self._edges, nodes_of_interest=new_entities)
+
+        if not self._graph_walked:
+            # The whole graph, including the new axioms, is projected and walked by train.
+            self._edges = None
+            return
+
+        new_edges = self._project_axioms(axioms)
+        self._edges.extend(new_edges)
+        if self._edges_by_node is not None:
+            self._index_edges(new_edges)
+        seeds = {edge.src for edge in new_edges} | {edge.dst for edge in new_edges}
+        affected_edges = self._neighbourhood_edges(seeds, self.walker.walk_length)
+
+        self.walker.walk(affected_edges, nodes_of_interest=list(new_entities))
         self.update_w2v_model = True
         #Rebuild vocab
-        sentences = LineSentence(self.walker.outfile)
-        self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
-        self.axioms_added = True
+        self._walk_corpus = self._load_walks()
+        self._walk_corpus.build_vocab(self.w2v_model, update=self.update_w2v_model)
         
     def from_pretrained(self, model):
         
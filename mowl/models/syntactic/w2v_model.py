@@ -1,11 +1,14 @@
 from mowl.base_models import SyntacticModel
 import os
+import tempfile
 from gensim.models import Word2Vec
-from gensim.models.word2vec import LineSentence
 import mowl.error.messages as msg
+from mowl.corpus import TokenCorpus, merge_corpus_files
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.utils.instrumentation import timed
 import numpy as np
 import torch as th
-from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionadded, versionchanged
 
 import logging
 logger = logging.getLogger(__name__)
@@ -38,11 +41,7 @@ class SyntacticPlusW2VModel(SyntacticModel):
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
         
-        cls_embeds = {}
-        for cls in self.dataset.classes.as_str:
-            if cls in self.w2v_model.wv:
-                cls_embeds[cls] = self.w2v_model.wv[cls]
-        return cls_embeds
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv, self.dataset.classes.as_str)
 
     @property
     def object_property_embeddings(self):
@@ -51,11 +50,8 @@ class SyntacticPlusW2VModel(SyntacticModel):
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
 
-        obj_prop_embeds = {}
-        for obj_prop in self.dataset.object_properties.as_str:
-            if obj_prop in self.w2v_model.wv:
-                obj_prop_embeds[obj_prop] = self.w2v_model.wv[obj_prop]
-        return obj_prop_embeds
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv,
+                                                 self.dataset.object_properties.as_str)
 
     @property
     def individual_embeddings(self):
@@ -63,13 +59,8 @@ class SyntacticPlusW2VModel(SyntacticModel):
             raise AttributeError(msg.W2V_MODEL_NOT_SET)
         if len(self.w2v_model.wv) == 0:
             raise AttributeError(msg.RANDOM_WALK_MODEL_EMBEDDINGS_NOT_FOUND)
-        
-        
-        ind_embeds = {}
-        for ind in self.dataset.individuals.as_str:
-            if ind in self.w2v_model.wv:
-                ind_embeds[ind] = self.w2v_model.wv[ind]
-        return ind_embeds
+
+        return EmbeddingStore.from_keyed_vectors(self.w2v_model.wv, self.dataset.individuals.as_str)
 
     @property
     def evaluation_model(self):
@@ -91,26 +82,63 @@ class SyntacticPlusW2VModel(SyntacticModel):
         self.w2v_model = Word2Vec(*args, **kwargs)
         self.embed_dim = self.w2v_model.vector_size
         
-    def train(self, epochs=None):
+    @versionchanged(version="1.0.2", reason="Trains from :attr:`corpus_stream` when the corpus was generated with ``stream=True``. Corpus files are parsed once into a :class:`mowl.corpus.TokenCorpus`. Added the ``use_corpus_file`` and ``workers`` parameters.")
+    @timed("train")
+    def train(self, epochs=None, use_corpus_file=False, workers=None):
         """
-        Triggers the Word2Vec training process.
+        Triggers the Word2Vec training process. If the corpus was generated with ``stream=True``, sentences are rendered from the ontology on every pass over the corpus instead of being read from :attr:`corpus_filepath`.
 
         :param epochs: Number of epochs to train the model. If None, the value of the epochs parameter passed to the constructor will be used.
         :type epochs: int
+        :param use_corpus_file: If True, Word2Vec reads :attr:`corpus_filepath` itself through its ``corpus_file`` mode, in which each worker trains on its own byte range of the file without going through the Python iterator. Compressed corpora are decompressed to a temporary file that is removed after training. Cannot be used with a streamed corpus. Default is False.
+        :type use_corpus_file: bool, optional
+        :param workers: Number of Word2Vec worker threads. If None, the value set in :meth:`set_w2v_model` is used.
+        :type workers: int, optional
         """
 
         if self.w2v_model is None:
             raise AttributeError(msg.W2V_MODEL_NOT_SET)
-        if not os.path.exists(self.corpus_filepath):
+        if not self._stream_corpus and not os.path.exists(self.corpus_filepath):
             raise FileNotFoundError(msg.CORPUS_NOT_GENERATED)
+        if use_corpus_file and self._stream_corpus:
+            raise ValueError("Parameter use_corpus_file cannot be used with a streamed corpus.")
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise TypeError("Optional parameter workers must be of type int.")
+            self.w2v_model.workers = workers
         
         if epochs is None:
             epochs = self.w2v_model.epochs
 
-        sentences = LineSentence(self.corpus_filepath)
-        self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
-
-        if epochs > 0:
+        if self._stream_corpus:
+            sentences = self.corpus_stream
+            self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
+        else:
+            sentences = TokenCorpus.from_file(self.corpus_filepath)
+            sentences.build_vocab(self.w2v_model, update=self.update_w2v_model)
+
+        if epochs <= 0:
+            return
+
+        if use_corpus_file:
+            if not self.corpus_filepath.endswith(".gz"):
+                self.w2v_model.train(corpus_file=self.corpus_filepath,
+                                     total_examples=len(sentences),
+                                     total_words=sentences.num_words, epochs=epochs)
+                return
+
+            # Word2Vec splits the file by byte offsets, so the corpus is decompressed to a
+            # temporary file that is removed after training.
+            fd, corpus_file = tempfile.mkstemp(
+                suffix=".txt", dir=os.path.dirname(os.path.abspath(self.corpus_filepath)))
+            os.close(fd)
+            try:
+                merge_corpus_files([self.corpus_filepath], corpus_file)
+                self.w2v_model.train(corpus_file=corpus_file, total_examples=len(sentences),
+                                     total_words=sentences.num_words, epochs=epochs)
+            finally:
+                os.remove(corpus_file)
+        else:
             self.w2v_model.train(sentences, total_examples=self.w2v_model.corpus_count, epochs=epochs)
 
 
@@ -128,7 +156,8 @@ class SyntacticPlusW2VModel(SyntacticModel):
         new_entities = list(classes.union(object_properties).union(individuals))
             
         self.dataset.add_axioms(*axioms)
-        self.generate_corpus(save=self._save_corpus, with_annotations=self._with_annotations)
+        self.generate_corpus(save=self._save_corpus, with_annotations=self._with_annotations,
+                             stream=self._stream_corpus, workers=self._corpus_workers)
         self.update_w2v_model = True
         
 
@@ -1,16 +1,135 @@
+import gzip
+import itertools
 import logging
 import os
+
+import pandas as pd
+from jpype import JArray, JString
+from tqdm import tqdm
+
 from mowl.owlapi import OWLAPIAdapter
-from org.semanticweb.owlapi.model import IRI
+from mowl.utils.instrumentation import timer
+from org.semanticweb.owlapi.model import IRI, OWLAxiom
+from java.util import Arrays, HashSet
+try:
+    from org.mowl.Ontology import ExistentialAxiomBuilder as GatewayAxiomBuilder
+except ImportError:
+    # gateway.jar built before the builder was added; axioms are created from Python.
+    GatewayAxiomBuilder = None
+from deprecated.sphinx import versionchanged
+
+DEFAULT_CHUNK_SIZE = 100000
+"""Number of rows parsed and added to the ontology at once by :func:`create_from_triples` and \
+:func:`mowl.ontology.extend.insert_annotations`."""
+
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Reads a text file in chunks of lines. Files ending in ``.gz`` are read as \
+gzip-compressed.
+
+    :param path: Path of the file.
+    :type path: str
+    :param chunk_size: Number of lines per chunk. Defaults to :data:`DEFAULT_CHUNK_SIZE`.
+    :type chunk_size: int, optional
+    :rtype: generator of :class:`pandas.Series` with the lines of each chunk, stripped of \
+surrounding whitespace.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            yield pd.Series(lines, dtype=object).str.strip()
+
+
+class ExistentialAxiomBuilder():
+    """Creates axioms of the form :math:`C \\sqsubseteq \\exists R.D` from arrays of IRIs and \
+adds them to an ontology with one ``addAxioms`` call per batch, so that OWLAPI change listeners \
+run once per batch instead of once per axiom. Classes, object properties and existential \
+restrictions are created once per distinct IRI. Each batch is passed as three string arrays to \
+``org.mowl.Ontology.ExistentialAxiomBuilder``, which creates the axioms in the JVM; with a \
+``gateway.jar`` built before the builder was added, they are created from Python.
+
+    :param manager: Manager of the ontology.
+    :type manager: :class:`org.semanticweb.owlapi.model.OWLOntologyManager`
+    :param ontology: Ontology where the axioms are added.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    """
 
+    def __init__(self, manager, ontology):
+        self.manager = manager
+        self.ontology = ontology
+        self.factory = manager.getOWLDataFactory()
+        self._classes = dict()
+        self._object_properties = dict()
+        self.num_axioms = 0
+        self._gateway_builder = None
+        if GatewayAxiomBuilder is not None:
+            self._gateway_builder = GatewayAxiomBuilder(manager, ontology)
 
+    def _class(self, iri):
+        owl_class = self._classes.get(iri)
+        if owl_class is None:
+            owl_class = self._classes[iri] = self.factory.getOWLClass(IRI.create(iri))
+        return owl_class
+
+    def _object_property(self, iri):
+        owl_property = self._object_properties.get(iri)
+        if owl_property is None:
+            owl_property = self.factory.getOWLObjectProperty(IRI.create(iri))
+            self._object_properties[iri] = owl_property
+        return owl_property
+
+    def add(self, subclasses, relations, fillers):
+        """Adds the axioms :math:`subclasses[i] \\sqsubseteq \\exists relations[i].fillers[i]`.
+
+        :param subclasses: IRIs of the subclasses.
+        :type subclasses: :class:`pandas.Series`
+        :param relations: IRIs of the object properties.
+        :type relations: :class:`pandas.Series`
+        :param fillers: IRIs of the classes in the existential restrictions.
+        :type fillers: :class:`pandas.Series`
+        """
+        if len(subclasses) == 0:
+            return
+
+        if self._gateway_builder is not None:
+            self.num_axioms += self._gateway_builder.add(JArray(JString)(subclasses.tolist()),
+                                                         JArray(JString)(relations.tolist()),
+                                                         JArray(JString)(fillers.tolist()))
+            return
+
+        subclass_codes, subclass_iris = pd.factorize(subclasses)
+        owl_subclasses = [self._class(iri) for iri in subclass_iris]
+
+        pairs = relations.reset_index(drop=True) + "\t" + fillers.reset_index(drop=True)
+        pair_codes, pair_keys = pd.factorize(pairs)
+        existentials = []
+        for key in pair_keys:
+            relation, filler = key.split("\t", 1)
+            existentials.append(self.factory.getOWLObjectSomeValuesFrom(
+                self._object_property(relation), self._class(filler)))
+
+        factory = self.factory
+        axioms = [factory.getOWLSubClassOfAxiom(owl_subclasses[sub], existentials[pair])
+                  for sub, pair in zip(subclass_codes.tolist(), pair_codes.tolist())]
+        self.manager.addAxioms(self.ontology, HashSet(Arrays.asList(JArray(OWLAxiom)(axioms))))
+        self.num_axioms += len(axioms)
+
+
+@versionchanged(version="1.0.2", reason="Input files are parsed in chunks and can be \
+gzip-compressed. Axioms are added with one ``addAxioms`` call per chunk. Added the \
+``chunk_size`` and ``verbose`` parameters.")
 def create_from_triples(
         triples_file,
         out_file,
         relation_name=None,
         bidirectional=False,
         head_prefix="",
-        tail_prefix=""
+        tail_prefix="",
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        verbose=False
 ):
     """Method to create an ontology from a .tsv file with triples.
 
@@ -18,7 +137,7 @@ def create_from_triples(
     :param triples_file: Path for the file containing the triples. This file must be a `.tsv`
         file and each row must be of the form (head, relation, tail). It is also supported `.tsv`
         files with rows of the form (head, tail); in that case the field `relation_name` must be
-        specified.
+        specified. Files ending in `.gz` are read as gzip-compressed.
     :type triples_file: str
     :param out_file: Path for the output ontology file.
     :type out_file: str
@@ -32,6 +151,12 @@ def create_from_triples(
     :type head_prefix: str, optional
     :param tail_prefix: Prefix to be assigned to the tail of each triple. Default is ``""``.
     :type tail_prefix: str, optional
+    :param chunk_size: Number of rows parsed and added to the ontology at once. Defaults to
+        :data:`DEFAULT_CHUNK_SIZE`.
+    :type chunk_size: int, optional
+    :param verbose: If `True`, a progress bar with the number of rows processed is shown.
+        Defaults to ``False``.
+    :type verbose: bool, optional
     """
 
     if not isinstance(triples_file, str):
@@ -46,42 +171,52 @@ def create_from_triples(
         raise TypeError("Optional parameter head_prefix must be of type str")
     if not isinstance(tail_prefix, str):
         raise TypeError("Optional parameter tail_prefix must be of type str")
+    if not isinstance(chunk_size, int):
+        raise TypeError("Optional parameter chunk_size must be of type int")
+    if not isinstance(verbose, bool):
+        raise TypeError("Optional parameter verbose must be of type bool")
 
     adapter = OWLAPIAdapter()
     manager = adapter.owl_manager
-    factory = adapter.data_factory
 
     ont = manager.createOntology()
+    builder = ExistentialAxiomBuilder(manager, ont)
 
-    with open(triples_file, "r") as f:
-        for line in f:
-            line = tuple(line.strip().split("\t"))
+    with timer("create_from_triples", items=0) as create_timer, \
+         tqdm(desc="Rows", unit=" rows", disable=not verbose) as progress:
+        for lines in read_chunks(triples_file, chunk_size):
+            parts = lines.str.split("\t", expand=True)
+            num_elements = parts.notna().sum(axis=1).to_numpy()
 
-            if len(line) < 2 or len(line) > 3:
-                raise ValueError(f"Expected number of elements in triple to be 2 or 3. \
-Got {len(line)}")
-            if len(line) == 2 and relation_name is None:
-                raise ValueError("Found 2 elements in triple but the relation_name field is None")
+            # Errors are reported for the first invalid row, as when reading row by row.
+            two_columns = num_elements == 2
+            invalid = (num_elements < 2) | (num_elements > 3)
+            if relation_name is None:
+                invalid |= two_columns
+            if invalid.any():
+                first = num_elements[invalid.argmax()]
+                if first == 2:
+                    raise ValueError("Found 2 elements in triple but the relation_name field is \
+None")
+                raise ValueError("Expected number of elements in triple to be 2 or 3. "
+                                 f"Got {first}")
 
-            if len(line) == 2:
-                head, tail = line
-                rel = relation_name
-            if len(line) == 3:
-                head, rel, tail = line
+            if parts.shape[1] == 2:
+                rels = pd.Series(relation_name, index=parts.index, dtype=object)
+                tails = parts[1]
+            else:
+                rels = parts[1].where(~two_columns, relation_name)
+                tails = parts[2].where(~two_columns, parts[1])
 
-            head = factory.getOWLClass(IRI.create(f"{head_prefix}{head}"))
-            rel = factory.getOWLObjectProperty(IRI.create(f"{rel}"))
-            tail = factory.getOWLClass(IRI.create(f"{tail_prefix}{tail}"))
-
-            axiom = factory.getOWLSubClassOfAxiom(
-                head, factory.getOWLObjectSomeValuesFrom(
-                    rel, tail))
-            manager.addAxiom(ont, axiom)
+            heads = head_prefix + parts[0]
+            tails = tail_prefix + tails
 
+            builder.add(heads, rels, tails)
             if bidirectional:
-                axiom = factory.getOWLSubClassOfAxiom(
-                    tail, factory.getOWLObjectSomeValuesFrom(
-                        rel, head))
-                manager.addAxiom(ont, axiom)
+                builder.add(tails, rels, heads)
+            progress.update(len(lines))
+
+        create_timer.set(items=builder.num_axioms)
 
+    logging.info(f"Created ontology with {builder.num_axioms} axioms")
     manager.saveOntology(ont, IRI.create("file:" + os.path.abspath(out_file)))
@@ -2,16 +2,26 @@ import logging
 import os
 from jpype import java
 
+import pandas as pd
+from tqdm import tqdm
+
+from mowl.ontology.create import DEFAULT_CHUNK_SIZE, ExistentialAxiomBuilder, read_chunks
+from mowl.utils.instrumentation import timer
 from org.semanticweb.owlapi.apibinding import OWLManager
 from org.semanticweb.owlapi.model import IRI
+from deprecated.sphinx import versionchanged
 
 
-def insert_annotations(ontology_file, annotations, out_file=None, verbose=False):
+@versionchanged(version="1.0.2", reason="Annotation files are parsed in chunks and can be \
+gzip-compressed. Axioms are added with one ``addAxioms`` call per chunk. Added the \
+``chunk_size`` parameter.")
+def insert_annotations(ontology_file, annotations, out_file=None, verbose=False,
+                       chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Method to build dataset given an ontology file and the annotations to be inserted to the
     ontology. Annotation files must be in .tsv format, with no header. Per each row, the first
     element is the annotated entity and the rest of the elements are the annotating entities
-    (which are the entities in the ontology).
+    (which are the entities in the ontology). Files ending in .gz are read as gzip-compressed.
 
     :param ontology_file: Ontology file in .owl format
     :type ontology_file: str
@@ -21,8 +31,12 @@ def insert_annotations(ontology_file, annotations, out_file=None, verbose=False)
         name, directed or undirected graph)
     :param out_file: Path for the new ontology. Defaults to ``ontology_file``
     :type out_file: str, optional
-    :param verbose: If true, information is shown."
+    :param verbose: If true, information and a progress bar with the number of rows processed
+        are shown.
     :type verbose: bool
+    :param chunk_size: Number of rows parsed and added to the ontology at once. Defaults to
+        :data:`mowl.ontology.create.DEFAULT_CHUNK_SIZE`.
+    :type chunk_size: int, optional
     """
 
     if not isinstance(ontology_file, str):
@@ -33,6 +47,8 @@ def insert_annotations(ontology_file, annotations, out_file=None, verbose=False)
         raise TypeError("Optional parameter out_file must be of type str")
     if not isinstance(verbose, bool):
         raise TypeError("Optional parameter verbose must be of type bool")
+    if not isinstance(chunk_size, int):
+        raise TypeError("Optional parameter chunk_size must be of type int")
 
     if verbose:
         logging.basicConfig(level=logging.INFO)
@@ -43,26 +59,26 @@ def insert_annotations(ontology_file, annotations, out_file=None, verbose=False)
     manager = OWLManager.createOWLOntologyManager()
     ont = manager.loadOntologyFromOntologyDocument(java.io.File(ontology_file))
 
-    factory = manager.getOWLDataFactory()
+    builder = ExistentialAxiomBuilder(manager, ont)
 
     for annots_file, relation_name, directed in annotations:
-        relation = factory.getOWLObjectProperty(IRI.create(f"{relation_name}"))
+        with timer("insert_annotations", file=annots_file) as insert_timer, \
+             tqdm(desc=os.path.basename(annots_file), unit=" rows",
+                  disable=not verbose) as progress:
+            num_axioms = builder.num_axioms
+            for lines in read_chunks(annots_file, chunk_size):
+                # One row per (annotated entity, annotating entity) pair.
+                items = lines.str.split("\t")
+                pairs = pd.DataFrame({"entity": items.str[0], "ont_id": items.str[1:]})
+                pairs = pairs.explode("ont_id").dropna()
 
-        with open(annots_file) as f:
-            for line in f:
-                items = line.strip().split("\t")
-                annotating_entity = items[0]
-                annotating_entity = factory.getOWLClass(IRI.create(f"{annotating_entity}"))
+                relations = pd.Series(relation_name, index=pairs.index, dtype=object)
+                builder.add(pairs["entity"], relations, pairs["ont_id"])
+                if not directed:
+                    builder.add(pairs["ont_id"], relations, pairs["entity"])
+                progress.update(len(lines))
 
-                for ont_id in items[1:]:
-                    ont_class = factory.getOWLClass(IRI.create(f"{ont_id}"))
-                    objSomeValsAxiom = factory.getOWLObjectSomeValuesFrom(relation, ont_class)
-                    axiom = factory.getOWLSubClassOfAxiom(annotating_entity, objSomeValsAxiom)
-                    manager.addAxiom(ont, axiom)
-                    if not directed:
-                        objSomeValsAxiom = factory.getOWLObjectSomeValuesFrom(relation,
-                                                                              annotating_entity)
-                        axiom = factory.getOWLSubClassOfAxiom(ont_class, objSomeValsAxiom)
-                        manager.addAxiom(ont, axiom)
+            insert_timer.set(items=builder.num_axioms - num_axioms)
+        logging.info(f"Added {builder.num_axioms - num_axioms} axioms from {annots_file}")
 
     manager.saveOntology(ont, IRI.create("file:" + os.path.abspath(out_file)))
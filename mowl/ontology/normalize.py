@@ -1,13 +1,22 @@
 from de.tudresden.inf.lat.jcel.ontology.normalization import OntologyNormalizer
 from de.tudresden.inf.lat.jcel.ontology.axiom.extension import IntegerOntologyObjectFactoryImpl
+from de.tudresden.inf.lat.jcel.coreontology.axiom import GCI0Axiom, GCI1Axiom, GCI2Axiom, \
+    GCI3Axiom
 from de.tudresden.inf.lat.jcel.owlapi.translator import ReverseAxiomTranslator
 from de.tudresden.inf.lat.jcel.owlapi.translator import Translator
 from org.semanticweb.owlapi.model.parameters import Imports
 from uk.ac.manchester.cs.owl.owlapi import OWLClassImpl, OWLObjectSomeValuesFromImpl, \
     OWLObjectIntersectionOfImpl
 from org.semanticweb.owlapi.model import OWLAxiom, OWLOntology, AxiomType, ClassExpressionType
+try:
+    from org.mowl.Normalization import NormalFormIndexer
+except ImportError:
+    # gateway.jar built before the indexer was added; normal forms are classified in Python.
+    NormalFormIndexer = None
 
-from java.util import HashSet
+from java.util import Collections, EnumSet, HashSet
+
+import numpy as np
 
 import logging
 logger = logging.getLogger(__name__)
@@ -16,7 +25,93 @@ logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
 from mowl.owlapi import OWLAPIAdapter
-from deprecated.sphinx import versionchanged
+from mowl.utils.instrumentation import timed
+from deprecated.sphinx import versionadded, versionchanged
+
+EL_CLASS_EXPRESSION_TYPES = EnumSet.noneOf(ClassExpressionType)
+for _expression_type in (ClassExpressionType.OWL_CLASS,
+                         ClassExpressionType.OBJECT_INTERSECTION_OF,
+                         ClassExpressionType.OBJECT_SOME_VALUES_FROM):
+    EL_CLASS_EXPRESSION_TYPES.add(_expression_type)
+"""Class expression types supported by the normalization. Axioms containing other class \
+expressions are removed by :meth:`ELNormalizer.preprocess_ontology`."""
+
+UNSUPPORTED_TBOX_AXIOM_TYPES = {"DataPropertyDomain", "DataPropertyRange",
+                                "FunctionalDataProperty", "DisjointUnion", "HasKey"}
+"""Names of the TBox axiom types removed by :meth:`ELNormalizer.preprocess_ontology`."""
+
+NORMAL_FORM_COLUMNS = {
+    "gci0": ("classes", "classes"),
+    "gci0_bot": ("classes", "classes"),
+    "gci1": ("classes", "classes", "classes"),
+    "gci1_bot": ("classes", "classes", "classes"),
+    "gci2": ("classes", "object_properties", "classes"),
+    "gci3": ("object_properties", "classes", "classes"),
+    "gci3_bot": ("object_properties", "classes", "classes"),
+    "class_assertion": ("individuals", "classes"),
+    "object_property_assertion": ("individuals", "object_properties", "individuals")}
+"""Entity type of every column of the arrays returned by \
+:meth:`ELNormalizer.normalize_as_arrays`. \
+Columns follow the order of the GCI datasets: :math:`C \\sqsubseteq D` is ``[C, D]``, \
+:math:`C \\sqcap D \\sqsubseteq E` is ``[C, D, E]``, :math:`C \\sqsubseteq \\exists R.D` is \
+``[C, R, D]``, :math:`\\exists R.C \\sqsubseteq D` is ``[R, C, D]``, :math:`A(a)` is ``[a, A]`` \
+and :math:`R(a,b)` is ``[a, R, b]``."""
+
+_GCI_ATTRIBUTES = {
+    "gci0": ("subclass", "superclass"),
+    "gci0_bot": ("subclass", "superclass"),
+    "gci1": ("left_subclass", "right_subclass", "superclass"),
+    "gci1_bot": ("left_subclass", "right_subclass", "superclass"),
+    "gci2": ("subclass", "object_property", "filler"),
+    "gci3": ("object_property", "filler", "superclass"),
+    "gci3_bot": ("object_property", "filler", "superclass"),
+    "class_assertion": ("individual", "class_"),
+    "object_property_assertion": ("subject", "object_property", "object_")}
+
+
+class _EntityIndex():
+    """Assigns consecutive indices to entity names. Entities referenced by jcel integer ids are \
+translated with ``lookup`` once per id; ids without an OWL entity, such as the auxiliary classes \
+introduced by the normalization, are mapped to ``None``."""
+
+    def __init__(self, lookup=None):
+        self.lookup = lookup
+        self.names = []
+        self._indices = dict()
+        self._jcel_ids = dict()
+
+    def add(self, name):
+        index = self._indices.get(name)
+        if index is None:
+            index = len(self.names)
+            self._indices[name] = index
+            self.names.append(name)
+        return index
+
+    def from_jcel_id(self, jcel_id):
+        try:
+            return self._jcel_ids[jcel_id]
+        except KeyError:
+            entity = self.lookup(jcel_id)
+            index = self.add(str(entity.get().toStringID())) if entity.isPresent() else None
+            self._jcel_ids[jcel_id] = index
+            return index
+
+
+def _compact(arrays, entities):
+    """Removes the entities that are not referenced by any array and renumbers the columns."""
+    for kind, names in entities.items():
+        columns = [(key, column) for key, kinds in NORMAL_FORM_COLUMNS.items()
+                   for column, column_kind in enumerate(kinds) if column_kind == kind]
+        used = np.zeros(len(names), dtype=bool)
+        for key, column in columns:
+            used[arrays[key][:, column]] = True
+
+        new_indices = np.cumsum(used) - 1
+        for key, column in columns:
+            arrays[key][:, column] = new_indices[arrays[key][:, column]]
+        entities[kind] = [name for name, keep in zip(names, used.tolist()) if keep]
+
 
 class ELNormalizer():
 
@@ -26,8 +121,13 @@ logic EL language.
     """
 
     def __init__(self):
-        return
+        self._translator = None
+        self._normalized_axioms = None
+        self._entities = None
+        self._indexer = None
+        self._loaded_normalized = False
 
+    @timed("normalize")
     def normalize(self, ontology, load=False):
         """Performs the normalization.
         :param ontology: Input ontology
@@ -56,24 +156,7 @@ type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
             axioms_dict = self.__load_normalized_ontology(ontology)
         else:
             ontology = self.preprocess_ontology(ontology)
-            root_ont = ontology
-            translator = Translator(ontology.getOWLOntologyManager().getOWLDataFactory(),
-                                    IntegerOntologyObjectFactoryImpl())
-            # translator = jreasoner.getTranslator()
-            axioms = HashSet()
-            axioms.addAll(root_ont.getAxioms())
-            translator.getTranslationRepository().addAxiomEntities(root_ont)
-
-            for ont in root_ont.getImportsClosure():
-                axioms.addAll(ont.getAxioms())
-                translator.getTranslationRepository().addAxiomEntities(ont)
-
-            intAxioms = translator.translateSA(axioms)
-
-            normalizer = OntologyNormalizer()
-
-            factory = IntegerOntologyObjectFactoryImpl()
-            normalized_ontology = normalizer.normalize(intAxioms, factory)
+            translator, normalized_ontology = self.__normalize_integer_axioms(ontology)
             self.rTranslator = ReverseAxiomTranslator(translator, ontology)
 
             axioms_dict = self.__revert_translation(normalized_ontology)
@@ -83,6 +166,203 @@ type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
 
         return axioms_dict
 
+    @versionadded(version="1.0.2")
+    @timed("normalize")
+    def normalize_as_arrays(self, ontology, load=False):
+        """Performs the normalization and returns every normal form as an integer array. \
+Unlike :meth:`normalize`, no OWL axiom is created for the normalized axioms: the integer axioms \
+produced by jcel are classified by their type in a single pass and each entity is translated \
+back to its IRI only once. The classification runs in the JVM in \
+``org.mowl.Normalization.NormalFormIndexer``, which returns the arrays directly; with a \
+``gateway.jar`` built before the indexer was added, it runs from Python.
+
+        :param ontology: Input ontology
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :param load: Load the GCIs if the ontology is already normalized. Default is False.
+        :type load: bool, optional
+        :rtype: tuple(dict, dict). The first dictionary maps the labels of the normal forms \
+(see :meth:`normalize`) to ``int64`` arrays with one row per axiom; the entity type of each \
+column is given by :data:`NORMAL_FORM_COLUMNS`. The second dictionary maps ``"classes"``, \
+``"object_properties"`` and ``"individuals"`` to the list of names indexed by the arrays.
+        """
+
+        if not isinstance(ontology, OWLOntology):
+            raise TypeError(f"Parameter 'ontology' must be of \
+type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
+
+        if load:
+            self._loaded_normalized = True
+            return self.__gcis_to_arrays(self.normalize(ontology, load=True))
+
+        self._loaded_normalized = False
+        self._translator, normalized_ontology = self.__normalize_integer_axioms(
+            self.preprocess_ontology(ontology))
+        self._normalized_axioms = HashSet(normalized_ontology)
+        repository = self._translator.getTranslationRepository()
+        if NormalFormIndexer is not None:
+            self._indexer = NormalFormIndexer(repository)
+        else:
+            self._entities = {"classes": _EntityIndex(repository.getOptOWLClass),
+                              "object_properties": _EntityIndex(
+                                  repository.getOptOWLObjectProperty),
+                              "individuals": _EntityIndex()}
+
+        return self.__index_axioms(normalized_ontology, ontology)
+
+    @versionadded(version="1.0.2")
+    @timed("normalize")
+    def normalize_new_axioms(self, axioms):
+        """Normalizes axioms added to an ontology that was normalized with \
+:meth:`normalize_as_arrays`. The translator, the auxiliary entities and the normalized axioms \
+of that call are reused: existing axioms are not translated again, auxiliary classes created \
+for the new axioms get fresh identifiers and normalized axioms that were already produced are \
+skipped.
+
+        :param axioms: Axioms to normalize.
+        :type axioms: list of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :rtype: tuple(dict, dict). Arrays of the new normal forms and entity names, as in \
+:meth:`normalize_as_arrays`.
+        """
+
+        if self._normalized_axioms is None and not self._loaded_normalized:
+            raise ValueError("normalize_as_arrays must be called before normalize_new_axioms.")
+
+        owl_manager = OWLAPIAdapter().owl_manager
+        axiom_set = HashSet()
+        for axiom in axioms:
+            axiom_set.add(axiom)
+        ontology = owl_manager.createOntology(axiom_set)
+
+        try:
+            if self._loaded_normalized:
+                return self.__gcis_to_arrays(self.normalize(ontology, load=True))
+
+            preprocessed = self.preprocess_ontology(ontology)
+            self._translator.getTranslationRepository().addAxiomEntities(preprocessed)
+            int_axioms = self._translator.translateSA(preprocessed.getAxioms())
+            normalized = HashSet(OntologyNormalizer().normalize(
+                int_axioms, self._translator.getOntologyObjectFactory()))
+            owl_manager.removeOntology(preprocessed)
+
+            normalized.removeAll(self._normalized_axioms)
+            self._normalized_axioms.addAll(normalized)
+            return self.__index_axioms(normalized, ontology)
+        finally:
+            owl_manager.removeOntology(ontology)
+
+    def __index_axioms(self, normalized_axioms, ontology):
+        """Classifies normalized jcel axioms into normal forms and collects the assertions of \
+the ontology."""
+        if self._indexer is not None:
+            normal_forms = self._indexer.indexAxioms(normalized_axioms, ontology)
+            if normal_forms.ignored() > 0:
+                logger.info(f"Reverse translation. Ignored {normal_forms.ignored()} axioms that \
+are not GCIs or contain auxiliary entities")
+            jarrays = normal_forms.arrays()
+            arrays = {key: np.array(jarrays.get(key), dtype=np.int64).reshape(-1, len(columns))
+                      for key, columns in NORMAL_FORM_COLUMNS.items()}
+            entities = {"classes": [str(name) for name in normal_forms.classes()],
+                        "object_properties": [str(name) for name
+                                              in normal_forms.objectProperties()],
+                        "individuals": [str(name) for name in normal_forms.individuals()]}
+            _compact(arrays, entities)
+            return arrays, entities
+
+        classes = self._entities["classes"]
+        object_properties = self._entities["object_properties"]
+        individuals = self._entities["individuals"]
+
+        rows = {key: [] for key in NORMAL_FORM_COLUMNS}
+        ignored = 0
+        for axiom in normalized_axioms:
+            if isinstance(axiom, GCI0Axiom):
+                key = "gci0"
+                row = (classes.from_jcel_id(axiom.getSubClass()),
+                       classes.from_jcel_id(axiom.getSuperClass()))
+            elif isinstance(axiom, GCI1Axiom):
+                key = "gci1"
+                row = (classes.from_jcel_id(axiom.getLeftSubClass()),
+                       classes.from_jcel_id(axiom.getRightSubClass()),
+                       classes.from_jcel_id(axiom.getSuperClass()))
+            elif isinstance(axiom, GCI2Axiom):
+                key = "gci2"
+                row = (classes.from_jcel_id(axiom.getSubClass()),
+                       object_properties.from_jcel_id(axiom.getPropertyInSuperClass()),
+                       classes.from_jcel_id(axiom.getClassInSuperClass()))
+            elif isinstance(axiom, GCI3Axiom):
+                key = "gci3"
+                row = (object_properties.from_jcel_id(axiom.getPropertyInSubClass()),
+                       classes.from_jcel_id(axiom.getClassInSubClass()),
+                       classes.from_jcel_id(axiom.getSuperClass()))
+            else:
+                ignored += 1
+                continue
+
+            if None in row:
+                ignored += 1
+                continue
+            if key == "gci1" and classes.names[row[0]] > classes.names[row[1]]:
+                # Same operand order as the intersections built by the reverse translation.
+                row = (row[1], row[0], row[2])
+            if key != "gci2" and "owl#Nothing" in classes.names[row[-1]]:
+                key += "_bot"
+            rows[key].append(row)
+
+        if ignored > 0:
+            logger.info(f"Reverse translation. Ignored {ignored} axioms that are not GCIs or \
+contain auxiliary entities")
+
+        imports = Imports.fromBoolean(True)
+        for axiom in ontology.getAxioms(AxiomType.CLASS_ASSERTION, imports):
+            class_expression = axiom.getClassExpression()
+            if class_expression.isAnonymous():
+                continue
+            rows["class_assertion"].append(
+                (individuals.add(str(axiom.getIndividual().toStringID())),
+                 classes.add(str(class_expression.toStringID()))))
+
+        for axiom in ontology.getAxioms(AxiomType.OBJECT_PROPERTY_ASSERTION, imports):
+            rows["object_property_assertion"].append(
+                (individuals.add(str(axiom.getSubject().toStringID())),
+                 object_properties.add(str(axiom.getProperty().toStringID())),
+                 individuals.add(str(axiom.getObject().toStringID()))))
+
+        arrays = {key: np.array(rows[key], dtype=np.int64).reshape(-1, len(columns))
+                  for key, columns in NORMAL_FORM_COLUMNS.items()}
+        entities = {kind: index.names for kind, index in self._entities.items()}
+        _compact(arrays, entities)
+        return arrays, entities
+
+    def __gcis_to_arrays(self, axioms_dict):
+        indices = {"classes": _EntityIndex(), "object_properties": _EntityIndex(),
+                   "individuals": _EntityIndex()}
+        arrays = dict()
+        for key, columns in NORMAL_FORM_COLUMNS.items():
+            attributes = _GCI_ATTRIBUTES[key]
+            rows = [tuple(indices[kind].add(getattr(gci, attribute))
+                          for kind, attribute in zip(columns, attributes))
+                    for gci in axioms_dict[key]]
+            arrays[key] = np.array(rows, dtype=np.int64).reshape(-1, len(columns))
+        return arrays, {kind: index.names for kind, index in indices.items()}
+
+    def __normalize_integer_axioms(self, ontology):
+        translator = Translator(ontology.getOWLOntologyManager().getOWLDataFactory(),
+                                IntegerOntologyObjectFactoryImpl())
+        axioms = HashSet()
+        axioms.addAll(ontology.getAxioms())
+        translator.getTranslationRepository().addAxiomEntities(ontology)
+
+        for ont in ontology.getImportsClosure():
+            axioms.addAll(ont.getAxioms())
+            translator.getTranslationRepository().addAxiomEntities(ont)
+
+        int_axioms = translator.translateSA(axioms)
+        normalizer = OntologyNormalizer()
+        # Auxiliary classes are created by the factory of the translator, so that their ids
+        # never collide with the ids of named entities translated later.
+        factory = translator.getOntologyObjectFactory()
+        return translator, normalizer.normalize(int_axioms, factory)
+
     def __load_normalized_ontology(self, ontology):
         axioms_dict = {
             "gci0": [], "gci1": [], "gci2": [], "gci3": [], "gci0_bot": [], "gci1_bot": [],
@@ -112,10 +392,15 @@ type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
 
         return axioms_dict
 
-    # TODO: This method is missing unit tests
+    @versionchanged(version="1.0.2", reason="Axioms are filtered by their structure instead \
+of their string rendering. Annotated axioms are kept.")
     def preprocess_ontology(self, ontology):
         """Preprocesses the ontology to remove axioms that are not supported by the normalization \
-            process.
+            process. Only TBox axioms are kept, except those whose type is in \
+            :data:`UNSUPPORTED_TBOX_AXIOM_TYPES` or that contain a class expression whose type is \
+            not in :data:`EL_CLASS_EXPRESSION_TYPES`. The class expressions are checked once per \
+            distinct expression, in the JVM if ``gateway.jar`` provides \
+            ``org.mowl.Normalization.NormalFormIndexer``.
 
         :param ontology: Input ontology
         :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
@@ -128,60 +413,37 @@ type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
             raise TypeError("Parameter 'ontology' must be of \
 type org.semanticweb.owlapi.model.OWLOntology")
 
-        tbox_axioms = ontology.getTBoxAxioms(Imports.fromBoolean(True))
-        new_tbox_axioms = HashSet()
-        for axiom in tbox_axioms:
-            axiom_as_str = axiom.toString()
-
-            if "UnionOf" in axiom_as_str:
-                continue
-            elif "MinCardinality" in axiom_as_str:
-                continue
-            elif "ComplementOf" in axiom_as_str:
-                continue
-            elif "AllValuesFrom" in axiom_as_str:
-                continue
-            elif "MaxCardinality" in axiom_as_str:
-                continue
-            elif "ExactCardinality" in axiom_as_str:
-                continue
-            elif "Annotation" in axiom_as_str:
-                continue
-            elif "ObjectHasSelf" in axiom_as_str:
-                continue
-            elif "urn:swrl" in axiom_as_str:
-                continue
-            elif "EquivalentObjectProperties" in axiom_as_str:
-                continue
-            elif "SymmetricObjectProperty" in axiom_as_str:
-                continue
-            elif "AsymmetricObjectProperty" in axiom_as_str:
-                continue
-            elif "ObjectOneOf" in axiom_as_str:
-                continue
-            elif "ObjectHasValue" in axiom_as_str:
-                continue
-            elif "DataSomeValuesFrom" in axiom_as_str:
-                continue
-            elif "DataAllValuesFrom" in axiom_as_str:
-                continue
-            elif "DataHasValue" in axiom_as_str:
-                continue
-            elif "DataPropertyRange" in axiom_as_str:
-                continue
-            elif "DataPropertyDomain" in axiom_as_str:
-                continue
-            elif "FunctionalDataProperty" in axiom_as_str:
-                continue
-            elif "DisjointUnion" in axiom_as_str:
-                continue
-            elif "HasKey" in axiom_as_str:
+        owl_manager = OWLAPIAdapter().owl_manager
+        if NormalFormIndexer is not None:
+            unsupported_types = HashSet()
+            for name in UNSUPPORTED_TBOX_AXIOM_TYPES:
+                unsupported_types.add(name)
+            return owl_manager.createOntology(NormalFormIndexer.supportedTBoxAxioms(
+                ontology, unsupported_types, EL_CLASS_EXPRESSION_TYPES))
+
+        imports = Imports.fromBoolean(True)
+        candidates = []
+        nested_expressions = HashSet()
+        for axiom_type in AxiomType.TBoxAxiomTypes:
+            if str(axiom_type.getName()) in UNSUPPORTED_TBOX_AXIOM_TYPES:
                 continue
-            
-            else:
+            for axiom in ontology.getAxioms(axiom_type, imports):
+                nested = axiom.getNestedClassExpressions()
+                nested_expressions.addAll(nested)
+                candidates.append((axiom, nested))
+
+        # Named classes are always supported, so only complex expressions are checked.
+        nested_expressions.removeAll(ontology.getClassesInSignature(imports))
+        unsupported = HashSet()
+        for expression in nested_expressions:
+            if not EL_CLASS_EXPRESSION_TYPES.contains(expression.getClassExpressionType()):
+                unsupported.add(expression)
+
+        new_tbox_axioms = HashSet()
+        for axiom, nested in candidates:
+            if unsupported.isEmpty() or Collections.disjoint(nested, unsupported):
                 new_tbox_axioms.add(axiom)
 
-        owl_manager = OWLAPIAdapter().owl_manager
         new_ontology = owl_manager.createOntology(new_tbox_axioms)
         return new_ontology
 
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jpype import java
+from org.semanticweb.owlapi.apibinding import OWLManager
+from org.semanticweb.owlapi.formats import FunctionalSyntaxDocumentFormat
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_paths(path):
+    """Returns the paths of the snapshot of an ontology document and of its metadata file. Both \
+are stored next to the document.
+
+    :param path: Path of the ontology document.
+    :type path: str
+    :rtype: tuple(str, str)
+    """
+    directory, basename = os.path.split(os.path.abspath(path))
+    prefix = os.path.join(directory, f".{basename}.mowl-snapshot")
+    return f"{prefix}.ofn", f"{prefix}.json"
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_metadata(meta_path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _temporary_path(path):
+    """Creates an empty file next to ``path`` with a unique name, so that threads and \
+processes writing the same file never share a temporary file."""
+    directory, basename = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{basename}.", suffix=".tmp")
+    os.close(fd)
+    return tmp_path
+
+
+def _write_metadata(meta_path, metadata):
+    tmp_path = _temporary_path(meta_path)
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_path, meta_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _valid_snapshot(path, snapshot_path, meta_path):
+    """Checks that the snapshot corresponds to the current content of the document. The \
+modification time and size of the document are compared first; the document is hashed only if \
+they changed."""
+    metadata = _read_metadata(meta_path)
+    if metadata is None or metadata.get("version") != SNAPSHOT_VERSION:
+        return False
+    if not os.path.exists(snapshot_path) or \
+       os.path.getsize(snapshot_path) != metadata.get("snapshot_size"):
+        return False
+
+    stat = os.stat(path)
+    if stat.st_mtime_ns == metadata["mtime_ns"] and stat.st_size == metadata["size"]:
+        return True
+    if stat.st_size != metadata["size"] or _file_digest(path) != metadata["sha256"]:
+        return False
+
+    metadata["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _write_metadata(meta_path, metadata)
+    except Exception as e:
+        logger.warning(f"Could not update snapshot metadata of {path}: {e}")
+    return True
+
+
+def _save_snapshot(ontology, path, snapshot_path, meta_path):
+    stat = os.stat(path)
+    tmp_path = _temporary_path(snapshot_path)
+    try:
+        stream = java.io.BufferedOutputStream(java.io.FileOutputStream(tmp_path), 1 << 20)
+        try:
+            ontology.getOWLOntologyManager().saveOntology(ontology,
+                                                          FunctionalSyntaxDocumentFormat(),
+                                                          stream)
+        finally:
+            stream.close()
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    _write_metadata(meta_path, {"version": SNAPSHOT_VERSION,
+                                "mtime_ns": stat.st_mtime_ns,
+                                "size": stat.st_size,
+                                "sha256": _file_digest(path),
+                                "snapshot_size": os.path.getsize(snapshot_path)})
+
+
+def load_ontology(path, snapshot=True, manager=None):
+    """Loads an ontology document. If ``snapshot`` is ``True``, the ontology is read from a \
+snapshot in OWL functional syntax stored next to the document, which parses faster than \
+RDF/XML. The snapshot is created the first time the document is loaded and recreated if the \
+document changes, as detected by its modification time, size and SHA-256 hash. If the snapshot \
+cannot be written, the ontology is still returned.
+
+    :param path: Path of the ontology document.
+    :type path: str
+    :param snapshot: Whether to use a snapshot. Defaults to ``True``.
+    :type snapshot: bool, optional
+    :param manager: Ontology manager used to load the ontology. Defaults to a new manager.
+    :type manager: :class:`org.semanticweb.owlapi.model.OWLOntologyManager`, optional
+    :rtype: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    """
+    if not isinstance(path, str):
+        raise TypeError("Parameter path must be of type str.")
+    if not isinstance(snapshot, bool):
+        raise TypeError("Optional parameter snapshot must be of type bool.")
+
+    if manager is None:
+        manager = OWLManager.createOWLOntologyManager()
+
+    start = time.perf_counter()
+    if not snapshot:
+        return manager.loadOntologyFromOntologyDocument(java.io.File(path))
+
+    snapshot_path, meta_path = snapshot_paths(path)
+    if _valid_snapshot(path, snapshot_path, meta_path):
+        ontology = manager.loadOntologyFromOntologyDocument(java.io.File(snapshot_path))
+        logger.debug(f"Loaded {path} from snapshot in {time.perf_counter() - start:.2f}s")
+        return ontology
+
+    ontology = manager.loadOntologyFromOntologyDocument(java.io.File(path))
+    logger.debug(f"Parsed {path} in {time.perf_counter() - start:.2f}s")
+    try:
+        _save_snapshot(ontology, path, snapshot_path, meta_path)
+    except Exception as e:
+        logger.warning(f"Could not save snapshot of {path}: {e}")
+    return ontology
+
+
+def load_ontologies(paths, snapshot=True, workers=None):
+    """Loads several ontology documents in parallel threads, each with its own ontology \
+manager. JPype releases the GIL while the JVM parses, so the documents are parsed concurrently.
+
+    :param paths: Paths of the ontology documents. ``None`` entries are returned as ``None``.
+    :type paths: list of str
+    :param snapshot: Whether to use snapshots, see :func:`load_ontology`. Defaults to ``True``.
+    :type snapshot: bool, optional
+    :param workers: Number of threads. Defaults to the number of documents.
+    :type workers: int, optional
+    :rtype: list of :class:`org.semanticweb.owlapi.model.OWLOntology`
+    """
+    if workers is not None and not isinstance(workers, int):
+        raise TypeError("Optional parameter workers must be of type int.")
+
+    to_load = [path for path in paths if path is not None]
+    if workers is None:
+        workers = max(1, len(to_load))
+
+    def load(path):
+        return load_ontology(path, snapshot=snapshot)
+
+    if workers == 1 or len(to_load) <= 1:
+        loaded = [load(path) for path in to_load]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load, to_load))
+
+    loaded = iter(loaded)
+    return [None if path is None else next(loaded) for path in paths]
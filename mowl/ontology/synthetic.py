@@ -0,0 +1,375 @@
+import os
+import tempfile
+
+import numpy as np
+
+from mowl.owlapi import OWLAPIAdapter
+from java.io import File
+from deprecated.sphinx import versionadded
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+OWL_NOTHING = "http://www.w3.org/2002/07/owl#Nothing"
+
+DEFAULT_NORMAL_FORMS = {"gci0": 0.1, "gci1": 0.1, "gci2": 0.6, "gci3": 0.2}
+"""Default proportions of the axioms generated besides the taxonomy."""
+
+SYNTHETIC_COLUMNS = {
+    "gci0": ("classes", "classes"),
+    "gci1": ("classes", "classes", "classes"),
+    "gci1_bot": ("classes", "classes", "classes"),
+    "gci2": ("classes", "object_properties", "classes"),
+    "gci3": ("object_properties", "classes", "classes"),
+    "union": ("classes", "classes", "classes"),
+    "universal": ("classes", "object_properties", "classes"),
+    "complement": ("classes", "classes"),
+    "class_assertion": ("individuals", "classes"),
+    "object_property_assertion": ("individuals", "object_properties", "individuals")}
+"""Entity type of every column of the arrays generated by \
+:class:`SyntheticOntologyGenerator`. The :math:`\\mathcal{EL}` forms follow \
+:data:`mowl.ontology.normalize.NORMAL_FORM_COLUMNS`; the last column of ``gci1_bot`` is \
+``owl:Nothing``. The :math:`\\mathcal{ALC}` forms are :math:`C \\sqsubseteq D \\sqcup E` \
+(``union``, ``[C, D, E]``), :math:`C \\sqsubseteq \\forall R.D` (``universal``, ``[C, R, D]``) \
+and :math:`C \\sqsubseteq \\neg D` (``complement``, ``[C, D]``)."""
+
+_TEMPLATES = {
+    "gci0": "SubClassOf({0} {1})\n",
+    "gci1": "SubClassOf(ObjectIntersectionOf({0} {1}) {2})\n",
+    "gci1_bot": "SubClassOf(ObjectIntersectionOf({0} {1}) {2})\n",
+    "gci2": "SubClassOf({0} ObjectSomeValuesFrom({1} {2}))\n",
+    "gci3": "SubClassOf(ObjectSomeValuesFrom({0} {1}) {2})\n",
+    "union": "SubClassOf({0} ObjectUnionOf({1} {2}))\n",
+    "universal": "SubClassOf({0} ObjectAllValuesFrom({1} {2}))\n",
+    "complement": "SubClassOf({0} ObjectComplementOf({1}))\n",
+    "class_assertion": "ClassAssertion({1} {0})\n",
+    "object_property_assertion": "ObjectPropertyAssertion({1} {0} {2})\n"}
+
+_DECLARATIONS = {"classes": "Class", "object_properties": "ObjectProperty",
+                 "individuals": "NamedIndividual"}
+
+_CHUNK_SIZE = 100000
+
+
+@versionadded(version="1.0.2")
+class SyntheticOntologyGenerator():
+    """Generates random ontologies of controlled size for benchmarks and load tests. The \
+ontology contains a taxonomy of ``num_classes`` classes, ``num_axioms`` additional axioms \
+distributed among normal forms according to ``normal_forms`` and, if ``num_individuals`` is \
+positive, class and object property assertions. The output only depends on the parameters and \
+the seed.
+
+    Axioms are generated as integer arrays with NumPy and written in OWL functional syntax, which \
+OWLAPI parses in bulk; no OWL object is created from Python. This keeps the generation of \
+ontologies with millions of axioms within seconds.
+
+    :param num_classes: Number of classes.
+    :type num_classes: int
+    :param num_object_properties: Number of object properties. Defaults to ``10``.
+    :type num_object_properties: int, optional
+    :param num_individuals: Number of individuals. Every individual is asserted to be an \
+instance of a random class. Defaults to ``0``.
+    :type num_individuals: int, optional
+    :param assertions_per_individual: Number of object property assertions per individual. \
+Defaults to ``2``.
+    :type assertions_per_individual: int, optional
+    :param num_axioms: Number of axioms generated besides the taxonomy and the assertions. \
+Defaults to twice the number of classes.
+    :type num_axioms: int, optional
+    :param normal_forms: Proportion of ``num_axioms`` generated for each form of \
+:data:`SYNTHETIC_COLUMNS` other than the assertions. Proportions are normalized to add up to \
+one. Defaults to :data:`DEFAULT_NORMAL_FORMS`.
+    :type normal_forms: dict, optional
+    :param branching_factor: Number of subclasses of every class in the taxonomy. Defaults to \
+``4``.
+    :type branching_factor: int, optional
+    :param depth: Maximum depth of the taxonomy. Classes that do not fit in a balanced taxonomy \
+of that depth become subclasses of random classes at depth ``depth - 1``. Defaults to ``None``, \
+in which case the depth is the one of a balanced taxonomy.
+    :type depth: int, optional
+    :param seed: Seed of the random number generator. Defaults to ``0``.
+    :type seed: int, optional
+    :param namespace: Prefix of the IRIs of the generated entities. Defaults to \
+``"http://mowl/synthetic#"``.
+    :type namespace: str, optional
+    """
+
+    def __init__(self, num_classes, num_object_properties=10, num_individuals=0,
+                 assertions_per_individual=2, num_axioms=None, normal_forms=None,
+                 branching_factor=4, depth=None, seed=0, namespace="http://mowl/synthetic#"):
+
+        if not isinstance(num_classes, int):
+            raise TypeError("Parameter num_classes must be of type int.")
+        for name, value in (("num_object_properties", num_object_properties),
+                            ("num_individuals", num_individuals),
+                            ("assertions_per_individual", assertions_per_individual),
+                            ("branching_factor", branching_factor), ("seed", seed)):
+            if not isinstance(value, int):
+                raise TypeError(f"Optional parameter {name} must be of type int.")
+        if num_axioms is not None and not isinstance(num_axioms, int):
+            raise TypeError("Optional parameter num_axioms must be of type int.")
+        if normal_forms is not None and not isinstance(normal_forms, dict):
+            raise TypeError("Optional parameter normal_forms must be of type dict.")
+        if depth is not None and not isinstance(depth, int):
+            raise TypeError("Optional parameter depth must be of type int.")
+        if not isinstance(namespace, str):
+            raise TypeError("Optional parameter namespace must be of type str.")
+
+        if num_classes < 2:
+            raise ValueError("Parameter num_classes must be at least 2.")
+        if num_object_properties < 1:
+            raise ValueError("Optional parameter num_object_properties must be at least 1.")
+        if branching_factor < 1:
+            raise ValueError("Optional parameter branching_factor must be at least 1.")
+        if depth is not None and depth < 1:
+            raise ValueError("Optional parameter depth must be at least 1.")
+
+        if normal_forms is None:
+            normal_forms = DEFAULT_NORMAL_FORMS
+        assertions = {"class_assertion", "object_property_assertion"}
+        unknown = set(normal_forms) - (set(SYNTHETIC_COLUMNS) - assertions)
+        if unknown:
+            raise ValueError(f"Unknown normal forms: {', '.join(sorted(unknown))}.")
+
+        self.num_classes = num_classes
+        self.num_object_properties = num_object_properties
+        self.num_individuals = num_individuals
+        self.assertions_per_individual = assertions_per_individual
+        self.num_axioms = 2 * num_classes if num_axioms is None else num_axioms
+        self.normal_forms = normal_forms
+        self.branching_factor = branching_factor
+        self.depth = depth
+        self.seed = seed
+        self.namespace = namespace
+
+        self._generated = None
+
+    def _taxonomy(self, rng):
+        """Parents of a breadth-first numbered taxonomy in which class ``i`` is a subclass of \
+class ``(i - 1) // branching_factor``."""
+        children = np.arange(1, self.num_classes, dtype=np.int64)
+        parents = (children - 1) // self.branching_factor
+        if self.depth is not None:
+            level_starts = [0]
+            level_size = 1
+            while len(level_starts) <= self.depth + 1 and level_starts[-1] < self.num_classes:
+                level_starts.append(level_starts[-1] + level_size)
+                level_size *= self.branching_factor
+            if len(level_starts) == self.depth + 2:
+                too_deep = children >= level_starts[self.depth + 1]
+                parents[too_deep] = rng.integers(level_starts[self.depth - 1],
+                                                 level_starts[self.depth], too_deep.sum())
+        return np.stack([children, parents], axis=1)
+
+    def _counts(self):
+        total = sum(self.normal_forms.values())
+        if total <= 0:
+            return {name: 0 for name in self.normal_forms}
+        return {name: int(round(self.num_axioms * weight / total))
+                for name, weight in self.normal_forms.items()}
+
+    def generate(self):
+        """Generates the axioms as integer arrays. The result is computed once and reused by the \
+other methods.
+
+        :rtype: tuple(dict, dict). The first dictionary maps the forms of \
+:data:`SYNTHETIC_COLUMNS` to ``int64`` arrays with one row per axiom. Duplicated rows are \
+removed, so a form may have slightly fewer axioms than requested. The second dictionary maps \
+``"classes"``, ``"object_properties"`` and ``"individuals"`` to the list of IRIs indexed by \
+the arrays.
+        """
+        if self._generated is not None:
+            return self._generated
+
+        rng = np.random.default_rng(self.seed)
+        n = self.num_classes
+        counts = self._counts()
+
+        def classes(size):
+            return rng.integers(0, n, size)
+
+        def distinct_classes(size):
+            # A second class different from the first one, so that conjunctions and unions
+            # have two operands.
+            first = classes(size)
+            return first, (first + rng.integers(1, n, size)) % n
+
+        def properties(size):
+            return rng.integers(0, self.num_object_properties, size)
+
+        arrays = {"gci0": self._taxonomy(rng)}
+        for name in SYNTHETIC_COLUMNS:
+            size = counts.get(name, 0)
+            if name == "gci0":
+                # Subclass axioms from a class to a class with smaller index, which keeps the
+                # hierarchy acyclic.
+                first, second = distinct_classes(size)
+                columns = [np.maximum(first, second), np.minimum(first, second)]
+            elif name in ("gci1", "gci1_bot", "union"):
+                # Operands are sorted so that every conjunction or union has a single row.
+                first, second = distinct_classes(size)
+                last = np.full(size, n) if name == "gci1_bot" else classes(size)
+                columns = [np.minimum(first, second), np.maximum(first, second), last]
+            elif name in ("gci2", "universal"):
+                columns = [classes(size), properties(size), classes(size)]
+            elif name == "gci3":
+                columns = [properties(size), classes(size), classes(size)]
+            elif name == "complement":
+                columns = list(distinct_classes(size))
+            elif name == "class_assertion":
+                columns = [np.arange(self.num_individuals), classes(self.num_individuals)]
+            else:
+                size = self.num_individuals * self.assertions_per_individual
+                individuals = self.num_individuals if self.num_individuals else 1
+                columns = [rng.integers(0, individuals, size), properties(size),
+                           rng.integers(0, individuals, size)]
+
+            array = np.stack(columns, axis=1).astype(np.int64)
+            if name == "gci0":
+                array = np.concatenate([arrays["gci0"], array])
+            arrays[name] = np.unique(array, axis=0) if len(array) else array
+
+        entities = {
+            "classes": [f"{self.namespace}C{i}" for i in range(n)],
+            "object_properties": [f"{self.namespace}r{i}"
+                                  for i in range(self.num_object_properties)],
+            "individuals": [f"{self.namespace}i{i}" for i in range(self.num_individuals)]}
+        if len(arrays["gci1_bot"]):
+            entities["classes"].append(OWL_NOTHING)
+
+        self._generated = arrays, entities
+        return self._generated
+
+    def save(self, path, arrays=None, declarations=True, ontology_iri=None):
+        """Writes the ontology in OWL functional syntax.
+
+        :param path: Path of the output file.
+        :type path: str
+        :param arrays: Axioms to write, in the format returned by :meth:`generate`. Defaults to \
+all the generated axioms.
+        :type arrays: dict, optional
+        :param declarations: Whether to declare all the entities. Defaults to ``True``.
+        :type declarations: bool, optional
+        :param ontology_iri: IRI of the ontology. Defaults to the namespace followed by the seed.
+        :type ontology_iri: str, optional
+        """
+        if not isinstance(path, str):
+            raise TypeError("Parameter path must be of type str.")
+
+        generated, entities = self.generate()
+        if arrays is None:
+            arrays = generated
+
+        if ontology_iri is None:
+            ontology_iri = f"{self.namespace.rstrip('#/')}/{self.seed}"
+
+        iris = {kind: np.array([f"<{name}>" for name in names] or [""], dtype=object)
+                for kind, names in entities.items()}
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Ontology(<{ontology_iri}>\n")
+            if declarations:
+                for kind, declaration in _DECLARATIONS.items():
+                    names = entities[kind]
+                    if kind == "classes" and OWL_NOTHING in names:
+                        names = names[:-1]
+                    for start in range(0, len(names), _CHUNK_SIZE):
+                        f.write("".join(f"Declaration({declaration}(<{name}>))\n"
+                                        for name in names[start:start + _CHUNK_SIZE]))
+
+            for name, array in arrays.items():
+                template = _TEMPLATES[name]
+                columns = SYNTHETIC_COLUMNS[name]
+                for start in range(0, len(array), _CHUNK_SIZE):
+                    chunk = array[start:start + _CHUNK_SIZE]
+                    rendered = [iris[kind][chunk[:, i]] for i, kind in enumerate(columns)]
+                    f.write("".join(template.format(*row) for row in zip(*rendered)))
+            f.write(")\n")
+
+    def _load(self, path, manager):
+        return manager.loadOntologyFromOntologyDocument(File(path))
+
+    def create_ontology(self):
+        """Generates the ontology and loads it with OWLAPI.
+
+        :rtype: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        """
+        manager = OWLAPIAdapter().owl_manager
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "ontology.ofn")
+            self.save(path)
+            return self._load(path, manager)
+
+    def split(self, validation_fraction=0.1, testing_fraction=0.1, split_forms=("gci2",)):
+        """Splits the generated axioms into training, validation and testing axioms. Only the \
+forms in ``split_forms`` are split; the other axioms are training axioms.
+
+        :param validation_fraction: Fraction of the axioms of each split form used for \
+validation. Defaults to ``0.1``.
+        :type validation_fraction: float, optional
+        :param testing_fraction: Fraction of the axioms of each split form used for testing. \
+Defaults to ``0.1``.
+        :type testing_fraction: float, optional
+        :param split_forms: Forms that are split. Defaults to ``("gci2",)``.
+        :type split_forms: tuple of str, optional
+        :rtype: tuple(dict, dict, dict)
+        """
+        if not isinstance(validation_fraction, float):
+            raise TypeError("Optional parameter validation_fraction must be of type float.")
+        if not isinstance(testing_fraction, float):
+            raise TypeError("Optional parameter testing_fraction must be of type float.")
+        if validation_fraction < 0 or testing_fraction < 0 or \
+           validation_fraction + testing_fraction >= 1:
+            raise ValueError("Validation and testing fractions must be non-negative and add up \
+to less than 1.")
+
+        arrays, _ = self.generate()
+        rng = np.random.default_rng(self.seed + 1)
+        training, validation, testing = dict(arrays), dict(), dict()
+        for name in split_forms:
+            array = arrays[name]
+            order = rng.permutation(len(array))
+            num_validation = int(len(array) * validation_fraction)
+            num_testing = int(len(array) * testing_fraction)
+            validation[name] = array[order[:num_validation]]
+            testing[name] = array[order[num_validation:num_validation + num_testing]]
+            training[name] = array[np.sort(order[num_validation + num_testing:])]
+        return training, validation, testing
+
+    def create_dataset(self, validation_fraction=0.1, testing_fraction=0.1, split_forms=("gci2",),
+                       out_dir=None):
+        """Generates the ontology, splits it with :meth:`split` and loads the three parts as a \
+dataset.
+
+        :param out_dir: Directory where the training, validation and testing ontologies are \
+written as ``ontology.owl``, ``valid.owl`` and ``test.owl``, the layout read by \
+:class:`mowl.datasets.PathDataset`. Defaults to ``None``, in which case they are written to a \
+temporary directory.
+        :type out_dir: str, optional
+        :rtype: :class:`mowl.datasets.Dataset`
+        """
+        from mowl.datasets import Dataset
+
+        if out_dir is not None and not isinstance(out_dir, str):
+            raise TypeError("Optional parameter out_dir must be of type str.")
+
+        parts = self.split(validation_fraction, testing_fraction, split_forms)
+        manager = OWLAPIAdapter().owl_manager
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            directory = tmp_dir if out_dir is None else out_dir
+            os.makedirs(directory, exist_ok=True)
+            ontologies = []
+            for filename, arrays, declarations in zip(["ontology.owl", "valid.owl", "test.owl"],
+                                                      parts, [True, False, False]):
+                path = os.path.join(directory, filename)
+                ontology_iri = f"{self.namespace.rstrip('#/')}/{self.seed}/{filename[:-4]}"
+                self.save(path, arrays=arrays, declarations=declarations,
+                          ontology_iri=ontology_iri)
+                ontologies.append(self._load(path, manager))
+
+        logger.debug(f"Created synthetic dataset with {ontologies[0].getAxiomCount()} training \
+axioms")
+        return Dataset(*ontologies)
@@ -1,7 +1,21 @@
-from mowl.owlapi.adapter import OWLAPIAdapter
-from mowl.owlapi.model import (
-    OWLOntology, OWLClass, OWLObjectProperty, OWLSubClassOfAxiom,
-    OWLEquivalentClassesAxiom, OWLObjectSomeValuesFrom, ClassExpressionType,
-    Imports, OWLAxiom, OWLDisjointClassesAxiom, OWLNaryAxiom, OWLClassAssertionAxiom,
-    OWLObjectPropertyAssertionAxiom
-)
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "OWLAPIAdapter": "mowl.owlapi.adapter",
+    "OWLOntology": "mowl.owlapi.model",
+    "OWLClass": "mowl.owlapi.model",
+    "OWLObjectProperty": "mowl.owlapi.model",
+    "OWLSubClassOfAxiom": "mowl.owlapi.model",
+    "OWLEquivalentClassesAxiom": "mowl.owlapi.model",
+    "OWLObjectSomeValuesFrom": "mowl.owlapi.model",
+    "ClassExpressionType": "mowl.owlapi.model",
+    "Imports": "mowl.owlapi.model",
+    "OWLAxiom": "mowl.owlapi.model",
+    "OWLDisjointClassesAxiom": "mowl.owlapi.model",
+    "OWLNaryAxiom": "mowl.owlapi.model",
+    "OWLClassAssertionAxiom": "mowl.owlapi.model",
+    "OWLObjectPropertyAssertionAxiom": "mowl.owlapi.model",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,7 +1,14 @@
-from .edge import Edge
-from .dl2vec.model import DL2VecProjector
-from .owl2vec_star.model import OWL2VecStarProjector
-from .taxonomy.model import TaxonomyProjector
-from .taxonomy_rels.model import TaxonomyWithRelationsProjector
-from .categorical.model import CategoricalProjector
-from .factory import projector_factory
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "Edge": ".edge",
+    "DL2VecProjector": ".dl2vec.model",
+    "OWL2VecStarProjector": ".owl2vec_star.model",
+    "TaxonomyProjector": ".taxonomy.model",
+    "TaxonomyWithRelationsProjector": ".taxonomy_rels.model",
+    "CategoricalProjector": ".categorical.model",
+    "projector_factory": ".factory",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
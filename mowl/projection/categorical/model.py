@@ -10,6 +10,7 @@ from mowl.owlapi import OWLAPIAdapter
 from mowl.owlapi.defaults import BOT, TOP
 import mowl.error.messages as msg
 from mowl.projection import Edge as mEdge
+from mowl.utils.instrumentation import timed
 
 from org.semanticweb.owlapi.model import  AxiomType, EntityType, OWLObjectInverseOf, OWLOntology
 from org.semanticweb.owlapi.model import ClassExpressionType as CT
@@ -594,6 +595,7 @@ class CategoricalProjector(ProjectionModel):
 
 
         
+    @timed("project", items=len)
     def project(self, ontology):
         r"""Generates the projection of the ontology.
 
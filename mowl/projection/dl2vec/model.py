@@ -2,6 +2,7 @@ from mowl.projection.base import ProjectionModel
 from org.mowl.Projectors import DL2VecProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
 from mowl.projection.edge import Edge
+from mowl.utils.instrumentation import timed
 import logging
 
 
@@ -23,6 +24,7 @@ class DL2VecProjector(ProjectionModel):
             raise TypeError("Optional parameter bidirectional_taxonomy must be of type boolean")
         self.projector = Projector(bidirectional_taxonomy)
 
+    @timed("project", items=len)
     def project(self, ontology, with_individuals=False, verbose=False):
         r"""Generates the projection of the ontology.
 
@@ -1,5 +1,6 @@
 from mowl.projection.base import ProjectionModel
 from mowl.projection.edge import Edge
+from mowl.utils.instrumentation import timed
 from org.mowl.Projectors import OWL2VecStarProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
 
@@ -35,6 +36,7 @@ class OWL2VecStarProjector(ProjectionModel):
         self.projector = Projector(self.bidirectional_taxonomy, self.only_taxonomy,
                                    self.include_literals)
 
+    @timed("project", items=len)
     def project(self, ontology):
         r"""Generates the projection of the ontology.
 
@@ -3,6 +3,7 @@ from mowl.projection.base import ProjectionModel
 from org.mowl.Projectors import TaxonomyProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
 from mowl.projection.edge import Edge
+from mowl.utils.instrumentation import timed
 
 
 class TaxonomyProjector(ProjectionModel):
@@ -21,6 +22,7 @@ class TaxonomyProjector(ProjectionModel):
             raise TypeError("Optional parameter bidirectional_taxonomy must be of type boolean")
         self.projector = Projector(bidirectional_taxonomy)
 
+    @timed("project", items=len)
     def project(self, ontology):
         r"""Generates the projection of the ontology.
 
@@ -3,6 +3,7 @@ from org.semanticweb.owlapi.model import OWLOntology
 from mowl.projection.edge import Edge
 
 from mowl.projection.base import ProjectionModel
+from mowl.utils.instrumentation import timed
 
 from java.util import ArrayList
 
@@ -48,6 +49,7 @@ relations a non-empty list")
 
         self.projector = Projector(taxonomy, bidirectional_taxonomy, relationsJ)
 
+    @timed("project", items=len)
     def project(self, ontology):
         r"""Generates the projection of the ontology.
 
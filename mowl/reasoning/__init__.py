@@ -1 +1,9 @@
-from .base import MOWLReasoner
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "MOWLReasoner": ".base",
+    "ClosureCache": ".closure",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
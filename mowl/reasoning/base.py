@@ -2,12 +2,24 @@
 from uk.ac.manchester.cs.owl.owlapi import OWLSubClassOfAxiomImpl, OWLDisjointClassesAxiomImpl, \
     OWLEquivalentClassesAxiomImpl
 from org.semanticweb.owlapi.model import OWLClass
-from org.semanticweb.owlapi.reasoner import OWLReasoner
+from org.semanticweb.owlapi.reasoner import OWLReasoner, InferenceType
+try:
+    from org.mowl.Reasoning import TaxonomyExporter
+except ImportError:
+    # gateway.jar built before the exporter was added; the taxonomy is exported from Python.
+    TaxonomyExporter = None
 
 from java.util import HashSet
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+import hashlib
+import os
+import tempfile
+
+import numpy as np
 
 from mowl.owlapi.adapter import OWLAPIAdapter
+from mowl.reasoning.closure import ontology_content_hash
 
 import logging
 logging.basicConfig(level=logging.INFO)
@@ -41,15 +53,177 @@ org.semanticweb.owlapi.reasoner.OWLReasoner")
         self.reasoner = reasoner
         self.adapter = OWLAPIAdapter()
         self.ont_manager = self.adapter.owl_manager
+        self._hierarchy_precomputed = False
+
+    def _check_workers(self, workers):
+        if not isinstance(workers, int) or workers < 1:
+            raise TypeError("Optional parameter workers must be a positive int")
+
+    def _query_classes(self, query, owl_classes, workers=1):
+        """Applies ``query`` to every class and returns the results in the same order. With \
+``workers > 1`` the classes are split in chunks queried from a thread pool; JPype releases the \
+GIL during JVM calls, so this only pays off for reasoners that answer queries concurrently \
+(e.g. ELK after :meth:`precompute_hierarchy`).
+        """
+        if workers == 1 or len(owl_classes) < 2:
+            return [query(owl_class) for owl_class in owl_classes]
+
+        chunk_size = (len(owl_classes) + workers - 1) // workers
+        chunks = [owl_classes[i:i + chunk_size] for i in range(0, len(owl_classes), chunk_size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda chunk: [query(c) for c in chunk], chunks)
+        return [result for chunk_result in results for result in chunk_result]
+
+    def precompute_hierarchy(self):
+        """Computes the class hierarchy in the reasoner. The hierarchy is computed only once per \
+:class:`MOWLReasoner`.
+        """
+        if not self._hierarchy_precomputed:
+            self.reasoner.precomputeInferences(InferenceType.CLASS_HIERARCHY)
+            self._hierarchy_precomputed = True
+
+    def cache_key(self, direct=False):
+        """Returns a key identifying the inferred taxonomy of the root ontology of the reasoner. \
+The key combines the reasoner name and version, the SHA-256 digest of the ontology computed by \
+:func:`mowl.reasoning.closure.ontology_content_hash` and the ``direct`` flag.
+
+        :param direct: Whether the key refers to the direct taxonomy. Default is False.
+        :type direct: bool, optional
+        :rtype: str
+        """
+        try:
+            version = str(self.reasoner.getReasonerVersion())
+        except Exception:
+            # ELK fails to parse its build timestamp as a version number.
+            version = str(self.reasoner.getClass().getPackage().getImplementationVersion())
+        components = [str(self.reasoner.getReasonerName()), version,
+                      ontology_content_hash(self.reasoner.getRootOntology()),
+                      str(direct)]
+        return hashlib.sha256("|".join(components).encode("utf-8")).hexdigest()
+
+    def infer_subclass_pairs(self, direct=False, cache_dir=None, workers=1):
+        """Infers the full taxonomy of the root ontology of the reasoner as integer pairs. \
+The taxonomy is exported in a single pass in the JVM by \
+``org.mowl.Reasoning.TaxonomyExporter``, which queries only the direct superclasses of each \
+class and computes their transitive closure. With a ``gateway.jar`` built before the exporter \
+was added, the same computation runs from Python, querying the reasoner with ``workers`` \
+threads.
+
+        :param direct: If True, only direct superclasses are returned. Default is False.
+        :type direct: bool, optional
+        :param cache_dir: Directory where the result is stored as a ``.npz`` file named after \
+:meth:`cache_key`. If the file exists, the taxonomy is loaded from it and the reasoner is not \
+queried. Default is None.
+        :type cache_dir: str, optional
+        :param workers: Number of threads used to query the reasoner when the taxonomy is \
+exported from Python. Default is 1.
+        :type workers: int, optional
+        :return: The list of class IRIs and an array of shape ``(N, 2)`` where each row \
+``(i, j)`` means that ``classes[i]`` is a subclass of ``classes[j]``.
+        :rtype: tuple(list[str], :class:`numpy.ndarray`)
+        """
+        if not isinstance(direct, bool):
+            raise TypeError("Optional parameter direct must be of type bool")
+        if cache_dir is not None and not isinstance(cache_dir, str):
+            raise TypeError("Optional parameter cache_dir must be of type str")
+        self._check_workers(workers)
+
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(cache_dir, f"taxonomy_{self.cache_key(direct)}.npz")
+            if os.path.exists(cache_path):
+                logging.info(f"Loading inferred taxonomy from {cache_path}")
+                with np.load(cache_path, allow_pickle=False) as data:
+                    return data["classes"].tolist(), data["pairs"]
+
+        self.precompute_hierarchy()
+
+        if TaxonomyExporter is not None:
+            taxonomy = TaxonomyExporter.subClassPairs(self.reasoner, direct)
+            classes = [str(name) for name in taxonomy.classes()]
+            pairs = np.array(taxonomy.pairs(), dtype=np.int64).reshape(-1, 2)
+        else:
+            classes, pairs = self._query_subclass_pairs(direct, workers)
+        logging.info(f"Number of inferred subclass pairs: {len(pairs)}.")
+
+        if cache_path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, classes=np.array(classes), pairs=pairs)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+        return classes, pairs
+
+    def _query_subclass_pairs(self, direct, workers):
+        ontology = self.reasoner.getRootOntology()
+        owl_classes = list(ontology.getClassesInSignature())
+        classes = sorted(str(owl_class.toStringID()) for owl_class in owl_classes)
+        class_to_id = {name: i for i, name in enumerate(classes)}
+
+        def query(owl_class):
+            supers = self.reasoner.getSuperClasses(owl_class, True).getFlattened()
+            return sorted(str(x.toStringID()) for x in supers)
+
+        parents = [[] for _ in classes]
+        results = self._query_classes(query, owl_classes, workers)
+        for owl_class, super_names in zip(owl_classes, results):
+            sub_id = class_to_id[str(owl_class.toStringID())]
+            for name in super_names:
+                if name not in class_to_id:
+                    class_to_id[name] = len(classes)
+                    classes.append(name)
+                    parents.append([])
+                parents[sub_id].append(class_to_id[name])
+
+        if direct:
+            ancestors = [set(p) for p in parents]
+        else:
+            ancestors = self._transitive_closure(parents)
+
+        pairs = np.array([(sub, sup) for sub, sups in enumerate(ancestors)
+                          for sup in sorted(sups)],
+                         dtype=np.int64).reshape(-1, 2)
+        return classes, pairs
+
+    @staticmethod
+    def _transitive_closure(parents):
+        ancestors = [None] * len(parents)
+        for start in range(len(parents)):
+            if ancestors[start] is not None:
+                continue
+            # Iterative post-order traversal to avoid recursion limits on deep hierarchies.
+            stack = [(start, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if ancestors[node] is not None:
+                    continue
+                if expanded:
+                    result = set(parents[node])
+                    for parent in parents[node]:
+                        result |= ancestors[parent] or set()
+                    ancestors[node] = result
+                    continue
+                stack.append((node, True))
+                for parent in parents[node]:
+                    if ancestors[parent] is None:
+                        stack.append((parent, False))
+        return ancestors
 
     @count_added_axioms
-    def infer_subclass_axioms(self, owl_classes, direct=False):
+    def infer_subclass_axioms(self, owl_classes, direct=False, workers=1):
         """Infers and returns axioms of the type :math:`C \sqsubseteq D`
 
         :param owl_classes: List of OWLClass objects to be used to infer the axioms.
         :type owl_class: list[:class:`org.semanticweb.owlapi.model.OWLClass`]
         :param direct: If True, only direct superclasses will be inferred. Default is False.
         :type direct: bool, optional
+        :param workers: Number of threads used to query the reasoner. Default is 1.
+        :type workers: int, optional
         :rtype: list[:class:`org.semanticweb.owlapi.model.OWLSubClassOfAxiom`]
         """
         owl_classes = list(owl_classes)
@@ -61,21 +235,25 @@ org.semanticweb.owlapi.model.OWLClass")
         if not isinstance(direct, bool):
             raise TypeError("Optional parameter direct must be of type bool")
 
-        axioms = []
-        for owl_class in owl_classes:
+        self._check_workers(workers)
+
+        def query(owl_class):
             super_classes = self.reasoner.getSuperClasses(owl_class, direct).getFlattened()
-            new_axioms = set(map(lambda x: OWLSubClassOfAxiomImpl(owl_class, x, []),
-                                 super_classes))
+            return set(map(lambda x: OWLSubClassOfAxiomImpl(owl_class, x, []), super_classes))
 
+        axioms = []
+        for new_axioms in self._query_classes(query, owl_classes, workers):
             axioms += list(new_axioms)
         return axioms
 
     @count_added_axioms
-    def infer_equivalent_class_axioms(self, owl_classes):
+    def infer_equivalent_class_axioms(self, owl_classes, workers=1):
         """Infers and returns axioms of the form :math:`C \equiv D`
 
         :param owl_classes: List of OWLClass objects to be used to infer the axioms.
         :type owl_class: list[:class:`org.semanticweb.owlapi.model.OWLClass`]
+        :param workers: Number of threads used to query the reasoner. Default is 1.
+        :type workers: int, optional
 
         :rtype: list[:class:`org.semanticweb.owlapi.model.OWLEquivalentClassesAxiom`]
         """
@@ -85,21 +263,23 @@ org.semanticweb.owlapi.model.OWLClass")
             raise TypeError("All elements in parameter owl_classes must be of type \
 org.semanticweb.owlapi.model.OWLClass")
 
-        axioms = []
-        for owl_class in owl_classes:
+        self._check_workers(workers)
+
+        def query(owl_class):
             equiv_classes = self.reasoner.getEquivalentClasses(owl_class).getEntities()
             equiv_classes.add(owl_class)
+            return OWLEquivalentClassesAxiomImpl(equiv_classes, [])
 
-            new_axiom = OWLEquivalentClassesAxiomImpl(equiv_classes, [])
-            axioms.append(new_axiom)
-        return axioms
+        return self._query_classes(query, owl_classes, workers)
 
     @count_added_axioms
-    def infer_disjoint_class_axioms(self, owl_classes):
+    def infer_disjoint_class_axioms(self, owl_classes, workers=1):
         """Infers and adds axioms of the type :math:`C` *disjoint\_with*  :math:`D`
 
         :param owl_classes: List of OWLClass objects to be used to infer the axioms.
         :type owl_class: list[:class:`org.semanticweb.owlapi.model.OWLClass`]
+        :param workers: Number of threads used to query the reasoner. Default is 1.
+        :type workers: int, optional
 
         :rtype: list[:class:`org.semanticweb.owlapi.model.OWLDisjointClassesAxiom`]
         """
@@ -109,10 +289,11 @@ org.semanticweb.owlapi.model.OWLClass")
             raise TypeError("All elements in parameter owl_classes must be of type \
 org.semanticweb.owlapi.model.OWLClass")
 
-        axioms = []
-        for owl_class in owl_classes:
+        self._check_workers(workers)
+
+        def query(owl_class):
             disjoint_classes = self.reasoner.getDisjointClasses(owl_class).getFlattened()
             disjoint_classes.add(owl_class)
-            new_axiom = OWLDisjointClassesAxiomImpl(disjoint_classes, HashSet())
-            axioms.append(new_axiom)
-        return axioms
+            return OWLDisjointClassesAxiomImpl(disjoint_classes, HashSet())
+
+        return self._query_classes(query, owl_classes, workers)
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+DEFAULT_CACHE_DIR = os.environ.get("MOWL_CACHE_DIR",
+                                   os.path.join(os.path.expanduser("~"), ".cache", "mowl"))
+
+
+def ontology_content_hash(ontology):
+    """Returns the SHA-256 digest of an ontology rendered in OWL functional syntax, which lists \
+the axioms in a canonical order. The rendering is streamed into the digest in the JVM, so \
+neither the document nor the axioms are transferred to Python.
+
+    :param ontology: The ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :rtype: str
+    """
+    from java.io import OutputStream
+    from java.security import DigestOutputStream, MessageDigest
+    from org.semanticweb.owlapi.formats import FunctionalSyntaxDocumentFormat
+
+    digest = MessageDigest.getInstance("SHA-256")
+    stream = DigestOutputStream(OutputStream.nullOutputStream(), digest)
+    try:
+        ontology.getOWLOntologyManager().saveOntology(ontology, FunctionalSyntaxDocumentFormat(),
+                                                      stream)
+    finally:
+        stream.close()
+    return "".join(f"{byte & 0xff:02x}" for byte in digest.digest())
+
+
+class ClosureCache():
+    """Content-addressed on-disk cache of deductive closures. Closures are stored as compressed \
+integer arrays (one row per inferred axiom) in ``.npz`` files whose names are derived from the \
+ontology content, the reasoner and the entity vocabulary used to index the closure.
+
+    :param cache_dir: Directory where closures are stored. Defaults to ``closures`` inside \
+``$MOWL_CACHE_DIR`` or ``~/.cache/mowl``.
+    :type cache_dir: str, optional
+    """
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, "closures")
+        if not isinstance(cache_dir, str):
+            raise TypeError("Optional parameter cache_dir must be of type str.")
+
+        self.cache_dir = cache_dir
+
+    def key(self, ontology, reasoner, vocabulary, namespace=""):
+        """Computes the cache key of a closure.
+
+        :param ontology: Ontology the closure is computed from.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :param reasoner: Name identifying how the closure was computed.
+        :type reasoner: str
+        :param vocabulary: Entity names in index order. Changing the vocabulary changes the \
+indices of the closure, so it is part of the key.
+        :type vocabulary: list of str
+        :param namespace: Additional string to separate closures indexed in different ways, \
+for example the name of the evaluator. Defaults to ``""``.
+        :type namespace: str, optional
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        for part in (namespace, reasoner, ontology_content_hash(ontology)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for name in vocabulary:
+            digest.update(name.encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"closure_{key}.npz")
+
+    def load(self, key):
+        """Loads a closure.
+
+        :rtype: :class:`numpy.ndarray` or ``None`` if the closure is not cached.
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path, allow_pickle=False) as data:
+            return data["tuples"]
+
+    def save(self, key, tuples):
+        """Stores a closure. The file is written under a temporary name and renamed, so \
+concurrent readers never see partial files.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, tuples=tuples)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get(self, key, compute_fn):
+        """Returns the cached closure or computes and stores it.
+
+        :param key: Key obtained with :meth:`key`.
+        :type key: str
+        :param compute_fn: Function returning the closure as an integer array-like of shape \
+``(N, d)``.
+        :type compute_fn: callable
+        :rtype: :class:`numpy.ndarray`
+        """
+        tuples = self.load(key)
+        if tuples is not None:
+            logger.info(f"Loaded deductive closure from {self.path(key)}")
+            return tuples
+
+        tuples = np.asarray(compute_fn(), dtype=np.int64)
+        if tuples.ndim != 2:
+            tuples = tuples.reshape(-1, 2) if tuples.size == 0 else tuples.reshape(len(tuples), -1)
+        self.save(key, tuples)
+        logger.info(f"Saved deductive closure to {self.path(key)}")
+        return tuples
@@ -0,0 +1,202 @@
+from collections.abc import Mapping
+import copy
+import os
+
+import numpy as np
+
+
+class EmbeddingStore(Mapping):
+    """
+    Read-only mapping from entity names (IRIs) to embedding vectors backed by a single \
+contiguous matrix.
+
+    Looking up an entity is a dictionary access followed by a row view of the matrix, so no \
+per-entity arrays are allocated. Stores can be saved as a ``.npy`` matrix plus a ``.vocab`` \
+text file and loaded back memory-mapped, which lets several processes share the same \
+embeddings without copying them.
+
+    :param vocabulary: Entity names. Either a list where the position of each name is its row \
+in ``matrix`` or a dictionary mapping names to rows.
+    :type vocabulary: list or dict
+    :param matrix: Embedding matrix of shape ``(len(vocabulary), embedding_dim)``.
+    :type matrix: :class:`numpy.ndarray`
+    """
+
+    def __init__(self, vocabulary, matrix):
+        if isinstance(vocabulary, dict):
+            index = vocabulary
+        elif isinstance(vocabulary, (list, tuple)):
+            index = {name: i for i, name in enumerate(vocabulary)}
+        else:
+            raise TypeError("Parameter vocabulary must be of type list or dict.")
+
+        if not isinstance(matrix, np.ndarray):
+            raise TypeError("Parameter matrix must be of type numpy.ndarray.")
+
+        if matrix.ndim != 2:
+            raise ValueError("Parameter matrix must be two-dimensional.")
+
+        if len(index) != matrix.shape[0]:
+            raise ValueError(f"Vocabulary size ({len(index)}) and number of rows in matrix \
+({matrix.shape[0]}) do not match.")
+
+        self._index = index
+        self._vocabulary = list(vocabulary) if isinstance(vocabulary, (list, tuple)) else None
+        self._matrix = np.ascontiguousarray(matrix)
+
+    @classmethod
+    def from_dict(cls, embeddings, embedding_dim=None):
+        """Creates a store from a dictionary of names and vectors.
+
+        :param embeddings: Dictionary mapping names to vectors.
+        :type embeddings: dict
+        :param embedding_dim: Embedding dimension, only needed if ``embeddings`` is empty.
+        :type embedding_dim: int, optional
+        :rtype: :class:`EmbeddingStore`
+        """
+        if len(embeddings) == 0:
+            return cls([], np.empty((0, embedding_dim or 0), dtype=np.float32))
+
+        vocabulary = list(embeddings.keys())
+        matrix = np.stack([np.asarray(embeddings[name]) for name in vocabulary])
+        return cls(vocabulary, matrix)
+
+    @classmethod
+    def from_keyed_vectors(cls, keyed_vectors, names):
+        """Creates a store with the rows of a :class:`gensim.models.KeyedVectors` object \
+corresponding to ``names``. Names missing in the keyed vectors are skipped.
+
+        :param keyed_vectors: Word vectors, for example ``w2v_model.wv``.
+        :type keyed_vectors: :class:`gensim.models.KeyedVectors`
+        :param names: Entity names to select.
+        :type names: list
+        :rtype: :class:`EmbeddingStore`
+        """
+        key_to_index = keyed_vectors.key_to_index
+        vocabulary = [name for name in names if name in key_to_index]
+        rows = np.fromiter((key_to_index[name] for name in vocabulary), dtype=np.int64,
+                           count=len(vocabulary))
+        return cls(vocabulary, keyed_vectors.vectors[rows])
+
+    @property
+    def vocabulary(self):
+        """Entity names ordered by row.
+
+        :rtype: list
+        """
+        if self._vocabulary is None:
+            vocabulary = [None] * len(self._index)
+            for name, row in self._index.items():
+                vocabulary[row] = name
+            self._vocabulary = vocabulary
+        return self._vocabulary
+
+    @property
+    def index(self):
+        """Dictionary mapping entity names to rows.
+
+        :rtype: dict
+        """
+        return self._index
+
+    @property
+    def matrix(self):
+        """Embedding matrix.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._matrix
+
+    @property
+    def embedding_dim(self):
+        return self._matrix.shape[1]
+
+    def __getitem__(self, name):
+        return self._matrix[self._index[name]]
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self.vocabulary)
+
+    def rows(self, names):
+        """Returns the rows of ``names`` as an integer array.
+
+        :param names: Entity names.
+        :type names: list
+        :rtype: :class:`numpy.ndarray`
+        """
+        index = self._index
+        return np.fromiter((index[name] for name in names), dtype=np.int64, count=len(names))
+
+    def get_vectors(self, names):
+        """Returns the embeddings of ``names`` as a matrix.
+
+        :param names: Entity names.
+        :type names: list
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._matrix[self.rows(names)]
+
+    def copy(self):
+        """Returns a copy of the store that does not share memory with the original one.
+
+        :rtype: :class:`EmbeddingStore`
+        """
+        return EmbeddingStore(copy.copy(self._index), np.array(self._matrix))
+
+    def to_dict(self):
+        """Returns a dictionary of names and vectors. Vectors are views of the matrix.
+
+        :rtype: dict
+        """
+        return dict(zip(self.vocabulary, self._matrix))
+
+    @staticmethod
+    def _get_paths(filepath):
+        if filepath.endswith(".npy"):
+            filepath = filepath[:-len(".npy")]
+        return filepath + ".npy", filepath + ".vocab"
+
+    def save(self, filepath):
+        """Saves the store as ``<filepath>.npy`` and ``<filepath>.vocab``.
+
+        :param filepath: Path prefix of the saved files.
+        :type filepath: str
+        """
+        if not isinstance(filepath, str):
+            raise TypeError("Parameter filepath must be of type str.")
+
+        matrix_path, vocab_path = self._get_paths(filepath)
+        np.save(matrix_path, self._matrix)
+        with open(vocab_path, "w", encoding="utf-8") as f:
+            for name in self.vocabulary:
+                f.write(f"{name}\n")
+
+    @classmethod
+    def load(cls, filepath, mmap_mode="r"):
+        """Loads a store saved with :meth:`save`.
+
+        :param filepath: Path prefix of the saved files.
+        :type filepath: str
+        :param mmap_mode: Memory-map mode passed to :func:`numpy.load`. Use ``None`` to read \
+the matrix into memory. Defaults to ``"r"``.
+        :type mmap_mode: str, optional
+        :rtype: :class:`EmbeddingStore`
+        """
+        if not isinstance(filepath, str):
+            raise TypeError("Parameter filepath must be of type str.")
+
+        matrix_path, vocab_path = cls._get_paths(filepath)
+        if not os.path.exists(matrix_path) or not os.path.exists(vocab_path):
+            raise FileNotFoundError(f"Embedding files not found: {matrix_path}, {vocab_path}")
+
+        matrix = np.load(matrix_path, mmap_mode=mmap_mode)
+        with open(vocab_path, "r", encoding="utf-8") as f:
+            vocabulary = f.read().splitlines()
+
+        return cls(vocabulary, matrix)
@@ -0,0 +1,281 @@
+import functools
+import json
+import os
+import threading
+import time
+
+from deprecated.sphinx import versionadded
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+
+class _State():
+    enabled = False
+    sink = None
+    records = []
+    listeners = []
+    lock = threading.Lock()
+    local = threading.local()
+
+
+_state = _State()
+
+
+@versionadded(version="1.0.2")
+def enable(path=None):
+    """Starts recording stage timings and counters. Records are kept in memory and, if ``path`` \
+is given, also appended to that file as JSON lines. Instrumentation can also be enabled by \
+setting the ``MOWL_INSTRUMENTATION`` environment variable to ``1`` or to the path of the output \
+file before importing mOWL.
+
+    :param path: File where records are appended as JSON lines. Defaults to ``None``.
+    :type path: str, optional
+    """
+    if path is not None and not isinstance(path, str):
+        raise TypeError("Optional parameter path must be of type str.")
+
+    with _state.lock:
+        if _state.sink is not None:
+            _state.sink.close()
+        _state.sink = None if path is None else open(path, "a", buffering=1)
+        _state.enabled = True
+
+
+@versionadded(version="1.0.2")
+def disable():
+    """Stops recording. Records already collected are kept until :func:`reset` is called."""
+    with _state.lock:
+        _state.enabled = False
+        if _state.sink is not None:
+            _state.sink.close()
+            _state.sink = None
+
+
+def is_enabled():
+    """:rtype: bool"""
+    return _state.enabled
+
+
+def reset():
+    """Removes the records collected in memory."""
+    with _state.lock:
+        _state.records = []
+
+
+def records():
+    """Returns the records collected in memory. Timer records have the keys ``type`` \
+(``"timer"``), ``stage``, ``path`` (the stages enclosing it, separated by ``/``), ``start`` (Unix \
+time), ``seconds`` and ``pid`` plus their attributes. Counter records have the keys ``type`` \
+(``"counter"``), ``name``, ``value``, ``path``, ``time`` and ``pid`` plus their attributes.
+
+    :rtype: list of dict
+    """
+    with _state.lock:
+        return list(_state.records)
+
+
+def add_listener(listener):
+    """Registers an object notified at stage boundaries. Its method ``stage_started(timer)`` is \
+called when a :class:`Timer` is entered and ``stage_finished(timer, record)`` when it exits, \
+before the record is stored, so listeners can add fields to the record. \
+:class:`mowl.utils.memory.MemoryProfiler` uses it to attribute memory usage to stages.
+    """
+    with _state.lock:
+        _state.listeners = _state.listeners + [listener]
+
+
+def remove_listener(listener):
+    """Unregisters a listener added with :func:`add_listener`."""
+    with _state.lock:
+        _state.listeners = [other for other in _state.listeners if other is not listener]
+
+
+def _emit(record):
+    with _state.lock:
+        _state.records.append(record)
+        if _state.sink is not None:
+            _state.sink.write(json.dumps(record, default=str) + "\n")
+
+
+def _stack():
+    stack = getattr(_state.local, "stack", None)
+    if stack is None:
+        stack = _state.local.stack = []
+    return stack
+
+
+class Timer():
+    """Context manager that records the wall time of a stage. Attributes given to the \
+constructor or to :meth:`set` are stored in the record. If the attribute ``items`` is set, \
+:func:`summary` reports the throughput of the stage in items per second.
+    """
+
+    __slots__ = ("stage", "attributes", "_start", "_wall_start")
+
+    def __init__(self, stage, **attributes):
+        self.stage = stage
+        self.attributes = attributes
+
+    def set(self, **attributes):
+        """Adds attributes to the record."""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        _stack().append(self.stage)
+        for listener in _state.listeners:
+            listener.stage_started(self)
+        self._wall_start = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self._start
+        stack = _stack()
+        path = "/".join(stack)
+        stack.pop()
+        record = {"type": "timer", "stage": self.stage, "path": path, "start": self._wall_start,
+                  "seconds": seconds, "pid": os.getpid()}
+        record.update(self.attributes)
+        if exc_info[0] is not None:
+            record["error"] = exc_info[0].__name__
+        for listener in _state.listeners:
+            listener.stage_finished(self, record)
+        _emit(record)
+        return False
+
+
+class _NullTimer():
+    """Timer returned while instrumentation is disabled. It does nothing."""
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+@versionadded(version="1.0.2")
+def timer(stage, **attributes):
+    """Returns a context manager that records the wall time of a stage:
+
+    .. code-block:: python
+
+        with timer("walk", walker="deepwalk") as t:
+            ...
+            t.set(items=num_walks)
+
+    While instrumentation is disabled, a shared no-op object is returned, so the cost is a \
+function call and a flag check.
+
+    :param stage: Name of the stage.
+    :type stage: str
+    :rtype: :class:`Timer`
+    """
+    if not _state.enabled:
+        return _NULL_TIMER
+    return Timer(stage, **attributes)
+
+
+@versionadded(version="1.0.2")
+def count(name, value=1, **attributes):
+    """Records a counter, for example the number of edges of a projection.
+
+    :param name: Name of the counter.
+    :type name: str
+    :param value: Value of the counter. Defaults to ``1``.
+    :type value: int or float, optional
+    """
+    if not _state.enabled:
+        return
+    record = {"type": "counter", "name": name, "value": value, "path": "/".join(_stack()),
+              "time": time.time(), "pid": os.getpid()}
+    record.update(attributes)
+    _emit(record)
+
+
+@versionadded(version="1.0.2")
+def timed(stage, items=None):
+    """Decorator that runs a function inside :func:`timer`. The record gets the attribute \
+``class`` with the class name when the function is a method. Calls made while the same stage is \
+already being timed, such as an overriding method calling ``super()``, are not recorded again.
+
+    :param stage: Name of the stage.
+    :type stage: str
+    :param items: Function that receives the result and returns the number of items produced, \
+stored as the ``items`` attribute. Defaults to ``None``.
+    :type items: callable, optional
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            stack = _stack()
+            if stack and stack[-1] == stage:
+                return fn(*args, **kwargs)
+
+            attributes = dict()
+            if args and fn.__qualname__ != fn.__name__:
+                attributes["class"] = type(args[0]).__name__
+            with Timer(stage, **attributes) as t:
+                result = fn(*args, **kwargs)
+                if items is not None and result is not None:
+                    t.set(items=items(result))
+            return result
+        return wrapper
+    return decorator
+
+
+@versionadded(version="1.0.2")
+def summary(records=None):
+    """Aggregates timer records by stage.
+
+    :param records: Records to aggregate. Defaults to the records collected in memory.
+    :type records: list of dict, optional
+    :rtype: dict. Maps every stage to a dictionary with ``calls``, ``total_seconds``, \
+``mean_seconds``, ``max_seconds`` and, for stages with ``items``, ``items`` and \
+``items_per_second``.
+    """
+    if records is None:
+        with _state.lock:
+            records = list(_state.records)
+
+    stages = dict()
+    for record in records:
+        if record.get("type") != "timer":
+            continue
+        stats = stages.setdefault(record["stage"], {"calls": 0, "total_seconds": 0.,
+                                                    "max_seconds": 0.})
+        stats["calls"] += 1
+        stats["total_seconds"] += record["seconds"]
+        stats["max_seconds"] = max(stats["max_seconds"], record["seconds"])
+        if "items" in record:
+            stats["items"] = stats.get("items", 0) + record["items"]
+
+    for stats in stages.values():
+        stats["mean_seconds"] = stats["total_seconds"] / stats["calls"]
+        if "items" in stats and stats["total_seconds"] > 0:
+            stats["items_per_second"] = stats["items"] / stats["total_seconds"]
+    return stages
+
+
+def _enable_from_environment():
+    value = os.environ.get("MOWL_INSTRUMENTATION", "")
+    if value.lower() in ("", "0", "false", "no"):
+        return
+    enable(None if value.lower() in ("1", "true", "yes") else value)
+
+
+_enable_from_environment()
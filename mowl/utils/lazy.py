@@ -0,0 +1,30 @@
+import importlib
+import sys
+
+
+def lazy_exports(package, exports):
+    """Creates the module-level ``__getattr__`` and ``__dir__`` functions (:pep:`562`) of a \
+package whose public names are imported from its submodules on first access. Packages that \
+re-export JVM-dependent classes use it so that importing the package, or one of its pure-Python \
+submodules, does not import OWLAPI classes nor start the JVM.
+
+    :param package: Name of the package, i.e., ``__name__``.
+    :type package: str
+    :param exports: Mapping from exported name to the (relative) name of the module defining it.
+    :type exports: dict of str to str
+    :rtype: tuple(callable, callable)
+    """
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,238 @@
+import math
+import os
+import resource
+import sys
+import threading
+
+import jpype
+from deprecated.sphinx import versionadded
+
+from mowl.utils import instrumentation
+
+import logging
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+MB = 2 ** 20
+
+
+def rss():
+    """Returns the resident set size of the process in bytes. On systems without ``/proc``, the \
+peak resident set size reported by ``getrusage`` is returned instead.
+
+    :rtype: int
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def jvm_heap():
+    """Returns the used and maximum heap of the JVM in bytes, read from the \
+``java.lang.management`` memory bean. Returns ``(None, None)`` if the JVM is not running; this \
+function does not start it.
+
+    :rtype: tuple(int, int)
+    """
+    if not jpype.isJVMStarted():
+        return None, None
+    from java.lang.management import ManagementFactory
+    usage = ManagementFactory.getMemoryMXBean().getHeapMemoryUsage()
+    return int(usage.getUsed()), int(usage.getMax())
+
+
+def torch_allocated():
+    """Returns the bytes allocated by PyTorch on the current CUDA device. Returns ``None`` if \
+PyTorch has not been imported or CUDA is not available. PyTorch does not track CPU tensors \
+separately; they are part of the resident set size.
+
+    :rtype: int
+    """
+    torch = sys.modules.get("torch")
+    if torch is None or not torch.cuda.is_available() or not torch.cuda.is_initialized():
+        return None
+    return int(torch.cuda.memory_allocated())
+
+
+def sample():
+    """Takes a memory sample of the Python process, the JVM heap and PyTorch.
+
+    :rtype: dict with the keys ``rss``, ``jvm_heap``, ``jvm_heap_max`` and ``torch``, in bytes.
+    """
+    heap, heap_max = jvm_heap()
+    return {"rss": rss(), "jvm_heap": heap, "jvm_heap_max": heap_max,
+            "torch": torch_allocated()}
+
+
+class _Frame():
+    """Memory observed while a stage runs."""
+
+    def __init__(self, start):
+        self.start = start
+        self.peak = dict(start)
+
+    def update(self, values):
+        for key, value in values.items():
+            if value is not None and (self.peak[key] is None or value > self.peak[key]):
+                self.peak[key] = value
+
+
+@versionadded(version="1.0.2")
+class MemoryProfiler():
+    """Samples the resident set size of the process, the JVM heap and the CUDA memory allocated \
+by PyTorch and attributes the peaks to the stages reported by \
+:mod:`mowl.utils.instrumentation`, such as ``load``, ``normalize``, ``project``, ``walk``, \
+``train``, ``epoch`` and ``evaluate``. Memory is sampled when a stage starts and finishes and \
+every ``interval`` seconds in a background thread while the profiler is active. The start, end \
+and peak values of every stage are added to its instrumentation record (``rss_peak_mb``, \
+``jvm_heap_peak_mb``, ...). The used JVM heap includes objects that were not collected yet, so \
+its peak is an upper bound of the heap the stage needs.
+
+    .. code-block:: python
+
+        with MemoryProfiler() as profiler:
+            model.train()
+            model.evaluate(dataset.testing)
+        print(profiler.report())
+        print(profiler.recommended_jvm_memory())
+
+    Instrumentation is enabled while the profiler is active if it was not already.
+
+    :param interval: Seconds between samples. Defaults to ``0.05``.
+    :type interval: float, optional
+    """
+
+    def __init__(self, interval=0.05):
+        if not isinstance(interval, (int, float)):
+            raise TypeError("Optional parameter interval must be of type float.")
+
+        self.interval = interval
+        self.stages = []
+        self.peak = None
+        self._frames = dict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._enabled_instrumentation = False
+
+    def _observe(self):
+        values = sample()
+        with self._lock:
+            if self.peak is None:
+                self.peak = _Frame(values)
+            else:
+                self.peak.update(values)
+            for frame in self._frames.values():
+                frame.update(values)
+        return values
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._observe()
+
+    def start(self):
+        """Starts sampling. Equivalent to entering the profiler as a context manager."""
+        if self._thread is not None:
+            return
+        if not instrumentation.is_enabled():
+            instrumentation.enable()
+            self._enabled_instrumentation = True
+        self._observe()
+        instrumentation.add_listener(self)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        instrumentation.remove_listener(self)
+        if self._enabled_instrumentation:
+            instrumentation.disable()
+            self._enabled_instrumentation = False
+        self._observe()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def stage_started(self, timer):
+        values = self._observe()
+        with self._lock:
+            self._frames[id(timer)] = _Frame(values)
+
+    def stage_finished(self, timer, record):
+        end = self._observe()
+        with self._lock:
+            frame = self._frames.pop(id(timer), None)
+        if frame is None:
+            return
+
+        fields = dict()
+        for key in ("rss", "jvm_heap", "torch"):
+            if frame.start[key] is None or end[key] is None:
+                continue
+            fields[f"{key}_start_mb"] = frame.start[key] / MB
+            fields[f"{key}_end_mb"] = end[key] / MB
+            fields[f"{key}_peak_mb"] = frame.peak[key] / MB
+        if end["jvm_heap_max"] is not None:
+            fields["jvm_heap_max_mb"] = end["jvm_heap_max"] / MB
+        fields = {key: round(value, 2) for key, value in fields.items()}
+
+        record.update(fields)
+        stage = {"stage": record["stage"], "path": record["path"],
+                 "seconds": record["seconds"]}
+        stage.update(fields)
+        with self._lock:
+            self.stages.append(stage)
+
+    def report(self):
+        """Aggregates the measurements by stage.
+
+        :rtype: dict. Maps every stage to a dictionary with the number of ``calls`` and the \
+maximum over its calls of the peak resident set size (``rss_peak_mb``), of the growth of the \
+resident set size during the stage (``rss_growth_mb``), of the peak JVM heap \
+(``jvm_heap_peak_mb``) and of the peak CUDA memory (``torch_peak_mb``), when available.
+        """
+        with self._lock:
+            stages = list(self.stages)
+
+        report = dict()
+        for stage in stages:
+            entry = report.setdefault(stage["stage"], {"calls": 0})
+            entry["calls"] += 1
+            values = {key: stage[key] for key in ("rss_peak_mb", "jvm_heap_peak_mb",
+                                                   "torch_peak_mb") if key in stage}
+            if "rss_peak_mb" in stage:
+                values["rss_growth_mb"] = round(stage["rss_peak_mb"] - stage["rss_start_mb"], 2)
+            for key, value in values.items():
+                entry[key] = max(entry.get(key, value), value)
+        return report
+
+    def recommended_jvm_memory(self, headroom=1.5):
+        """Suggests a maximum heap size for :func:`mowl.init_jvm` from the peak JVM heap usage \
+observed, multiplied by ``headroom`` and rounded up to multiples of 256 MB.
+
+        :param headroom: Factor applied to the peak usage. Defaults to ``1.5``.
+        :type headroom: float, optional
+        :rtype: str or ``None`` if the JVM heap was not observed.
+        """
+        if self.peak is None or self.peak.peak["jvm_heap"] is None:
+            return None
+        megabytes = math.ceil(self.peak.peak["jvm_heap"] * headroom / MB / 256) * 256
+        if megabytes % 1024 == 0:
+            return f"{megabytes // 1024}g"
+        return f"{megabytes}m"
@@ -0,0 +1,143 @@
+import queue
+import threading
+
+import torch as th
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class EarlyStopping:
+    """
+    Patience-based early stopping tracker.
+
+    :param patience: Number of consecutive validation steps without improvement after which \
+    training should stop. If ``None``, training never stops early. Defaults to ``None``.
+    :type patience: int, optional
+    :param mode: Either ``"min"`` (lower values are better) or ``"max"`` (higher values are \
+    better). Defaults to ``"min"``.
+    :type mode: str, optional
+    :param min_delta: Minimum change in the monitored value to count as an improvement. \
+    Defaults to ``0``.
+    :type min_delta: float, optional
+    """
+
+    def __init__(self, patience=None, mode="min", min_delta=0):
+        if patience is not None and not isinstance(patience, int):
+            raise TypeError("Optional parameter patience must be of type int.")
+
+        if mode not in ["min", "max"]:
+            raise ValueError("Optional parameter mode must be either 'min' or 'max'.")
+
+        self.patience = patience
+        self.mode = mode
+        self.min_delta = min_delta
+        self.best = float("inf") if mode == "min" else float("-inf")
+        self.num_bad_steps = 0
+
+    def step(self, value):
+        """Registers a new validation value.
+
+        :param value: The validation value.
+        :type value: float
+        :return: ``True`` if the value improves on the best one seen so far.
+        :rtype: bool
+        """
+        if self.mode == "min":
+            improved = value < self.best - self.min_delta
+        else:
+            improved = value > self.best + self.min_delta
+
+        if improved:
+            self.best = value
+            self.num_bad_steps = 0
+        else:
+            self.num_bad_steps += 1
+
+        return improved
+
+    @property
+    def should_stop(self):
+        """Whether the patience has been exhausted.
+
+        :rtype: bool
+        """
+        if self.patience is None:
+            return False
+        return self.num_bad_steps >= self.patience
+
+
+class AsyncCheckpointer:
+    """
+    Writes model checkpoints from a background thread.
+
+    Calling :meth:`save` takes a CPU snapshot of the module weights on the caller thread and \
+    returns immediately; serialization with :func:`torch.save` happens on a worker thread. Only \
+    the most recent pending snapshot is kept, so a slow disk never makes the queue grow.
+
+    :param filepath: Path where the checkpoint is written.
+    :type filepath: str
+    """
+
+    def __init__(self, filepath):
+        if not isinstance(filepath, str):
+            raise TypeError("Parameter filepath must be of type str.")
+
+        self.filepath = filepath
+        self._queue = queue.Queue(maxsize=1)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            state_dict = self._queue.get()
+            if state_dict is None:
+                self._queue.task_done()
+                break
+            try:
+                th.save(state_dict, self.filepath)
+            except Exception as e:
+                self._error = e
+                logger.error(f"Checkpoint could not be saved to {self.filepath}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def save(self, module):
+        """Schedules a checkpoint of the module weights.
+
+        :param module: Module to checkpoint.
+        :type module: :class:`torch.nn.Module`
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("Checkpointer has already been closed.")
+
+        snapshot = {k: v.detach().to("cpu", copy=True) for k, v in module.state_dict().items()}
+
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            # Replace the pending snapshot with the newer one.
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+            self._queue.put(snapshot)
+
+    def wait(self):
+        """Blocks until every scheduled checkpoint has been written."""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Writes pending checkpoints and stops the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
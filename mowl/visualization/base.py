@@ -1,7 +1,12 @@
+from collections.abc import Mapping
+from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE as SKTSNE
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from gensim.models.keyedvectors import KeyedVectors
+from deprecated.sphinx import versionchanged
+from mowl.utils.embedding_store import EmbeddingStore
 import logging
 import warnings
 logging.basicConfig(level=logging.INFO)
@@ -24,7 +29,8 @@ class TSNE(Visualizer):
     Wrapper for :class:`sklearn.manifold.TSNE`
 
     :param embeddings: Embeddings dictionary
-    :type embeddings: dict or :class:`gensim.models.keyedvectors.KeyedVectors`
+    :type embeddings: dict, :class:`mowl.utils.embedding_store.EmbeddingStore` or \
+        :class:`gensim.models.keyedvectors.KeyedVectors`
     :param labels: Dictionary containing label information of the entities
     :type labels: dict of {str: str}
     :param entities: List of entities to consider for computing the TSNE. If `None`, then all \
@@ -36,38 +42,83 @@ class TSNE(Visualizer):
 
         self.total_embeddings = len(embeddings)
         self.labels = labels
-        self.embeddings = dict()
+        if entities is not None:
+            entities = set(entities)
 
-        self.not_to_process = 0
         if isinstance(embeddings, KeyedVectors):
-            for idx, word in enumerate(embeddings.index_to_key):
-                if (entities is not None) and (word not in entities):
-                    self.not_to_process += 1
-                    continue
-                if word not in self.labels:
-                    self.not_to_process += 1
-                    continue
-                self.embeddings[word] = embeddings[word]
-        elif isinstance(embeddings, dict):
-            if entities is None:
-                self.embeddings = {name: emb for name, emb in embeddings.items()
-                                   if name in self.labels}
-            else:
-                self.embeddings = {name: emb for name, emb in embeddings.items()
-                                   if name in entities and name in self.labels}
+            names = embeddings.index_to_key
+            vectors = embeddings.vectors
+        elif isinstance(embeddings, EmbeddingStore):
+            names = embeddings.vocabulary
+            vectors = embeddings.matrix
+        elif isinstance(embeddings, Mapping):
+            names = list(embeddings.keys())
+            vectors = embeddings.values()
         else:
-            raise TypeError("Embeddings type {type(embeddings)} not recognized. Expected types \
-                are dict or gensim.models.keyedvectors.KeyedVectors")
+            raise TypeError(f"Embeddings type {type(embeddings)} not recognized. Expected types \
+                are dict, EmbeddingStore or gensim.models.keyedvectors.KeyedVectors")
+
+        selected = [idx for idx, name in enumerate(names)
+                    if name in self.labels and (entities is None or name in entities)]
+        self.names = [names[idx] for idx in selected]
+        self.not_to_process = self.total_embeddings - len(self.names)
+
+        if isinstance(vectors, np.ndarray):
+            self.vectors = vectors[selected]
+        elif len(selected) == len(names):
+            self.vectors = np.array(list(vectors))
+        else:
+            self.vectors = np.array([embeddings[name] for name in self.names])
+
+        self.label_ids, self.label_values = pd.factorize(
+            np.array([self.labels[name] for name in self.names], dtype=object))
 
         logging.info("Found %d embedding vectors. Processing only %d.", self.total_embeddings,
-                     len(self.embeddings))
-        self.embedding_idx_dict = {v: k for k, v in enumerate(self.embeddings.keys())}
+                     len(self.names))
 
         self.classes = set(self.labels.values())
         colors = plt.cm.rainbow(np.linspace(0, 1, len(self.classes)))
         self.class_color_dict = {cl: col for cl, col in zip(self.classes, colors)}
 
-    def generate_points(self, epochs, workers=1, verbose=0):
+    @property
+    def embeddings(self):
+        """Dictionary of the embeddings that are processed.
+
+        :rtype: dict of {str: :class:`numpy.ndarray`}
+        """
+        return dict(zip(self.names, self.vectors))
+
+    @property
+    def embedding_idx_dict(self):
+        """Dictionary mapping the processed entities to their rows in :attr:`vectors`.
+
+        :rtype: dict of {str: int}
+        """
+        return {name: idx for idx, name in enumerate(self.names)}
+
+    def subsample(self, samples_per_label, seed=None):
+        """Selects at most ``samples_per_label`` entities of every label uniformly at random.
+
+        :param samples_per_label: Maximum number of entities per label.
+        :type samples_per_label: int
+        :param seed: Seed of the random number generator. Defaults to ``None``.
+        :type seed: int, optional
+        :rtype: :class:`numpy.ndarray` with the sorted rows of the selected entities.
+        """
+        label_ids = self.label_ids
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(label_ids))
+        order = order[np.argsort(label_ids[order], kind="stable")]
+        sorted_labels = label_ids[order]
+        starts = np.searchsorted(sorted_labels, sorted_labels, side="left")
+        rank = np.arange(len(order)) - starts
+        return np.sort(order[rank < samples_per_label])
+
+    @versionchanged(version="1.0.2", reason="Embeddings with more than ``pca_components`` \
+dimensions are reduced with PCA before TSNE, entities can be subsampled per label with \
+``samples_per_label`` and the Barnes-Hut approximation is used with a PCA initialization.")
+    def generate_points(self, epochs, workers=1, verbose=0, pca_components=50,
+                        samples_per_label=None, seed=None):
         """This method will call the :meth:`sklearn.manifold.TSNE.fit_transform`
         method to generate the points for the plot.
 
@@ -76,39 +127,72 @@ class TSNE(Visualizer):
         :param workers: Number of workers to use for parallel processing. Defaults to 1.
         :type workers: int, optional
         :param verbose: Verbosity level. Defaults to 0.
+        :param pca_components: Number of dimensions the embeddings are reduced to with \
+            :class:`sklearn.decomposition.PCA` before running TSNE. If ``None``, embeddings \
+            are not reduced. Defaults to ``50``.
+        :type pca_components: int, optional
+        :param samples_per_label: Maximum number of entities of each label to plot, chosen at \
+            random. If ``None``, all the entities are plotted. Defaults to ``None``.
+        :type samples_per_label: int, optional
+        :param seed: Seed used for subsampling, PCA and TSNE. Defaults to ``None``.
+        :type seed: int, optional
         """
-        points = np.array(list(self.embeddings.values()))
+        if pca_components is not None and not isinstance(pca_components, int):
+            raise TypeError("Optional parameter pca_components must be of type int.")
+        if samples_per_label is not None and not isinstance(samples_per_label, int):
+            raise TypeError("Optional parameter samples_per_label must be of type int.")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("Optional parameter seed must be of type int.")
+
+        if samples_per_label is None:
+            self.point_idxs = np.arange(len(self.names))
+        else:
+            self.point_idxs = self.subsample(samples_per_label, seed=seed)
+
+        points = self.vectors[self.point_idxs]
         if np.iscomplexobj(points):
             if verbose:
                 warnings.warn("Complex numpy array detected. Only real part will be considered",
                               UserWarning)
             points = points.real
-        self.points = SKTSNE(n_components=2, verbose=verbose, n_iter=epochs, n_jobs=workers)
-        self.points = self.points.fit_transform(points)
-        self.plot_data = {}
+        points = np.asarray(points, dtype=np.float32)
+
+        if pca_components is not None and points.shape[1] > pca_components and \
+                points.shape[0] > pca_components:
+            points = PCA(n_components=pca_components, svd_solver="randomized",
+                         random_state=seed).fit_transform(points)
 
-        for name, idx in self.embedding_idx_dict.items():
-            label = self.labels[name]
-            x, y = tuple(self.points[idx])
+        self.points = SKTSNE(n_components=2, verbose=verbose, max_iter=epochs, n_jobs=workers,
+                             method="barnes_hut", init="pca", learning_rate="auto",
+                             random_state=seed)
+        self.points = self.points.fit_transform(points)
 
-            if label not in self.plot_data:
-                self.plot_data[label] = [], []
-            self.plot_data[label][0].append(x)
-            self.plot_data[label][1].append(y)
+        label_ids = self.label_ids[self.point_idxs]
+        order = np.argsort(label_ids, kind="stable")
+        bounds = np.searchsorted(label_ids[order], np.arange(len(self.label_values) + 1))
 
-    def show(self):
-        """ This method will call the :meth:`matplotlib.pyplot.show` method to show the plot.
-        """
+        self.plot_data = {}
+        for i, label in enumerate(self.label_values):
+            idxs = order[bounds[i]:bounds[i + 1]]
+            if len(idxs) > 0:
+                self.plot_data[label] = self.points[idxs, 0], self.points[idxs, 1]
 
+    def _plot(self):
         fig, ax = plt.subplots(figsize=(20, 20))
 
         for label, (xs, ys) in self.plot_data.items():
             color = self.class_color_dict[label]
-            ax.scatter(xs, ys, color=color, label=label)
+            ax.scatter(xs, ys, color=color, label=label, rasterized=len(xs) > 10000)
 
-            ax.legend()
-            ax.grid(True)
+        ax.legend()
+        ax.grid(True)
+        return fig, ax
 
+    def show(self):
+        """ This method will call the :meth:`matplotlib.pyplot.show` method to show the plot.
+        """
+
+        self._plot()
         plt.show()
 
     def savefig(self, outfile):
@@ -117,14 +201,6 @@ class TSNE(Visualizer):
         :type outfile: str
         """
 
-        fig, ax = plt.subplots(figsize=(20, 20))
-
-        for label, (xs, ys) in self.plot_data.items():
-            color = self.class_color_dict[label]
-            ax.scatter(xs, ys, color=color, label=label)
-
-            ax.legend()
-            ax.grid(True)
-
+        self._plot()
         plt.savefig(outfile)
         plt.close()
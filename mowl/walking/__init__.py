@@ -1,4 +1,11 @@
-from .walking import WalkingModel
-from .deepwalk.model import DeepWalk
-from .node2vec.model import Node2Vec
-from .factory import walker_factory
+from mowl.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "WalkingModel": ".walking",
+    "DeepWalk": ".deepwalk.model",
+    "Node2Vec": ".node2vec.model",
+    "walker_factory": ".factory",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -8,6 +8,7 @@ from java.util import HashMap
 from java.util import ArrayList
 from org.mowl import Edge
 from mowl.projection.edge import Edge as PyEdge
+from mowl.utils.instrumentation import count, timed
 from deprecated.sphinx import versionchanged
 
 logging.basicConfig(level=logging.INFO)
@@ -29,9 +30,11 @@ class DeepWalk(WalkingModel):
                  alpha=0.,
                  outfile=None,
                  workers=1,
-                 seed=0
+                 seed=0,
+                 sharded=False
                  ):
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         sharded=sharded)
 
         # Type checking
         if not isinstance(alpha, float):
@@ -44,6 +47,7 @@ class DeepWalk(WalkingModel):
 
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
     focus on when generating the random walks.")
+    @timed("walk")
     def walk(self, edges, nodes_of_interest=None):
         if nodes_of_interest is None:
             nodes_of_interest = ArrayList()
@@ -63,11 +67,21 @@ class DeepWalk(WalkingModel):
             newEdge = Edge(edge.src, edge.rel, edge.dst)
             edgesJ.add(newEdge)
 
-        walker = DW(edgesJ, self.num_walks, self.walk_length, self.alpha, self.workers,
-                    self.outfile, nodes_of_interest, self.seed)
+        if self.sharded:
+            shard_files = ArrayList()
+            for path in self.shard_files:
+                shard_files.add(path)
+            walker = DW(edgesJ, self.num_walks, self.walk_length, self.alpha, self.workers,
+                        self.outfile, nodes_of_interest, self.seed, shard_files)
+        else:
+            walker = DW(edgesJ, self.num_walks, self.walk_length, self.alpha, self.workers,
+                        self.outfile, nodes_of_interest, self.seed)
 
         walker.walk()
+        count("walks", int(walker.numWalksWritten()), seconds=walker.walkingTimeMillis() / 1000)
 
-        self.wait_for_all_walks()
+        # Shards are closed by their threads before walk returns.
+        if not self.sharded:
+            self.wait_for_all_walks()
         
 
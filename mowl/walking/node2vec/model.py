@@ -5,6 +5,7 @@ from java.util import ArrayList
 from org.mowl import Edge
 from org.mowl.Walking import Node2Vec as N2V
 from mowl.projection.edge import Edge as PyEdge
+from mowl.utils.instrumentation import count, timed
 from deprecated.sphinx import versionchanged
 
 logging.basicConfig(level=logging.INFO)
@@ -28,10 +29,12 @@ class Node2Vec(WalkingModel):
                  p=1,
                  q=1,
                  outfile=None,
-                 workers=1
+                 workers=1,
+                 sharded=False
                  ):
 
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         sharded=sharded)
 
         # Type checking
         if not isinstance(p, float):
@@ -47,6 +50,7 @@ class Node2Vec(WalkingModel):
         self.p = p
         self.q = q
 
+    @timed("walk")
     def walk(self, edges, nodes_of_interest=None):
         if nodes_of_interest is None:
             nodes_of_interest = ArrayList()
@@ -66,9 +70,21 @@ class Node2Vec(WalkingModel):
             newEdge = Edge(edge.src, edge.rel, edge.dst, edge.weight)
             edgesJ.add(newEdge)
 
-        walker = N2V(edgesJ, self.num_walks, self.walk_length, self.p, self.q, self.workers,
-                     self.outfile, nodes_of_interest)
+        if self.sharded:
+            shard_files = ArrayList()
+            for path in self.shard_files:
+                shard_files.add(path)
+            walker = N2V(edgesJ, self.num_walks, self.walk_length, self.p, self.q, self.workers,
+                         self.outfile, nodes_of_interest, shard_files)
+        else:
+            walker = N2V(edgesJ, self.num_walks, self.walk_length, self.p, self.q, self.workers,
+                         self.outfile, nodes_of_interest)
 
         walker.walk()
+        count("walks", int(walker.numWalksWritten()),
+              seconds=walker.walkingTimeMillis() / 1000,
+              preprocessing_seconds=walker.preprocessingTimeMillis() / 1000)
 
-        self.wait_for_all_walks()
+        # Shards are closed by their threads before walk returns.
+        if not self.sharded:
+            self.wait_for_all_walks()
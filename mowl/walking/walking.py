@@ -15,9 +15,13 @@ class WalkingModel():
     :type walk_length: int
     :param workers: Number of threads to be used for computing the walks, defaults to 1'
     :type workers: int, optional
+    :param sharded: If ``True``, every thread writes its walks to its own file (see \
+    :attr:`shard_files`) instead of all the threads sharing ``outfile``. Defaults to ``False``.
+    :type sharded: bool, optional
     '''
 
-    def __init__(self, num_walks, walk_length, outfile, workers=1):
+    @versionchanged(version="1.0.2", reason="Added the ``sharded`` parameter.")
+    def __init__(self, num_walks, walk_length, outfile, workers=1, sharded=False):
 
         if not isinstance(num_walks, int):
             raise TypeError("Parameter num_walks must be an integer")
@@ -25,6 +29,8 @@ class WalkingModel():
             raise TypeError("Parameter walk_length must be an integer")
         if not isinstance(workers, int):
             raise TypeError("Optional parameter workers must be an integer")
+        if not isinstance(sharded, bool):
+            raise TypeError("Optional parameter sharded must be of type bool")
 
         if outfile is None:
             tmp_file = tempfile.NamedTemporaryFile()
@@ -37,6 +43,33 @@ class WalkingModel():
         self.num_walks = num_walks
         self.walk_length = walk_length
         self.workers = workers
+        self.sharded = sharded
+
+    @property
+    @versionadded(version="1.0.2")
+    def shard_files(self):
+        '''
+        Files written by the threads when ``sharded=True``. They are named by inserting the \
+        thread number before the extension of ``outfile``, as in \
+        :func:`mowl.corpus.save_corpus`. Threads without walks to compute do not create their file.
+
+        :rtype: list of str
+        '''
+        root, ext = os.path.splitext(self.outfile)
+        return [f"{root}-{i:05d}{ext}" for i in range(self.workers)]
+
+    @property
+    @versionadded(version="1.0.2")
+    def walk_files(self):
+        '''
+        Files containing the walks: the existing :attr:`shard_files` if ``sharded=True``, \
+        otherwise ``outfile``.
+
+        :rtype: list of str
+        '''
+        if self.sharded:
+            return [path for path in self.shard_files if os.path.exists(path)]
+        return [self.outfile]
 
     # Abstract methods
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
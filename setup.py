@@ -37,7 +37,7 @@ setuptools.setup(
         "pykeen==1.11.0",
         "pyyaml",
         "requests",
-        "scikit-learn",
+        "scikit-learn>=1.2",
         "scipy<1.16.0",
         "temp",
         "tqdm",
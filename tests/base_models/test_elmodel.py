@@ -5,6 +5,8 @@ from mowl.datasets import Dataset
 from tests.datasetFactory import FamilyDataset, PPIYeastSlimDataset
 from mowl.datasets.el import ELDataset
 from mowl.models import ELEmbeddings
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.owlapi import OWLAPIAdapter
 import random
 import torch as th
 import numpy as np
@@ -190,7 +192,7 @@ non-existing attributes"""
         num_individuals = len(model.dataset.individuals)
 
         class_embeddings = model.class_embeddings
-        self.assertIsInstance(class_embeddings, dict)
+        self.assertIsInstance(class_embeddings, EmbeddingStore)
         self.assertTrue(len(class_embeddings) == num_classes)
         for key, value in class_embeddings.items():
             with self.subTest(key=key):
@@ -199,7 +201,7 @@ non-existing attributes"""
                 self.assertEqual(value.shape, (embed_dim,))
 
         object_property_embeddings = model.object_property_embeddings
-        self.assertIsInstance(object_property_embeddings, dict)
+        self.assertIsInstance(object_property_embeddings, EmbeddingStore)
         self.assertTrue(len(object_property_embeddings) == num_relations)
         for key, value in object_property_embeddings.items():
             with self.subTest(key=key):
@@ -208,10 +210,84 @@ non-existing attributes"""
                 self.assertEqual(value.shape, (embed_dim,))
 
         individual_embeddings = model.individual_embeddings
-        self.assertIsInstance(individual_embeddings, dict)
+        self.assertIsInstance(individual_embeddings, EmbeddingStore)
         self.assertTrue(len(individual_embeddings) == num_individuals)
         for key, value in individual_embeddings.items():
             with self.subTest(key=key):
                 self.assertIsInstance(key, str)
                 self.assertIsInstance(value, np.ndarray)
                 self.assertEqual(value.shape, (embed_dim,))
+
+    def test_sampled_ranking_metric(self):
+        """This should check that the sampled ranking metrics are valid proportions"""
+        model = ELEmbeddings(self.family_dataset, embed_dim=10)
+        data = model.training_datasets["gci2"][:]
+
+        mrr = model.sampled_ranking_metric(data, metric="mrr", num_candidates=5)
+        hits = model.sampled_ranking_metric(data, metric="hits@3", num_candidates=5)
+        self.assertTrue(0 <= mrr <= 1)
+        self.assertTrue(0 <= hits <= 1)
+
+        with self.assertRaisesRegex(ValueError, "Parameter metric must be 'mrr' or 'hits@k'."):
+            model.sampled_ranking_metric(data, metric="auc")
+
+    def test_score_axioms(self):
+        """This should check that batched scoring matches scoring axioms one by one"""
+        model = ELEmbeddings(self.family_dataset, embed_dim=10, batch_size=2)
+        adapter = OWLAPIAdapter()
+        classes = model.dataset.classes.as_owl[:4]
+        relation = model.dataset.object_properties.as_owl[0]
+
+        axioms = [adapter.create_subclass_of(classes[0], classes[1]),
+                  adapter.create_subclass_of(
+                      classes[1], adapter.create_object_some_values_from(relation, classes[2])),
+                  adapter.create_subclass_of(
+                      adapter.create_object_some_values_from(relation, classes[3]), classes[0]),
+                  adapter.create_subclass_of(classes[2], classes[3]),
+                  adapter.create_subclass_of(
+                      adapter.create_object_intersection_of(classes[0], classes[1]), classes[2])]
+
+        model.module.train()
+        scores = model.score_axioms(axioms)
+        self.assertIsInstance(scores, np.ndarray)
+        self.assertEqual(scores.shape, (len(axioms),))
+        self.assertTrue(model.module.training)
+
+        for axiom, score in zip(axioms, scores):
+            with self.subTest(axiom=str(axiom)):
+                expected = model.score(axiom).item()
+                self.assertAlmostEqual(score, expected, places=5)
+
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter batch_size must be of type int."):
+            model.score_axioms(axioms, batch_size="2")
+
+        not_normalized = adapter.create_subclass_of(
+            classes[0], adapter.create_object_intersection_of(classes[1], classes[2]))
+        with self.assertRaisesRegex(TypeError, "is not in EL normal form."):
+            model.score_axioms([not_normalized])
+
+    def test_axiom_scoring(self):
+        """This should check that the axiom scoring of every normal form gives the same scores \
+in batches as one axiom at a time"""
+        model = ELEmbeddings(self.family_dataset, embed_dim=10, batch_size=2)
+        patterns = {"gci0": "c?.*? SubClassOf c?.*?",
+                    "gci1": "c?.*? and c?.*? SubClassOf c?.*?",
+                    "gci2": "c?.*? SubClassOf p?.*? some c?.*?",
+                    "gci3": "p?.*? some c?.*? SubClassOf c?.*?"}
+
+        for gci_name, pattern in patterns.items():
+            with self.subTest(gci_name=gci_name):
+                scoring = model.get_axiom_scoring(gci_name)
+                self.assertIsNotNone(scoring.batch_method)
+                batched = scoring.score(pattern, batch_size=7)
+                scoring.batch_method = None
+                per_axiom = scoring.score(pattern)
+
+                self.assertGreater(len(batched), 0)
+                self.assertEqual(batched.keys(), per_axiom.keys())
+                for axiom, score in batched.items():
+                    self.assertAlmostEqual(score, per_axiom[axiom], places=5)
+
+        with self.assertRaisesRegex(ValueError, "Parameter gci_name must be one of the following"):
+            model.get_axiom_scoring("gci0_bot")
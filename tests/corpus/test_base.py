@@ -1,11 +1,16 @@
 from tests.datasetFactory import FamilyDataset, PPIYeastSlimDataset
 from unittest import TestCase
+from unittest import mock
 import os
 import shutil
 import mowl
 mowl.init_jvm("10g")
 from mowl.corpus import extract_and_save_axiom_corpus, \
-    extract_and_save_annotation_corpus, extract_axiom_corpus, extract_annotation_corpus
+    extract_and_save_annotation_corpus, extract_axiom_corpus, extract_annotation_corpus, \
+    iter_axiom_corpus, save_corpus, CorpusStream
+from mowl.corpus import base as corpus_base
+import gzip
+import tempfile
 
 
 class TestBase(TestCase):
@@ -162,3 +167,55 @@ class TestBase(TestCase):
 
         self.assertIsInstance(extract_annotation_corpus(self.ppi_yeast_slim_dataset.ontology),
                               list)
+
+    #########################################
+
+    def test_parallel_rendering_matches_sequential(self):
+        """This should check that rendering with several threads and small blocks gives the same \
+corpus as sequential rendering."""
+
+        ontology = self.ppi_yeast_slim_dataset.ontology
+        sequential = list(iter_axiom_corpus(ontology))
+        parallel = list(iter_axiom_corpus(ontology, block_size=7, workers=4))
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(len(sequential), ontology.getAxiomCount())
+
+    def test_gateway_rendering(self):
+        """This should check that blocks rendered in the JVM match the axioms rendered one by \
+one from Python."""
+        self.assertIsNotNone(corpus_base.AxiomRenderer,
+                             "gateway.jar does not include org.mowl.Corpus.AxiomRenderer")
+
+        ontology = self.family_dataset.ontology
+        gateway = list(iter_axiom_corpus(ontology, block_size=5))
+        with mock.patch.object(corpus_base, "AxiomRenderer", None):
+            python = list(iter_axiom_corpus(ontology, block_size=5))
+        self.assertEqual(gateway, python)
+
+    def test_compressed_and_sharded_corpus(self):
+        """This should check that gzip-compressed and sharded corpus files contain the whole \
+corpus."""
+
+        corpus = extract_axiom_corpus(self.family_dataset.ontology)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_file = os.path.join(tmp_dir, "corpus.txt.gz")
+            extract_and_save_axiom_corpus(self.family_dataset.ontology, out_file, workers=2)
+            with gzip.open(out_file, "rt") as f:
+                self.assertEqual(f.read().splitlines(), corpus)
+
+            paths = save_corpus(corpus, out_file, shard_size=5)
+            self.assertEqual(len(paths), (len(corpus) + 4) // 5)
+            self.assertEqual(os.path.basename(paths[0]), "corpus-00000.txt.gz")
+            lines = []
+            for path in paths:
+                with gzip.open(path, "rt") as f:
+                    lines += f.read().splitlines()
+            self.assertEqual(lines, corpus)
+
+    def test_corpus_stream_is_restartable(self):
+        """This should check that a CorpusStream can be iterated several times."""
+
+        stream = CorpusStream(lambda: iter_axiom_corpus(self.family_dataset.ontology))
+        first = list(stream)
+        self.assertEqual(first, list(stream))
+        self.assertEqual(first[0], extract_axiom_corpus(self.family_dataset.ontology)[0].split())
@@ -0,0 +1,62 @@
+from unittest import TestCase
+from mowl.corpus import TokenCorpus
+import gzip
+import os
+import tempfile
+
+
+class TestTokenCorpus(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.sentences = ["a b c", "b c", "", "d a a"]
+        self.corpus = TokenCorpus.from_sentences(self.sentences, block_size=2)
+
+    def test_iteration_matches_sentences(self):
+        """This should check that iterating the corpus gives back the tokenized sentences, \
+several times."""
+
+        expected = [sentence.split() for sentence in self.sentences]
+        self.assertEqual(list(self.corpus), expected)
+        self.assertEqual(list(self.corpus), expected)
+        self.assertEqual(len(self.corpus), 4)
+        self.assertEqual(self.corpus.num_words, 8)
+
+    def test_counts(self):
+        """This should check that word counts are computed from the token array"""
+        self.assertEqual(self.corpus.counts, {"a": 3, "b": 2, "c": 2, "d": 1})
+
+    def test_save_and_load_memory_mapped(self):
+        """This should check that a saved corpus loads memory-mapped with the same content"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prefix = os.path.join(tmp_dir, "walks")
+            self.corpus.save(prefix)
+            loaded = TokenCorpus.load(prefix)
+            self.assertEqual(list(loaded), list(self.corpus))
+            self.assertEqual(loaded.counts, self.corpus.counts)
+
+    def test_from_compressed_file(self):
+        """This should check that gzip-compressed corpus files are parsed"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "walks.txt.gz")
+            with gzip.open(path, "wt") as f:
+                f.write("\n".join(self.sentences) + "\n")
+            self.assertEqual(list(TokenCorpus.from_file(path)), list(self.corpus))
+
+    def test_from_files(self):
+        """This should check that several corpus files are parsed into one corpus in order"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, "walks-00000.txt"),
+                     os.path.join(tmp_dir, "walks-00001.txt.gz")]
+            with open(paths[0], "w") as f:
+                f.write("\n".join(self.sentences[:2]) + "\n")
+            with gzip.open(paths[1], "wt") as f:
+                f.write("\n".join(self.sentences[2:]) + "\n")
+            self.assertEqual(list(TokenCorpus.from_files(paths)), list(self.corpus))
+
+    def test_param_types(self):
+        """This should check that incorrect parameter types raise errors"""
+        with self.assertRaisesRegex(TypeError, "Parameter path must be of type str."):
+            TokenCorpus.from_file(1)
+        with self.assertRaisesRegex(TypeError, "Parameter paths must be of type list."):
+            TokenCorpus.from_files("walks.txt")
@@ -3,8 +3,11 @@ from unittest import TestCase
 
 from tests.datasetFactory import FamilyDataset
 from mowl.datasets import ELDataset
+from mowl.owlapi import OWLAPIAdapter
 from mowl.owlapi.defaults import BOT, TOP
 
+from java.util import HashSet
+
 
 class TestElDataset(TestCase):
 
@@ -90,3 +93,31 @@ must be of type dict"):
         true_gci3 = set()
         true_gci3.add((object_property_index_dict[self.has_child], class_index_dict[self.person],
                       class_index_dict[self.parent]))
+
+    def test_add_axioms(self):
+        """This should check that adding axioms gives the same datasets as a full normalization"""
+
+        adapter = OWLAPIAdapter()
+        has_sibling = adapter.create_object_property("http://hasSibling")
+        aunt = adapter.create_class("http://Aunt")
+        sibling_of_parent = adapter.create_object_intersection_of(
+            adapter.create_class(self.female),
+            adapter.create_object_some_values_from(has_sibling, adapter.create_class(self.parent)))
+        axioms = [adapter.create_subclass_of(aunt, sibling_of_parent),
+                  adapter.create_subclass_of(aunt, adapter.create_class(self.female))]
+
+        incremental = ELDataset(FamilyDataset().ontology)
+        incremental.load()
+        incremental.add_axioms(*axioms)
+
+        ontology = FamilyDataset().ontology
+        adapter.owl_manager.addAxioms(ontology, HashSet(axioms))
+        full = ELDataset(ontology)
+
+        self.assertEqual(incremental.class_index_dict, full.class_index_dict)
+        self.assertEqual(incremental.object_property_index_dict, full.object_property_index_dict)
+        for key, dataset in full.get_gci_datasets().items():
+            with self.subTest(key=key):
+                expected = {tuple(row) for row in dataset.data.tolist()}
+                actual = {tuple(row) for row in incremental.get_gci_datasets()[key].data.tolist()}
+                self.assertEqual(actual, expected)
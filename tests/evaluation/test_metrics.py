@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import numpy as np
+from sklearn import metrics as skm
+
+from mowl.evaluation.metrics import auc, binary_metrics, precision_and_recall_at_k, \
+    precision_and_recall_at_ks
+from mowl.evaluation.predictions import evaluate_predictions
+
+
+class TestMetrics(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        rng = np.random.default_rng(0)
+        self.y_true = rng.integers(0, 2, size=1000)
+        # Rounded scores have ties
+        self.y_score = np.round(rng.random(1000) + 0.3 * self.y_true, 2)
+        self.ks = [1, 10, 100, 1000, 2000]
+
+    def test_precision_and_recall_at_ks(self):
+        """This should check that precision and recall at several cut-offs match the ranking \
+by score"""
+
+        nb_positives = int(self.y_true.sum())
+        results = precision_and_recall_at_ks(self.y_true, self.y_score, self.ks, nb_positives)
+        order = np.argsort(self.y_score, kind="stable")[::-1]
+        for k in self.ks:
+            true_positives = self.y_true[order][:k].sum()
+            self.assertAlmostEqual(results[k][0], true_positives / k)
+            self.assertAlmostEqual(results[k][1], true_positives / nb_positives)
+            self.assertEqual(results[k], precision_and_recall_at_k(self.y_true, self.y_score, k,
+                                                                   nb_positives))
+
+    def test_precision_and_recall_at_ks_empty(self):
+        """This should check that undefined precision and recall are NaN instead of raising \
+ZeroDivisionError"""
+
+        results = precision_and_recall_at_ks(np.array([], dtype=bool), np.array([]), [0, 1], 0)
+        self.assertTrue(np.isnan(results[0][0]))
+        self.assertTrue(np.isnan(results[0][1]))
+        self.assertEqual(results[1][0], 0)
+        self.assertTrue(np.isnan(results[1][1]))
+
+    def test_binary_metrics(self):
+        """This should check that binary_metrics matches the metrics computed with \
+scikit-learn"""
+
+        metrics = binary_metrics(self.y_true, self.y_score, self.ks)
+        auc_value, threshold = auc(self.y_true, self.y_score)
+        y_pred = (self.y_score > threshold).astype(int)
+
+        self.assertAlmostEqual(metrics["auc"], auc_value)
+        self.assertAlmostEqual(metrics["precision"], skm.precision_score(self.y_true, y_pred))
+        self.assertAlmostEqual(metrics["recall"], skm.recall_score(self.y_true, y_pred))
+
+    def test_evaluate_predictions_inputs(self):
+        """This should check that evaluate_predictions gives the same metrics for \
+dictionaries, id-keyed arrays and aligned arrays"""
+
+        names = [f"axiom_{i}" for i in range(len(self.y_true))]
+        predictions = dict(zip(names, self.y_score))
+        true_axioms = {name for name, label in zip(names, self.y_true) if label == 1}
+        ids = np.arange(len(self.y_true))
+
+        from_dict = evaluate_predictions(true_axioms, predictions, self.ks)
+        from_ids = evaluate_predictions(ids[self.y_true == 1], (ids, self.y_score), self.ks)
+        from_arrays = evaluate_predictions(self.y_true, self.y_score, self.ks)
+
+        self.assertEqual(list(from_dict), sorted(from_dict))
+        for key, value in from_dict.items():
+            self.assertAlmostEqual(value, from_ids[key])
+            self.assertAlmostEqual(value, from_arrays[key])
+
+        with self.assertRaisesRegex(ValueError, "Pos label must be either 0 or 1"):
+            evaluate_predictions(self.y_true, self.y_score, self.ks, pos_label=2)
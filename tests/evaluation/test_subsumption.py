@@ -3,8 +3,11 @@ from tests.datasetFactory import FamilyDataset
 from mowl.models import GraphPlusPyKEENModel
 from mowl.projection import OWL2VecStarProjector
 from mowl.evaluation import SubsumptionEvaluator
+from mowl.evaluation.base import cached_tuples
 from pykeen.models import TransE
 import torch as th
+import os
+import tempfile
 
 allowed_diff = 1e-6
 
@@ -100,8 +103,46 @@ class TestSubsumption(TestCase):
         true_auc = auc_from_mr(mr, num_classes)
         diff_auc = abs(auc - true_auc)
         self.assertLess(diff_auc, allowed_diff)
-        
-        
-
-
 
+    def test_deductive_closure_cache(self):
+        """This should check that the deductive closure is stored and reused from the cache"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            evaluator = SubsumptionEvaluator(self.dataset, closure_cache=cache_dir)
+            tuples = evaluator.deductive_closure_tuples
+            self.assertEqual(tuples.shape[1], 2)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            cached_evaluator = SubsumptionEvaluator(self.dataset, closure_cache=cache_dir)
+            self.assertEqual(tuples.tolist(), cached_evaluator.deductive_closure_tuples.tolist())
+
+        with self.assertRaisesRegex(
+                TypeError, "Optional parameter closure_cache must be of type bool or str."):
+            SubsumptionEvaluator(self.dataset, closure_cache=1)
+
+    def test_evaluation_index_cache(self):
+        """This should check that the evaluation heads, tails and tuples are stored and reused \
+from the index cache"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            evaluator = SubsumptionEvaluator(self.dataset, closure_cache=False,
+                                             index_cache=cache_dir)
+            tuples = evaluator.create_tuples(self.dataset.ontology)
+            cached = SubsumptionEvaluator(self.dataset, closure_cache=False,
+                                          index_cache=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            self.assertEqual(evaluator.heads.tolist(), cached.heads.tolist())
+            self.assertEqual(evaluator.tails.tolist(), cached.tails.tolist())
+
+            self.assertEqual(tuples.tolist(),
+                             cached_tuples(evaluator, self.dataset.ontology).tolist())
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            self.assertEqual(tuples.tolist(),
+                             cached_tuples(cached, self.dataset.ontology).tolist())
+
+            index_cache = evaluator.index_cache
+            dataset_key = index_cache.dataset_key(evaluator, self.dataset)
+            self.assertNotEqual(index_cache.key(dataset_key, "heads", names=["http://A"]),
+                                index_cache.key(dataset_key, "heads", names=["http://B"]))
+
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter index_cache must be of type bool or str."):
+            SubsumptionEvaluator(self.dataset, index_cache=1)
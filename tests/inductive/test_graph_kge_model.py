@@ -54,8 +54,25 @@ class TestKGEPyKEENModel(TestCase):
             with self.subTest(prop=prop):
                 self.assertEqual(emb.tolist(), property_embeddings_after[prop].tolist())
 
+    def test_add_axioms_keeps_ids(self):
+        """This should check that adding axioms does not change the ids of existing entities"""
+        model = GraphPlusPyKEENModel(FamilyDataset())
+        model.set_projector(self.projector)
+        model.set_kge_method(TransE, random_seed=42)
+        node_to_id_before = dict(model.graph_node_to_id)
+        num_triples_before = model.triples_factory.num_triples
+
+        model.add_axioms(self.axiom)
+        node_to_id_after = model.graph_node_to_id
 
+        for node, idx in node_to_id_before.items():
+            with self.subTest(node=node):
+                self.assertEqual(idx, node_to_id_after[node])
 
+        self.assertEqual(node_to_id_after["http://Aunt"], len(node_to_id_after) - 1)
+        self.assertGreater(model.triples_factory.num_triples, num_triples_before)
+        num_entities = model.kge_method.entity_representations[0](indices=None).shape[0]
+        self.assertEqual(num_entities, len(node_to_id_after))
 
                 
     def test_from_pretrained(self):
@@ -47,6 +47,18 @@ class TestSemanticModel(TestCase):
                 self.assertEqual(emb.tolist(), property_embeddings_after[prop].tolist())
 
 
+    def test_add_axioms_resizes_all_tables(self):
+        """This should check that every class table of the module is resized"""
+        model = ELEmbeddings(FamilyDataset())
+        model.add_axioms(self.axiom)
+        num_classes = len(model.dataset.classes)
+
+        self.assertEqual(model.module.class_embed.weight.shape[0], num_classes)
+        self.assertEqual(model.module.class_rad.weight.shape[0], num_classes)
+        self.assertEqual(model.module.class_embed.num_embeddings, num_classes)
+        self.assertEqual(model.module.nb_ont_classes, num_classes)
+        self.assertEqual(len(model.class_embeddings), num_classes)
+
     def test_from_pretrained(self):
         model = ELEmbeddings(self.dataset)
 
@@ -77,3 +77,12 @@ class TestSyntacticModel(TestCase):
         second_model.generate_corpus(save=True, with_annotations=True)
         second_model.train(epochs=2)
 
+    def test_train_from_stream(self):
+        """This should check that the model trains from a streamed corpus without a corpus file"""
+        model = SyntacticPlusW2VModel(self.dataset, corpus_filepath="/tmp/not_generated_corpus")
+        model.set_w2v_model(min_count=1)
+        model.generate_corpus(stream=True, with_annotations=True, workers=2)
+        model.train(epochs=1)
+
+        self.assertFalse(os.path.exists(model.corpus_filepath))
+        self.assertIn("http://Father", model.class_embeddings)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+from mowl.inference.cosine import CosineSimilarityInfer
+import numpy as np
+
+
+class TestAxiomScoring(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        rng = np.random.default_rng(0)
+        names = [f"http://A{i}" for i in range(6)] + [f"http://B{i}" for i in range(4)]
+        self.embeddings = {name: rng.normal(size=4).astype(np.float32) for name in names}
+        self.pattern = "c?http://A.*? SubClassOf http://rel some c?http://B.*?"
+
+    def test_batched_scores_match_per_axiom_scores(self):
+        """This should check that batched scoring gives the same scores as the per-axiom method"""
+        scoring = CosineSimilarityInfer(self.embeddings, "http://rel")
+        preds = scoring.score(self.pattern, batch_size=5)
+        self.assertEqual(len(preds), 6 * 4)
+
+        for point in scoring.pattern_to_data_points(self.pattern):
+            axiom = f"{point[0]} SubClassOf http://rel some {point[1]}"
+            with self.subTest(axiom=axiom):
+                expected = scoring.method(point).item()
+                self.assertAlmostEqual(preds[axiom], expected, places=5)
+
+    def test_top_k(self):
+        """This should check that top-k scoring returns the best axioms in order"""
+        scoring = CosineSimilarityInfer(self.embeddings, "http://rel")
+        preds = scoring.score(self.pattern, batch_size=5)
+        top = scoring.score(self.pattern, top_k=3, batch_size=5)
+
+        expected = sorted(preds.items(), key=lambda x: x[1])[:3]
+        self.assertEqual(list(top.keys()), [axiom for axiom, _ in expected])
+
+    def test_literal_slot(self):
+        """This should check that a slot with a literal name resolves to a single entity"""
+        scoring = CosineSimilarityInfer(self.embeddings, "http://rel")
+        preds = scoring.score("c?http://A1? SubClassOf http://rel some c?http://B.*?")
+        self.assertEqual(len(preds), 4)
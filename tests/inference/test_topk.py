@@ -0,0 +1,44 @@
+from unittest import TestCase
+from mowl.inference.elinfer.topk import stream_topk, pair_filter
+import torch as th
+
+
+class TestStreamTopK(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.scores = th.rand(7, 11)
+
+        def score_fn(queries, candidates):
+            return self.scores[queries][:, candidates]
+
+        self.score_fn = staticmethod(score_fn)
+
+    def test_matches_dense_topk(self):
+        """This should check that chunked streaming gives the same result as a dense top-k"""
+        records = list(stream_topk(self.score_fn, 7, 11, 3, batch_size=4))
+        self.assertEqual(len(records), 7 * 3)
+
+        expected_scores, expected_idxs = th.topk(self.scores, 3, dim=1, largest=False)
+        for i, (query, candidate, score) in enumerate(records):
+            with self.subTest(record=i):
+                self.assertEqual(query, i // 3)
+                self.assertEqual(candidate, expected_idxs[query, i % 3].item())
+                self.assertAlmostEqual(score, expected_scores[query, i % 3].item(), places=6)
+
+    def test_filtered_pairs_are_skipped(self):
+        """This should check that filtered pairs never appear in the results"""
+        best = th.argmin(self.scores, dim=1)
+        excluded = [(q, best[q].item()) for q in range(7)]
+        records = stream_topk(self.score_fn, 7, 11, 11, batch_size=5,
+                              mask_fn=pair_filter(excluded, 11))
+
+        pairs = {(query, candidate) for query, candidate, _ in records}
+        self.assertEqual(len(pairs), 7 * 10)
+        for pair in excluded:
+            self.assertNotIn(pair, pairs)
+
+    def test_param_types(self):
+        """This should check that incorrect parameter types raise errors"""
+        with self.assertRaisesRegex(TypeError, "Parameter top_k must be of type int."):
+            list(stream_topk(self.score_fn, 7, 11, "3"))
@@ -0,0 +1,52 @@
+from unittest import TestCase
+from mowl.models.falcon.module import FALCONModule
+import torch as th
+
+
+class TestFALCONModule(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.nentities = 20
+        self.heads_dict = {(0, 0): [1, 2, 3], (4, 1): list(range(19))}
+        self.tails_dict = {(1, 0): [0], (2, 1): [5, 6]}
+        self.module = FALCONModule(5, self.nentities, 2, self.heads_dict, self.tails_dict,
+                                   embed_dim=8, num_negs=16)
+
+    def test_sample_negatives_excludes_used_entities(self):
+        """This should check that sampled negatives are never in the used dictionary"""
+        e = th.tensor([[0], [4], [3]])
+        r = th.tensor([[0], [1], [0]])
+        # Only one entity is allowed for (4, 1), so enough rounds are needed to draw it.
+        negs = self.module.sample_negatives(e, r, self.heads_dict, max_rounds=1000)
+
+        self.assertEqual(negs.shape, (3, 16))
+        for used in [1, 2, 3]:
+            self.assertFalse((negs[0] == used).any())
+        self.assertTrue((negs[1] == 19).all())
+        self.assertTrue(((negs[2] >= 0) & (negs[2] < self.nentities)).all())
+
+    def test_sample_negatives_warns_on_exhausted_rounds(self):
+        """This should check that a warning is logged when known entities remain after the \
+last sampling round"""
+        used_dict = {(0, 0): list(range(self.nentities))}
+        e = th.tensor([[0]])
+        r = th.tensor([[0]])
+        with self.assertLogs("mowl.models.falcon.module", level="WARNING"):
+            negs = self.module.sample_negatives(e, r, used_dict, max_rounds=2)
+        self.assertEqual(negs.shape, (1, 16))
+
+    def test_membership_matches_mem(self):
+        """This should check that the split membership computation matches _mem"""
+        c_emb = th.randn(3, 8)
+        e_emb = th.randn(5, 8)
+
+        expected_c = self.module._mem(c_emb.unsqueeze(1).expand(3, 5, 8),
+                                      e_emb.unsqueeze(0).expand(3, 5, 8)).squeeze(-1)
+        expected_r = self.module._mem(e_emb.unsqueeze(0) + c_emb.unsqueeze(1),
+                                      e_emb.unsqueeze(0).expand(3, 5, 8)).squeeze(-1)
+
+        self.assertTrue(th.allclose(self.module._get_c_fs_batch(c_emb, e_emb), expected_c,
+                                    atol=1e-6))
+        self.assertTrue(th.allclose(self.module._get_r_fs_batch(c_emb, e_emb), expected_r,
+                                    atol=1e-6))
@@ -5,6 +5,7 @@ from mowl.projection import TaxonomyProjector
 from pykeen.triples import TriplesFactory
 from pykeen.models import TransE, ERModel
 import mowl.error.messages as err
+from mowl.utils.embedding_store import EmbeddingStore
 import torch as th
 
 class TestPyKEENModel(TestCase):
@@ -69,11 +70,11 @@ class TestPyKEENModel(TestCase):
         model.set_kge_method(kge_method)
 
         class_embs = model.class_embeddings
-        self.assertIsInstance(class_embs, dict)
+        self.assertIsInstance(class_embs, EmbeddingStore)
                 
         role_embs = model.object_property_embeddings
-        self.assertIsInstance(role_embs, dict)
+        self.assertIsInstance(role_embs, EmbeddingStore)
 
         individual_embs = model.individual_embeddings
-        self.assertIsInstance(individual_embs, dict)
+        self.assertIsInstance(individual_embs, EmbeddingStore)
         
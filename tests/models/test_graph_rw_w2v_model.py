@@ -4,6 +4,7 @@ from mowl.models import RandomWalkPlusW2VModel
 from mowl.projection import TaxonomyProjector
 from mowl.walking import DeepWalk
 import mowl.error.messages as msg
+import os
 
 
 class TestRandomWalkPlusW2VModel(TestCase):
@@ -58,3 +59,83 @@ class TestRandomWalkPlusW2VModel(TestCase):
         with self.assertRaisesRegex(AttributeError, msg.W2V_MODEL_NOT_SET):
             model.train()
 
+    def test_train_from_memory_mapped_walks(self):
+        """This should test that the model trains from tokenized walks stored in corpus_dir"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            model = RandomWalkPlusW2VModel(self.dataset, corpus_dir=corpus_dir)
+            model.set_projector(TaxonomyProjector())
+            model.set_walker(DeepWalk(2, 3))
+            model.set_w2v_model(min_count=1, vector_size=8)
+            model.train(epochs=1)
+
+            counts = model.walk_corpus.counts
+            for word, count in counts.items():
+                with self.subTest(word=word):
+                    self.assertEqual(model.w2v_model.wv.get_vecattr(word, "count"), count)
+            self.assertTrue(os.path.exists(os.path.join(corpus_dir, "walks.tokens.npy")))
+
+    def test_train_with_corpus_file(self):
+        """This should test that the model trains with the corpus_file mode of Word2Vec"""
+        model = RandomWalkPlusW2VModel(self.dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_walker(DeepWalk(2, 3))
+        model.set_w2v_model(min_count=1, vector_size=8)
+        model.train(epochs=1, use_corpus_file=True, workers=2)
+
+        self.assertEqual(model.w2v_model.workers, 2)
+        vocabulary = set(model.w2v_model.wv.index_to_key)
+        walked_classes = {cls for cls in self.dataset.classes.as_str if cls in vocabulary}
+        self.assertGreater(len(walked_classes), 0)
+        self.assertEqual(set(model.class_embeddings), walked_classes)
+
+        with self.assertRaisesRegex(TypeError, "Optional parameter workers must be of type int."):
+            model.train(epochs=0, workers="2")
+
+    def test_add_axioms_before_training(self):
+        """This should test that adding axioms before training does not restrict the first \
+training corpus to walks around the new axioms"""
+        from mowl.owlapi import OWLAPIAdapter
+
+        dataset = FamilyDataset()
+        model = RandomWalkPlusW2VModel(dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_walker(DeepWalk(2, 3))
+        model.set_w2v_model(min_count=1, vector_size=8)
+
+        adapter = OWLAPIAdapter()
+        new_class = adapter.create_class("http://new_class")
+        model.add_axioms(adapter.create_subclass_of(new_class, dataset.classes.as_owl[0]))
+        model.train(epochs=1)
+
+        nodes = {edge.src for edge in model._edges} | {edge.dst for edge in model._edges}
+        self.assertIn("http://new_class", nodes)
+        self.assertTrue(nodes <= set(model.walk_corpus.counts))
+
+    def test_add_axioms_updates_edge_index(self):
+        """This should test that adding axioms after training extends the edges and the index \
+of the edges incident to every node in place"""
+        from mowl.owlapi import OWLAPIAdapter
+
+        dataset = FamilyDataset()
+        model = RandomWalkPlusW2VModel(dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_walker(DeepWalk(2, 3))
+        model.set_w2v_model(min_count=1, vector_size=8)
+        model.train(epochs=1)
+
+        adapter = OWLAPIAdapter()
+        parent = dataset.classes.as_str[0]
+        edges = model._edges
+        for name in ["http://new_class_1", "http://new_class_2"]:
+            model.add_axioms(adapter.create_subclass_of(adapter.create_class(name),
+                                                        adapter.create_class(parent)))
+
+        self.assertIs(model._edges, edges)
+        expected = dict()
+        for edge in model._edges:
+            expected.setdefault(edge.src, set()).add(edge)
+            expected.setdefault(edge.dst, set()).add(edge)
+        self.assertEqual({node: set(node_edges) for node, node_edges
+                          in model._edges_by_node.items()}, expected)
+        self.assertIn("http://new_class_2", model._edges_by_node)
@@ -1,7 +1,14 @@
+import gzip
 import os
+import shutil
+import tempfile
 
+from mowl.ontology import create
 from mowl.ontology.create import create_from_triples
+from mowl.datasets import PathDataset
+from org.semanticweb.owlapi.model import AxiomType
 from unittest import TestCase
+from unittest import mock
 
 
 class TestCreate(TestCase):
@@ -45,6 +52,12 @@ class TestCreate(TestCase):
         self.assertRaisesRegex(TypeError, "Optional parameter tail_prefix must be of type str",
                                create_from_triples, "triples_file", "out_file", tail_prefix=1)
 
+        self.assertRaisesRegex(TypeError, "Optional parameter chunk_size must be of type int",
+                               create_from_triples, "triples_file", "out_file", chunk_size="1")
+
+        self.assertRaisesRegex(TypeError, "Optional parameter verbose must be of type bool",
+                               create_from_triples, "triples_file", "out_file", verbose=1)
+
     def test_file_with_2_columns(self):
         """This would test correct behaviour when a file with 2 columns is used"""
 
@@ -64,3 +77,45 @@ field is None"):
         with self.assertRaisesRegex(ValueError, "Expected number of elements in triple to be 2 or \
 3. Got 4"):
             create_from_triples(self._4_columns, self._2_columns_owl)
+
+    def test_gzip_input_in_chunks(self):
+        """This should check that gzip-compressed files parsed in chunks produce the same \
+ontology as plain files"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            gz_file = os.path.join(tmp_dir, "3_columns.tsv.gz")
+            with open(self._3_columns, "rb") as f_in, gzip.open(gz_file, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+            plain_owl = os.path.join(tmp_dir, "plain.owl")
+            gz_owl = os.path.join(tmp_dir, "gz.owl")
+            create_from_triples(self._3_columns, plain_owl, bidirectional=True)
+            create_from_triples(gz_file, gz_owl, bidirectional=True, chunk_size=1)
+
+            # Relative IRIs are resolved against the directory of each file, which is the same.
+            plain_axioms = {str(axiom) for axiom in
+                            PathDataset(plain_owl).ontology.getAxioms(AxiomType.SUBCLASS_OF)}
+            gz_axioms = {str(axiom) for axiom in
+                         PathDataset(gz_owl).ontology.getAxioms(AxiomType.SUBCLASS_OF)}
+
+        self.assertEqual(plain_axioms, gz_axioms)
+        self.assertEqual(len(plain_axioms), 4)
+
+    def test_gateway_axiom_builder(self):
+        """This should check that the axioms created in the JVM match the axioms created from \
+Python"""
+        self.assertIsNotNone(
+            create.GatewayAxiomBuilder,
+            "gateway.jar does not include org.mowl.Ontology.ExistentialAxiomBuilder")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            gateway_owl = os.path.join(tmp_dir, "gateway.owl")
+            python_owl = os.path.join(tmp_dir, "python.owl")
+            create_from_triples(self._3_columns, gateway_owl, bidirectional=True)
+            with mock.patch.object(create, "GatewayAxiomBuilder", None):
+                create_from_triples(self._3_columns, python_owl, bidirectional=True)
+
+            gateway_axioms = {str(ax) for ax in PathDataset(gateway_owl).ontology.getAxioms()}
+            python_axioms = {str(ax) for ax in PathDataset(python_owl).ontology.getAxioms()}
+
+        self.assertEqual(gateway_axioms, python_axioms)
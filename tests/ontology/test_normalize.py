@@ -1,6 +1,9 @@
+import importlib
 from unittest import TestCase
+from unittest import mock
+from mowl.ontology import normalize
 from mowl.ontology.normalize import ELNormalizer, GCI, GCI0, GCI1, GCI2, GCI3, GCI0_BOT, \
-    GCI1_BOT, GCI3_BOT, process_axiom
+    GCI1_BOT, GCI3_BOT, process_axiom, NORMAL_FORM_COLUMNS
 from tests.datasetFactory import FamilyDataset
 from mowl.owlapi import OWLAPIAdapter
 from mowl.owlapi.defaults import BOT
@@ -158,6 +161,48 @@ org.semanticweb.owlapi.model.OWLOntology. Found: <class 'str'>"):
             message = f"Reverse translation. Ignoring axiom: {self.gci0_axiom}"
             self.assertEqual(log.records[0].getMessage(), message)
 
+    def test_normalize_as_arrays(self):
+        """This should check that the integer arrays contain the same GCIs as normalize"""
+
+        normalizer = ELNormalizer()
+        normalized_axioms = normalizer.normalize(self.family_dataset.ontology)
+        arrays, entities = normalizer.normalize_as_arrays(self.family_dataset.ontology)
+
+        expected = {"gci0": 7, "gci1": 2, "gci2": 1, "gci3": 1, "gci0_bot": 0, "gci1_bot": 1,
+                    "gci3_bot": 0}
+        for key, count in expected.items():
+            self.assertEqual(arrays[key].shape, (count, len(NORMAL_FORM_COLUMNS[key])))
+
+        names = {key: [[entities[kind][i] for kind, i in zip(NORMAL_FORM_COLUMNS[key], row)]
+                       for row in arrays[key].tolist()] for key in expected}
+
+        gci0 = {(gci.subclass, gci.superclass) for gci in normalized_axioms["gci0"]}
+        self.assertEqual({tuple(row) for row in names["gci0"]}, gci0)
+        gci2 = {(gci.subclass, gci.object_property, gci.filler)
+                for gci in normalized_axioms["gci2"]}
+        self.assertEqual({tuple(row) for row in names["gci2"]}, gci2)
+        gci1 = {frozenset([gci.left_subclass, gci.right_subclass, gci.superclass])
+                for gci in normalized_axioms["gci1"]}
+        self.assertEqual({frozenset(row) for row in names["gci1"]}, gci1)
+
+    def test_normal_form_indexer(self):
+        """This should check that the normal forms classified in the JVM match the ones \
+classified from Python"""
+        self.assertIsNotNone(
+            normalize.NormalFormIndexer,
+            "gateway.jar does not include org.mowl.Normalization.NormalFormIndexer")
+
+        def as_names(arrays, entities):
+            return {key: {tuple(entities[kind][i] for kind, i in zip(columns, row))
+                          for row in arrays[key].tolist()}
+                    for key, columns in NORMAL_FORM_COLUMNS.items()}
+
+        ontology = self.family_dataset.ontology
+        expected = as_names(*ELNormalizer().normalize_as_arrays(ontology))
+        with mock.patch.object(normalize, "NormalFormIndexer", None):
+            python_names = as_names(*ELNormalizer().normalize_as_arrays(ontology))
+        self.assertEqual(expected, python_names)
+
     def test_process_axiom_type_checking(self):
         """This performs type checking on the process_axiom method"""
 
@@ -212,6 +257,27 @@ org.semanticweb.owlapi.model.OWLOntology"):
 
         self.assertEqual(ontology.getAxiomCount(), 0)
 
+    def test_preprocess_ontology_keeps_el_axioms(self):
+        """This should check that preprocess_ontology keeps EL axioms, including annotated ones"""
+
+        normalizer = ELNormalizer()
+        ontology = self.adapter.owl_manager.createOntology()
+        for axiom in [self.gci0_axiom, self.gci1_axiom, self.gci2_axiom, self.gci3_axiom,
+                      self.gci1_bot_axiom, self.union_axiom, self.object_one_of_axiom]:
+            ontology.addAxiom(axiom)
+
+        annot_prop = self.data_factory.getOWLAnnotationProperty(IRI.create("http://annotation"))
+        annotation = self.data_factory.getOWLAnnotation(
+            annot_prop, self.data_factory.getOWLLiteral("test"))
+        annotations = HashSet()
+        annotations.add(annotation)
+        ontology.addAxiom(self.gci0_bot_axiom.getAnnotatedAxiom(annotations))
+
+        preprocessed = normalizer.preprocess_ontology(ontology)
+        self.assertEqual(preprocessed.getAxiomCount(), 6)
+        self.assertFalse(preprocessed.containsAxiom(self.union_axiom))
+        self.assertFalse(preprocessed.containsAxiom(self.object_one_of_axiom))
+
     # Test GCIs
 
     def test_gci0(self):
@@ -333,3 +399,14 @@ org.semanticweb.owlapi.model.OWLOntology"):
         self.assertEqual(classes, {"http://class1", "http://class2", "http://class3"})
         self.assertEqual(roles, {"http://role"})
         self.assertEqual(inds, set())
+
+
+class TestNormalizeModule(TestCase):
+
+    def test_import(self):
+        """This should check that the module is imported and builds the set of class expression \
+types supported by the normalization"""
+
+        module = importlib.import_module("mowl.ontology.normalize")
+        self.assertEqual(set(map(str, module.EL_CLASS_EXPRESSION_TYPES)),
+                         {"Class", "ObjectIntersectionOf", "ObjectSomeValuesFrom"})
@@ -0,0 +1,90 @@
+from mowl.ontology import snapshot
+from mowl.ontology.snapshot import load_ontology, load_ontologies, snapshot_paths
+from mowl.owlapi import OWLAPIAdapter
+from unittest import TestCase
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from jpype import java
+from org.semanticweb.owlapi.formats import RDFXMLDocumentFormat
+from org.semanticweb.owlapi.model import IRI
+import os
+import tempfile
+import time
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "ontology.owl")
+        self.write_ontology(["http://A", "http://B"])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_ontology(self, class_names):
+        adapter = OWLAPIAdapter()
+        manager = adapter.owl_manager
+        ontology = manager.createOntology()
+        for sub, sup in zip(class_names[:-1], class_names[1:]):
+            axiom = adapter.create_subclass_of(adapter.create_class(sub),
+                                               adapter.create_class(sup))
+            manager.addAxiom(ontology, axiom)
+        manager.saveOntology(ontology, RDFXMLDocumentFormat(),
+                             IRI.create(java.io.File(self.path)))
+        manager.removeOntology(ontology)
+
+    def axioms(self, ontology):
+        return {str(axiom) for axiom in ontology.getAxioms()}
+
+    def test_snapshot_is_created_and_reused(self):
+        """This should check that the snapshot is created on first load and gives the same \
+ontology afterwards"""
+        parsed = load_ontology(self.path)
+        snapshot_path, meta_path = snapshot_paths(self.path)
+        self.assertTrue(os.path.exists(snapshot_path))
+        self.assertTrue(os.path.exists(meta_path))
+
+        from_snapshot = load_ontology(self.path)
+        self.assertEqual(self.axioms(parsed), self.axioms(from_snapshot))
+
+    def test_stale_snapshot_is_recreated(self):
+        """This should check that changing the document invalidates the snapshot"""
+        load_ontology(self.path)
+        time.sleep(0.01)
+        self.write_ontology(["http://A", "http://B", "http://C"])
+
+        ontology = load_ontology(self.path)
+        self.assertEqual(ontology.getAxiomCount(), load_ontology(self.path, snapshot=False)
+                         .getAxiomCount())
+        self.assertIn("http://C", {str(c.toStringID()) for c in ontology.getClassesInSignature()})
+
+    def test_touched_document_with_read_only_metadata(self):
+        """This should check that a touched but unchanged document is loaded from the snapshot \
+when the metadata cannot be updated"""
+        parsed = load_ontology(self.path)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with mock.patch.object(snapshot, "_write_metadata",
+                               side_effect=OSError("Read-only file system")):
+            with self.assertLogs("mowl.ontology.snapshot", level="WARNING"):
+                ontology = load_ontology(self.path)
+        self.assertEqual(self.axioms(ontology), self.axioms(parsed))
+
+    def test_load_ontologies(self):
+        """This should check that several documents are loaded in order and None is kept"""
+        ontology, validation, testing = load_ontologies([self.path, None, self.path])
+        self.assertIsNone(validation)
+        self.assertEqual(self.axioms(ontology), self.axioms(testing))
+
+    def test_concurrent_snapshots_in_threads(self):
+        """This should check that threads creating the same snapshot do not share temporary \
+files"""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            ontologies = list(executor.map(lambda _: load_ontology(self.path), range(8)))
+
+        for ontology in ontologies:
+            self.assertEqual(self.axioms(ontology), self.axioms(ontologies[0]))
+        self.assertEqual([name for name in os.listdir(self.tmp_dir.name)
+                          if name.endswith(".tmp")], [])
@@ -0,0 +1,79 @@
+from mowl.ontology.synthetic import SyntheticOntologyGenerator
+from mowl.ontology.normalize import ELNormalizer
+from org.semanticweb.owlapi.model import AxiomType
+from unittest import TestCase
+import os
+import tempfile
+
+
+class TestSyntheticOntologyGenerator(TestCase):
+
+    def test_type_checking(self):
+        """This should check the type and value checking of the generator parameters"""
+        self.assertRaisesRegex(TypeError, "Parameter num_classes must be of type int.",
+                               SyntheticOntologyGenerator, "10")
+        self.assertRaisesRegex(TypeError, "Optional parameter depth must be of type int.",
+                               SyntheticOntologyGenerator, 10, depth="2")
+        self.assertRaisesRegex(ValueError, "Parameter num_classes must be at least 2.",
+                               SyntheticOntologyGenerator, 1)
+        self.assertRaisesRegex(ValueError, "Unknown normal forms: gci4.",
+                               SyntheticOntologyGenerator, 10, normal_forms={"gci4": 1})
+
+    def test_deterministic(self):
+        """This should check that the generated axioms only depend on the parameters and the \
+seed"""
+        arrays, _ = SyntheticOntologyGenerator(100, seed=1).generate()
+        same, _ = SyntheticOntologyGenerator(100, seed=1).generate()
+        other, _ = SyntheticOntologyGenerator(100, seed=2).generate()
+
+        for name in arrays:
+            self.assertEqual(arrays[name].tolist(), same[name].tolist())
+        self.assertNotEqual(arrays["gci2"].tolist(), other["gci2"].tolist())
+
+    def test_taxonomy_depth(self):
+        """This should check that the taxonomy respects the branching factor and the depth"""
+        generator = SyntheticOntologyGenerator(200, branching_factor=3, depth=2,
+                                               normal_forms={"gci2": 1})
+        arrays, _ = generator.generate()
+        parents = dict(arrays["gci0"].tolist())
+        self.assertEqual(len(parents), 199)
+
+        def depth(cls):
+            return 0 if cls == 0 else 1 + depth(parents[cls])
+
+        self.assertEqual(max(depth(cls) for cls in range(200)), 2)
+
+    def test_create_ontology(self):
+        """This should check that the generated ontology contains the generated axioms in their \
+normal forms"""
+        generator = SyntheticOntologyGenerator(100, num_individuals=10, num_axioms=200)
+        arrays, entities = generator.generate()
+        ontology = generator.create_ontology()
+
+        self.assertEqual(len(ontology.getClassesInSignature()), 100)
+        self.assertEqual(len(ontology.getAxioms(AxiomType.CLASS_ASSERTION)), 10)
+        num_subclass_axioms = sum(len(arrays[name]) for name in ("gci0", "gci1", "gci2", "gci3"))
+        self.assertEqual(len(ontology.getAxioms(AxiomType.SUBCLASS_OF)), num_subclass_axioms)
+
+        normalized, _ = ELNormalizer().normalize_as_arrays(ontology)
+        self.assertEqual(len(normalized["gci2"]), len(arrays["gci2"]))
+
+    def test_create_dataset(self):
+        """This should check that the generated dataset splits the GCI2 axioms"""
+        generator = SyntheticOntologyGenerator(100, num_axioms=500)
+        arrays, _ = generator.generate()
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            dataset = generator.create_dataset(validation_fraction=0.1, testing_fraction=0.2,
+                                               out_dir=out_dir)
+            self.assertEqual(sorted(os.listdir(out_dir)),
+                             ["ontology.owl", "test.owl", "valid.owl"])
+
+        num_gci2 = len(arrays["gci2"])
+        num_validation = int(num_gci2 * 0.1)
+        num_testing = int(num_gci2 * 0.2)
+        self.assertEqual(dataset.validation.getAxiomCount(), num_validation)
+        self.assertEqual(dataset.testing.getAxiomCount(), num_testing)
+        training = dataset.ontology.getAxioms(AxiomType.SUBCLASS_OF)
+        for axiom in dataset.testing.getAxioms():
+            self.assertNotIn(axiom, training)
@@ -6,6 +6,9 @@ from org.semanticweb.owlapi.model import OWLSubClassOfAxiom, OWLEquivalentClasse
     OWLDisjointClassesAxiom
 from random import randrange
 from unittest import TestCase
+import numpy as np
+import os
+import tempfile
 
 
 class TestMowlReasoner(TestCase):
@@ -120,3 +123,62 @@ correct"""
         self.assertIsInstance(result, list)
         rand_idx = randrange(0, len(result))
         self.assertIsInstance(result[rand_idx], OWLDisjointClassesAxiom)
+
+###############################################
+
+    def test_infer_subclass_pairs(self):
+        """This should test that inferred subclass pairs match the inferred subclass axioms"""
+        reasoner_factory = ElkReasonerFactory()
+        reasoner = reasoner_factory.createReasoner(self.dataset.ontology)
+        mowl_reasoner = MOWLReasoner(reasoner)
+
+        classes = list(self.dataset.ontology.getClassesInSignature())
+        axioms = mowl_reasoner.infer_subclass_axioms(classes)
+        expected = {(str(ax.getSubClass().toStringID()), str(ax.getSuperClass().toStringID()))
+                    for ax in axioms}
+
+        names, pairs = mowl_reasoner.infer_subclass_pairs(workers=2)
+        self.assertIsInstance(pairs, np.ndarray)
+        self.assertEqual(pairs.shape[1], 2)
+        self.assertEqual({(names[i], names[j]) for i, j in pairs.tolist()}, expected)
+
+        _, direct_pairs = mowl_reasoner.infer_subclass_pairs(direct=True)
+        self.assertLess(len(direct_pairs), len(pairs))
+
+    def test_infer_subclass_pairs_exporter(self):
+        """This should test that the taxonomy exported in the JVM matches the one exported from \
+Python"""
+        from mowl.reasoning import base
+        self.assertIsNotNone(base.TaxonomyExporter,
+                             "gateway.jar does not include org.mowl.Reasoning.TaxonomyExporter")
+
+        reasoner_factory = ElkReasonerFactory()
+        reasoner = reasoner_factory.createReasoner(self.dataset.ontology)
+        mowl_reasoner = MOWLReasoner(reasoner)
+
+        for direct in (False, True):
+            with self.subTest(direct=direct):
+                names, pairs = mowl_reasoner.infer_subclass_pairs(direct=direct)
+                py_names, py_pairs = mowl_reasoner._query_subclass_pairs(direct, 1)
+                self.assertEqual({(names[i], names[j]) for i, j in pairs.tolist()},
+                                 {(py_names[i], py_names[j]) for i, j in py_pairs.tolist()})
+
+    def test_infer_subclass_pairs_cache(self):
+        """This should test that inferred subclass pairs are stored and loaded from the cache"""
+        reasoner_factory = ElkReasonerFactory()
+        reasoner = reasoner_factory.createReasoner(self.dataset.ontology)
+        mowl_reasoner = MOWLReasoner(reasoner)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            names, pairs = mowl_reasoner.infer_subclass_pairs(cache_dir=cache_dir)
+            cache_file = os.path.join(cache_dir,
+                                      f"taxonomy_{mowl_reasoner.cache_key()}.npz")
+            self.assertEqual(os.listdir(cache_dir), [os.path.basename(cache_file)])
+
+            cached_names, cached_pairs = mowl_reasoner.infer_subclass_pairs(cache_dir=cache_dir)
+            self.assertEqual(names, cached_names)
+            self.assertEqual(pairs.tolist(), cached_pairs.tolist())
+
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter workers must be a positive int"):
+            mowl_reasoner.infer_subclass_pairs(workers=0)
@@ -0,0 +1,70 @@
+from mowl.owlapi import OWLAPIAdapter
+from mowl.reasoning import ClosureCache
+from mowl.reasoning.closure import ontology_content_hash
+from java.util import HashSet
+from tests.datasetFactory import FamilyDataset
+from unittest import TestCase
+import numpy as np
+import tempfile
+
+
+class TestClosureCache(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.dataset = FamilyDataset()
+
+    def test_key_depends_on_inputs(self):
+        """This should test that the cache key changes with the reasoner and the vocabulary"""
+        cache = ClosureCache(tempfile.gettempdir())
+        vocabulary = self.dataset.classes.as_str
+        key = cache.key(self.dataset.ontology, "elk", vocabulary)
+
+        self.assertEqual(key, cache.key(self.dataset.ontology, "elk", vocabulary))
+        self.assertNotEqual(key, cache.key(self.dataset.ontology, "hermit", vocabulary))
+        self.assertNotEqual(key, cache.key(self.dataset.ontology, "elk", vocabulary[::-1]))
+
+    def test_content_hash(self):
+        """This should test that the content hash distinguishes ontologies whose axioms only \
+swap operands and matches ontologies with the same axioms"""
+        adapter = OWLAPIAdapter()
+        manager = adapter.owl_manager
+        a, b, c, d = [adapter.create_class(f"http://{name}") for name in "ABCD"]
+
+        def ontology(*axioms):
+            ont = manager.createOntology()
+            axiom_set = HashSet()
+            for axiom in axioms:
+                axiom_set.add(axiom)
+            manager.addAxioms(ont, axiom_set)
+            return ont
+
+        first = ontology(adapter.create_subclass_of(a, b), adapter.create_subclass_of(c, d))
+        swapped = ontology(adapter.create_subclass_of(a, d), adapter.create_subclass_of(c, b))
+        same = ontology(adapter.create_subclass_of(c, d), adapter.create_subclass_of(a, b))
+
+        self.assertNotEqual(ontology_content_hash(first), ontology_content_hash(swapped))
+        self.assertEqual(ontology_content_hash(first), ontology_content_hash(same))
+
+    def test_get_computes_once(self):
+        """This should test that a cached closure is not recomputed"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.array([[0, 1], [1, 2]])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ClosureCache(cache_dir)
+            key = cache.key(self.dataset.ontology, "elk", self.dataset.classes.as_str)
+            first = cache.get(key, compute)
+            second = cache.get(key, compute)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_parameter_types(self):
+        """This should test that ClosureCache checks parameter types"""
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter cache_dir must be of type str."):
+            ClosureCache(1)
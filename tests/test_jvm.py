@@ -0,0 +1,46 @@
+from unittest import TestCase
+import mowl
+import os
+import tempfile
+
+
+class TestInitJVM(TestCase):
+
+    def test_param_types(self):
+        """This should check that incorrect parameter types raise errors"""
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter jvm_options must be of type list."):
+            mowl.init_jvm("2g", jvm_options="-Xms1g")
+        with self.assertRaisesRegex(TypeError,
+                                    "Optional parameter cds_archive must be of type str."):
+            mowl.init_jvm("2g", cds_archive=1)
+
+    def test_startup_times(self):
+        """This should check that the startup breakdown of the running JVM was recorded"""
+        self.assertEqual(set(mowl.jvm_startup_times), {"classpath", "start_jvm", "load_owlapi"})
+
+    def test_java_major_version(self):
+        """This should check that the Java version is read from the release file"""
+        with tempfile.TemporaryDirectory() as java_home:
+            jvm_path = os.path.join(java_home, "lib", "server", "libjvm.so")
+            self.assertIsNone(mowl._java_major_version(jvm_path))
+            for content, version in [('JAVA_VERSION="17.0.2"', 17),
+                                     ('JAVA_VERSION="1.8.0_362"', 8)]:
+                with self.subTest(version=version):
+                    with open(os.path.join(java_home, "release"), "w") as f:
+                        f.write(content)
+                    self.assertEqual(mowl._java_major_version(jvm_path), version)
+
+    def test_cds_options(self):
+        """This should check that the archive is created by one process and reused afterwards"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            archive = os.path.join(tmp_dir, "mowl.jsa")
+            jvm_path = os.path.join(tmp_dir, "libjvm.so")
+
+            options = mowl._cds_options(jvm_path, [], archive)
+            self.assertEqual(options, [f"-XX:ArchiveClassesAtExit={archive}"])
+            self.assertEqual(mowl._cds_options(jvm_path, [], archive), [])
+
+            open(archive, "wb").close()
+            options = mowl._cds_options(jvm_path, [], archive)
+            self.assertIn(f"-XX:SharedArchiveFile={archive}", options)
@@ -0,0 +1,94 @@
+from unittest import TestCase
+from mowl.utils.embedding_store import EmbeddingStore
+from mowl.inference.cosine import CosineSimilarityInfer
+import numpy as np
+import tempfile
+import os
+
+
+class TestEmbeddingStore(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.vocabulary = ["http://A", "http://B", "http://C"]
+        self.matrix = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+    def test_embedding_store_types(self):
+        """Test the input types of EmbeddingStore"""
+        with self.assertRaisesRegex(TypeError,
+                                    "Parameter vocabulary must be of type list or dict."):
+            EmbeddingStore("http://A", self.matrix)
+
+        with self.assertRaisesRegex(TypeError, "Parameter matrix must be of type numpy.ndarray."):
+            EmbeddingStore(self.vocabulary, [[0, 1]])
+
+        with self.assertRaisesRegex(ValueError, "do not match"):
+            EmbeddingStore(self.vocabulary[:2], self.matrix)
+
+    def test_lookup(self):
+        """Test that rows are looked up by name"""
+        store = EmbeddingStore(self.vocabulary, self.matrix)
+        self.assertEqual(len(store), 3)
+        self.assertIn("http://B", store)
+        self.assertNotIn("http://D", store)
+        self.assertEqual(store["http://B"].tolist(), [2, 3])
+        self.assertEqual(list(store), self.vocabulary)
+        self.assertEqual(store.get_vectors(["http://C", "http://A"]).tolist(), [[4, 5], [0, 1]])
+
+    def test_dict_vocabulary(self):
+        """Test that a name-to-row dictionary is accepted as vocabulary"""
+        store = EmbeddingStore({"http://B": 1, "http://A": 0, "http://C": 2}, self.matrix)
+        self.assertEqual(store.vocabulary, self.vocabulary)
+        self.assertEqual(store["http://C"].tolist(), [4, 5])
+
+    def test_copy_does_not_share_memory(self):
+        """Test that copy returns an independent store"""
+        matrix = self.matrix.copy()
+        store = EmbeddingStore(self.vocabulary, matrix)
+        copied = store.copy()
+        matrix[0, 0] = 100
+        self.assertEqual(store["http://A"][0], 100)
+        self.assertEqual(copied["http://A"][0], 0)
+
+    def test_from_dict(self):
+        """Test the creation of a store from a dictionary"""
+        store = EmbeddingStore.from_dict({"http://A": np.array([1., 2.])})
+        self.assertEqual(store["http://A"].tolist(), [1., 2.])
+
+        empty = EmbeddingStore.from_dict(dict(), embedding_dim=4)
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.embedding_dim, 4)
+
+    def test_save_and_load(self):
+        """Test that stores are saved and loaded memory-mapped"""
+        store = EmbeddingStore(self.vocabulary, self.matrix)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "embeddings")
+            store.save(filepath)
+            self.assertTrue(os.path.exists(filepath + ".npy"))
+            self.assertTrue(os.path.exists(filepath + ".vocab"))
+
+            loaded = EmbeddingStore.load(filepath + ".npy")
+            self.assertEqual(loaded.vocabulary, self.vocabulary)
+            self.assertTrue(np.array_equal(loaded.matrix, self.matrix))
+            self.assertEqual(loaded["http://C"].tolist(), [4, 5])
+            del loaded
+
+        with self.assertRaises(FileNotFoundError):
+            EmbeddingStore.load("non_existing_embeddings")
+
+    def test_cosine_inference_input(self):
+        """This should check that CosineSimilarityInfer gives the same scores for an \
+EmbeddingStore as for a dictionary"""
+        rng = np.random.default_rng(0)
+        names = [f"http://A{i}" for i in range(6)] + [f"http://B{i}" for i in range(4)]
+        embeddings = {name: rng.normal(size=4).astype(np.float32) for name in names}
+        store = EmbeddingStore.from_dict(embeddings)
+        pattern = "c?http://A.*? SubClassOf http://rel some c?http://B.*?"
+
+        preds = CosineSimilarityInfer(embeddings, "http://rel").score(pattern)
+        store_preds = CosineSimilarityInfer(store, "http://rel").score(pattern)
+
+        self.assertEqual(preds.keys(), store_preds.keys())
+        for axiom, score in preds.items():
+            self.assertAlmostEqual(store_preds[axiom], score, places=5)
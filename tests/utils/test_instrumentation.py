@@ -0,0 +1,79 @@
+from unittest import TestCase
+from mowl.utils import instrumentation
+from mowl.utils.instrumentation import timer, timed, count
+import json
+import os
+import tempfile
+
+
+class TestInstrumentation(TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        """This should check that nothing is recorded while instrumentation is disabled"""
+        instrumentation.disable()
+        with timer("stage") as t:
+            t.set(items=10)
+        count("counter")
+        self.assertEqual(instrumentation.records(), [])
+
+    def test_timer_and_counter(self):
+        """This should check that nested timers and counters are recorded with their paths and \
+attributes"""
+        instrumentation.enable()
+        with timer("outer", dataset="family"):
+            with timer("inner") as t:
+                t.set(items=4)
+            count("edges", 3)
+
+        records = instrumentation.records()
+        self.assertEqual([r["type"] for r in records], ["timer", "counter", "timer"])
+        inner, counter, outer = records
+        self.assertEqual(inner["path"], "outer/inner")
+        self.assertEqual(inner["items"], 4)
+        self.assertEqual(counter["path"], "outer")
+        self.assertEqual(counter["value"], 3)
+        self.assertEqual(outer["dataset"], "family")
+        self.assertGreaterEqual(outer["seconds"], inner["seconds"])
+
+        summary = instrumentation.summary()
+        self.assertEqual(summary["inner"]["calls"], 1)
+        self.assertIn("items_per_second", summary["inner"])
+
+    def test_timed(self):
+        """This should check that decorated methods are recorded once, with their class and the \
+number of items they return"""
+
+        class Base():
+            @timed("project", items=len)
+            def project(self):
+                return [1, 2, 3]
+
+        class Child(Base):
+            @timed("project", items=len)
+            def project(self):
+                return super().project() + [4]
+
+        instrumentation.enable()
+        Child().project()
+        records = instrumentation.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["class"], "Child")
+        self.assertEqual(records[0]["items"], 4)
+
+    def test_json_lines(self):
+        """This should check that records are written as JSON lines"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "records.jsonl")
+            instrumentation.enable(path)
+            with timer("stage"):
+                pass
+            instrumentation.disable()
+
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["stage"], "stage")
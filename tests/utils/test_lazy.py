@@ -0,0 +1,74 @@
+from unittest import TestCase
+import subprocess
+import sys
+
+
+class TestLazyImports(TestCase):
+
+    def run_python(self, code):
+        return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                              check=True).stdout.strip()
+
+    def test_numeric_modules_do_not_start_jvm(self):
+        """This should check that pure-Python modules are imported without starting the JVM"""
+        code = ("import jpype\n"
+                "import mowl.nn, mowl.evaluation, mowl.reasoning, mowl.corpus\n"
+                "from mowl.utils.embedding_store import EmbeddingStore\n"
+                "from mowl.evaluation.metrics import auc\n"
+                "from mowl.reasoning.closure import ClosureCache\n"
+                "from mowl.corpus.tokens import TokenCorpus\n"
+                "print(jpype.isJVMStarted())")
+        self.assertEqual(self.run_python(code), "False")
+
+    def test_jvm_starts_on_demand(self):
+        """This should check that the JVM starts when a JVM-dependent name is first used"""
+        code = ("import jpype\n"
+                "from mowl.owlapi import OWLAPIAdapter\n"
+                "adapter = OWLAPIAdapter()\n"
+                "print(jpype.isJVMStarted(), adapter.create_class('http://A').toStringID())")
+        self.assertEqual(self.run_python(code), "True http://A")
+
+    def test_standard_library_imports_do_not_start_jvm(self):
+        """This should check that Jython probes of the standard library, such as \
+``from org.python.core import PyStringMap`` in :mod:`copy`, do not start the JVM"""
+        code = ("import jpype\n"
+                "import mowl, mowl.nn\n"
+                "import copy, pickle, platform\n"
+                "copy.deepcopy({'a': [1]})\n"
+                "platform.java_ver()\n"
+                "print(jpype.isJVMStarted())")
+        self.assertEqual(self.run_python(code), "False")
+
+    def test_unrelated_imports_do_not_start_jvm(self):
+        """This should check that importing a module outside of :data:`mowl.JAVA_PACKAGES` does \
+not start the JVM, even if it shares a parent package with them"""
+        code = ("import importlib, jpype\n"
+                "import mowl\n"
+                "for name in ['org.example.module', 'java.lang', 'uk.ac.other']:\n"
+                "    try:\n"
+                "        importlib.import_module(name)\n"
+                "    except ImportError:\n"
+                "        pass\n"
+                "print(jpype.isJVMStarted())")
+        self.assertEqual(self.run_python(code), "False")
+
+    def test_jvm_starts_after_unrelated_import(self):
+        """This should check that a Java package is imported on demand after an unrelated import \
+with the same parent package"""
+        code = ("import jpype\n"
+                "import mowl, copy\n"
+                "try:\n"
+                "    import org.example.module\n"
+                "except ImportError:\n"
+                "    pass\n"
+                "from org.semanticweb.owlapi.model import IRI\n"
+                "print(jpype.isJVMStarted(), IRI.create('http://A').toString())")
+        self.assertEqual(self.run_python(code).splitlines()[-1], "True http://A")
+
+    def test_lazy_exports(self):
+        """This should check that lazily exported names are listed and unknown names raise \
+AttributeError"""
+        import mowl.reasoning
+        self.assertIn("ClosureCache", dir(mowl.reasoning))
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'Unknown'"):
+            mowl.reasoning.Unknown
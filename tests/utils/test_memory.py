@@ -0,0 +1,38 @@
+from unittest import TestCase
+from mowl.utils import instrumentation
+from mowl.utils.instrumentation import timer
+from mowl.utils.memory import MemoryProfiler, sample
+
+
+class TestMemoryProfiler(TestCase):
+
+    def tearDown(self):
+        instrumentation.reset()
+
+    def test_sample(self):
+        """This should check that memory samples include the Python process and the JVM heap"""
+        values = sample()
+        self.assertGreater(values["rss"], 0)
+        self.assertGreater(values["jvm_heap"], 0)
+        self.assertGreaterEqual(values["jvm_heap_max"], values["jvm_heap"])
+
+    def test_stage_attribution(self):
+        """This should check that memory peaks are attributed to the stage that allocates the \
+memory and added to its instrumentation record"""
+        with MemoryProfiler(interval=0.01) as profiler:
+            with timer("allocate"):
+                data = bytearray(64 * 2**20)
+                data[::4096] = b"\1" * len(data[::4096])
+                del data
+            with timer("idle"):
+                pass
+
+        self.assertFalse(instrumentation.is_enabled())
+        report = profiler.report()
+        self.assertEqual(report["allocate"]["calls"], 1)
+        self.assertGreater(report["allocate"]["rss_growth_mb"], 32)
+        self.assertIn("jvm_heap_peak_mb", report["idle"])
+
+        record = [r for r in instrumentation.records() if r["stage"] == "allocate"][0]
+        self.assertGreaterEqual(record["rss_peak_mb"], record["rss_start_mb"])
+        self.assertRegex(profiler.recommended_jvm_memory(), r"^\d+[mg]$")
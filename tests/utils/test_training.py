@@ -0,0 +1,61 @@
+from unittest import TestCase
+from mowl.utils.training import AsyncCheckpointer, EarlyStopping
+import torch as th
+import tempfile
+import os
+
+
+class TestEarlyStopping(TestCase):
+
+    def test_early_stopping_types(self):
+        """Test the input types of EarlyStopping"""
+        with self.assertRaisesRegex(TypeError, "Optional parameter patience must be of type int."):
+            EarlyStopping(patience="1")
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter mode must be either"):
+            EarlyStopping(mode="maximum")
+
+    def test_early_stopping_min(self):
+        """Test that EarlyStopping stops after patience steps without improvement"""
+        stopper = EarlyStopping(patience=2, mode="min")
+        self.assertTrue(stopper.step(1.0))
+        self.assertTrue(stopper.step(0.5))
+        self.assertFalse(stopper.step(0.7))
+        self.assertFalse(stopper.should_stop)
+        self.assertFalse(stopper.step(0.6))
+        self.assertTrue(stopper.should_stop)
+        self.assertEqual(stopper.best, 0.5)
+
+    def test_early_stopping_max_without_patience(self):
+        """Test that EarlyStopping never stops when patience is None"""
+        stopper = EarlyStopping(mode="max")
+        stopper.step(0.5)
+        for _ in range(10):
+            self.assertFalse(stopper.step(0.1))
+        self.assertFalse(stopper.should_stop)
+
+
+class TestAsyncCheckpointer(TestCase):
+
+    def test_async_checkpointer_types(self):
+        """Test the input types of AsyncCheckpointer"""
+        with self.assertRaisesRegex(TypeError, "Parameter filepath must be of type str."):
+            AsyncCheckpointer(1)
+
+    def test_async_checkpointer_saves_last_snapshot(self):
+        """Test that the last scheduled snapshot is written and is independent of later updates"""
+        module = th.nn.Linear(4, 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.pt")
+            checkpointer = AsyncCheckpointer(filepath)
+            checkpointer.save(module)
+            expected = module.weight.detach().clone()
+            with th.no_grad():
+                module.weight.add_(1)
+            checkpointer.close()
+
+            state_dict = th.load(filepath)
+            self.assertTrue(th.equal(state_dict["weight"], expected))
+
+            with self.assertRaisesRegex(RuntimeError, "Checkpointer has already been closed."):
+                checkpointer.save(module)
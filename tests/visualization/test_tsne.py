@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import numpy as np
+
+from mowl.visualization import TSNE
+
+
+class TestTSNE(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        rng = np.random.default_rng(0)
+        self.names = [f"http://entity_{i}" for i in range(300)]
+        self.embeddings = dict(zip(self.names, rng.random((300, 8))))
+        # Labels of different sizes, one of them smaller than samples_per_label
+        sizes = {"a": 200, "b": 95, "c": 5}
+        label_list = [label for label, size in sizes.items() for _ in range(size)]
+        self.labels = dict(zip(self.names, label_list))
+
+    def test_subsample_per_label(self):
+        """This should check that subsample selects at most samples_per_label entities of \
+every label"""
+
+        tsne = TSNE(self.embeddings, self.labels)
+        rows = tsne.subsample(10, seed=0)
+
+        self.assertTrue(np.all(np.diff(rows) > 0))
+        selected = [self.labels[tsne.names[row]] for row in rows]
+        self.assertEqual(selected.count("a"), 10)
+        self.assertEqual(selected.count("b"), 10)
+        self.assertEqual(selected.count("c"), 5)
+
+    def test_subsample_seed(self):
+        """This should check that subsample is deterministic for a given seed"""
+
+        tsne = TSNE(self.embeddings, self.labels)
+        first = tsne.subsample(10, seed=42)
+        second = tsne.subsample(10, seed=42)
+        np.testing.assert_array_equal(first, second)
+        self.assertFalse(np.array_equal(first, tsne.subsample(10, seed=43)))
+
+    def test_generate_points_grouping(self):
+        """This should check that generate_points groups the subsampled points by label"""
+
+        tsne = TSNE(self.embeddings, self.labels)
+        # TSNE needs more points than its default perplexity of 30
+        tsne.generate_points(250, pca_components=4, samples_per_label=20, seed=0)
+
+        self.assertEqual(tsne.points.shape, (45, 2))
+        self.assertEqual(set(tsne.plot_data), {"a", "b", "c"})
+        for label, (xs, ys) in tsne.plot_data.items():
+            self.assertEqual(len(xs), min(20, list(self.labels.values()).count(label)))
+            self.assertEqual(len(xs), len(ys))
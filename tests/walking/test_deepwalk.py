@@ -1,5 +1,6 @@
 from mowl.walking import DeepWalk
 from mowl.projection import Edge
+from mowl.utils import instrumentation
 from unittest import TestCase
 import os
 
@@ -83,6 +84,55 @@ Ignoring it."])
         self.assertTrue(os.path.exists(outfile))
         os.remove(outfile)
 
+    def test_sharded_walks(self):
+        """This should check that a sharded walker writes one file per thread with all the \
+walks"""
+        num_walks = 10
+        walk_length = 5
+        workers = 2
+        graph = self.graph[:6]
+        nodes, _ = Edge.get_entities_and_relations(graph)
+        outfile = "test_sharded_walks.txt"
+        deepwalk = DeepWalk(num_walks, walk_length, outfile=outfile, workers=workers,
+                            sharded=True)
+        deepwalk.walk(graph)
+
+        self.assertEqual(deepwalk.shard_files, ["test_sharded_walks-00000.txt",
+                                                "test_sharded_walks-00001.txt"])
+        self.assertEqual(deepwalk.walk_files, deepwalk.shard_files)
+        self.assertFalse(os.path.exists(outfile))
+
+        walks = []
+        for path in deepwalk.walk_files:
+            with open(path, "r") as f:
+                walks.extend(f.readlines())
+            os.remove(path)
+
+        self.assertEqual(len(walks), num_walks * len(nodes))
+
+    def test_walk_counters(self):
+        """This should check that the number of walks written by the Scala walker is recorded \
+as a counter"""
+        num_walks = 10
+        walk_length = 5
+        graph = self.graph[:6]
+        nodes, _ = Edge.get_entities_and_relations(graph)
+        deepwalk = DeepWalk(num_walks, walk_length)
+
+        instrumentation.enable()
+        try:
+            deepwalk.walk(graph)
+            counters = [record for record in instrumentation.records()
+                        if record["type"] == "counter" and record["name"] == "walks"]
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+
+        self.assertEqual(len(counters), 1)
+        self.assertEqual(counters[0]["value"], num_walks * len(nodes))
+        self.assertEqual(counters[0]["path"], "walk")
+        self.assertGreaterEqual(counters[0]["seconds"], 0)
+
     def test_walking_on_updated_graph(self):
         """This should test that walks file get updated (not overwritten) when walking on updated graph"""
         num_walks = 10